@@ -1,14 +1,24 @@
 """
 Confluence - Confluence 통합 서비스
 """
-from .client import ConfluenceAPIClient
+from .client import ConfluenceAPIClient, ConnectionPoolConfig
 from .transformer import ConfluenceDataTransformer
 from .service import ConfluenceService
+from .manifest import SyncManifest
+from .ratelimit import RetryPolicy, TokenBucket
+from .concurrency import AdaptiveConcurrencyLimiter
+from .streaming import SearchResultsStreamDecoder
 
 __all__ = [
     'ConfluenceAPIClient',
+    'ConnectionPoolConfig',
     'ConfluenceDataTransformer', 
-    'ConfluenceService'
+    'ConfluenceService',
+    'SyncManifest',
+    'RetryPolicy',
+    'TokenBucket',
+    'AdaptiveConcurrencyLimiter',
+    'SearchResultsStreamDecoder'
 ]
 
 
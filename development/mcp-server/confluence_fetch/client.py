@@ -2,19 +2,74 @@
 Confluence API 클라이언트
 """
 import os
+import time
+import asyncio
 import logging
 import aiohttp
-from typing import Dict, Any, Optional
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Any, Optional, AsyncIterator
+
+from .ratelimit import RetryPolicy, TokenBucket
+from .concurrency import AdaptiveConcurrencyLimiter
+from .streaming import SearchResultsStreamDecoder
+
+
+# 검색 응답 확장 필드: 본문 포함 / 메타데이터만 (2단계 조회의 1단계용)
+SEARCH_EXPAND_FULL = "body.storage,version,space,ancestors"
+SEARCH_EXPAND_METADATA = "version,space"
+
+# 스트리밍 조회 시 응답 본문을 읽는 단위 (바이트)
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+@dataclass
+class ConnectionPoolConfig:
+    """Confluence HTTP 커넥션 풀 설정"""
+    limit: int = 100                  # 전체 동시 커넥션 수
+    limit_per_host: int = 16          # 호스트당 동시 커넥션 수
+    keepalive_timeout: float = 30.0   # 유휴 커넥션 유지 시간(초)
+    dns_cache_ttl: int = 300          # DNS 캐시 TTL(초)
+    request_timeout: float = 60.0     # 요청 전체 타임아웃(초)
+    
+    @classmethod
+    def from_env(cls) -> "ConnectionPoolConfig":
+        """환경변수(CONFLUENCE_POOL_*)에서 설정을 읽는다. 미설정 항목은 기본값 사용"""
+        defaults = cls()
+        return cls(
+            limit=int(os.getenv("CONFLUENCE_POOL_LIMIT", defaults.limit)),
+            limit_per_host=int(os.getenv("CONFLUENCE_POOL_LIMIT_PER_HOST", defaults.limit_per_host)),
+            keepalive_timeout=float(os.getenv("CONFLUENCE_POOL_KEEPALIVE_TIMEOUT", defaults.keepalive_timeout)),
+            dns_cache_ttl=int(os.getenv("CONFLUENCE_POOL_DNS_CACHE_TTL", defaults.dns_cache_ttl)),
+            request_timeout=float(os.getenv("CONFLUENCE_REQUEST_TIMEOUT", defaults.request_timeout))
+        )
 
 
 class ConfluenceAPIClient:
-    """Confluence API 클라이언트"""
+    """Confluence API 클라이언트
+    
+    하나의 aiohttp.ClientSession을 재사용하여 요청 간 TCP/TLS 커넥션을 공유한다.
+    세션은 첫 요청 시 실행 중인 이벤트 루프에서 생성되며, close()로 정리한다.
+    """
     
-    def __init__(self):
+    def __init__(
+        self,
+        pool_config: Optional[ConnectionPoolConfig] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[TokenBucket] = None,
+        concurrency: Optional[AdaptiveConcurrencyLimiter] = None
+    ):
         self.logger = logging.getLogger("specgate.confluence.client")
         self.domain = None
         self.email = None
         self.api_token = None
+        self.base_url_override = os.getenv("CONFLUENCE_BASE_URL")
+        self.pool_config = pool_config or ConnectionPoolConfig.from_env()
+        self.retry_policy = retry_policy or RetryPolicy.from_env()
+        self.rate_limiter = rate_limiter or TokenBucket.from_env()
+        self.concurrency = concurrency or AdaptiveConcurrencyLimiter.from_env()
+        self._session: Optional[aiohttp.ClientSession] = None
+        self.metrics = self._create_empty_metrics()
         self._validate_environment()
     
     def _validate_environment(self) -> bool:
@@ -53,39 +108,403 @@ class ConfluenceAPIClient:
         """Confluence 클라이언트가 올바르게 구성되었는지 확인"""
         return bool(self.domain and self.email and self.api_token)
     
-    async def search_content(self, cql: str, limit: int = 10) -> Dict[str, Any]:
-        """Confluence API로 콘텐츠 검색"""
-        url = f"https://{self.domain}/wiki/rest/api/content/search"
+    def _base_url(self) -> str:
+        """Confluence REST API 기본 URL
+        
+        CONFLUENCE_BASE_URL이 설정되어 있으면 그 값을 사용한다
+        (예: 로컬 스탠드인 서버 'http://127.0.0.1:8090/wiki').
+        """
+        if self.base_url_override:
+            return self.base_url_override.rstrip("/")
+        return f"https://{self.domain}/wiki"
+    
+    async def search_content(self, cql: str, limit: int = 10, start: int = 0, expand: str = SEARCH_EXPAND_FULL) -> Dict[str, Any]:
+        """Confluence API로 콘텐츠 검색
+        
+        expand=SEARCH_EXPAND_METADATA로 호출하면 본문 없이 id/제목/버전만 조회한다.
+        """
+        url = f"{self._base_url()}/rest/api/content/search"
         
         params = {
             "cql": cql,
             "limit": limit,
-            "expand": "body.storage,version,space,ancestors"
+            "expand": expand
         }
+        if start:
+            params["start"] = start
+        
+        return await self._get_json(url, params)
+    
+    async def stream_search_results(
+        self,
+        cql: str,
+        limit: int = 10,
+        start: int = 0,
+        expand: str = SEARCH_EXPAND_FULL,
+        envelope: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Confluence API로 콘텐츠 검색 (스트리밍)
+        
+        응답 본문 전체를 버퍼링하지 않고 results[] 항목이 완성될 때마다 하나씩 yield한다.
+        envelope 딕셔너리를 넘기면 results를 제외한 응답 필드(start, limit, size, totalSize,
+        _links)가 채워지고, 실패 시에는 "error" 키가 설정된다.
+        """
+        url = f"{self._base_url()}/rest/api/content/search"
         
-        auth = aiohttp.BasicAuth(self.email, self.api_token)
+        params = {
+            "cql": cql,
+            "limit": limit,
+            "expand": expand
+        }
+        if start:
+            params["start"] = start
+        
+        async for item in self._stream_results(url, params, envelope if envelope is not None else {}):
+            yield item
+    
+    async def get_content_by_id(self, content_id: str, expand: str = SEARCH_EXPAND_FULL) -> Dict[str, Any]:
+        """ID로 단일 콘텐츠 조회"""
+        url = f"{self._base_url()}/rest/api/content/{content_id}"
+        return await self._get_json(url, {"expand": expand})
+    
+    async def get_next_page(self, next_link: str) -> Dict[str, Any]:
+        """검색 응답의 _links.next 링크로 다음 페이지 조회"""
+        if next_link.startswith("http://") or next_link.startswith("https://"):
+            url = next_link
+        else:
+            # _links.next는 '/rest/api/...' 형태의 상대경로
+            url = f"{self._base_url()}{next_link}"
+        return await self._get_json(url)
+    
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """공유 세션 반환 (없거나 닫혔으면 커넥션 풀 설정으로 새로 생성)"""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.pool_config.limit,
+                limit_per_host=self.pool_config.limit_per_host,
+                keepalive_timeout=self.pool_config.keepalive_timeout,
+                ttl_dns_cache=self.pool_config.dns_cache_ttl
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                auth=aiohttp.BasicAuth(self.email or "", self.api_token or ""),
+                timeout=aiohttp.ClientTimeout(total=self.pool_config.request_timeout),
+                trace_configs=[self._create_trace_config()]
+            )
+            self.logger.info(
+                f"🔌 Confluence HTTP 세션 생성 (limit={self.pool_config.limit}, "
+                f"per_host={self.pool_config.limit_per_host}, keepalive={self.pool_config.keepalive_timeout}s)"
+            )
+        return self._session
+    
+    async def close(self) -> None:
+        """공유 세션과 커넥션 풀을 닫는다"""
+        session, self._session = self._session, None
+        if session is None or session.closed:
+            return
+        try:
+            await session.close()
+            self.logger.info("🔌 Confluence HTTP 세션 종료")
+        except RuntimeError as e:
+            # 세션을 만든 이벤트 루프가 이미 종료된 경우 (서버 종료 시점)
+            self.logger.warning(f"Confluence HTTP 세션 종료 중 경고: {e}")
+    
+    def _create_trace_config(self) -> aiohttp.TraceConfig:
+        """커넥션 재사용 여부를 요청별로 기록하는 TraceConfig 생성"""
+        async def on_connection_create_end(session, ctx, params):
+            if isinstance(ctx.trace_request_ctx, dict):
+                ctx.trace_request_ctx["connection"] = "new"
+        
+        async def on_connection_reuseconn(session, ctx, params):
+            if isinstance(ctx.trace_request_ctx, dict):
+                ctx.trace_request_ctx["connection"] = "reused"
+        
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_connection_create_end.append(on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(on_connection_reuseconn)
+        return trace_config
+    
+    async def _get_json(self, url: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """GET 요청을 보내고 JSON 응답을 반환 (실패 시 {"error": ...})
+        
+        429/5xx 응답과 네트워크 오류는 재시도 정책에 따라 지수 백오프로 재시도한다.
+        429 응답의 대기 시간은 공유 토큰 버킷에 반영되어 다른 동시 요청도 함께 대기한다.
+        동시 요청 수는 AdaptiveConcurrencyLimiter가 응답 지연/오류에 따라 조절한다.
+        """
+        attempt = 0
+        while True:
+            attempt += 1
+            await self.rate_limiter.acquire()
+            started_at = await self.concurrency.acquire()
+            try:
+                status, payload, headers = await self._request_once(url, params)
+            except asyncio.CancelledError:
+                self.concurrency.release(started_at)
+                raise
+            self.concurrency.release(started_at, status, time.monotonic() - started_at)
+            if status == 200:
+                return payload
+            
+            if not self.retry_policy.should_retry(status, attempt):
+                if status is None:
+                    return {"error": f"API 호출 오류: {payload}"}
+                return {"error": f"API 호출 실패: {status}"}
+            
+            await asyncio.sleep(self._retry_delay(status, headers, attempt))
+    
+    def _retry_delay(self, status: Optional[int], headers, attempt: int) -> float:
+        """재시도 전 대기 시간 계산 (429이면 공유 토큰 버킷도 일시 중지)"""
+        delay = self.retry_policy.compute_delay(attempt, headers)
+        if status == 429:
+            self.metrics["throttled"] += 1
+            self.rate_limiter.pause(delay)
+        self.metrics["retries"] += 1
+        self.logger.warning(
+            f"🔁 Confluence API 재시도 {attempt}/{self.retry_policy.max_attempts - 1} - "
+            f"status={status or 'network_error'}, {delay:.2f}초 후"
+        )
+        return delay
+    
+    async def _request_once(self, url: str, params: Optional[Dict[str, Any]]):
+        """단일 GET 요청 (status, JSON 또는 오류 메시지, 응답 헤더) 반환. 네트워크 오류 시 status=None"""
+        request_ctx = {"connection": "unknown"}
+        t0 = time.perf_counter()
+        status = None
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, params=params, auth=auth) as response:
+            session = await self._get_session()
+            async with session.get(url, params=params, trace_request_ctx=request_ctx) as response:
+                status = response.status
+                if response.status == 200:
+                    data = await response.json()
+                    self.logger.info(f"✅ Confluence API 호출 성공: {len(data.get('results', []))}개 문서")
+                    return status, data, response.headers
+                else:
+                    error_text = await response.text()
+                    self.logger.error(f"❌ Confluence API 호출 실패: {response.status} - {error_text[:500]}")
+                    return status, error_text, response.headers
+        except Exception as e:
+            self.logger.error(f"❌ Confluence API 호출 중 오류: {str(e)}")
+            return None, str(e), {}
+        finally:
+            self._record_request(status, request_ctx["connection"], time.perf_counter() - t0)
+    
+    async def _stream_results(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        envelope: Dict[str, Any]
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """GET 요청의 응답 본문을 청크 단위로 읽으며 results[] 항목을 하나씩 yield
+        
+        재시도 정책은 _get_json과 같지만, 이미 항목을 전달한 뒤 발생한 오류는
+        중복 전달을 막기 위해 재시도하지 않고 envelope["error"]로 알린다.
+        """
+        attempt = 0
+        while True:
+            attempt += 1
+            await self.rate_limiter.acquire()
+            started_at = await self.concurrency.acquire()
+            request_ctx = {"connection": "unknown"}
+            t0 = time.perf_counter()
+            status, headers, error, elapsed = None, {}, None, None
+            yielded = 0
+            finished = False
+            
+            try:
+                session = await self._get_session()
+                async with session.get(url, params=params, trace_request_ctx=request_ctx) as response:
+                    status = response.status
+                    headers = response.headers
+                    # 동시성 조절은 헤더 수신까지의 지연으로 판단 (본문 소비 속도와 무관)
+                    elapsed = time.perf_counter() - t0
                     if response.status == 200:
-                        data = await response.json()
-                        self.logger.info(f"✅ Confluence API 호출 성공: {len(data.get('results', []))}개 문서")
-                        return data
+                        decoder = SearchResultsStreamDecoder()
+                        async for chunk in response.content.iter_chunked(STREAM_CHUNK_SIZE):
+                            for item in decoder.feed(chunk):
+                                yielded += 1
+                                yield item
+                        envelope.update(decoder.close())
+                        self.logger.info(
+                            f"✅ Confluence API 스트리밍 조회 성공: {yielded}개 문서 "
+                            f"(최대 항목 {decoder.max_item_chars}자)"
+                        )
                     else:
                         error_text = await response.text()
-                        self.logger.error(f"❌ Confluence API 호출 실패: {response.status} - {error_text}")
-                        return {"error": f"API 호출 실패: {response.status}"}
-        except Exception as e:
-            self.logger.error(f"❌ Confluence API 호출 중 오류: {str(e)}")
-            return {"error": f"API 호출 오류: {str(e)}"}
+                        error = f"API 호출 실패: {response.status}"
+                        self.logger.error(f"❌ Confluence API 호출 실패: {response.status} - {error_text[:500]}")
+                finished = True
+            except Exception as e:
+                self.logger.error(f"❌ Confluence API 스트리밍 조회 중 오류: {str(e)}")
+                error = f"API 호출 오류: {str(e)}"
+                status = None
+                elapsed = time.perf_counter() - t0
+                finished = True
+            finally:
+                self._record_request(status, request_ctx["connection"], time.perf_counter() - t0)
+                # 소비자가 중간에 멈춘 경우(finished=False)에는 윈도우를 조정하지 않는다
+                self.concurrency.release(started_at, status, elapsed if finished else None)
+            
+            if error is None:
+                return
+            if yielded or not self.retry_policy.should_retry(status, attempt):
+                envelope["error"] = error
+                return
+            await asyncio.sleep(self._retry_delay(status, headers, attempt))
+    
+    def _create_empty_metrics(self) -> Dict[str, Any]:
+        """요청 타이밍 메트릭 초기값"""
+        return {
+            "requests": 0,
+            "failed_requests": 0,
+            "retries": 0,
+            "throttled": 0,
+            "connections_new": 0,
+            "connections_reused": 0,
+            "elapsed_new_total": 0.0,
+            "elapsed_reused_total": 0.0,
+            "last_request": None
+        }
+    
+    def _record_request(self, status: Optional[int], connection: str, elapsed: float) -> None:
+        """요청 1건의 타이밍/커넥션 재사용 여부를 메트릭에 반영"""
+        self.metrics["requests"] += 1
+        if status != 200:
+            self.metrics["failed_requests"] += 1
+        if connection in ("new", "reused"):
+            self.metrics[f"connections_{connection}"] += 1
+            self.metrics[f"elapsed_{connection}_total"] += elapsed
+        self.metrics["last_request"] = {"status": status, "connection": connection, "elapsed": round(elapsed, 4)}
+        self.logger.info(
+            "Confluence API | status=%s | connection=%s | elapsed=%.3fs",
+            status, connection, elapsed
+        )
     
-    def generate_cql_query(self, label: str, space_key: Optional[str] = None) -> str:
-        """CQL 쿼리 생성"""
+    def get_metrics(self) -> Dict[str, Any]:
+        """요청 타이밍 메트릭 조회 (신규/재사용 커넥션별 평균 응답 시간 포함)"""
+        metrics = dict(self.metrics)
+        for kind in ("new", "reused"):
+            count = metrics[f"connections_{kind}"]
+            metrics[f"avg_elapsed_{kind}"] = round(metrics[f"elapsed_{kind}_total"] / count, 4) if count else None
+        total = metrics["connections_new"] + metrics["connections_reused"]
+        metrics["connection_reuse_ratio"] = round(metrics["connections_reused"] / total, 3) if total else 0.0
+        metrics["concurrency"] = self.concurrency.get_metrics()
+        return metrics
+    
+    async def iter_search_pages(
+        self,
+        cql: str,
+        page_size: int = 25,
+        max_results: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+        expand: str = SEARCH_EXPAND_FULL
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """검색 결과 전체를 페이지 단위로 순회 (도착 순서대로 yield)
+        
+        첫 페이지 응답에 totalSize가 있으면 나머지 start 오프셋을 계산해
+        최대 max_concurrency개까지 동시에 요청한다 (실제 동시 요청 수는
+        AdaptiveConcurrencyLimiter가 그 범위 안에서 조절). totalSize가 없으면
+        _links.next를 따라 순차적으로 조회한다.
+        
+        Args:
+            cql: CQL 쿼리
+            page_size: 요청당 문서 수 (limit)
+            max_results: 최대 수집 문서 수 (None이면 전체)
+            max_concurrency: 동시에 진행할 최대 요청 수 (None이면 컨트롤러의 max_limit)
+            expand: 검색 응답 확장 필드
+        
+        Yields:
+            Dict[str, Any]: 페이지 단위 Confluence 검색 응답 (실패 시 {"error": ...})
+        """
+        first_page = await self.search_content(cql, page_size, expand=expand)
+        yield first_page
+        if "error" in first_page:
+            return
+        
+        fetched = len(first_page.get("results", []))
+        total_size = first_page.get("totalSize")
+        if max_results is not None and fetched >= max_results:
+            return
+        
+        if isinstance(total_size, int):
+            # 서버가 limit을 줄여서 응답할 수 있으므로 실제 limit 기준으로 오프셋 계산
+            step = first_page.get("limit") or fetched or page_size
+            end = total_size if max_results is None else min(total_size, max_results)
+            offsets = list(range(step, end, step))
+            window = max(1, max_concurrency or self.concurrency.max_limit)
+            self.logger.info(f"📚 페이지 병렬 수집: 총 {total_size}개, 추가 요청 {len(offsets)}건 (동시 최대 {window})")
+            
+            pending = set()
+            offset_iter = iter(offsets)
+            
+            def _schedule() -> bool:
+                start = next(offset_iter, None)
+                if start is None:
+                    return False
+                pending.add(asyncio.ensure_future(self.search_content(cql, step, start, expand)))
+                return True
+            
+            try:
+                while len(pending) < window and _schedule():
+                    pass
+                while pending:
+                    done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        yield task.result()
+                        _schedule()
+            finally:
+                # 소비자가 중간에 순회를 멈춘 경우 남은 요청 취소
+                for task in pending:
+                    task.cancel()
+            return
+        
+        # totalSize가 없으면 next 링크를 순차적으로 따라간다
+        page = first_page
+        while True:
+            next_link = page.get("_links", {}).get("next")
+            if not next_link:
+                return
+            if max_results is not None and fetched >= max_results:
+                return
+            page = await self.get_next_page(next_link)
+            yield page
+            if "error" in page:
+                return
+            fetched += len(page.get("results", []))
+    
+    def generate_cql_query(self, label: str, space_key: Optional[str] = None, modified_since: Optional[str] = None) -> str:
+        """CQL 쿼리 생성
+        
+        Args:
+            label: 검색할 라벨
+            space_key: 스페이스 키 (선택사항)
+            modified_since: 이 시점 이후 수정된 페이지만 조회 (선택사항)
+                - 'now("-90m")' 같은 CQL 함수식은 그대로 사용
+                - 'YYYY-MM-DD' 또는 'YYYY-MM-DD HH:MM' 형식 날짜는 CQL 날짜로 변환
+        """
         if space_key:
             cql = f'label = "{label}" AND space = "{space_key}"'
         else:
             cql = f'label = "{label}"'
         
+        if modified_since:
+            cql += f' AND lastmodified >= {self._format_cql_date(modified_since)}'
+        
         self.logger.info(f"🔍 생성된 CQL 쿼리: {cql}")
         return cql
+    
+    def _format_cql_date(self, value: str) -> str:
+        """since 값을 CQL 날짜 표현식으로 변환"""
+        value = value.strip()
+        if value.startswith(("now(", "startOf", "endOf")):
+            return value
+        
+        try:
+            parsed = datetime.fromisoformat(value)
+        except ValueError:
+            raise ValueError(f"지원하지 않는 since 형식입니다: {value} (예: 2025-01-31, 2025-01-31 09:00)")
+        
+        # 날짜만 주어지면 날짜 형식, 시각이 있으면 분 단위까지 사용
+        if len(value) <= 10:
+            return f'"{parsed.strftime("%Y/%m/%d")}"'
+        return f'"{parsed.strftime("%Y/%m/%d %H:%M")}"'
@@ -0,0 +1,173 @@
+"""
+Confluence 요청 동시성 자동 조절
+응답 지연과 오류율을 관찰하여 동시 요청 수(윈도우)를 AIMD 방식으로
+늘리고 줄이는 컨트롤러를 제공하는 모듈
+"""
+import os
+import time
+import asyncio
+import logging
+from collections import deque
+from typing import Dict, Any, Optional
+
+
+# 윈도우 조정 결정 사유
+DECISION_INCREASE = "increase"
+DECISION_THROTTLED = "throttled"
+DECISION_SERVER_ERROR = "server_error"
+DECISION_LATENCY = "latency"
+
+
+class AdaptiveConcurrencyLimiter:
+    """AIMD(가산 증가/승산 감소) 동시성 컨트롤러
+
+    - 정상 응답: 윈도우를 절반 이상 사용 중일 때 성공하면 윈도우를 1/윈도우씩 늘린다
+      (윈도우를 쓰지 않는 상태에서 한도만 계속 올라가는 것을 방지).
+    - 429, 5xx, 네트워크 오류, 지연 급증: 윈도우에 decrease_factor를 곱해 줄인다.
+      같은 혼잡 구간에서 여러 번 줄이지 않도록, 마지막 감소 이후 시작된 요청의
+      결과에만 반응한다.
+
+    지연 급증은 정상 응답 지연의 이동 최소값(baseline)에 latency_tolerance를
+    곱한 값을 넘고, 그 차이가 latency_floor(초) 이상인 경우로 판단한다.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 16,
+        decrease_factor: float = 0.5,
+        latency_tolerance: float = 2.0,
+        latency_floor: float = 0.25,
+        history_size: int = 20
+    ):
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        self.limit = float(min(max(initial_limit, self.min_limit), self.max_limit))
+        self.decrease_factor = decrease_factor
+        self.latency_tolerance = latency_tolerance
+        self.latency_floor = latency_floor
+        self.logger = logging.getLogger("specgate.confluence.concurrency")
+        self.in_flight = 0
+        self.baseline_latency: Optional[float] = None
+        self.decisions: deque = deque(maxlen=history_size)
+        self.counts = {DECISION_INCREASE: 0, DECISION_THROTTLED: 0, DECISION_SERVER_ERROR: 0, DECISION_LATENCY: 0}
+        self.peak_limit = int(self.limit)
+        self._last_decrease_at = 0.0
+        self._waiters: deque = deque()
+
+    @classmethod
+    def from_env(cls) -> "AdaptiveConcurrencyLimiter":
+        """환경변수(CONFLUENCE_CONCURRENCY_*)에서 설정을 읽는다. 미설정 항목은 기본값 사용"""
+        return cls(
+            initial_limit=int(os.getenv("CONFLUENCE_CONCURRENCY_INITIAL", 4)),
+            min_limit=int(os.getenv("CONFLUENCE_CONCURRENCY_MIN", 1)),
+            max_limit=int(os.getenv("CONFLUENCE_CONCURRENCY_MAX", 16)),
+            latency_tolerance=float(os.getenv("CONFLUENCE_CONCURRENCY_LATENCY_TOLERANCE", 2.0))
+        )
+
+    @property
+    def window(self) -> int:
+        """현재 허용되는 동시 요청 수"""
+        return max(self.min_limit, int(self.limit))
+
+    async def acquire(self) -> float:
+        """윈도우에 자리가 날 때까지 대기 후 슬롯을 점유하고, 요청 시작 시각을 반환"""
+        while self.in_flight >= self.window:
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+                elif waiter.done() and not waiter.cancelled():
+                    # 깨워진 직후 취소되었으면 받은 자리를 다음 대기자에게 넘긴다
+                    self._wake_waiters()
+                raise
+        self.in_flight += 1
+        return time.monotonic()
+
+    def release(self, started_at: float, status: Optional[int] = None, elapsed: Optional[float] = None) -> None:
+        """슬롯을 반납하고 요청 결과로 윈도우를 조정
+
+        elapsed가 None이면(요청이 취소된 경우 등) 슬롯만 반납하고 윈도우는 조정하지 않는다.
+        status가 None이면 네트워크 오류로 본다.
+        """
+        if elapsed is not None:
+            self._on_result(started_at, status, elapsed, saturated=self.in_flight * 2 >= self.window)
+        self.in_flight -= 1
+        self._wake_waiters()
+
+    def _wake_waiters(self) -> None:
+        available = self.window - self.in_flight
+        while available > 0 and self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                available -= 1
+
+    def _on_result(self, started_at: float, status: Optional[int], elapsed: float, saturated: bool) -> None:
+        if status == 429:
+            self._decrease(started_at, DECISION_THROTTLED)
+        elif status is None or status >= 500:
+            self._decrease(started_at, DECISION_SERVER_ERROR)
+        elif status < 400:
+            if self._is_latency_spike(elapsed):
+                self._decrease(started_at, DECISION_LATENCY, elapsed)
+                return
+            self._update_baseline(elapsed)
+            if saturated:
+                self._increase()
+
+    def _is_latency_spike(self, elapsed: float) -> bool:
+        if self.baseline_latency is None:
+            return False
+        return (elapsed > self.baseline_latency * self.latency_tolerance
+                and elapsed - self.baseline_latency >= self.latency_floor)
+
+    def _update_baseline(self, elapsed: float) -> None:
+        # 더 빠른 응답은 즉시 반영하고, 느린 응답은 천천히 반영 (이동 최소값)
+        if self.baseline_latency is None or elapsed < self.baseline_latency:
+            self.baseline_latency = elapsed
+        else:
+            self.baseline_latency += (elapsed - self.baseline_latency) * 0.05
+
+    def _increase(self) -> None:
+        if self.limit >= self.max_limit:
+            return
+        before = self.window
+        self.limit = min(float(self.max_limit), self.limit + 1.0 / self.limit)
+        if self.window > before:
+            self.peak_limit = max(self.peak_limit, self.window)
+            self._record(DECISION_INCREASE, before)
+            self._wake_waiters()
+
+    def _decrease(self, started_at: float, reason: str, elapsed: Optional[float] = None) -> None:
+        if started_at < self._last_decrease_at:
+            return
+        before = self.window
+        self.limit = max(float(self.min_limit), self.limit * self.decrease_factor)
+        self._last_decrease_at = time.monotonic()
+        self._record(reason, before, elapsed)
+        self.logger.warning(f"📉 Confluence 동시 요청 축소: {before} → {self.window} ({reason})")
+
+    def _record(self, action: str, before: int, elapsed: Optional[float] = None) -> None:
+        self.counts[action] += 1
+        decision = {"action": action, "from": before, "to": self.window, "at": time.time()}
+        if elapsed is not None:
+            decision["elapsed"] = round(elapsed, 4)
+        self.decisions.append(decision)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """현재 윈도우와 조정 결정 내역"""
+        return {
+            "window": self.window,
+            "in_flight": self.in_flight,
+            "min_limit": self.min_limit,
+            "max_limit": self.max_limit,
+            "peak_window": self.peak_limit,
+            "baseline_latency": round(self.baseline_latency, 4) if self.baseline_latency is not None else None,
+            "decisions": dict(self.counts),
+            "recent_decisions": list(self.decisions)
+        }
@@ -0,0 +1,167 @@
+"""
+Confluence 동기화 매니페스트
+페이지별로 마지막으로 처리한 버전과 콘텐츠 해시를 기록하여
+변경되지 않은 페이지를 파이프라인에서 건너뛸 수 있도록 하는 모듈
+"""
+import os
+import json
+import hashlib
+import logging
+from datetime import datetime, timezone
+from typing import Dict, Any, Optional
+
+
+MANIFEST_FILENAME = "sync_manifest.json"
+MANIFEST_FORMAT_VERSION = 1
+
+SYNC_NEW = "new"
+SYNC_CHANGED = "changed"
+SYNC_UNCHANGED = "unchanged"
+
+# 델타 조회 시 워터마크보다 이만큼 앞선 시점부터 조회 (시계 오차/처리 지연 대비)
+DEFAULT_DELTA_OVERLAP_MINUTES = 10
+
+
+class SyncManifest:
+    """페이지 ID → 마지막 처리 버전/콘텐츠 해시 매핑을 저장하는 매니페스트
+
+    파일 형식:
+        {
+            "format_version": 1,
+            "pages": {
+                "<page_id>": {"version": int, "content_hash": str, "title": str, ...}
+            },
+            "watermarks": {
+                "<label>|<space_key>": "<마지막 성공 실행 시작 시각 (UTC ISO)>"
+            }
+        }
+    """
+
+    def __init__(self, path: str, data: Optional[Dict[str, Any]] = None):
+        self.path = path
+        self.logger = logging.getLogger("specgate.confluence.manifest")
+        data = data or {}
+        self.pages: Dict[str, Dict[str, Any]] = data.get("pages", {})
+        self.watermarks: Dict[str, str] = data.get("watermarks", {})
+        self._dirty = False
+
+    @classmethod
+    def load(cls, path: str) -> "SyncManifest":
+        """매니페스트 파일 로드 (없거나 손상되었으면 빈 매니페스트)"""
+        logger = logging.getLogger("specgate.confluence.manifest")
+        if not os.path.exists(path):
+            return cls(path)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            logger.info(f"동기화 매니페스트 로드: {path} ({len(data.get('pages', {}))}개 페이지)")
+            return cls(path, data)
+        except Exception as e:
+            logger.warning(f"동기화 매니페스트 로드 실패, 새로 시작합니다: {path} ({e})")
+            return cls(path)
+
+    @staticmethod
+    def content_hash(html_content: Optional[str]) -> str:
+        """HTML 원본의 콘텐츠 해시 (sha256)"""
+        return hashlib.sha256((html_content or "").encode("utf-8")).hexdigest()
+
+    def get(self, page_id: str) -> Optional[Dict[str, Any]]:
+        """페이지의 마지막 처리 기록 조회"""
+        return self.pages.get(str(page_id)) if page_id else None
+
+    def classify(self, document: Dict[str, Any]) -> str:
+        """문서의 동기화 상태 판정 ("new", "changed", "unchanged")
+
+        버전이 같으면 변경되지 않은 것으로 본다. 단, 본문이 있는 경우
+        콘텐츠 해시까지 비교하여 버전 번호 없이 수정된 경우도 감지한다.
+        """
+        entry = self.get(document.get("id"))
+        if entry is None:
+            return SYNC_NEW
+        if entry.get("version") != document.get("version"):
+            return SYNC_CHANGED
+        html_content = document.get("html_content")
+        if html_content and entry.get("content_hash") != self.content_hash(html_content):
+            return SYNC_CHANGED
+        return SYNC_UNCHANGED
+
+    def record(self, document: Dict[str, Any], **extra: Any) -> None:
+        """문서 처리 완료 기록 (extra: markdown_file, score 등 부가 정보)"""
+        page_id = document.get("id")
+        if not page_id:
+            return
+        entry = {
+            "version": document.get("version"),
+            "content_hash": self.content_hash(document.get("html_content")),
+            "title": document.get("title", ""),
+            "modified": document.get("modified", ""),
+            "processed_at": datetime.now().isoformat()
+        }
+        entry.update({k: v for k, v in extra.items() if v is not None})
+        self.pages[str(page_id)] = entry
+        self._dirty = True
+
+    @staticmethod
+    def _watermark_key(label: str, space_key: Optional[str]) -> str:
+        return f"{label}|{space_key or '*'}"
+
+    def get_watermark(self, label: str, space_key: Optional[str] = None) -> Optional[datetime]:
+        """(라벨, 스페이스)의 마지막 성공 실행 시작 시각 조회"""
+        value = self.watermarks.get(self._watermark_key(label, space_key))
+        if not value:
+            return None
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            self.logger.warning(f"잘못된 워터마크 형식 무시: {value}")
+            return None
+
+    def set_watermark(self, label: str, space_key: Optional[str], started_at: datetime) -> None:
+        """성공한 실행의 시작 시각을 워터마크로 기록 (기존 값보다 이후일 때만)"""
+        if started_at.tzinfo is None:
+            started_at = started_at.astimezone(timezone.utc)
+        current = self.get_watermark(label, space_key)
+        if current is not None and current >= started_at:
+            return
+        self.watermarks[self._watermark_key(label, space_key)] = started_at.astimezone(timezone.utc).isoformat()
+        self._dirty = True
+
+    def delta_since(
+        self,
+        label: str,
+        space_key: Optional[str] = None,
+        overlap_minutes: int = DEFAULT_DELTA_OVERLAP_MINUTES,
+        now: Optional[datetime] = None
+    ) -> Optional[str]:
+        """워터마크 기준 CQL 상대 날짜 표현식 (예: 'now("-90m")'), 워터마크가 없으면 None
+
+        CQL의 절대 날짜는 Confluence 사용자 시간대로 해석되므로,
+        시간대에 영향을 받지 않는 now() 기준 상대 시간으로 변환한다.
+        """
+        watermark = self.get_watermark(label, space_key)
+        if watermark is None:
+            return None
+        now = now or datetime.now(timezone.utc)
+        elapsed_minutes = int((now - watermark).total_seconds() // 60) + 1
+        return f'now("-{max(elapsed_minutes, 0) + overlap_minutes}m")'
+
+    def save(self) -> bool:
+        """변경 사항이 있으면 매니페스트 저장 (임시 파일 작성 후 교체)"""
+        if not self._dirty:
+            return False
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.path)
+        self._dirty = False
+        self.logger.info(f"동기화 매니페스트 저장: {self.path} ({len(self.pages)}개 페이지)")
+        return True
+
+    def to_dict(self) -> Dict[str, Any]:
+        """직렬화용 딕셔너리"""
+        return {
+            "format_version": MANIFEST_FORMAT_VERSION,
+            "pages": self.pages,
+            "watermarks": self.watermarks
+        }
@@ -0,0 +1,152 @@
+"""
+Confluence API 호출 제한 대응
+재시도 정책(지수 백오프 + 지터, Retry-After 준수)과
+동시 요청 전체가 공유하는 토큰 버킷 리미터를 제공하는 모듈
+"""
+import os
+import time
+import random
+import asyncio
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Mapping, Optional, Tuple
+
+
+@dataclass
+class RetryPolicy:
+    """재시도 정책
+
+    지연 시간은 full jitter 지수 백오프(0 ~ base_delay * 2^(attempt-1), 최대 max_delay)로
+    계산하며, 서버가 Retry-After 등으로 대기 시간을 알려주면 그 값 이상 기다린다.
+    """
+    max_attempts: int = 5
+    base_delay: float = 0.5
+    max_delay: float = 30.0
+    max_retry_after: float = 300.0  # 서버가 요구한 대기 시간의 상한(초)
+    retry_statuses: Tuple[int, ...] = (429, 500, 502, 503, 504)
+
+    @classmethod
+    def from_env(cls) -> "RetryPolicy":
+        """환경변수(CONFLUENCE_RETRY_*)에서 설정을 읽는다. 미설정 항목은 기본값 사용"""
+        defaults = cls()
+        return cls(
+            max_attempts=int(os.getenv("CONFLUENCE_RETRY_MAX_ATTEMPTS", defaults.max_attempts)),
+            base_delay=float(os.getenv("CONFLUENCE_RETRY_BASE_DELAY", defaults.base_delay)),
+            max_delay=float(os.getenv("CONFLUENCE_RETRY_MAX_DELAY", defaults.max_delay))
+        )
+
+    def should_retry(self, status: Optional[int], attempt: int) -> bool:
+        """재시도 여부 (status가 None이면 네트워크 오류)"""
+        if attempt >= self.max_attempts:
+            return False
+        return status is None or status in self.retry_statuses
+
+    def compute_delay(self, attempt: int, headers: Optional[Mapping[str, str]] = None) -> float:
+        """attempt번째 시도 실패 후 대기할 시간(초)"""
+        backoff = random.uniform(0, min(self.max_delay, self.base_delay * (2 ** (attempt - 1))))
+        hinted = parse_retry_after(headers) if headers else None
+        if hinted is None:
+            return backoff
+        # 서버 지정 시간은 반드시 지키되, 동시에 깨어나지 않도록 약간의 지터를 더한다
+        return min(hinted, self.max_retry_after) + random.uniform(0, self.base_delay)
+
+
+def parse_retry_after(headers: Mapping[str, str], now: Optional[datetime] = None) -> Optional[float]:
+    """응답 헤더에서 서버가 요구한 대기 시간(초)을 추출
+
+    지원 헤더:
+        - Retry-After: 초 또는 HTTP-date
+        - Beta-Retry-After: 초 (Atlassian)
+        - X-RateLimit-Reset: 제한이 풀리는 ISO-8601 시각 (Atlassian)
+    """
+    now = now or datetime.now(timezone.utc)
+
+    for name in ("Retry-After", "Beta-Retry-After"):
+        value = headers.get(name)
+        if not value:
+            continue
+        value = value.strip()
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, (parsedate_to_datetime(value) - now).total_seconds())
+        except (TypeError, ValueError):
+            continue
+
+    reset = headers.get("X-RateLimit-Reset")
+    if reset:
+        try:
+            reset_at = datetime.fromisoformat(reset.strip().replace("Z", "+00:00"))
+            if reset_at.tzinfo is None:
+                reset_at = reset_at.replace(tzinfo=timezone.utc)
+            return max(0.0, (reset_at - now).total_seconds())
+        except ValueError:
+            pass
+
+    return None
+
+
+class TokenBucket:
+    """동시 요청 전체가 공유하는 토큰 버킷 리미터
+
+    초당 rate개의 토큰이 최대 capacity개까지 채워지며, 요청마다 토큰 1개를 소모한다.
+    429 응답 등으로 pause()가 호출되면 지정 시간 동안 모든 요청이 대기하여
+    재시도 폭주를 막는다.
+    """
+
+    def __init__(self, rate: float = 10.0, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self.tokens = self.capacity
+        self.logger = logging.getLogger("specgate.confluence.ratelimit")
+        self._updated_at = time.monotonic()
+        self._paused_until = 0.0
+        self._lock: Optional[asyncio.Lock] = None
+
+    @classmethod
+    def from_env(cls) -> "TokenBucket":
+        """환경변수(CONFLUENCE_RATE_LIMIT, CONFLUENCE_RATE_BURST)에서 설정을 읽는다"""
+        rate = float(os.getenv("CONFLUENCE_RATE_LIMIT", 10.0))
+        burst = os.getenv("CONFLUENCE_RATE_BURST")
+        return cls(rate=rate, capacity=float(burst) if burst else None)
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated_at
+        self._updated_at = now
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+
+    async def acquire(self) -> float:
+        """토큰 1개를 얻을 때까지 대기하고, 대기한 시간(초)을 반환"""
+        if self.rate <= 0:
+            return 0.0
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        started_at = time.monotonic()
+        # 락을 잡은 요청부터 순서대로 토큰을 받는다 (FIFO)
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    delay = self._paused_until - now
+                else:
+                    self._refill(now)
+                    if self.tokens >= 1:
+                        self.tokens -= 1
+                        return now - started_at
+                    delay = (1 - self.tokens) / self.rate
+                await asyncio.sleep(delay)
+
+    def pause(self, seconds: float) -> None:
+        """seconds 동안 모든 요청의 토큰 발급을 멈춘다"""
+        until = time.monotonic() + seconds
+        if until > self._paused_until:
+            self._paused_until = until
+            # 일시 중지가 끝난 시점부터 토큰을 다시 채운다
+            self.tokens = 0.0
+            self._updated_at = until
+            self.logger.warning(f"⏳ Confluence 호출 제한 - {seconds:.1f}초 동안 요청 일시 중지")
@@ -2,12 +2,19 @@
 Confluence 서비스
 Confluence 통합 기능을 제공하는 메인 서비스 클래스
 """
+import asyncio
 import logging
+from contextlib import aclosing
 from datetime import datetime
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, AsyncIterator, Awaitable, Callable
 
-from .client import ConfluenceAPIClient
+from .client import ConfluenceAPIClient, SEARCH_EXPAND_FULL, SEARCH_EXPAND_METADATA
 from .transformer import ConfluenceDataTransformer
+from .manifest import SyncManifest, SYNC_UNCHANGED
+
+
+# 스트리밍 조회에서 stream_handler에 한 번에 넘기는 문서 수
+STREAM_BATCH_SIZE = 16
 
 
 class ConfluenceService:
@@ -24,32 +31,114 @@ class ConfluenceService:
         space_key: Optional[str] = None, 
         limit: int = 10,
         save_html: bool = True,
-        output_dir: Optional[str] = None
+        output_dir: Optional[str] = None,
+        crawl: bool = False,
+        max_results: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+        manifest: Optional[SyncManifest] = None,
+        modified_since: Optional[str] = None,
+        two_phase: bool = False,
+        body_filter: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        stream: bool = False,
+        stream_handler: Optional[Callable[[List[Dict[str, Any]]], Awaitable[None]]] = None,
+        stream_batch_size: int = STREAM_BATCH_SIZE
     ) -> Dict[str, Any]:
-        """라벨 기준으로 문서 수집"""
+        """라벨 기준으로 문서 수집
+        
+        crawl=True이면 limit을 페이지 크기로 사용하여 모든 페이지를 수집한다
+        (max_results로 전체 수집 수 제한 가능).
+        manifest가 주어지면 각 문서에 sync_status를 표시하고,
+        변경되지 않은(unchanged) 문서는 HTML 원본을 다시 저장하지 않는다.
+        modified_since가 주어지면 그 이후 수정된 페이지만 조회한다 (델타 조회).
+        two_phase=True이면 먼저 본문 없이 메타데이터만 검색한 뒤, 매니페스트 기준
+        변경되었거나 body_filter를 통과한 페이지만 본문을 개별 조회한다.
+        stream=True이면 (crawl이 아닐 때) 검색 응답을 스트리밍으로 디코딩하여
+        results[] 항목이 완성되는 대로 변환한다.
+        반환 문서의 content(Markdown)는 비어 있으며(None), 파이프라인이 변환 방식을 고를 수 있도록
+        transformer.ensure_markdown() / ensure_markdown_batch()를 호출할 때 채워진다.
+        stream_handler를 함께 넘기면 디코딩된 문서를 stream_batch_size개씩 본문 조회(2단계),
+        동기화 판정, HTML 저장까지 마친 뒤 바로 핸들러에 넘기고, 핸들러가 끝난 문서에서는
+        본문(html_content, content)을 비운다. 메모리에는 응답 전체가 아니라 묶음 하나만 남는다.
+        핸들러가 실행되는 동안에는 응답 읽기가 멈추므로, 처리 시간이 요청 타임아웃을 넘으면
+        스트림이 중단되고 metadata["stream"]["error"]로 알린다.
+        """
         self.logger.info(f"Confluence 문서 수집 시작 - 라벨: {label}, 스페이스: {space_key}")
         
         try:
             # 1단계: CQL 쿼리 생성
-            cql_query = self.client.generate_cql_query(label, space_key)
+            cql_query = self.client.generate_cql_query(label, space_key, modified_since)
             self.logger.info(f"CQL 쿼리: {cql_query}")
             
-            # 2단계: Confluence API 호출
-            self.logger.info("Confluence API 호출 중...")
-            confluence_response = await self.client.search_content(cql_query, limit)
+            # 본문 조회, 동기화 판정, HTML 저장 결과 (묶음 단위로 처리해도 합산)
+            prepared = {"html_files": []}
+            if two_phase:
+                prepared["two_phase"] = {"metadata_only": 0, "bodies_fetched": 0, "body_errors": []}
+            if manifest is not None:
+                prepared["sync"] = {"new": 0, "changed": 0, "unchanged": 0, "manifest_path": manifest.path}
             
-            # 3단계: SpecGate 형식으로 변환
-            self.logger.info("SpecGate 형식으로 변환 중...")
-            specgate_documents = self.transformer.transform_batch_to_specgate_format(confluence_response)
+            async def prepare(documents: List[Dict[str, Any]]) -> None:
+                await self._prepare_documents(
+                    documents, prepared, label, output_dir, save_html, manifest, two_phase, body_filter, max_concurrency
+                )
             
-            # 4단계: HTML 원본 저장 (새로 추가)
-            html_files = []
-            if save_html:
-                html_files = await self._save_html_files(specgate_documents, label, output_dir)
+            # 2단계: Confluence API 호출 + 3단계: SpecGate 형식으로 변환
+            expand = SEARCH_EXPAND_METADATA if two_phase else SEARCH_EXPAND_FULL
+            handled = False
+            if crawl:
+                self.logger.info("Confluence 전체 페이지 수집 중...")
+                specgate_documents = []
+                crawl_stats = {"pages_fetched": 0, "errors": []}
+                async for doc in self._iter_crawled_documents(cql_query, limit, max_results, max_concurrency, crawl_stats, expand):
+                    specgate_documents.append(doc)
+                confluence_response = crawl_stats.pop("envelope", {"results": []})
+            elif stream:
+                self.logger.info("Confluence API 스트리밍 조회 중...")
+                confluence_response = {}
+                documents = self._stream_documents(cql_query, limit, expand, confluence_response)
+                if stream_handler is None:
+                    specgate_documents = [doc async for doc in documents]
+                else:
+                    specgate_documents = await self._stream_to_handler(
+                        documents, prepare, stream_handler, stream_batch_size
+                    )
+                    handled = True
+            else:
+                self.logger.info("Confluence API 호출 중...")
+                confluence_response = await self.client.search_content(cql_query, limit, expand=expand)
+                
+                self.logger.info("SpecGate 형식으로 변환 중...")
+                specgate_documents = self.transformer.transform_batch_to_specgate_format(confluence_response)
+            
+            # 2단계 조회(필요한 페이지만 본문 조회), 동기화 상태 판정, 4단계: HTML 원본 저장
+            if not handled:
+                await prepare(specgate_documents)
+            html_files = prepared["html_files"]
             
             # 5단계: 메타데이터 생성
             metadata = self._create_metadata(label, space_key, cql_query, confluence_response)
             metadata["html_files"] = html_files  # HTML 파일 경로 추가
+            metadata["http_metrics"] = self.client.get_metrics()
+            if "sync" in prepared:
+                metadata["sync"] = prepared["sync"]
+            if modified_since:
+                metadata["modified_since"] = modified_since
+            if "two_phase" in prepared:
+                metadata["two_phase"] = prepared["two_phase"]
+            if stream and not crawl:
+                metadata["total_count"] = len(specgate_documents)
+                metadata["stream"] = {"error": confluence_response.get("error")}
+                if handled:
+                    metadata["stream"]["handled"] = True
+            if crawl:
+                metadata["total_count"] = len(specgate_documents)
+                metadata["has_more"] = (metadata.get("total_size") or 0) > len(specgate_documents)
+                metadata["crawl"] = {
+                    "page_size": limit,
+                    "max_results": max_results,
+                    "max_concurrency": max_concurrency or self.client.concurrency.max_limit,
+                    "pages_fetched": crawl_stats["pages_fetched"],
+                    "errors": crawl_stats["errors"]
+                }
             
             result = {
                 "status": "success",
@@ -66,6 +155,194 @@ class ConfluenceService:
             self.logger.error(f"Confluence 문서 수집 실패: {str(e)}")
             return self._create_error_result(str(e), label, space_key)
     
+    async def iter_documents(
+        self,
+        label: str,
+        space_key: Optional[str] = None,
+        page_size: int = 25,
+        max_results: Optional[int] = None,
+        max_concurrency: Optional[int] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """라벨 기준 전체 페이지를 수집하며 변환된 문서를 도착 순서대로 yield (content는 ensure_markdown()으로 채움)"""
+        cql_query = self.client.generate_cql_query(label, space_key)
+        async for doc in self._iter_crawled_documents(cql_query, page_size, max_results, max_concurrency):
+            yield doc
+    
+    async def stream_documents(
+        self,
+        label: str,
+        space_key: Optional[str] = None,
+        limit: int = 10,
+        modified_since: Optional[str] = None,
+        envelope: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """라벨 기준 검색 결과를 응답 스트림에서 디코딩되는 즉시 변환하여 yield
+        
+        메모리에는 응답 전체가 아닌 현재 디코딩 중인 페이지 하나만 유지된다.
+        문서의 content는 ensure_markdown()으로 채운다.
+        envelope를 넘기면 totalSize, _links 등 응답 필드가 채워진다.
+        """
+        cql_query = self.client.generate_cql_query(label, space_key, modified_since)
+        async for doc in self._stream_documents(cql_query, limit, SEARCH_EXPAND_FULL, envelope):
+            yield doc
+    
+    async def _stream_documents(
+        self,
+        cql_query: str,
+        limit: int,
+        expand: str,
+        envelope: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """스트리밍 검색 결과 항목을 SpecGate 형식 문서로 변환하여 yield"""
+        if envelope is None:
+            envelope = {}
+        
+        yielded = 0
+        items = self.client.stream_search_results(cql_query, limit, expand=expand, envelope=envelope)
+        async with aclosing(items):
+            async for item in items:
+                yielded += 1
+                yield self.transformer.transform_to_specgate_format({"results": [item]})
+        
+        if "error" in envelope:
+            self.logger.warning(f"스트리밍 조회 실패: {envelope['error']} ({yielded}개 문서 수신 후)")
+            if not yielded:
+                # 받은 문서가 없으면 페이지 수집 모드와 동일하게 오류로 처리
+                raise RuntimeError(envelope["error"])
+    
+    async def _stream_to_handler(
+        self,
+        documents: AsyncIterator[Dict[str, Any]],
+        prepare: Callable[[List[Dict[str, Any]]], Awaitable[None]],
+        handler: Callable[[List[Dict[str, Any]]], Awaitable[None]],
+        batch_size: int
+    ) -> List[Dict[str, Any]]:
+        """스트리밍 문서를 묶음 단위로 준비하여 핸들러에 넘기고, 본문을 비운 문서 목록을 반환"""
+        handled = []
+        batch = []
+        
+        async def flush() -> None:
+            await prepare(batch)
+            await handler(batch)
+            for doc in batch:
+                # 본문은 핸들러가 처리했고 필요하면 html_file로 저장되어 있다
+                doc.pop("html_content", None)
+                doc.pop("content", None)
+            handled.extend(batch)
+            batch.clear()
+        
+        async with aclosing(documents):
+            async for doc in documents:
+                batch.append(doc)
+                if len(batch) >= max(1, batch_size):
+                    await flush()
+        if batch:
+            await flush()
+        return handled
+    
+    async def _prepare_documents(
+        self,
+        documents: List[Dict[str, Any]],
+        prepared: Dict[str, Any],
+        label: str,
+        output_dir: Optional[str],
+        save_html: bool,
+        manifest: Optional[SyncManifest],
+        two_phase: bool,
+        body_filter: Optional[Callable[[Dict[str, Any]], bool]],
+        max_concurrency: Optional[int]
+    ) -> None:
+        """본문 조회(2단계), 동기화 판정, HTML 원본 저장을 수행하고 결과를 prepared에 누적"""
+        if two_phase:
+            stats = await self._fetch_bodies(documents, manifest, body_filter, max_concurrency)
+            totals = prepared["two_phase"]
+            totals["metadata_only"] += stats["metadata_only"]
+            totals["bodies_fetched"] += stats["bodies_fetched"]
+            totals["body_errors"].extend(stats["body_errors"])
+        
+        if manifest is not None:
+            summary = self._classify_documents(documents, manifest)
+            for status in ("new", "changed", "unchanged"):
+                prepared["sync"][status] += summary[status]
+        
+        if save_html:
+            changed_documents = [d for d in documents if d.get("sync_status") != SYNC_UNCHANGED]
+            prepared["html_files"].extend(await self._save_html_files(changed_documents, label, output_dir))
+    
+    async def _iter_crawled_documents(
+        self,
+        cql_query: str,
+        page_size: int,
+        max_results: Optional[int],
+        max_concurrency: Optional[int],
+        stats: Optional[Dict[str, Any]] = None,
+        expand: str = SEARCH_EXPAND_FULL
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """페이지 수집 결과를 SpecGate 형식 문서로 변환하여 yield"""
+        if stats is None:
+            stats = {"pages_fetched": 0, "errors": []}
+        
+        yielded = 0
+        pages = self.client.iter_search_pages(cql_query, page_size, max_results, max_concurrency, expand)
+        async with aclosing(pages):
+            async for page in pages:
+                if "error" in page:
+                    # 일부 페이지 실패는 기록만 하고 나머지 페이지 수집은 계속한다
+                    self.logger.warning(f"페이지 수집 실패: {page['error']}")
+                    stats["errors"].append(page["error"])
+                    continue
+                
+                stats["pages_fetched"] += 1
+                # 메타데이터 생성을 위해 첫 응답의 결과 외 필드(totalSize 등)만 보관
+                stats.setdefault("envelope", {**{k: v for k, v in page.items() if k != "results"}, "results": []})
+                
+                for doc in self.transformer.transform_batch_to_specgate_format(page):
+                    if max_results is not None and yielded >= max_results:
+                        return
+                    yielded += 1
+                    yield doc
+        
+        if stats["errors"] and not stats["pages_fetched"]:
+            # 모든 페이지가 실패했으면 기존 단일 호출과 동일하게 오류로 처리
+            raise RuntimeError(stats["errors"][0])
+    
+    async def _fetch_bodies(
+        self,
+        documents: List[Dict[str, Any]],
+        manifest: Optional[SyncManifest],
+        body_filter: Optional[Callable[[Dict[str, Any]], bool]],
+        max_concurrency: Optional[int]
+    ) -> Dict[str, Any]:
+        """메타데이터만 조회한 문서 중 처리가 필요한 문서의 본문을 동시 조회하여 교체"""
+        def _needs_body(doc: Dict[str, Any]) -> bool:
+            if manifest is not None and manifest.classify(doc) == SYNC_UNCHANGED:
+                return False
+            return body_filter(doc) if body_filter else True
+        
+        targets = [i for i, doc in enumerate(documents) if doc.get("id") and _needs_body(doc)]
+        stats = {
+            "metadata_only": len(documents) - len(targets),
+            "bodies_fetched": 0,
+            "body_errors": []
+        }
+        self.logger.info(f"2단계 조회: 전체 {len(documents)}개 중 {len(targets)}개 본문 조회")
+        
+        semaphore = asyncio.Semaphore(max(1, max_concurrency or self.client.concurrency.max_limit))
+        
+        async def _fetch(index: int) -> None:
+            doc = documents[index]
+            async with semaphore:
+                response = await self.client.get_content_by_id(doc["id"])
+            if "error" in response:
+                self.logger.warning(f"본문 조회 실패 - ID: {doc['id']} ({response['error']})")
+                stats["body_errors"].append({"id": doc["id"], "error": response["error"]})
+                return
+            documents[index] = self.transformer.transform_to_specgate_format({"results": [response]})
+            stats["bodies_fetched"] += 1
+        
+        await asyncio.gather(*(_fetch(i) for i in targets))
+        return stats
+    
     async def fetch_document_by_id(self, content_id: str) -> Dict[str, Any]:
         """ID로 특정 문서 조회"""
         self.logger.info(f"Confluence 문서 조회 시작 - ID: {content_id}")
@@ -78,6 +355,7 @@ class ConfluenceService:
             specgate_document = self.transformer.transform_to_specgate_format(
                 {"results": [confluence_response]}
             )
+            await self.transformer.ensure_markdown(specgate_document)
             
             result = {
                 "status": "success",
@@ -105,6 +383,8 @@ class ConfluenceService:
             
             # 2단계: SpecGate 형식으로 변환
             specgate_documents = self.transformer.transform_batch_to_specgate_format(confluence_response)
+            for specgate_document in specgate_documents:
+                await self.transformer.ensure_markdown(specgate_document)
             
             # 3단계: 메타데이터 생성
             metadata = self._create_metadata_from_cql(cql_query, confluence_response)
@@ -122,6 +402,18 @@ class ConfluenceService:
             self.logger.error(f"CQL 검색 실패: {str(e)}")
             return self._create_error_result(str(e), cql_query=cql_query)
     
+    def _classify_documents(self, documents: List[Dict[str, Any]], manifest: SyncManifest) -> Dict[str, Any]:
+        """매니페스트와 비교하여 문서별 sync_status를 표시하고 요약을 반환"""
+        summary = {"new": 0, "changed": 0, "unchanged": 0, "manifest_path": manifest.path}
+        for doc in documents:
+            status = manifest.classify(doc)
+            doc["sync_status"] = status
+            summary[status] += 1
+        self.logger.info(
+            f"동기화 상태 - 신규: {summary['new']}, 변경: {summary['changed']}, 변경 없음: {summary['unchanged']}"
+        )
+        return summary
+    
     def _create_metadata(
         self, 
         label: str, 
@@ -139,7 +431,8 @@ class ConfluenceService:
             "cql_query": cql_query,
             "timestamp": datetime.now().isoformat(),
             "confluence_api_version": "direct_api_call",
-            "has_more": transformer_metadata.get("has_more", False)
+            "has_more": transformer_metadata.get("has_more", False),
+            "total_size": transformer_metadata.get("total_size")
         }
     
     def _create_metadata_from_cql(self, cql_query: str, confluence_response: Dict[str, Any]) -> Dict[str, Any]:
@@ -187,6 +480,10 @@ class ConfluenceService:
         """Confluence 서비스 사용 가능 여부 확인"""
         return self.client.is_configured()
     
+    async def close(self) -> None:
+        """Confluence 클라이언트의 공유 HTTP 세션 정리"""
+        await self.client.close()
+    
     async def _save_html_files(self, documents: List[Dict[str, Any]], label: str, output_dir: Optional[str] = None) -> List[str]:
         """HTML 원본을 파일로 저장"""
         import os
@@ -263,6 +560,7 @@ class ConfluenceService:
                         self.logger.error(f"HTML 파일 저장 실패: {filepath} - {e}")
                         continue
                     
+                    doc["html_file"] = filepath
                     html_files.append(filepath)
                     self.logger.info(f"HTML 파일 저장: {filepath}")
             
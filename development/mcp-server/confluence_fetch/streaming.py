@@ -0,0 +1,123 @@
+"""
+Confluence 검색 응답 스트리밍 디코더
+응답 본문을 청크 단위로 읽으면서 results[] 배열의 항목을 하나씩 디코딩하여,
+전체 응답을 메모리에 올리지 않고도 페이지를 바로 처리할 수 있도록 하는 모듈
+"""
+import re
+import json
+import codecs
+from typing import Dict, Any, List
+
+
+# 문자열 밖에서 의미가 있는 JSON 구조 문자
+_STRUCTURAL = re.compile(r'["{}\[\],]')
+# 문자열 안에서 의미가 있는 문자 (종료 따옴표, 이스케이프)
+_STRING_SPECIAL = re.compile(r'["\\]')
+
+_ENVELOPE = "envelope"
+_RESULTS = "results"
+
+
+class SearchResultsStreamDecoder:
+    """최상위 객체의 results 배열 항목을 점진적으로 디코딩하는 디코더
+
+    feed()에 응답 바이트를 순서대로 넣으면 완성된 항목 목록을 반환한다.
+    results 이외의 필드(start, limit, size, totalSize, _links 등)는 봉투(envelope)로
+    모아 두었다가 close()에서 반환한다. 메모리에는 봉투와 현재 디코딩 중인
+    항목 하나만 유지된다.
+    """
+
+    def __init__(self, array_key: str = "results"):
+        self._key_pattern = re.compile(r'"%s"\s*:\s*$' % re.escape(array_key))
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._envelope = ""
+        self._item: List[str] = []
+        self._state = _ENVELOPE
+        self._depth = 0
+        self._in_string = False
+        self._pending_escape = False
+        self.items_decoded = 0
+        self.max_item_chars = 0
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        """바이트 청크를 입력하고 이번 청크에서 완성된 results 항목 목록 반환"""
+        return self._scan(self._decoder.decode(chunk))
+
+    def close(self) -> Dict[str, Any]:
+        """입력 종료 후 results를 제외한 응답 봉투 반환 (results는 빈 리스트)"""
+        rest = self._decoder.decode(b"", final=True)
+        if rest:
+            self._scan(rest)
+        if self._state != _ENVELOPE or self._depth != 0 or self._in_string:
+            raise ValueError("불완전한 JSON 응답입니다")
+        envelope = json.loads(self._envelope)
+        if not isinstance(envelope, dict):
+            raise ValueError("검색 응답이 JSON 객체가 아닙니다")
+        return envelope
+
+    def _scan(self, text: str) -> List[Any]:
+        items = []
+        pos = 0
+        segment_start = 0
+        length = len(text)
+
+        if self._pending_escape and length:
+            # 이전 청크가 역슬래시로 끝났으면 이번 청크의 첫 글자는 이스케이프된 문자
+            self._pending_escape = False
+            pos = 1
+
+        while pos < length:
+            if self._in_string:
+                match = _STRING_SPECIAL.search(text, pos)
+                if match is None:
+                    break
+                if match.group() == "\\":
+                    pos = match.end() + 1
+                    if pos > length:
+                        self._pending_escape = True
+                    continue
+                self._in_string = False
+                pos = match.end()
+                continue
+
+            match = _STRUCTURAL.search(text, pos)
+            if match is None:
+                break
+            char = match.group()
+            index = match.start()
+            pos = match.end()
+
+            if char == '"':
+                self._in_string = True
+            elif char in "{[":
+                self._depth += 1
+                if char == "[" and self._state == _ENVELOPE and self._depth == 2:
+                    self._envelope += text[segment_start:pos]
+                    segment_start = pos
+                    if self._key_pattern.search(self._envelope, 0, len(self._envelope) - 1):
+                        self._state = _RESULTS
+            elif char in "}]":
+                if char == "]" and self._state == _RESULTS and self._depth == 2:
+                    self._finish_item(text[segment_start:index], items)
+                    self._state = _ENVELOPE
+                    segment_start = index
+                self._depth -= 1
+            elif char == "," and self._state == _RESULTS and self._depth == 2:
+                self._finish_item(text[segment_start:index], items)
+                segment_start = pos
+
+        if self._state == _RESULTS:
+            self._item.append(text[segment_start:])
+        else:
+            self._envelope += text[segment_start:]
+        return items
+
+    def _finish_item(self, tail: str, items: List[Any]) -> None:
+        self._item.append(tail)
+        raw = "".join(self._item).strip()
+        self._item = []
+        if not raw:
+            return
+        self.max_item_chars = max(self.max_item_chars, len(raw))
+        items.append(json.loads(raw))
+        self.items_decoded += 1
@@ -5,14 +5,19 @@ Confluence API 응답을 SpecGate 형식으로 변환하는 모듈
 import os
 import re
 import logging
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 
 
 class ConfluenceDataTransformer:
-    """Confluence 데이터 변환기"""
+    """Confluence 데이터 변환기
+    
+    HTML→Markdown 변환은 문서 변환 시점이 아니라 ensure_markdown() 최초 호출 시
+    한 번만 수행하고, 결과를 문서의 content 필드에 캐시한다.
+    """
     
     def __init__(self):
         self.logger = logging.getLogger("specgate.confluence.transformer")
+        self._converter = None
     
     def transform_to_specgate_format(self, confluence_response: Dict[str, Any]) -> Dict[str, Any]:
         """Confluence API 응답을 SpecGate 형식으로 변환"""
@@ -21,12 +26,9 @@ class ConfluenceDataTransformer:
         
         result = confluence_response["results"][0]  # 첫 번째 결과 사용
         
-        # HTML 내용 추출
+        # HTML 내용 추출 (Markdown 변환은 ensure_markdown()에서 지연 수행)
         html_content = result.get("body", {}).get("storage", {}).get("value", "")
         
-        # HTML 내용을 Markdown으로 변환
-        content = self._convert_html_to_markdown(result)
-        
         # 상대경로(webui)를 절대 URL로 변환
         webui_path = result.get("_links", {}).get("webui", "")
         absolute_url = self._build_absolute_confluence_url(webui_path)
@@ -34,7 +36,7 @@ class ConfluenceDataTransformer:
         return {
             "id": result.get("id", ""),
             "title": result.get("title", ""),
-            "content": content,
+            "content": None,  # ensure_markdown() 호출 시 채워짐
             "html_content": html_content,  # HTML 원본 추가
             "space_key": result.get("space", {}).get("key", ""),
             "space_name": result.get("space", {}).get("name", ""),
@@ -76,47 +78,66 @@ class ConfluenceDataTransformer:
             "version": 1
         }
     
-    def _convert_html_to_markdown(self, result: Dict[str, Any]) -> str:
-        """HTML을 Markdown으로 변환"""
-        from html_to_md.converter import HTMLToMarkdownConverter
+    async def ensure_markdown(self, document: Dict[str, Any]) -> Optional[str]:
+        """문서의 HTML 원본을 Markdown으로 변환하여 반환 (문서당 최초 1회만 변환)
         
-        content = result.get("body", {}).get("storage", {}).get("value", "")
-        if not content:
-            return ""
-        
-        document_title = result.get("title", "")
+        변환 결과는 document["content"]에 캐시되어 이후 호출과 파이프라인이 재사용한다.
+        변환기가 실패하면 content에는 폴백 변환 결과를 넣고 None을 반환한다.
+        """
+        status = document.get("conversion_status")
+        if status is not None:
+            return document.get("content") if status == "success" else None
+        
+        html_content = document.get("html_content") or ""
+        document_title = document.get("title", "")
+        if not html_content:
+            document["content"] = ""
+            document["conversion_status"] = "empty"
+            return None
         
-        # HTML to Markdown 변환기 사용
-        converter = HTMLToMarkdownConverter()
+        if self._converter is None:
+            from html_to_md.converter import HTMLToMarkdownConverter
+            self._converter = HTMLToMarkdownConverter()
         
-        # 비동기 함수를 동기적으로 호출
-        import asyncio
+        conversion_result = await self._converter.convert(html_content, document_title=document_title)
+        return self._store_conversion(document, conversion_result)
+    
+    async def ensure_markdown_batch(self, documents: List[Dict[str, Any]], executor, cache=None) -> None:
+        """아직 변환하지 않은 문서들을 ConversionExecutor로 한 번에 변환하여 content에 캐시
         
-        # 이미 실행 중인 이벤트 루프가 있는지 확인
-        try:
-            # 실행 중인 이벤트 루프가 있으면 새 태스크로 실행
-            loop = asyncio.get_running_loop()
-            # 이 경우 동기적으로 실행할 수 없으므로 None 반환
-            self.logger.warning("이벤트 루프가 이미 실행 중입니다. HTML to Markdown 변환을 건너뜁니다.")
-            return None
-        except RuntimeError:
-            # 실행 중인 이벤트 루프가 없으면 새로 생성
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                conversion_result = loop.run_until_complete(
-                    converter.convert(content, document_title=document_title)
-                )
-            finally:
-                loop.close()
-        
-        if conversion_result and "markdown" in conversion_result:
+        이후 ensure_markdown() 호출은 캐시된 결과를 그대로 반환한다.
+        cache(ConversionCache)를 넘기면 이전 실행에서 변환한 같은 HTML은 다시 변환하지 않는다.
+        """
+        pending = []
+        for document in documents:
+            if document.get("conversion_status") is not None:
+                continue
+            if not document.get("html_content"):
+                document["content"] = ""
+                document["conversion_status"] = "empty"
+                continue
+            pending.append(document)
+        if not pending:
+            return
+        
+        results = await executor.convert_batch([(d["html_content"], d.get("title", "")) for d in pending], cache=cache)
+        for document, conversion_result in zip(pending, results):
+            self._store_conversion(document, conversion_result)
+    
+    def _store_conversion(self, document: Dict[str, Any], conversion_result: Dict[str, Any]) -> Optional[str]:
+        """변환 결과를 문서에 캐시하고 Markdown을 반환 (실패 시 폴백 결과를 넣고 None)"""
+        document_title = document.get("title", "")
+        if conversion_result.get("status") == "success":
             self.logger.info(f"HTML to Markdown 변환기 사용됨 - 제목: {document_title}")
-            return conversion_result["markdown"]
+            document["content"] = conversion_result["markdown"]
+            document["conversion_status"] = "success"
+            return document["content"]
         
         # 폴백: 간단한 변환
         self.logger.info(f"폴백 변환 사용됨 - 제목: {document_title}")
-        return self._fallback_html_to_markdown(content, document_title)
+        document["content"] = self._fallback_html_to_markdown(document.get("html_content") or "", document_title)
+        document["conversion_status"] = "error"
+        return None
     
     def _fallback_html_to_markdown(self, content: str, document_title: str = "") -> str:
         """HTML to Markdown 변환 폴백 방식"""
@@ -187,7 +208,10 @@ class ConfluenceDataTransformer:
         
         return {
             "total_count": len(confluence_response.get("results", [])),
+            "total_size": confluence_response.get("totalSize"),
+            "start": confluence_response.get("start", 0),
             "has_more": confluence_response.get("_links", {}).get("next") is not None,
+            "next_link": confluence_response.get("_links", {}).get("next"),
             "api_version": "confluence_rest_api_v1"
         }
 
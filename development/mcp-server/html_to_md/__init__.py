@@ -3,10 +3,16 @@ HTML to Markdown Converter
 HTML 문서를 Markdown 형식으로 변환하는 모듈
 """
 
+from .cache import ConversionCache, ConversionCacheConfig
 from .converter import HTMLToMarkdownConverter
+from .document import DocumentStats, ParsedDocument
+from .executor import ConversionExecutor, ConversionExecutorConfig
 from .parser import HTMLParser
+from .pruner import HTMLPruner, PruneConfig
 from .validator import ConversionValidator
 
-__all__ = ['HTMLToMarkdownConverter', 'HTMLParser', 'ConversionValidator']
+__all__ = ['HTMLToMarkdownConverter', 'HTMLParser', 'ConversionValidator', 'ParsedDocument', 'DocumentStats',
+           'ConversionExecutor', 'ConversionExecutorConfig', 'ConversionCache', 'ConversionCacheConfig',
+           'HTMLPruner', 'PruneConfig']
 
 
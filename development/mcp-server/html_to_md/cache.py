@@ -0,0 +1,198 @@
+"""
+HTML→Markdown 변환 캐시
+HTML 원본, 변환기 버전, 변환 옵션의 해시를 키로 변환 결과를 디스크에 저장하는 모듈
+
+변경되지 않은 페이지는 재수집·재검사·재시도 때마다 다시 변환할 필요가 없으므로
+해시 한 번으로 이전 결과(Markdown과 메타데이터)를 돌려준다.
+"""
+import os
+import json
+import time
+import hashlib
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+
+CACHE_FORMAT_VERSION = 1
+CACHE_FILE_SUFFIX = ".json"
+
+
+@dataclass
+class ConversionCacheConfig:
+    """변환 캐시 설정"""
+    enabled: bool = True
+    max_bytes: int = 256 * 1024 * 1024        # 캐시 파일 총 크기 상한 (초과 시 가장 오래 사용하지 않은 항목부터 제거)
+    max_age_seconds: float = 30 * 24 * 3600   # 마지막 사용 후 이 시간이 지나면 만료
+
+    @classmethod
+    def from_env(cls) -> "ConversionCacheConfig":
+        """환경변수(HTML_TO_MD_CACHE*)에서 설정을 읽는다. 미설정 항목은 기본값 사용"""
+        defaults = cls()
+        return cls(
+            enabled=os.getenv("HTML_TO_MD_CACHE", "1").lower() not in ("0", "false", "no", "off"),
+            max_bytes=int(float(os.getenv("HTML_TO_MD_CACHE_MAX_MB", defaults.max_bytes / (1024 * 1024))) * 1024 * 1024),
+            max_age_seconds=float(os.getenv("HTML_TO_MD_CACHE_MAX_AGE_DAYS", defaults.max_age_seconds / 86400)) * 86400
+        )
+
+
+class ConversionCache:
+    """콘텐츠 주소 기반 변환 결과 캐시
+
+    항목마다 directory/<키 앞 2자리>/<키>.json 파일 하나를 쓰며, 파일 수정 시각을
+    마지막 사용 시각으로 삼는다 (조회 성공 시 갱신). 사용 순서는 처음 접근할 때
+    디렉토리를 한 번 훑어 메모리에 올리고, 이후에는 메모리 목록으로 LRU 제거를 한다.
+    다른 프로세스가 같은 디렉토리에 쓴 항목은 조회는 되지만 다음 로드 때부터 크기 계산에 포함된다.
+    """
+
+    def __init__(self, directory: str, config: Optional[ConversionCacheConfig] = None):
+        self.directory = directory
+        self.config = config or ConversionCacheConfig()
+        self.logger = logging.getLogger("specgate.htmlconverter.cache")
+        # 키 → 파일 크기 (앞쪽일수록 오래 사용하지 않은 항목)
+        self._entries: Optional["OrderedDict[str, int]"] = None
+        self._total_bytes = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    @staticmethod
+    def make_key(html_content: str, version: str, **options: Any) -> str:
+        """HTML 원본, 변환기 버전, 변환 옵션으로 캐시 키(sha256) 계산"""
+        digest = hashlib.sha256()
+        digest.update(json.dumps([version, sorted(options.items())], ensure_ascii=False, default=str).encode("utf-8"))
+        digest.update(b"\0")
+        digest.update((html_content or "").encode("utf-8"))
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """캐시된 변환 결과 조회 (없거나 만료되었으면 None)"""
+        path = self._path(key)
+        try:
+            mtime = os.path.getmtime(path)
+        except OSError:
+            self.misses += 1
+            return None
+
+        if time.time() - mtime > self.config.max_age_seconds:
+            self._remove(key)
+            self.expirations += 1
+            self.misses += 1
+            return None
+
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+            if entry.get("format_version") != CACHE_FORMAT_VERSION:
+                raise ValueError(f"지원하지 않는 캐시 형식: {entry.get('format_version')}")
+            os.utime(path)
+        except Exception as e:
+            self.logger.warning(f"변환 캐시 항목 읽기 실패, 무시합니다: {path} ({e})")
+            self._remove(key)
+            self.misses += 1
+            return None
+
+        entries = self._load_entries()
+        if key in entries:
+            entries.move_to_end(key)
+        self.hits += 1
+        return entry["result"]
+
+    def put(self, key: str, result: Dict[str, Any]) -> None:
+        """변환 결과 저장 후 크기 상한을 넘으면 오래 사용하지 않은 항목부터 제거"""
+        path = self._path(key)
+        payload = json.dumps(
+            {"format_version": CACHE_FORMAT_VERSION, "result": result},
+            ensure_ascii=False
+        ).encode("utf-8")
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # 동시에 읽는 쪽이 쓰다 만 파일을 보지 않도록 임시 파일에 쓴 뒤 교체
+            temp_path = f"{path}.{os.getpid()}.tmp"
+            with open(temp_path, 'wb') as f:
+                f.write(payload)
+            os.replace(temp_path, path)
+        except OSError as e:
+            self.logger.warning(f"변환 캐시 저장 실패: {path} ({e})")
+            return
+
+        entries = self._load_entries()
+        self._total_bytes += len(payload) - entries.pop(key, 0)
+        entries[key] = len(payload)
+        self.stores += 1
+        self._evict()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """적중/실패 카운터와 캐시 크기"""
+        entries = self._load_entries()
+        lookups = self.hits + self.misses
+        return {
+            'directory': self.directory,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / lookups, 4) if lookups else None,
+            'stores': self.stores,
+            'evictions': self.evictions,
+            'expirations': self.expirations,
+            'entries': len(entries),
+            'bytes': self._total_bytes
+        }
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], f"{key}{CACHE_FILE_SUFFIX}")
+
+    def _load_entries(self) -> "OrderedDict[str, int]":
+        """디렉토리를 한 번 훑어 사용 순서 목록을 만든다 (만료된 항목은 이때 제거)"""
+        if self._entries is not None:
+            return self._entries
+
+        found = []
+        now = time.time()
+        if os.path.isdir(self.directory):
+            for shard in os.scandir(self.directory):
+                if not shard.is_dir():
+                    continue
+                for item in os.scandir(shard.path):
+                    if not item.name.endswith(CACHE_FILE_SUFFIX):
+                        continue
+                    try:
+                        stat = item.stat()
+                    except OSError:
+                        continue
+                    key = item.name[:-len(CACHE_FILE_SUFFIX)]
+                    if now - stat.st_mtime > self.config.max_age_seconds:
+                        self._unlink(item.path)
+                        self.expirations += 1
+                        continue
+                    found.append((stat.st_mtime, key, stat.st_size))
+
+        found.sort()
+        self._entries = OrderedDict((key, size) for _, key, size in found)
+        self._total_bytes = sum(self._entries.values())
+        self._evict()
+        return self._entries
+
+    def _evict(self) -> None:
+        entries = self._entries
+        while entries and self._total_bytes > self.config.max_bytes:
+            key, size = entries.popitem(last=False)
+            self._total_bytes -= size
+            self._unlink(self._path(key))
+            self.evictions += 1
+
+    def _remove(self, key: str) -> None:
+        if self._entries is not None and key in self._entries:
+            self._total_bytes -= self._entries.pop(key)
+        self._unlink(self._path(key))
+
+    def _unlink(self, path: str) -> None:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            self.logger.warning(f"변환 캐시 항목 삭제 실패: {path} ({e})")
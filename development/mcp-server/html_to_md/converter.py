@@ -4,58 +4,122 @@ HTML 요소를 Markdown 형식으로 변환하는 핵심 모듈
 """
 import re
 import logging
-from typing import Dict, List, Any, Optional
-from bs4 import BeautifulSoup, Tag
+from typing import AsyncIterable, AsyncIterator, Dict, Iterable, List, Any, Optional, Union
+from bs4 import BeautifulSoup
+
+from .cache import ConversionCache
+from .renderer import MarkdownRenderer
+from .document import ParsedDocument
+from .pruner import HTMLPruner, PruneConfig
+from .lxml_backend import LXML_AVAILABLE, LxmlMarkdownRenderer
+from .streaming import STREAM_CHUNK_SIZE, MarkdownStreamConverter
+
+
+# 변환 결과가 달라지는 변경 시 올린다 (변환 캐시 키에 포함되어 이전 결과를 무효화)
+CONVERTER_VERSION = "2025.4"
+
+# 변환 백엔드: 'lxml'은 lxml 요소를 직접 순회, 'bs4'는 BeautifulSoup 트리를 순회
+CONVERSION_BACKENDS = ('lxml', 'bs4')
+DEFAULT_BACKEND = 'lxml' if LXML_AVAILABLE else 'bs4'
+# bs4 백엔드가 사용하는 파서 (모듈 로드 시 한 번만 결정)
+BS4_PARSER = 'lxml' if LXML_AVAILABLE else 'html.parser'
+
+# 스트리밍 변환 입력: HTML 문자열/바이트 또는 그 조각들의 (비동기) 이터러블
+HTMLSource = Union[str, bytes, Iterable[Union[str, bytes]], AsyncIterable[Union[str, bytes]]]
 
 
 class HTMLToMarkdownConverter:
     """HTML to Markdown 변환기"""
     
-    def __init__(self):
+    def __init__(self, backend: Optional[str] = None, cache: Optional[ConversionCache] = None, prune_config: Optional[PruneConfig] = None):
         self.logger = logging.getLogger("specgate.htmlconverter.converter")
         self.conversion_mapping = self._init_conversion_mapping()
+        self.renderer = MarkdownRenderer()
+        self.lxml_renderer = LxmlMarkdownRenderer() if LXML_AVAILABLE else None
+        self.backend = backend or DEFAULT_BACKEND
+        self.cache = cache
+        self.prune_config = prune_config or PruneConfig.from_env()
     
-    async def convert(self, html_content: str, preserve_structure: bool = True, save_to_file: bool = False, output_path: str = None, document_title: str = None) -> Dict[str, Any]:
-        """HTML을 Markdown으로 변환한다."""
+    async def convert(self, html_content: Union[str, ParsedDocument], preserve_structure: bool = True, save_to_file: bool = False, output_path: str = None, document_title: str = None, backend: Optional[str] = None, use_cache: bool = True) -> Dict[str, Any]:
+        """HTML을 Markdown으로 변환한다.
+
+        backend로 호출마다 변환 백엔드('lxml' 또는 'bs4')를 고를 수 있으며,
+        지정하지 않으면 생성 시 지정한 백엔드(기본: lxml 설치 시 'lxml')를 사용한다.
+        이미 파싱한 ParsedDocument를 넘기면 lxml 백엔드는 다시 파싱하지 않는다.
+        변환 캐시가 설정되어 있으면 파싱 전에 캐시를 먼저 조회한다 (use_cache=False로 생략).
+        문자열 입력은 파싱 전에 HTMLPruner로 불필요한 요소/속성을 걷어내고, 제거한 바이트 수를
+        conversion_info['pruned_bytes']로 알려 준다. 코드 매크로의 CDATA 본문은 가지치기 설정과
+        상관없이 텍스트로 바꿔 파서가 버리지 않게 한다.
+        """
+        document = html_content if isinstance(html_content, ParsedDocument) else None
+        if document is not None:
+            html_content = document.html
         try:
             import time
             t0 = time.perf_counter()
 
-            # 파서 선택(가능 시 lxml 사용)
-            parser = 'lxml'
-            try:
-                import lxml  # noqa: F401
-            except Exception:
-                parser = 'html.parser'
+            backend = self.resolve_backend(backend)
+            cache = self.cache if use_cache else None
+            cache_key = None
+            if cache is not None:
+                cache_key = self.cache_key(html_content, preserve_structure=preserve_structure, document_title=document_title, backend=backend, pruned=document is None)
+                cached = cache.get(cache_key)
+                if cached is not None:
+                    self.logger.info(
+                        "HTML→MD | step=cache | hit=True | length=%s | elapsed=%.3fs",
+                        len(html_content) if html_content else 0,
+                        (time.perf_counter() - t0)
+                    )
+                    saved_file_path = await self._save_to_file(cached['markdown'], output_path) if save_to_file else None
+                    return self._build_result(cached, backend, preserve_structure, save_to_file, saved_file_path, cache_hit=True)
 
-            soup = BeautifulSoup(html_content, parser)
+            # 파싱 전 가지치기 (이미 파싱된 문서는 그대로 사용)
+            source_html = html_content
+            pruned_bytes = elements_pruned = 0
+            if document is None and html_content:
+                pruner = HTMLPruner(self.prune_config)
+                source_html = pruner.prune(html_content)
+                pruned_bytes, elements_pruned = pruner.pruned_bytes, pruner.elements_pruned
+            t_prune = time.perf_counter()
+            self.logger.info(
+                "HTML→MD | step=prune | pruned_bytes=%d | elements=%d | elapsed=%.3fs",
+                pruned_bytes,
+                elements_pruned,
+                (t_prune - t0)
+            )
+
+            if backend == 'lxml':
+                parser = 'lxml' if document is None else 'lxml/shared'
+                document = ParsedDocument.of(document or source_html)
+            else:
+                soup = BeautifulSoup(source_html, BS4_PARSER)
+                parser = f"bs4/{BS4_PARSER}"
             t1 = time.perf_counter()
             self.logger.info(
                 "HTML→MD | step=parse | parser=%s | length=%s | elapsed=%.3fs",
                 parser,
-                len(html_content) if html_content else 0,
-                (t1 - t0)
+                len(source_html) if source_html else 0,
+                (t1 - t_prune)
             )
 
             markdown_parts = []
             
             # 제목이 없고 document_title이 제공된 경우 제목 추가
-            if document_title and not soup.find(['h1', 'h2', 'h3', 'h4', 'h5', 'h6']):
+            if backend == 'lxml':
+                has_heading = document.stats.headings > 0
+            else:
+                has_heading = soup.find(['h1', 'h2', 'h3', 'h4', 'h5', 'h6']) is not None
+            if document_title and not has_heading:
                 markdown_parts.append(f"# {document_title}")
                 self.logger.info(f"제목 추가됨: {document_title}")
             
-            # 주요 요소들을 순서대로 변환
-            for element in soup.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6', 
-                                         'p', 'ul', 'ol', 'table', 'pre', 'blockquote']):
-                converted = self._convert_element(element, preserve_structure)
-                if converted:
-                    markdown_parts.append(converted)
-            
-            # Confluence 특수 매크로 처리
-            for macro in soup.find_all('ac:structured-macro'):
-                converted = self._convert_confluence_macro(macro)
-                if converted:
-                    markdown_parts.append(converted)
+            # 문서 순서대로 한 번만 순회하며 블록 요소와 Confluence 매크로를 제자리에서 변환
+            if backend == 'lxml':
+                markdown_parts.extend(self.lxml_renderer.render(document.root))
+                metadata = document.metadata()
+            else:
+                markdown_parts.extend(self.renderer.render(soup))
+                metadata = self._extract_metadata(soup)
             
             # 빈 줄로 구분하여 결합
             markdown_content = '\n\n'.join(markdown_parts)
@@ -87,17 +151,15 @@ class HTMLToMarkdownConverter:
                 (t4 - t0)
             )
             
-            return {
-                'status': 'success',
+            converted = {
                 'markdown': markdown_content,
-                'metadata': self._extract_metadata(soup),
-                'conversion_info': {
-                    'preserve_structure': preserve_structure,
-                    'elements_converted': len(markdown_parts),
-                    'saved_to_file': save_to_file,
-                    'file_path': saved_file_path
-                }
+                'metadata': metadata,
+                'elements_converted': len(markdown_parts),
+                'pruned_bytes': pruned_bytes
             }
+            if cache_key is not None:
+                cache.put(cache_key, converted)
+            return self._build_result(converted, backend, preserve_structure, save_to_file, saved_file_path, cache_hit=False if cache_key else None)
             
         except Exception as e:
             self.logger.error(f"HTML→MD 변환 실패: {str(e)}")
@@ -108,245 +170,164 @@ class HTMLToMarkdownConverter:
                 'requires_manual_review': True
             }
     
-    def _convert_element(self, element: Tag, preserve_structure: bool) -> str:
-        """개별 HTML 요소를 Markdown으로 변환한다."""
-        tag = element.name
-        
-        if tag in ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']:
-            return self._convert_heading(element)
-        
-        elif tag == 'p':
-            return self._convert_paragraph(element)
-        
-        elif tag in ['ul', 'ol']:
-            return self._convert_list(element)
-        
-        elif tag == 'table':
-            return self._convert_table(element)
-        
-        elif tag == 'pre':
-            return self._convert_code_block(element)
-        
-        elif tag == 'blockquote':
-            return self._convert_blockquote(element)
-        
-        else:
-            return element.get_text().strip()
-    
-    def _convert_heading(self, heading: Tag) -> str:
-        """헤딩을 변환한다."""
-        level = int(heading.name[1])
-        text = heading.get_text().strip()
-        return f"{'#' * level} {text}"
-    
-    def _convert_paragraph(self, paragraph: Tag) -> str:
-        """문단을 변환하고 인라인 요소를 처리한다."""
-        text = paragraph.get_text()
-        
-        # 인라인 요소 처리
-        text = self._process_inline_elements(paragraph, text)
-        
-        return text.strip()
+    def cache_key(self, html_content: Optional[str], preserve_structure: bool = True, document_title: Optional[str] = None, backend: str = DEFAULT_BACKEND, pruned: bool = True) -> str:
+        """변환 캐시 키 (HTML 원본 + 변환기 버전 + 변환 옵션/가지치기 설정의 해시)"""
+        return ConversionCache.make_key(
+            html_content or '', CONVERTER_VERSION,
+            preserve_structure=preserve_structure, document_title=document_title, backend=backend,
+            prune=self.prune_config.signature if pruned else 'off'
+        )
     
-    def _convert_list(self, list_element: Tag) -> str:
-        """리스트를 변환한다."""
-        items = []
-        list_type = list_element.name
-        
-        for li in list_element.find_all('li', recursive=False):
-            item_text = self._process_inline_elements(li, li.get_text())
-            
-            if list_type == 'ul':
-                items.append(f"- {item_text}")
-            else:  # ol
-                items.append(f"1. {item_text}")
-        
-        return '\n'.join(items)
-    
-    def _convert_table(self, table: Tag) -> str:
-        """표를 Markdown 형식으로 변환한다."""
-        rows = []
-        
-        # 헤더 행 처리
-        thead = table.find('thead')
-        if thead:
-            header_row = []
-            for th in thead.find_all('th'):
-                header_row.append(th.get_text().strip())
-            if header_row:
-                rows.append('| ' + ' | '.join(header_row) + ' |')
-                rows.append('| ' + ' | '.join(['---'] * len(header_row)) + ' |')
-        else:
-            # thead가 없으면 첫 번째 행을 헤더로 간주
-            first_row = table.find('tr')
-            if first_row:
-                header_row = []
-                for th in first_row.find_all(['th', 'td']):
-                    header_row.append(th.get_text().strip())
-                if header_row:
-                    rows.append('| ' + ' | '.join(header_row) + ' |')
-                    rows.append('| ' + ' | '.join(['---'] * len(header_row)) + ' |')
-        
-        # 데이터 행 처리
-        tbody = table.find('tbody') or table
-        for tr in tbody.find_all('tr'):
-            if tr.find('th'):  # 헤더 행인 경우
-                continue
-            row = []
-            for td in tr.find_all('td'):
-                cell_text = td.get_text().strip()
-                # 파이프 문자 이스케이프
-                cell_text = cell_text.replace('|', '\\|')
-                row.append(cell_text)
-            if row:
-                rows.append('| ' + ' | '.join(row) + ' |')
-        
-        return '\n'.join(rows)
-    
-    def _convert_code_block(self, pre: Tag) -> str:
-        """코드 블록을 변환한다."""
-        code = pre.find('code')
-        if code:
-            language = self._detect_code_language(code)
-            content = code.get_text()
-            return f"```{language}\n{content}\n```"
-        else:
-            content = pre.get_text()
-            return f"```\n{content}\n```"
+    @staticmethod
+    def _build_result(converted: Dict[str, Any], backend: str, preserve_structure: bool, save_to_file: bool, saved_file_path: Optional[str], cache_hit: Optional[bool]) -> Dict[str, Any]:
+        """convert() 성공 결과 구성 (cache_hit은 캐시를 사용하지 않으면 None)"""
+        return {
+            'status': 'success',
+            'markdown': converted['markdown'],
+            'metadata': converted['metadata'],
+            'conversion_info': {
+                'backend': backend,
+                'preserve_structure': preserve_structure,
+                'elements_converted': converted['elements_converted'],
+                'pruned_bytes': converted.get('pruned_bytes', 0),
+                'saved_to_file': save_to_file,
+                'file_path': saved_file_path,
+                'cache_hit': cache_hit
+            }
+        }
     
-    def _convert_blockquote(self, blockquote: Tag) -> str:
-        """인용문을 변환한다."""
-        text = blockquote.get_text().strip()
-        lines = text.split('\n')
-        quoted_lines = [f"> {line}" for line in lines]
-        return '\n'.join(quoted_lines)
+    def get_cache_stats(self) -> Optional[Dict[str, Any]]:
+        """변환 캐시 적중/실패 카운터 (캐시 미설정 시 None)"""
+        return self.cache.get_stats() if self.cache is not None else None
     
-    def _process_inline_elements(self, element: Tag, text: str) -> str:
-        """인라인 요소를 처리한다."""
-        # strong/b 태그
-        for strong in element.find_all(['strong', 'b']):
-            original = strong.get_text()
-            replacement = f"**{original}**"
-            text = text.replace(original, replacement)
-        
-        # em/i 태그
-        for em in element.find_all(['em', 'i']):
-            original = em.get_text()
-            replacement = f"*{original}*"
-            text = text.replace(original, replacement)
-        
-        # code 태그 (인라인)
-        for code in element.find_all('code'):
-            if not code.find_parent('pre'):  # pre 안에 있지 않은 경우만
-                original = code.get_text()
-                replacement = f"`{original}`"
-                text = text.replace(original, replacement)
-        
-        # del/s 태그
-        for del_tag in element.find_all(['del', 's']):
-            original = del_tag.get_text()
-            replacement = f"~~{original}~~"
-            text = text.replace(original, replacement)
-        
-        # 링크 처리
-        for a in element.find_all('a'):
-            href = a.get('href', '')
-            link_text = a.get_text()
-            if href and link_text:
-                replacement = f"[{link_text}]({href})"
-                text = text.replace(link_text, replacement)
-        
-        return text
+    async def convert_stream(self, source: HTMLSource, document_title: str = None, metadata: Optional[Dict[str, Any]] = None, chunk_size: int = STREAM_CHUNK_SIZE) -> AsyncIterator[str]:
+        """HTML을 조각 단위로 파싱하며 Markdown 조각을 순서대로 생성하는 비동기 제너레이터
+
+        생성된 조각을 그대로 이어 붙이면 convert()의 markdown과 같다. 최상위 블록이 닫힐
+        때마다 내보내고 해당 요소를 트리에서 제거하므로 최대 메모리는 페이지 크기가 아니라
+        가장 큰 블록 크기에 비례한다. metadata 딕셔너리를 넘기면 변환이 끝난 뒤 메타데이터와
+        변환 통계를 채워 준다. lxml이 없으면 convert()로 한 번에 변환한 결과를 내보낸다.
+        """
+        if not LXML_AVAILABLE:
+            html_content = await self._read_source(source)
+            result = await self.convert(html_content, document_title=document_title, backend='bs4')
+            if result['status'] != 'success':
+                raise RuntimeError(result['message'])
+            if metadata is not None:
+                metadata.update(result['metadata'])
+            if result['markdown']:
+                yield result['markdown']
+            return
+
+        stream = MarkdownStreamConverter(document_title=document_title, renderer=self.lxml_renderer)
+        pruner = HTMLPruner(self.prune_config)
+        input_chars = 0
+        async for chunk in self._iter_source(source, chunk_size):
+            input_chars += len(chunk)
+            for fragment in stream.feed(pruner.feed(chunk)):
+                yield fragment
+        for fragment in stream.feed(pruner.close()):
+            yield fragment
+        for fragment in stream.close():
+            yield fragment
+
+        if metadata is not None:
+            metadata.update(stream.metadata)
+            metadata['stream'] = {
+                'input_chars': input_chars,
+                'pruned_bytes': pruner.pruned_bytes,
+                'output_chars': stream.chars_emitted,
+                'blocks': stream.blocks_emitted,
+                'parser_restarts': stream.parser_restarts
+            }
     
-    def _detect_code_language(self, code_element: Tag) -> str:
-        """코드 언어를 감지한다."""
-        # class에서 언어 추출
-        class_name = code_element.get('class', [])
-        for cls in class_name:
-            if cls.startswith('language-'):
-                return cls.replace('language-', '')
-            if cls in ['python', 'javascript', 'json', 'yaml', 'xml', 'sql', 'bash', 'shell']:
-                return cls
+    async def convert_to_file(self, source: HTMLSource, output_path: str, document_title: str = None, chunk_size: int = STREAM_CHUNK_SIZE) -> Dict[str, Any]:
+        """HTML을 스트리밍으로 변환하며 Markdown을 파일에 바로 기록한다.
+
+        결과 문자열을 메모리에 모으지 않으므로 반환값에는 markdown 대신 file_path가 들어간다.
+        """
+        import os
+        import time
+        import aiofiles
         
-        # 부모 pre 태그의 class 확인
-        pre = code_element.find_parent('pre')
-        if pre:
-            pre_class = pre.get('class', [])
-            for cls in pre_class:
-                if cls.startswith('language-'):
-                    return cls.replace('language-', '')
-                if cls in ['python', 'javascript', 'json', 'yaml', 'xml', 'sql', 'bash', 'shell']:
-                    return cls
+        try:
+            t0 = time.perf_counter()
+            os.makedirs(os.path.dirname(output_path) if os.path.dirname(output_path) else ".", exist_ok=True)
+            metadata: Dict[str, Any] = {}
+            async with aiofiles.open(output_path, 'w', encoding='utf-8') as f:
+                # 조각마다 쓰면 스레드 풀 왕복이 잦으므로 chunk_size만큼 모아서 기록
+                buffer: List[str] = []
+                buffered = 0
+                async for fragment in self.convert_stream(source, document_title=document_title, metadata=metadata, chunk_size=chunk_size):
+                    buffer.append(fragment)
+                    buffered += len(fragment)
+                    if buffered >= chunk_size:
+                        await f.write(''.join(buffer))
+                        buffer, buffered = [], 0
+                if buffer:
+                    await f.write(''.join(buffer))
+            stream_info = metadata.pop('stream', {})
+            self.logger.info(
+                "HTML→MD | step=stream | input_chars=%s | output_chars=%s | blocks=%s | path=%s | elapsed=%.3fs",
+                stream_info.get('input_chars'),
+                stream_info.get('output_chars'),
+                stream_info.get('blocks'),
+                output_path,
+                (time.perf_counter() - t0)
+            )
+            return {
+                'status': 'success',
+                'file_path': output_path,
+                'metadata': metadata,
+                'conversion_info': {
+                    'backend': 'lxml' if LXML_AVAILABLE else 'bs4',
+                    'streaming': True,
+                    'elements_converted': stream_info.get('blocks'),
+                    'input_chars': stream_info.get('input_chars'),
+                    'output_chars': stream_info.get('output_chars'),
+                    'pruned_bytes': stream_info.get('pruned_bytes'),
+                    'saved_to_file': True,
+                    'file_path': output_path
+                }
+            }
         
-        return 'text'
+        except Exception as e:
+            self.logger.error(f"HTML→MD 스트리밍 변환 실패: {str(e)}")
+            return {
+                'status': 'error',
+                'message': f'HTML→MD 스트리밍 변환 중 오류가 발생했습니다: {str(e)}',
+                'requires_manual_review': True
+            }
     
-    def _convert_confluence_macro(self, macro: Tag) -> str:
-        """Confluence 특수 매크로를 변환한다."""
-        macro_name = macro.get('ac:name', '')
-        
-        if macro_name == 'code':
-            return self._convert_confluence_code_macro(macro)
-        elif macro_name == 'info':
-            return self._convert_confluence_info_macro(macro)
-        elif macro_name == 'warning':
-            return self._convert_confluence_warning_macro(macro)
-        elif macro_name == 'note':
-            return self._convert_confluence_note_macro(macro)
+    @staticmethod
+    async def _iter_source(source: HTMLSource, chunk_size: int) -> AsyncIterator[Union[str, bytes]]:
+        """스트리밍 입력을 조각 단위로 순회 (문자열/바이트는 chunk_size로 분할)"""
+        if isinstance(source, (str, bytes)):
+            for offset in range(0, len(source), chunk_size):
+                yield source[offset:offset + chunk_size]
+        elif hasattr(source, '__aiter__'):
+            async for chunk in source:
+                yield chunk
         else:
-            # 알 수 없는 매크로는 텍스트로 변환
-            return macro.get_text().strip()
+            for chunk in source:
+                yield chunk
     
-    def _convert_confluence_code_macro(self, macro: Tag) -> str:
-        """Confluence 코드 매크로를 변환한다."""
-        # 언어 파라미터 확인
-        language_param = macro.find('ac:parameter', {'ac:name': 'language'})
-        language = language_param.get_text().strip() if language_param else ''
-        
-        # 코드 내용 추출 (CDATA 섹션 처리)
-        plain_text_body = macro.find('ac:plain-text-body')
-        if plain_text_body:
-            # CDATA 섹션에서 텍스트 추출
-            code_content = self._extract_cdata_content(plain_text_body)
-            if code_content:
-                if language:
-                    return f"```{language}\n{code_content}\n```"
-                else:
-                    return f"```\n{code_content}\n```"
-        
-        return ''
+    async def _read_source(self, source: HTMLSource) -> str:
+        """스트리밍 입력 전체를 문자열로 읽는다 (lxml이 없을 때만 사용)"""
+        parts = []
+        async for chunk in self._iter_source(source, STREAM_CHUNK_SIZE):
+            parts.append(chunk.decode('utf-8') if isinstance(chunk, bytes) else chunk)
+        return ''.join(parts)
     
-    def _extract_cdata_content(self, element: Tag) -> str:
-        """CDATA 섹션에서 내용을 추출한다."""
-        # CDATA 섹션 찾기
-        for content in element.contents:
-            if hasattr(content, 'strip') and content.strip():
-                # CDATA 섹션은 보통 문자열로 저장됨
-                text = content.strip()
-                # CDATA 태그 제거
-                if text.startswith('[CDATA[') and text.endswith(']]'):
-                    text = text[7:-2]  # [CDATA[ 와 ]] 제거
-                return text
-        
-        # 일반 텍스트 추출 시도
-        text = element.get_text().strip()
-        if text.startswith('[CDATA[') and text.endswith(']]'):
-            text = text[7:-2]  # [CDATA[ 와 ]] 제거
-        return text
-    
-    def _convert_confluence_info_macro(self, macro: Tag) -> str:
-        """Confluence 정보 매크로를 변환한다."""
-        content = macro.get_text().strip()
-        return f"> **정보**: {content}"
-    
-    def _convert_confluence_warning_macro(self, macro: Tag) -> str:
-        """Confluence 경고 매크로를 변환한다."""
-        content = macro.get_text().strip()
-        return f"> **⚠️ 경고**: {content}"
-    
-    def _convert_confluence_note_macro(self, macro: Tag) -> str:
-        """Confluence 노트 매크로를 변환한다."""
-        content = macro.get_text().strip()
-        return f"> **📝 노트**: {content}"
+    def resolve_backend(self, backend: Optional[str] = None) -> str:
+        """호출별 백엔드를 확정한다 (None이면 생성 시 지정한 백엔드, lxml 미설치 시 bs4로 대체)."""
+        backend = backend or self.backend
+        if backend not in CONVERSION_BACKENDS:
+            raise ValueError(f"지원하지 않는 변환 백엔드입니다: {backend} (지원: {', '.join(CONVERSION_BACKENDS)})")
+        if backend == 'lxml' and not LXML_AVAILABLE:
+            self.logger.warning("lxml이 설치되어 있지 않아 bs4 백엔드로 변환합니다")
+            return 'bs4'
+        return backend
     
     def _cleanup_markdown(self, markdown: str) -> str:
         """Markdown을 정리한다."""
@@ -386,6 +367,10 @@ class HTMLToMarkdownConverter:
         
         return metadata
     
+    async def save_markdown(self, markdown_content: str, output_path: str = None) -> str:
+        """이미 변환된 Markdown을 파일로 저장하고 저장 경로를 반환한다."""
+        return await self._save_to_file(markdown_content, output_path)
+    
     async def _save_to_file(self, markdown_content: str, output_path: str = None) -> str:
         """Markdown을 파일로 저장한다."""
         import os
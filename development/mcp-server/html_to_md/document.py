@@ -0,0 +1,106 @@
+"""
+파싱된 문서 모델
+HTML을 한 번만 파싱하여 변환기, 파서, 검증기가 함께 사용하는 불변 문서 객체를 제공하는 모듈
+"""
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Tuple, Union
+
+from .lxml_backend import parse_html, text_of
+from .renderer import HEADING_TAGS, LIST_TAGS
+
+
+# 파싱과 같은 순회에서 요소를 모아 두는 태그 (변환 메타데이터, 구조 분석, 검증에 필요한 것만)
+INDEXED_TAGS = frozenset(HEADING_TAGS + LIST_TAGS + (
+    'title', 'p', 'table', 'pre', 'code', 'a', 'img', 'ac:structured-macro'
+))
+
+
+@dataclass(frozen=True)
+class DocumentStats:
+    """문서 구조 통계"""
+    headings: int = 0
+    tables: int = 0
+    lists: int = 0
+    pre_blocks: int = 0
+    code_macros: int = 0
+    links: int = 0
+    images: int = 0
+    text_length: int = 0
+    title: str = ''
+
+    @property
+    def code_blocks(self) -> int:
+        """코드 블록 수 (pre 태그 + Confluence 코드 매크로)"""
+        return self.pre_blocks + self.code_macros
+
+
+@dataclass(frozen=True)
+class ParsedDocument:
+    """한 번 파싱한 HTML 문서
+
+    ParsedDocument.parse()로 만들며, 파싱 직후 한 번의 순회로 구조 통계(stats)와
+    태그별 요소 목록을 함께 계산한다. HTMLToMarkdownConverter.convert(),
+    HTMLParser.parse_html_structure(), ConversionValidator.validate_conversion()은
+    HTML 문자열 대신 이 객체를 받아 다시 파싱하지 않는다.
+    사용하는 쪽은 root 트리를 읽기만 해야 한다.
+    """
+    html: str
+    root: Optional[Any]
+    stats: DocumentStats
+    _index: Mapping[str, Tuple[Any, ...]] = field(default_factory=dict, repr=False, compare=False)
+
+    @classmethod
+    def parse(cls, html_content: str) -> "ParsedDocument":
+        """HTML을 lxml로 파싱하고 같은 순회에서 통계와 요소 목록을 계산"""
+        html_content = html_content or ''
+        root = parse_html(html_content)
+        index: Dict[str, list] = {}
+        code_macros = 0
+        if root is not None:
+            for element in root.iter():
+                tag = element.tag
+                if tag not in INDEXED_TAGS:
+                    continue
+                index.setdefault(tag, []).append(element)
+                if tag == 'ac:structured-macro' and element.get('ac:name') == 'code':
+                    code_macros += 1
+
+        frozen = {tag: tuple(elements) for tag, elements in index.items()}
+        h1 = frozen.get('h1') or frozen.get('title')
+        stats = DocumentStats(
+            headings=sum(len(frozen.get(tag, ())) for tag in HEADING_TAGS),
+            tables=len(frozen.get('table', ())),
+            lists=sum(len(frozen.get(tag, ())) for tag in LIST_TAGS),
+            pre_blocks=len(frozen.get('pre', ())),
+            code_macros=code_macros,
+            links=len(frozen.get('a', ())),
+            images=len(frozen.get('img', ())),
+            text_length=len(text_of(root).strip()) if root is not None else 0,
+            title=text_of(h1[0]).strip() if h1 else ''
+        )
+        return cls(html=html_content, root=root, stats=stats, _index=MappingProxyType(frozen))
+
+    @classmethod
+    def of(cls, source: Union[str, "ParsedDocument"]) -> "ParsedDocument":
+        """문자열이면 파싱하고, 이미 파싱된 문서면 그대로 반환"""
+        return source if isinstance(source, cls) else cls.parse(source)
+
+    def elements(self, tag: str) -> Tuple[Any, ...]:
+        """문서 순서대로 정렬된 태그 요소 목록 (INDEXED_TAGS에 속한 태그만)"""
+        if tag not in INDEXED_TAGS:
+            raise KeyError(f"색인하지 않은 태그입니다: {tag}")
+        return self._index.get(tag, ())
+
+    def metadata(self) -> Dict[str, Any]:
+        """HTMLToMarkdownConverter.convert() 결과의 metadata 형식으로 변환"""
+        stats = self.stats
+        return {
+            'title': stats.title,
+            'has_tables': stats.tables > 0,
+            'has_code_blocks': stats.code_blocks > 0,
+            'has_lists': stats.lists > 0,
+            'has_links': stats.links > 0,
+            'has_images': stats.images > 0,
+            'code_blocks_count': stats.code_blocks
+        }
@@ -0,0 +1,244 @@
+"""
+HTML→Markdown 배치 변환 실행기
+여러 페이지의 변환을 프로세스 풀에 나눠 실행하고 입력 순서대로 결과를 돌려주는 모듈
+
+HTML 파싱과 렌더링은 GIL을 잡는 CPU 작업이므로 이벤트 루프에서 한 페이지씩 변환하면
+코어 하나만 사용한다. 워커에는 HTML 바이트만 보내고 Markdown과 메타데이터만 돌려받는다.
+"""
+import os
+import time
+import asyncio
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from utils.mp import worker_context
+
+from .cache import ConversionCache
+from .converter import HTMLToMarkdownConverter
+from .pruner import PruneConfig
+
+
+# (입력 순번, UTF-8 HTML 바이트, 문서 제목)
+ConversionTask = Tuple[int, bytes, Optional[str]]
+
+# 워커 프로세스마다 한 번 만들어 재사용하는 변환기와 이벤트 루프
+_worker_converter: Optional[HTMLToMarkdownConverter] = None
+_worker_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _init_worker(backend: Optional[str], prune_config: PruneConfig) -> None:
+    global _worker_converter, _worker_loop
+    _worker_converter = HTMLToMarkdownConverter(backend=backend, prune_config=prune_config)
+    _worker_loop = asyncio.new_event_loop()
+
+
+def _convert_in_worker(task: ConversionTask) -> Tuple[int, Dict[str, Any], int, float]:
+    """워커 프로세스에서 한 페이지를 변환 (결과, 워커 PID, 변환 시간 반환)"""
+    index, html_bytes, document_title = task
+    started = time.perf_counter()
+    result = _worker_loop.run_until_complete(
+        _worker_converter.convert(html_bytes.decode('utf-8'), document_title=document_title)
+    )
+    # 실패 시 원본 HTML(fallback_content)은 호출 측에 이미 있으므로 돌려보내지 않는다
+    result.pop('fallback_content', None)
+    return index, result, os.getpid(), time.perf_counter() - started
+
+
+@dataclass
+class ConversionExecutorConfig:
+    """배치 변환 실행기 설정"""
+    workers: int = field(default_factory=lambda: os.cpu_count() or 1)  # 워커 프로세스 수
+    min_batch: int = 2                 # 이보다 적은 페이지는 프로세스 풀 없이 현재 프로세스에서 변환
+    min_bytes: int = 1024 * 1024       # 변환할 HTML 합계가 이보다 작아도 현재 프로세스에서 변환 (풀 시작 비용이 더 큼)
+    start_method: str = "spawn"        # 서버의 스레드/이벤트 루프 상태를 복제하지 않도록 spawn 사용
+
+    @classmethod
+    def from_env(cls) -> "ConversionExecutorConfig":
+        """환경변수(HTML_TO_MD_*)에서 설정을 읽는다. 미설정 항목은 기본값 사용"""
+        defaults = cls()
+        return cls(
+            workers=max(1, int(os.getenv("HTML_TO_MD_WORKERS", defaults.workers))),
+            min_batch=int(os.getenv("HTML_TO_MD_MIN_BATCH", defaults.min_batch)),
+            min_bytes=int(os.getenv("HTML_TO_MD_MIN_BYTES", defaults.min_bytes)),
+            start_method=os.getenv("HTML_TO_MD_START_METHOD", defaults.start_method)
+        )
+
+
+class ConversionExecutor:
+    """프로세스 풀 기반 HTML→Markdown 배치 변환기
+
+    convert_batch()는 (HTML, 제목) 목록을 받아 입력 순서대로 convert() 결과를 반환한다.
+    변환 캐시를 넘기면 현재 프로세스에서 먼저 조회하여 적중한 페이지는 워커로 보내지 않는다.
+    프로세스 풀은 첫 배치에서 만들어 재사용하며, shutdown()으로 정리한다.
+    워커가 비정상 종료되면 해당 페이지는 오류 결과로 채우고 다음 배치에서 풀을 새로 만든다.
+    """
+
+    def __init__(self, config: Optional[ConversionExecutorConfig] = None, backend: Optional[str] = None, prune_config: Optional[PruneConfig] = None):
+        self.logger = logging.getLogger("specgate.htmlconverter.executor")
+        self.config = config or ConversionExecutorConfig.from_env()
+        self.backend = backend
+        self.prune_config = prune_config or PruneConfig.from_env()
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._local_converter: Optional[HTMLToMarkdownConverter] = None
+
+        self.batches = 0
+        self.pages_converted = 0
+        self.pages_failed = 0
+        self.last_batch: Dict[str, Any] = {}
+
+    async def convert_batch(self, pages: Sequence[Tuple[str, Optional[str]]], cache: Optional[ConversionCache] = None) -> List[Dict[str, Any]]:
+        """(HTML, 문서 제목) 목록을 변환하여 입력 순서대로 결과 목록 반환"""
+        if not pages:
+            return []
+        started = time.perf_counter()
+
+        results: List[Optional[Dict[str, Any]]] = [None] * len(pages)
+        keys: List[Optional[str]] = [None] * len(pages)
+        if cache is not None:
+            converter = self._get_local_converter()
+            backend = converter.resolve_backend()
+            for index, (html, title) in enumerate(pages):
+                keys[index] = converter.cache_key(html, document_title=title, backend=backend)
+                cached = cache.get(keys[index])
+                if cached is not None:
+                    results[index] = HTMLToMarkdownConverter._build_result(cached, backend, True, False, None, cache_hit=True)
+        pending = [index for index, result in enumerate(results) if result is None]
+        cache_hits = len(pages) - len(pending)
+
+        use_pool = self.uses_pool([pages[index][0] for index in pending])
+        timings: Dict[int, List[float]] = {}
+        if pending:
+            pending_pages = [pages[index] for index in pending]
+            if use_pool:
+                timings, converted = await self._convert_in_pool(pending_pages)
+            else:
+                timings, converted = await self._convert_locally(pending_pages)
+            for index, result in zip(pending, converted):
+                results[index] = result
+                if cache is not None and result.get('status') == 'success':
+                    result['conversion_info']['cache_hit'] = False
+                    cache.put(keys[index], {
+                        'markdown': result['markdown'],
+                        'metadata': result['metadata'],
+                        'elements_converted': result['conversion_info']['elements_converted'],
+                        'pruned_bytes': result['conversion_info']['pruned_bytes']
+                    })
+        elapsed = time.perf_counter() - started
+
+        failed = sum(1 for result in results if result.get('status') != 'success')
+        self.batches += 1
+        self.pages_converted += len(results) - failed
+        self.pages_failed += failed
+        self.last_batch = self._summarize(len(pages), elapsed, timings, use_pool, failed)
+        self.last_batch['cache_hits'] = cache_hits
+        self.logger.info(
+            "HTML→MD 배치 변환 | pages=%d | cache_hits=%d | mode=%s | workers=%d | failed=%d | elapsed=%.3fs | busy=%.3fs",
+            len(pages), cache_hits, self.last_batch['mode'], len(timings), failed, elapsed, self.last_batch['busy_seconds']
+        )
+        return results
+
+    def uses_pool(self, htmls: Sequence[str]) -> bool:
+        """이 HTML 목록을 프로세스 풀에서 변환할지 (워커 2개 이상, 페이지 수와 HTML 크기가 기준 이상)"""
+        if self.config.workers <= 1 or len(htmls) < self.config.min_batch:
+            return False
+        return sum(len((html or '').encode('utf-8')) for html in htmls) >= self.config.min_bytes
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """누적 변환 지표와 마지막 배치의 워커별 시간"""
+        return {
+            'workers': self.config.workers,
+            'batches': self.batches,
+            'pages_converted': self.pages_converted,
+            'pages_failed': self.pages_failed,
+            'last_batch': self.last_batch
+        }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """프로세스 풀 종료"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=wait, cancel_futures=True)
+            self._pool = None
+
+    async def _convert_in_pool(self, pages: Sequence[Tuple[str, Optional[str]]]) -> Tuple[Dict[int, List[float]], List[Dict[str, Any]]]:
+        pool = self._get_pool()
+        loop = asyncio.get_running_loop()
+        futures = [
+            loop.run_in_executor(pool, _convert_in_worker, (index, (html or '').encode('utf-8'), title))
+            for index, (html, title) in enumerate(pages)
+        ]
+        outcomes = await asyncio.gather(*futures, return_exceptions=True)
+
+        timings: Dict[int, List[float]] = {}
+        results: List[Dict[str, Any]] = []
+        for index, outcome in enumerate(outcomes):
+            if isinstance(outcome, BaseException):
+                if isinstance(outcome, BrokenProcessPool):
+                    self._pool = None
+                self.logger.error(f"HTML→MD 워커 변환 실패 (index={index}): {outcome}")
+                results.append(self._error_result(outcome))
+                continue
+            _, result, pid, elapsed = outcome
+            timings.setdefault(pid, []).append(elapsed)
+            results.append(result)
+        return timings, results
+
+    async def _convert_locally(self, pages: Sequence[Tuple[str, Optional[str]]]) -> Tuple[Dict[int, List[float]], List[Dict[str, Any]]]:
+        converter = self._get_local_converter()
+        pid = os.getpid()
+        timings: Dict[int, List[float]] = {pid: []}
+        results = []
+        for html, title in pages:
+            started = time.perf_counter()
+            result = await converter.convert(html or '', document_title=title)
+            result.pop('fallback_content', None)
+            timings[pid].append(time.perf_counter() - started)
+            results.append(result)
+        return timings, results
+
+    def _get_local_converter(self) -> HTMLToMarkdownConverter:
+        if self._local_converter is None:
+            self._local_converter = HTMLToMarkdownConverter(backend=self.backend, prune_config=self.prune_config)
+        return self._local_converter
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.config.workers,
+                mp_context=worker_context(self.config.start_method),
+                initializer=_init_worker,
+                initargs=(self.backend, self.prune_config)
+            )
+        return self._pool
+
+    @staticmethod
+    def _summarize(pages: int, elapsed: float, timings: Dict[int, List[float]], use_pool: bool, failed: int) -> Dict[str, Any]:
+        per_worker = {
+            str(pid): {
+                'pages': len(samples),
+                'busy_seconds': round(sum(samples), 4),
+                'max_page_seconds': round(max(samples), 4)
+            }
+            for pid, samples in timings.items()
+        }
+        busy = sum(worker['busy_seconds'] for worker in per_worker.values())
+        return {
+            'mode': 'process_pool' if use_pool else 'in_process',
+            'pages': pages,
+            'failed': failed,
+            'elapsed': round(elapsed, 4),
+            'busy_seconds': round(busy, 4),
+            # 실제 병렬 효과 (워커 변환 시간 합 / 경과 시간)
+            'parallelism': round(busy / elapsed, 2) if elapsed else None,
+            'per_worker': per_worker
+        }
+
+    @staticmethod
+    def _error_result(error: BaseException) -> Dict[str, Any]:
+        return {
+            'status': 'error',
+            'message': f'HTML→MD 변환 중 오류가 발생했습니다: {str(error) or type(error).__name__}',
+            'requires_manual_review': True
+        }
@@ -0,0 +1,291 @@
+"""
+lxml 변환 백엔드
+BeautifulSoup 트리 없이 lxml 요소를 직접 순회하여 Markdown을 생성하는 모듈
+
+MarkdownRenderer(BeautifulSoup 경로)와 동일한 출력을 내도록 작성되어 있으며,
+Confluence 저장 형식의 ac:/ri: 접두어 요소(매크로, 링크 등)도 태그 이름 그대로 다룬다.
+"""
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+try:
+    from lxml import etree
+    LXML_AVAILABLE = True
+except ImportError:  # pragma: no cover - lxml은 requirements에 포함되어 있음
+    etree = None
+    LXML_AVAILABLE = False
+
+from .renderer import (
+    CELL_TAGS,
+    HEADING_TAGS,
+    INLINE_MARKERS,
+    KNOWN_CODE_LANGUAGES,
+    LIST_TAGS,
+    MACRO_PLAIN_BODY_TAG,
+    MACRO_RICH_BODY_TAG,
+    MACRO_TAG,
+    PANEL_MACRO_PREFIXES,
+    TABLE_SECTION_TAGS,
+)
+from .pruner import escape_cdata
+from .tables import MAX_COLSPAN, MAX_ROWSPAN, MarkdownTableWriter, TableCell, format_cell_text, parse_span
+
+
+# BeautifulSoup의 get_text()가 제외하는 문자열 컨테이너 (Script/Stylesheet/TemplateString)
+NON_TEXT_TAGS = ('script', 'style', 'template')
+
+
+def parse_html(html_content: str) -> Optional[Any]:
+    """HTML 문자열을 lxml 요소 트리로 파싱 (빈 문서는 None)
+
+    BeautifulSoup이 텍스트로 취급하지 않는 script/style/template 요소는
+    뒤따르는 텍스트만 남기고 파싱 직후 한 번에 제거한다. CDATA 구획(코드 매크로 본문)은
+    파서가 버리지 않도록 파싱 전에 텍스트로 바꾼다.
+    """
+    if not html_content:
+        return None
+    html_content = escape_cdata(html_content)
+    try:
+        root = etree.HTML(html_content)
+    except ValueError:
+        # 인코딩 선언이 포함된 문자열은 바이트로 다시 파싱
+        root = etree.HTML(html_content.encode('utf-8'), etree.HTMLParser(encoding='utf-8'))
+    if root is not None:
+        etree.strip_elements(root, *NON_TEXT_TAGS, with_tail=False)
+    return root
+
+
+def text_of(element: Any) -> str:
+    """요소 하위 텍스트 (BeautifulSoup get_text()와 동일하게 주석 제외)"""
+    return ''.join(element.itertext())
+
+
+class LxmlMarkdownRenderer:
+    """lxml 요소 트리용 단일 순회 Markdown 렌더러
+
+    블록/인라인 처리 규칙은 MarkdownRenderer와 같다. lxml은 텍스트를 요소의
+    text/tail로 보관하므로 자식 순회 시 각 자식 뒤에 tail을 이어 붙인다.
+    """
+
+    def __init__(self):
+        self._handlers: Dict[str, Callable[[Any], str]] = {
+            'p': self._render_paragraph,
+            'ul': self._render_list,
+            'ol': self._render_list,
+            'table': self._render_table,
+            'pre': self._render_code_block,
+            'blockquote': self._render_blockquote,
+            MACRO_TAG: self.render_macro,
+        }
+        for tag in HEADING_TAGS:
+            self._handlers[tag] = self._render_heading
+
+    def render(self, root: Optional[Any]) -> List[str]:
+        """root 하위의 블록들을 문서 순서대로 렌더링한 Markdown 블록 목록 반환"""
+        blocks: List[str] = []
+        if root is not None:
+            self._walk(root, blocks)
+        return blocks
+
+    def is_block(self, tag: Any) -> bool:
+        """블록 단위로 렌더링하는 태그인지 확인 (스트리밍 변환에서 사용)"""
+        return tag in self._handlers
+
+    def render_block(self, element: Any) -> str:
+        """블록 요소 하나를 렌더링 (블록 태그가 아니면 빈 문자열)"""
+        handler = self._handlers.get(element.tag)
+        return handler(element) if handler else ""
+
+    def _walk(self, node: Any, blocks: List[str]) -> None:
+        for child in node:
+            tag = child.tag
+            if not isinstance(tag, str):
+                continue
+            handler = self._handlers.get(tag)
+            if handler is None:
+                self._walk(child, blocks)
+                continue
+            block = handler(child)
+            if block:
+                blocks.append(block)
+
+    # ------------------------------------------------------------------
+    # 블록 요소
+    # ------------------------------------------------------------------
+    def _render_heading(self, heading: Any) -> str:
+        level = int(heading.tag[1])
+        text = text_of(heading).strip()
+        return f"{'#' * level} {text}" if text else ""
+
+    def _render_paragraph(self, paragraph: Any) -> str:
+        return self.render_inline(paragraph).strip()
+
+    def _render_list(self, list_element: Any, depth: int = 0) -> str:
+        lines = []
+        marker = '- ' if list_element.tag == 'ul' else '1. '
+        indent = '  ' * depth
+        for li in list_element:
+            if li.tag != 'li':
+                continue
+            lines.append(f"{indent}{marker}{' '.join(self.render_inline(li, LIST_TAGS).split())}")
+            for child in li:
+                if child.tag in LIST_TAGS:
+                    sub_list = self._render_list(child, depth + 1)
+                    if sub_list:
+                        lines.append(sub_list)
+        return '\n'.join(lines)
+
+    def _render_table(self, table: Any) -> str:
+        header_row = None
+        thead = table.find('thead')
+        if thead is not None:
+            header_row = thead.find('tr')
+
+        writer = MarkdownTableWriter()
+        lines: List[str] = []
+        if header_row is not None:
+            lines.extend(writer.add_row(self.row_cells(header_row)))
+        for tr in self._iter_rows(table):
+            if tr is not header_row:
+                lines.extend(writer.add_row(self.row_cells(tr)))
+        return '\n'.join(lines)
+
+    @staticmethod
+    def _iter_rows(table: Any) -> Iterator[Any]:
+        """표 자신의 행만 순서대로 순회 (중첩 표의 행은 제외)"""
+        for child in table:
+            if child.tag == 'tr':
+                yield child
+            elif child.tag in TABLE_SECTION_TAGS:
+                for tr in child:
+                    if tr.tag == 'tr':
+                        yield tr
+
+    def row_cells(self, tr: Any) -> List[TableCell]:
+        """행의 셀 목록 (셀 텍스트, colspan, rowspan)"""
+        cells = []
+        for cell in tr:
+            if cell.tag in CELL_TAGS:
+                cells.append((
+                    format_cell_text(self.render_inline(cell)),
+                    parse_span(cell.get('colspan'), MAX_COLSPAN),
+                    parse_span(cell.get('rowspan'), MAX_ROWSPAN)
+                ))
+        return cells
+
+    def _render_code_block(self, pre: Any) -> str:
+        code = pre.find('.//code')
+        if code is not None:
+            language = self._detect_code_language(code, pre)
+            return f"```{language}\n{text_of(code)}\n```"
+        return f"```\n{text_of(pre)}\n```"
+
+    def _render_blockquote(self, blockquote: Any) -> str:
+        inner: List[str] = []
+        self._walk(blockquote, inner)
+        text = '\n\n'.join(inner) if inner else text_of(blockquote).strip()
+        if not text:
+            return ""
+        return '\n'.join(f"> {line}" if line else ">" for line in text.split('\n'))
+
+    # ------------------------------------------------------------------
+    # 인라인 요소
+    # ------------------------------------------------------------------
+    def render_inline(self, element: Any, skip_tags: Tuple[str, ...] = ()) -> str:
+        """요소의 자식을 한 번 순회하며 인라인 Markdown 생성 (skip_tags 하위는 제외)"""
+        buffer: List[str] = []
+        self._inline_children(element, skip_tags, buffer)
+        return ''.join(buffer)
+
+    def _inline_children(self, element: Any, skip_tags: Tuple[str, ...], buffer: List[str]) -> None:
+        if element.text:
+            buffer.append(element.text)
+        for child in element:
+            if isinstance(child.tag, str) and child.tag not in skip_tags:
+                self._inline_node(child, skip_tags, buffer)
+            if child.tail:
+                buffer.append(child.tail)
+
+    def _inline_node(self, node: Any, skip_tags: Tuple[str, ...], buffer: List[str]) -> None:
+        name = node.tag
+        marker = INLINE_MARKERS.get(name)
+        if marker:
+            self._wrap(self.render_inline(node, skip_tags), marker, marker, buffer)
+        elif name == 'code':
+            self._wrap(text_of(node), '`', '`', buffer)
+        elif name == 'a':
+            href = node.get('href', '')
+            text = self.render_inline(node, skip_tags)
+            if href and text.strip():
+                self._wrap(text, '[', f']({href})', buffer)
+            else:
+                buffer.append(text)
+        elif name == 'br':
+            buffer.append('\n')
+        elif name == 'img':
+            src = node.get('src', '')
+            if src:
+                buffer.append(f"![{node.get('alt', '')}]({src})")
+        else:
+            self._inline_children(node, skip_tags, buffer)
+
+    @staticmethod
+    def _wrap(text: str, opener: str, closer: str, buffer: List[str]) -> None:
+        """앞뒤 공백은 표식 밖으로 빼서 감싼다 ('** 굵게 **' 방지)"""
+        stripped = text.strip()
+        if not stripped:
+            buffer.append(text)
+            return
+        leading = text[:len(text) - len(text.lstrip())]
+        trailing = text[len(text.rstrip()):]
+        buffer.append(f"{leading}{opener}{stripped}{closer}{trailing}")
+
+    @staticmethod
+    def _detect_code_language(code: Any, pre: Any) -> str:
+        for element in (code, pre):
+            for cls in (element.get('class') or '').split():
+                if cls.startswith('language-'):
+                    return cls.replace('language-', '')
+                if cls in KNOWN_CODE_LANGUAGES:
+                    return cls
+        return 'text'
+
+    # ------------------------------------------------------------------
+    # Confluence 매크로 (ac:structured-macro)
+    # ------------------------------------------------------------------
+    def render_macro(self, macro: Any) -> str:
+        """ac:structured-macro 요소 하나를 변환 (중첩 매크로는 본문 순회 중 제자리에서 변환)"""
+        macro_name = macro.get('ac:name', '')
+        if macro_name == 'code':
+            return self._render_code_macro(macro)
+
+        # ElementPath는 'ac:' 접두어를 네임스페이스로 해석하므로 자식을 직접 확인
+        body = next((child for child in macro if child.tag == MACRO_RICH_BODY_TAG), None)
+        prefix = PANEL_MACRO_PREFIXES.get(macro_name)
+        if body is None:
+            # 본문이 없는 매크로는 기존처럼 텍스트로 변환
+            content = text_of(macro).strip()
+            return f"{prefix}{content}" if prefix else content
+
+        inner: List[str] = []
+        self._walk(body, inner)
+        text = '\n\n'.join(inner) if inner else text_of(body).strip()
+        if not prefix or not text:
+            return text
+        first, *rest = text.split('\n')
+        return '\n'.join([f"{prefix}{first}"] + [f"> {line}" if line else ">" for line in rest])
+
+    def _render_code_macro(self, macro: Any) -> str:
+        language = ''
+        for parameter in macro.iter('ac:parameter'):
+            if parameter.get('ac:name') == 'language':
+                language = text_of(parameter).strip()
+                break
+
+        body = next(macro.iter(MACRO_PLAIN_BODY_TAG), None)
+        if body is None:
+            return ''
+        # CDATA 본문은 파싱 전에 escape_cdata()로 텍스트가 되어 있다
+        code_content = (body.text or '').strip() or text_of(body).strip()
+        if not code_content:
+            return ''
+        return f"```{language}\n{code_content}\n```"
@@ -0,0 +1,267 @@
+"""
+HTML 사전 가지치기
+파싱 전에 Markdown과 품질 검사에 쓰이지 않는 Confluence 저장 형식 요소/속성을 걷어내는 모듈
+
+draw.io/gliffy/Jira 매크로, base64 데이터 URI 이미지, 인라인 style, 레이아웃 래퍼는
+변환 결과에 남지 않지만 그대로 두면 파서가 트리로 만든다. 태그 단위 토크나이저로
+문자열을 한 번 훑어 트리를 만들기 전에 제거한다.
+"""
+import os
+import re
+import html
+import codecs
+from dataclasses import dataclass
+from typing import Iterator, Match, Tuple, Union
+
+from .renderer import MACRO_TAG
+
+
+# 통째로 제거하는 매크로 (ac:name)
+DEFAULT_PRUNED_MACROS = (
+    'drawio', 'drawio-sketch', 'inc-drawio', 'gliffy',  # 다이어그램: 매개변수와 첨부 참조만 있음
+    'jira',                                              # Jira 이슈 매크로: 서버 ID/조회 조건
+)
+# 태그만 제거하고 내용은 남기는 래퍼 (렌더러에서도 투명한 컨테이너)
+DEFAULT_UNWRAPPED_TAGS = ('ac:layout', 'ac:layout-section', 'ac:layout-cell')
+# 제거하는 속성
+DEFAULT_PRUNED_ATTRIBUTES = ('style',)
+# 값이 data: URI이면 제거하는 속성 (base64 인라인 이미지 등)
+DATA_URI_ATTRIBUTES = ('src', 'href')
+
+# 주석, CDATA, 시작 태그, 끝 태그 (속성값 안의 '>'는 따옴표로 구분)
+TOKEN_PATTERN = re.compile(
+    r'<!--.*?-->'
+    r'|<!\[CDATA\[.*?\]\]>'
+    r'|<(?P<end>/)?(?P<name>[A-Za-z][\w:.-]*)'
+    r'(?P<attrs>(?:\s+[^\s=>/"\']+(?:\s*=\s*(?:"[^"]*"|\'[^\']*\'|[^\s>"\']+))?)*)\s*(?P<selfclose>/)?>',
+    re.DOTALL
+)
+ATTRIBUTE_PATTERN = re.compile(r'(\s+)([^\s=>/"\']+)(?:(\s*=\s*)("[^"]*"|\'[^\']*\'|[^\s>"\']+))?')
+MACRO_NAME_PATTERN = re.compile(r'\bac:name\s*=\s*(?:"([^"]*)"|\'([^\']*)\')')
+# 닫히지 않은 주석/CDATA 여부 확인 (스트리밍 입력의 조각 경계)
+OPEN_SECTIONS = (('<!--', '-->'), ('<![CDATA[', ']]>'))
+# 주석 또는 CDATA 구획 (주석 안의 CDATA 표기는 그대로 둔다)
+CDATA_PATTERN = re.compile(r'<!--.*?-->|<!\[CDATA\[(?P<cdata>.*?)\]\]>', re.DOTALL)
+
+
+def escape_cdata(html_content: str) -> str:
+    """CDATA 구획을 같은 내용의 이스케이프된 텍스트로 바꾼다
+
+    Confluence 코드 매크로 본문(ac:plain-text-body)은 <![CDATA[...]]>로 저장되지만,
+    HTML 파서(lxml, html.parser)는 CDATA 구획을 주석으로 보고 버린다.
+    """
+    if '<![CDATA[' not in html_content:
+        return html_content
+    return CDATA_PATTERN.sub(
+        lambda match: match.group(0) if match.group('cdata') is None else html.escape(match.group('cdata'), quote=False),
+        html_content
+    )
+
+
+@dataclass(frozen=True)
+class PruneConfig:
+    """사전 가지치기 설정"""
+    enabled: bool = True
+    macros: Tuple[str, ...] = DEFAULT_PRUNED_MACROS
+    unwrap_tags: Tuple[str, ...] = DEFAULT_UNWRAPPED_TAGS
+    attributes: Tuple[str, ...] = DEFAULT_PRUNED_ATTRIBUTES
+    drop_data_uris: bool = True
+
+    @classmethod
+    def from_env(cls) -> "PruneConfig":
+        """환경변수(HTML_TO_MD_PRUNE*)에서 설정을 읽는다. 미설정 항목은 기본값 사용"""
+        defaults = cls()
+
+        def names(key: str, default: Tuple[str, ...]) -> Tuple[str, ...]:
+            value = os.getenv(key)
+            if value is None:
+                return default
+            return tuple(name.strip() for name in value.split(',') if name.strip())
+
+        return cls(
+            enabled=os.getenv("HTML_TO_MD_PRUNE", "1").lower() not in ("0", "false", "no", "off"),
+            macros=names("HTML_TO_MD_PRUNE_MACROS", defaults.macros),
+            unwrap_tags=names("HTML_TO_MD_PRUNE_UNWRAP", defaults.unwrap_tags),
+            attributes=names("HTML_TO_MD_PRUNE_ATTRIBUTES", defaults.attributes),
+            drop_data_uris=defaults.drop_data_uris
+        )
+
+    @property
+    def signature(self) -> str:
+        """변환 캐시 키에 넣는 설정 요약 (설정이 바뀌면 캐시된 결과를 쓰지 않음)"""
+        if not self.enabled:
+            return 'off'
+        return '|'.join((','.join(self.macros), ','.join(self.unwrap_tags), ','.join(self.attributes), str(self.drop_data_uris)))
+
+
+class HTMLPruner:
+    """태그 토크나이저 기반 사전 가지치기
+
+    모든 태그를 토큰화하지 않고, 제거 대상이 될 수 있는 위치(대상 태그 이름, 대상 속성,
+    data: 값)와 주석/CDATA 시작만 정규식 한 번으로 찾아 그 자리의 태그만 해석한다.
+    속성 관련 패턴은 조각에 해당 문자열이 있을 때만 넣어 '<'로 시작하는 빠른 검색을 유지한다.
+    feed(chunk)는 가지치기한 HTML을 반환하고, 태그가 조각 경계에서 잘리면 뒷부분을
+    다음 조각과 합쳐 처리한다. close()는 남은 부분을 반환한다. prune()은 한 번에 처리한다.
+    CDATA 구획은 가지치기 설정과 상관없이 escape_cdata()로 텍스트로 바꾼다.
+    pruned_bytes는 제거한 UTF-8 바이트 수이다.
+    """
+
+    def __init__(self, config: PruneConfig = None):
+        self.config = config or PruneConfig()
+        self._macros = frozenset(self.config.macros)
+        self._unwrap = frozenset(self.config.unwrap_tags)
+        self._attributes = frozenset(self.config.attributes)
+        self._triggers = {}
+        self._carry = ''
+        self._decoder = codecs.getincrementaldecoder('utf-8')()
+        self._skip_depth = 0      # 제거 중인 매크로 안의 ac:structured-macro 중첩 깊이
+        self.pruned_bytes = 0
+        self.elements_pruned = 0
+
+    def prune(self, html_content: str) -> str:
+        """HTML 문자열 전체를 가지치기"""
+        return self.feed(html_content) + self.close()
+
+    def feed(self, chunk: Union[str, bytes]) -> str:
+        """HTML 조각을 가지치기하여 반환 (잘린 태그는 다음 조각으로 넘김)"""
+        if isinstance(chunk, bytes):
+            # 조각 경계에서 잘린 멀티바이트 문자는 다음 조각과 합쳐 디코딩
+            chunk = self._decoder.decode(chunk)
+        text = self._carry + chunk if self._carry else chunk
+        cut = self._safe_end(text)
+        self._carry = text[cut:]
+        return self._prune(text[:cut])
+
+    def close(self) -> str:
+        """남은 입력을 가지치기하여 반환"""
+        text, self._carry = self._carry + self._decoder.decode(b'', final=True), ''
+        return self._prune(text) if text else ''
+
+    @staticmethod
+    def _safe_end(text: str) -> int:
+        """완결된 토큰만 처리하도록 마지막 '<' 또는 닫히지 않은 주석/CDATA 시작 위치에서 자른다"""
+        cut = len(text)
+        for opener, closer in OPEN_SECTIONS:
+            start = text.rfind(opener)
+            if start != -1 and text.find(closer, start + len(opener)) == -1:
+                cut = min(cut, start)
+        last_lt = text.rfind('<', 0, cut)
+        if last_lt != -1 and text.find('>', last_lt) == -1:
+            cut = min(cut, last_lt)
+        return cut
+
+    def _trigger_for(self, text: str) -> "re.Pattern":
+        """조각에 나타나는 대상만 포함한 위치 검색 패턴 (조합별로 한 번만 컴파일)"""
+        attributes = tuple(sorted(name for name in self._attributes if name in text))
+        data_uris = self.config.drop_data_uris and 'data:' in text
+        key = (attributes, data_uris)
+        if key not in self._triggers:
+            tags = sorted(set(self._unwrap) | ({MACRO_TAG} if self._macros else set()), key=len, reverse=True)
+            tag_pattern = r'|(?P<tag>/?(?:' + '|'.join(re.escape(tag) for tag in tags) + r'))' if tags else ''
+            alternatives = [r'<(?:!--|!\[CDATA\[' + tag_pattern + ')']
+            if attributes:
+                alternatives.append(r'\s(?:' + '|'.join(re.escape(name) for name in attributes) + r')\s*=')
+            if data_uris:
+                alternatives.append(r'=\s*["\']?\s*data:')
+            self._triggers[key] = re.compile('|'.join(alternatives))
+        return self._triggers[key]
+
+    def _candidate_tokens(self, text: str) -> Iterator[Match]:
+        """제거 대상일 수 있는 태그 토큰을 문서 순서대로 생성 (주석/CDATA 안은 건너뜀)"""
+        trigger_pattern = self._trigger_for(text)
+        scan = 0
+        while True:
+            trigger = trigger_pattern.search(text, scan)
+            if trigger is None:
+                return
+            found = trigger.group(0)
+            if found.startswith('<!'):
+                closer = '-->' if found == '<!--' else ']]>'
+                end = text.find(closer, trigger.end())
+                if end == -1:
+                    return
+                scan = end + len(closer)
+                continue
+            if 'tag' in trigger_pattern.groupindex and trigger.group('tag'):
+                start = trigger.start()
+            else:
+                # 속성 위치: 같은 태그의 '<'부터 토큰을 해석
+                start = text.rfind('<', scan, trigger.start())
+            token = TOKEN_PATTERN.match(text, start) if start != -1 else None
+            if token is None or token.group('name') is None or token.end() <= trigger.start():
+                scan = trigger.end()
+                continue
+            scan = token.end()
+            yield token
+
+    def _prune(self, text: str) -> str:
+        if not self.config.enabled:
+            return escape_cdata(text)
+        out = []
+        pos = 0
+        skip_from = 0 if self._skip_depth else None
+        for match in self._candidate_tokens(text):
+            name = match.group('name')
+            if self._skip_depth:
+                if name == MACRO_TAG and not match.group('selfclose'):
+                    self._skip_depth += -1 if match.group('end') else 1
+                    if not self._skip_depth:
+                        self._drop(text[skip_from:match.end()])
+                        pos = match.end()
+                        skip_from = None
+                continue
+
+            if name in self._unwrap:
+                out.append(text[pos:match.start()])
+                self._drop(match.group(0))
+                pos = match.end()
+                continue
+            if name == MACRO_TAG and not match.group('end') and self._macros:
+                macro_name = MACRO_NAME_PATTERN.search(match.group('attrs'))
+                if macro_name and (macro_name.group(1) or macro_name.group(2) or '') in self._macros:
+                    out.append(text[pos:match.start()])
+                    self.elements_pruned += 1
+                    if match.group('selfclose'):
+                        self._drop(match.group(0))
+                        pos = match.end()
+                    else:
+                        self._skip_depth = 1
+                        skip_from = match.start()
+                    continue
+            if not match.group('end') and match.group('attrs'):
+                attrs = match.group('attrs')
+                pruned_attrs = self._prune_attributes(attrs)
+                if pruned_attrs is not attrs:
+                    out.append(text[pos:match.start('attrs')])
+                    out.append(pruned_attrs)
+                    pos = match.end('attrs')
+
+        if skip_from is not None:
+            # 제거 중인 매크로가 이 조각에서 끝나지 않음
+            self._drop(text[skip_from:])
+        else:
+            out.append(text[pos:])
+        return escape_cdata(''.join(out))
+
+    def _prune_attributes(self, attrs: str) -> str:
+        """제거 대상 속성이 있으면 걸러낸 속성 문자열, 없으면 원래 문자열 객체를 반환"""
+        has_data_uri = self.config.drop_data_uris and 'data:' in attrs
+        if not has_data_uri and not any(name in attrs for name in self._attributes):
+            return attrs
+        kept = []
+        changed = False
+        for match in ATTRIBUTE_PATTERN.finditer(attrs):
+            name = match.group(2).lower()
+            value = match.group(4) or ''
+            if name in self._attributes or (
+                self.config.drop_data_uris and name in DATA_URI_ATTRIBUTES
+                and value.strip('"\'').lstrip().lower().startswith('data:')
+            ):
+                self._drop(match.group(0))
+                changed = True
+                continue
+            kept.append(match.group(0))
+        return ''.join(kept) if changed else attrs
+
+    def _drop(self, text: str) -> None:
+        self.pruned_bytes += len(text.encode('utf-8'))
@@ -0,0 +1,273 @@
+"""
+Markdown 렌더러
+DOM을 문서 순서대로 한 번만 순회하며 Markdown 블록을 생성하는 모듈
+"""
+from typing import Callable, Dict, Iterator, List, Tuple
+from bs4 import CData, NavigableString, Tag
+
+from .tables import MAX_COLSPAN, MAX_ROWSPAN, MarkdownTableWriter, TableCell, format_cell_text, parse_span
+
+
+HEADING_TAGS = ('h1', 'h2', 'h3', 'h4', 'h5', 'h6')
+LIST_TAGS = ('ul', 'ol')
+TABLE_SECTION_TAGS = ('thead', 'tbody', 'tfoot')
+CELL_TAGS = ('th', 'td')
+KNOWN_CODE_LANGUAGES = ('python', 'javascript', 'json', 'yaml', 'xml', 'sql', 'bash', 'shell')
+
+# 인라인 강조 태그 → Markdown 표식
+INLINE_MARKERS = {
+    'strong': '**', 'b': '**',
+    'em': '*', 'i': '*',
+    'del': '~~', 's': '~~',
+}
+# 텍스트로 출력하는 문자열 노드 타입 (주석, 처리 명령 등은 제외)
+TEXT_NODE_TYPES = (NavigableString, CData)
+
+# Confluence 매크로 태그와 본문 태그
+MACRO_TAG = 'ac:structured-macro'
+MACRO_RICH_BODY_TAG = 'ac:rich-text-body'
+MACRO_PLAIN_BODY_TAG = 'ac:plain-text-body'
+
+# Confluence 안내 매크로 → 인용 머리말
+PANEL_MACRO_PREFIXES = {
+    'info': '> **정보**: ',
+    'warning': '> **⚠️ 경고**: ',
+    'note': '> **📝 노트**: ',
+}
+
+
+class MarkdownRenderer:
+    """단일 순회 Markdown 렌더러
+
+    블록 요소(h1~h6, p, ul/ol, table, pre, blockquote)를 만나면 그 하위 트리를
+    해당 블록의 일부로 한 번만 렌더링하고 더 내려가지 않는다. 그 밖의 요소
+    (div, span, Confluence 레이아웃 등)는 투명한 컨테이너로 보고 자식을 순회한다.
+    블록 밖에 단독으로 놓인 텍스트는 기존 변환기와 동일하게 출력하지 않는다.
+
+    - Confluence 매크로(ac:structured-macro)도 블록으로 보고 문서 안 제자리에서 한 번만 렌더링:
+      코드 매크로는 코드 블록, info/warning/note는 머리말이 붙은 인용, 그 밖의 매크로는
+      본문(ac:rich-text-body)의 블록을 그대로 출력
+
+    - 리스트: 중첩 깊이에 따라 들여쓰기하며, 항목 안의 하위 리스트는 항목 아래에 출력
+    - 표: 셀 안의 문단/리스트는 셀 텍스트로 합치며, 중첩 표의 행은 바깥 표에 섞이지 않음.
+      행은 MarkdownTableWriter로 한 줄씩 만들며 colspan/rowspan 위치는 빈 셀로 채움
+    """
+
+    def __init__(self):
+        self._handlers: Dict[str, Callable[[Tag], str]] = {
+            'p': self._render_paragraph,
+            'ul': self._render_list,
+            'ol': self._render_list,
+            'table': self._render_table,
+            'pre': self._render_code_block,
+            'blockquote': self._render_blockquote,
+            MACRO_TAG: self.render_macro,
+        }
+        for tag in HEADING_TAGS:
+            self._handlers[tag] = self._render_heading
+
+    def render(self, root: Tag) -> List[str]:
+        """root 하위의 블록들을 문서 순서대로 렌더링한 Markdown 블록 목록 반환"""
+        blocks: List[str] = []
+        self._walk(root, blocks)
+        return blocks
+
+    def _walk(self, node: Tag, blocks: List[str]) -> None:
+        for child in node.children:
+            if not isinstance(child, Tag):
+                continue
+            handler = self._handlers.get(child.name)
+            if handler is None:
+                self._walk(child, blocks)
+                continue
+            block = handler(child)
+            if block:
+                blocks.append(block)
+
+    # ------------------------------------------------------------------
+    # 블록 요소
+    # ------------------------------------------------------------------
+    def _render_heading(self, heading: Tag) -> str:
+        level = int(heading.name[1])
+        text = heading.get_text().strip()
+        return f"{'#' * level} {text}" if text else ""
+
+    def _render_paragraph(self, paragraph: Tag) -> str:
+        return self.render_inline(paragraph).strip()
+
+    def _render_list(self, list_element: Tag, depth: int = 0) -> str:
+        lines = []
+        marker = '- ' if list_element.name == 'ul' else '1. '
+        indent = '  ' * depth
+        for li in list_element.find_all('li', recursive=False):
+            lines.append(f"{indent}{marker}{' '.join(self.render_inline(li, LIST_TAGS).split())}")
+            nested = [child for child in li.children if isinstance(child, Tag) and child.name in LIST_TAGS]
+            for child in nested:
+                sub_list = self._render_list(child, depth + 1)
+                if sub_list:
+                    lines.append(sub_list)
+        return '\n'.join(lines)
+
+    def _render_table(self, table: Tag) -> str:
+        header_row = None
+        thead = table.find('thead', recursive=False)
+        if thead is not None:
+            header_row = thead.find('tr', recursive=False)
+
+        writer = MarkdownTableWriter()
+        lines: List[str] = []
+        if header_row is not None:
+            lines.extend(writer.add_row(self.row_cells(header_row)))
+        for tr in self._iter_rows(table):
+            if tr is not header_row:
+                lines.extend(writer.add_row(self.row_cells(tr)))
+        return '\n'.join(lines)
+
+    @staticmethod
+    def _iter_rows(table: Tag) -> Iterator[Tag]:
+        """표 자신의 행만 순서대로 순회 (중첩 표의 행은 제외)"""
+        for child in table.children:
+            if not isinstance(child, Tag):
+                continue
+            if child.name == 'tr':
+                yield child
+            elif child.name in TABLE_SECTION_TAGS:
+                for tr in child.children:
+                    if isinstance(tr, Tag) and tr.name == 'tr':
+                        yield tr
+
+    def row_cells(self, tr: Tag) -> List[TableCell]:
+        """행의 셀 목록 (셀 텍스트, colspan, rowspan)"""
+        cells = []
+        for cell in tr.children:
+            if isinstance(cell, Tag) and cell.name in CELL_TAGS:
+                cells.append((
+                    format_cell_text(self.render_inline(cell)),
+                    parse_span(cell.get('colspan'), MAX_COLSPAN),
+                    parse_span(cell.get('rowspan'), MAX_ROWSPAN)
+                ))
+        return cells
+
+    def _render_code_block(self, pre: Tag) -> str:
+        code = pre.find('code')
+        if code:
+            language = self._detect_code_language(code, pre)
+            return f"```{language}\n{code.get_text()}\n```"
+        return f"```\n{pre.get_text()}\n```"
+
+    def _render_blockquote(self, blockquote: Tag) -> str:
+        inner: List[str] = []
+        self._walk(blockquote, inner)
+        text = '\n\n'.join(inner) if inner else blockquote.get_text().strip()
+        if not text:
+            return ""
+        return '\n'.join(f"> {line}" if line else ">" for line in text.split('\n'))
+
+    # ------------------------------------------------------------------
+    # Confluence 매크로 (ac:structured-macro)
+    # ------------------------------------------------------------------
+    def render_macro(self, macro: Tag) -> str:
+        """ac:structured-macro 요소 하나를 변환 (중첩 매크로는 본문 순회 중 제자리에서 변환)"""
+        macro_name = macro.get('ac:name', '')
+        if macro_name == 'code':
+            return self._render_code_macro(macro)
+
+        body = macro.find(MACRO_RICH_BODY_TAG, recursive=False)
+        prefix = PANEL_MACRO_PREFIXES.get(macro_name)
+        if body is None:
+            # 본문이 없는 매크로는 기존처럼 텍스트로 변환
+            content = macro.get_text().strip()
+            return f"{prefix}{content}" if prefix else content
+
+        inner: List[str] = []
+        self._walk(body, inner)
+        text = '\n\n'.join(inner) if inner else body.get_text().strip()
+        if not prefix or not text:
+            return text
+        first, *rest = text.split('\n')
+        return '\n'.join([f"{prefix}{first}"] + [f"> {line}" if line else ">" for line in rest])
+
+    def _render_code_macro(self, macro: Tag) -> str:
+        language_param = macro.find('ac:parameter', {'ac:name': 'language'})
+        language = language_param.get_text().strip() if language_param else ''
+
+        body = macro.find(MACRO_PLAIN_BODY_TAG)
+        if body is None:
+            return ''
+        code_content = self._plain_text_body(body)
+        if not code_content:
+            return ''
+        return f"```{language}\n{code_content}\n```"
+
+    @staticmethod
+    def _plain_text_body(element: Tag) -> str:
+        """ac:plain-text-body의 코드 내용 (CDATA 본문은 파싱 전에 escape_cdata()로 텍스트가 되어 있다)"""
+        text = ''
+        for content in element.contents:
+            if hasattr(content, 'strip') and content.strip():
+                text = content.strip()
+                break
+        else:
+            text = element.get_text().strip()
+        return text
+
+    # ------------------------------------------------------------------
+    # 인라인 요소
+    # ------------------------------------------------------------------
+    def render_inline(self, element: Tag, skip_tags: Tuple[str, ...] = ()) -> str:
+        """요소의 자식을 한 번 순회하며 인라인 Markdown 생성 (skip_tags 하위는 제외)"""
+        buffer: List[str] = []
+        self._inline_children(element, skip_tags, buffer)
+        return ''.join(buffer)
+
+    def _inline_children(self, element: Tag, skip_tags: Tuple[str, ...], buffer: List[str]) -> None:
+        for child in element.children:
+            if isinstance(child, Tag):
+                if child.name not in skip_tags:
+                    self._inline_node(child, skip_tags, buffer)
+            elif type(child) in TEXT_NODE_TYPES:
+                buffer.append(str(child))
+
+    def _inline_node(self, node: Tag, skip_tags: Tuple[str, ...], buffer: List[str]) -> None:
+        name = node.name
+        marker = INLINE_MARKERS.get(name)
+        if marker:
+            self._wrap(self.render_inline(node, skip_tags), marker, marker, buffer)
+        elif name == 'code':
+            self._wrap(node.get_text(), '`', '`', buffer)
+        elif name == 'a':
+            href = node.get('href', '')
+            text = self.render_inline(node, skip_tags)
+            if href and text.strip():
+                self._wrap(text, '[', f']({href})', buffer)
+            else:
+                buffer.append(text)
+        elif name == 'br':
+            buffer.append('\n')
+        elif name == 'img':
+            src = node.get('src', '')
+            if src:
+                buffer.append(f"![{node.get('alt', '')}]({src})")
+        else:
+            self._inline_children(node, skip_tags, buffer)
+
+    @staticmethod
+    def _wrap(text: str, opener: str, closer: str, buffer: List[str]) -> None:
+        """앞뒤 공백은 표식 밖으로 빼서 감싼다 ('** 굵게 **' 방지)"""
+        stripped = text.strip()
+        if not stripped:
+            buffer.append(text)
+            return
+        leading = text[:len(text) - len(text.lstrip())]
+        trailing = text[len(text.rstrip()):]
+        buffer.append(f"{leading}{opener}{stripped}{closer}{trailing}")
+
+    @staticmethod
+    def _detect_code_language(code: Tag, pre: Tag) -> str:
+        for element in (code, pre):
+            for cls in element.get('class', []):
+                if cls.startswith('language-'):
+                    return cls.replace('language-', '')
+                if cls in KNOWN_CODE_LANGUAGES:
+                    return cls
+        return 'text'
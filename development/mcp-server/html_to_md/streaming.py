@@ -0,0 +1,340 @@
+"""
+스트리밍 HTML→Markdown 변환
+lxml 풀 파서로 HTML을 조각 단위로 받아, 최상위 블록이 닫히는 즉시 Markdown으로 내보내는 모듈
+
+수십 MB 크기의 API 레퍼런스 페이지도 전체 트리나 결과 문자열을 메모리에 올리지 않고
+변환할 수 있도록, 렌더링이 끝난 요소는 바로 트리에서 떼어낸다.
+"""
+import re
+import tempfile
+from typing import Any, Dict, List, Optional, Union
+
+from .lxml_backend import NON_TEXT_TAGS, LxmlMarkdownRenderer, etree, text_of
+from .renderer import HEADING_TAGS, LIST_TAGS, MACRO_TAG, TABLE_SECTION_TAGS
+from .tables import MarkdownTableWriter
+
+
+# 피드 단위 (문자열 입력을 나눌 때 사용)
+STREAM_CHUNK_SIZE = 64 * 1024
+# 보류 중인 출력(제목 판단 전 블록)을 메모리에 둘 최대 크기
+SPOOL_MAX_SIZE = 1024 * 1024
+# libxml2 HTML 푸시 파서는 이미 처리한 입력을 반납하지 않으므로, 이만큼 입력할 때마다
+# 최상위 블록 경계에서 파서를 새로 만든다
+PARSER_RESTART_CHARS = 1024 * 1024
+
+BLOCK_SEPARATOR = '\n\n'
+MULTI_BLANK_LINES = re.compile(r'\n{3,}')
+
+
+class MarkdownStreamConverter:
+    """HTML 조각을 받아 Markdown 조각을 돌려주는 증분 변환기
+
+    feed(chunk)는 그 사이 완성된 Markdown 조각 목록을 반환하고, close()는 남은 조각을
+    반환한다. 반환된 조각을 순서대로 이어 붙이면 HTMLToMarkdownConverter.convert()의
+    markdown과 같다 (앞뒤 공백 제거와 연속 빈 줄 축소도 같게 적용한다).
+
+    - 블록(h1~h6, p, ul/ol, table, pre, blockquote, Confluence 매크로)은 바깥쪽 블록이
+      닫힐 때 제자리에서 렌더링하고, 렌더링이 끝난 요소와 그 앞 형제들은 트리에서 제거해
+      메모리를 반납한다.
+    - 최상위 표는 행(tr)이 닫힐 때마다 한 줄씩 내보내고 그 행을 제거하므로 행 수가 많아도
+      표 전체를 트리에 유지하지 않는다. 머리글은 첫 행(보통 thead의 행)이다.
+    - document_title이 주어지면 헤딩 존재 여부가 정해질 때까지 블록을 임시 파일(SpooledTemporaryFile)에 보류한다.
+    - 파서가 입력 버퍼를 계속 쥐고 있으므로 PARSER_RESTART_CHARS마다 블록 밖 경계에서
+      파서를 교체하고, 열려 있던 컨테이너 태그(div, ac:layout 등)를 새 파서에 다시 연다.
+      최상위 표 안에서는 행 사이도 교체 경계로 쓴다.
+    """
+
+    def __init__(self, document_title: Optional[str] = None, renderer: Optional[LxmlMarkdownRenderer] = None, encoding: str = 'utf-8'):
+        self.renderer = renderer or LxmlMarkdownRenderer()
+        self.document_title = document_title
+        self.encoding = encoding
+        self._parser = None
+        self._carry: Union[str, bytes] = ''
+        self._open_tags: List[str] = []
+        self._skip_starts = 0
+        self._chars_since_restart = 0
+
+        self._block_depth = 0
+        self._table_writer: Optional[MarkdownTableWriter] = None
+        self._table_started = False
+        self._pending = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE, mode='w+', encoding='utf-8') if document_title else None
+        self._heading_seen = False
+        self._closed = False
+
+        self._counts = {'pre': 0, 'code_macro': 0, 'table': 0, 'list': 0, 'a': 0, 'img': 0}
+        self._h1_title: Optional[str] = None
+        self._title_tag: Optional[str] = None
+
+        self.blocks_emitted = 0
+        self.chars_fed = 0
+        self.chars_emitted = 0
+        self._held = ''           # 아직 내보내지 않은 끝 공백
+        self.parser_restarts = 0
+
+    def feed(self, chunk: Union[str, bytes]) -> List[str]:
+        """HTML 조각을 입력하고 그 사이 완성된 Markdown 조각 목록을 반환"""
+        if not chunk:
+            return []
+        self.chars_fed += len(chunk)
+        if self._carry:
+            chunk = self._carry + chunk
+        # libxml2 푸시 파서는 조각 경계에서 잘린 </script>, </style> 등을 놓치므로
+        # 마지막 '>' 뒤는 다음 조각과 합쳐서 넣는다
+        close_tag, gt = ('</', '>') if isinstance(chunk, str) else (b'</', b'>')
+        cut = chunk.rfind(gt) + 1
+        chunk, self._carry = chunk[:cut], chunk[cut:]
+        out: List[str] = []
+        if not chunk:
+            return out
+        if self._parser is None:
+            self._parser = self._new_parser(chunk)
+        if self._chars_since_restart + len(chunk) < PARSER_RESTART_CHARS:
+            self._feed_parser(chunk, out)
+            return out
+
+        # 교체 시점이면 닫는 태그 단위로 나눠 넣으며 블록 밖 경계를 찾는다
+        pos = 0
+        while True:
+            start = chunk.find(close_tag, pos)
+            if start == -1:
+                break
+            end = chunk.find(gt, start) + 1
+            self._feed_parser(chunk[pos:end], out)
+            pos = end
+            if self._at_restart_point():
+                self._restart_parser(chunk, out)
+                break
+        if pos < len(chunk):
+            self._feed_parser(chunk[pos:], out)
+        return out
+
+    def close(self) -> List[str]:
+        """입력을 끝내고 남은 Markdown 조각(보류 블록 포함)을 반환"""
+        if self._closed:
+            return []
+        self._closed = True
+        out: List[str] = []
+        if self._carry:
+            if self._parser is None:
+                self._parser = self._new_parser(self._carry)
+            self._parser.feed(self._carry)
+            self._carry = self._carry[:0]
+        if self._parser is not None:
+            self._parser.close()
+            self._drain(out)
+
+        if self._pending is not None:
+            # 끝까지 헤딩이 없었으므로 제목을 맨 앞에 두고 보류한 블록을 내보낸다
+            title_block = f"# {self.document_title}"
+            self._emit_text(title_block, out, count=True)
+            self._release_pending(out, after_title=True)
+        # convert()와 같이 끝 공백은 내보내지 않는다
+        self._held = ''
+        return out
+
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        """지금까지 본 요소 기준 메타데이터 (convert()의 metadata와 같은 형식)"""
+        counts = self._counts
+        total_code_blocks = counts['pre'] + counts['code_macro']
+        title = self._h1_title if self._h1_title is not None else self._title_tag
+        return {
+            'title': title or '',
+            'has_tables': counts['table'] > 0,
+            'has_code_blocks': total_code_blocks > 0,
+            'has_lists': counts['list'] > 0,
+            'has_links': counts['a'] > 0,
+            'has_images': counts['img'] > 0,
+            'code_blocks_count': total_code_blocks
+        }
+
+    # ------------------------------------------------------------------
+    # 파서 이벤트 처리
+    # ------------------------------------------------------------------
+    def _new_parser(self, sample: Union[str, bytes]) -> Any:
+        # 바이트 입력은 인코딩 선언이 없는 Confluence 본문이므로 인코딩을 지정한다 (기본: UTF-8)
+        encoding = self.encoding if isinstance(sample, bytes) else None
+        return etree.HTMLPullParser(events=('start', 'end'), encoding=encoding)
+
+    def _feed_parser(self, data: Union[str, bytes], out: List[str]) -> None:
+        self._parser.feed(data)
+        self._chars_since_restart += len(data)
+        self._drain(out)
+
+    def _at_restart_point(self) -> bool:
+        """닫는 태그 직후 블록/script 밖(또는 최상위 표의 행 사이)에 있어 파서를 교체해도 되는지 확인"""
+        if self._skip_starts:
+            return False
+        if self._block_depth:
+            in_table_rows = (
+                self._block_depth == 1 and self._table_writer is not None
+                and self._open_tags[-1] in ('table',) + TABLE_SECTION_TAGS
+            )
+            if not in_table_rows:
+                return False
+        return not any(tag in NON_TEXT_TAGS for tag in self._open_tags)
+
+    def _restart_parser(self, sample: Union[str, bytes], out: List[str]) -> None:
+        """현재 파서를 닫고, 열려 있던 컨테이너를 다시 연 새 파서로 교체"""
+        ancestors = list(self._open_tags)
+        self._parser.close()
+        # 닫히는 컨테이너(최상위 표 포함)는 새 파서에서 이어지므로 종료 처리하지 않는다
+        self._drain(out, handle_ends=False)
+        self._parser = self._new_parser(sample)
+        prefix = ''.join(f"<{tag}>" for tag in ancestors)
+        self._skip_starts = len(ancestors)
+        self._parser.feed(prefix if isinstance(sample, str) else prefix.encode(self.encoding))
+        self._drain(out)
+        self._chars_since_restart = 0
+        self.parser_restarts += 1
+
+    def _drain(self, out: List[str], handle_ends: bool = True) -> None:
+        for event, element in self._parser.read_events():
+            tag = element.tag
+            if not isinstance(tag, str):
+                continue
+            if event == 'start':
+                self._open_tags.append(tag)
+                if self._skip_starts:
+                    # 파서 교체 시 다시 연 컨테이너는 이미 처리한 요소이므로 건너뛴다
+                    self._skip_starts -= 1
+                    continue
+                self._on_start(element, tag, out)
+            else:
+                if handle_ends:
+                    self._on_end(element, tag, out)
+                self._open_tags.pop()
+
+    def _on_start(self, element: Any, tag: str, out: List[str]) -> None:
+        counts = self._counts
+        if tag == 'pre':
+            counts['pre'] += 1
+        elif tag == MACRO_TAG:
+            if element.get('ac:name') == 'code':
+                counts['code_macro'] += 1
+        elif tag == 'table':
+            counts['table'] += 1
+        elif tag in LIST_TAGS:
+            counts['list'] += 1
+        elif tag == 'a' or tag == 'img':
+            counts[tag] += 1
+
+        if tag in HEADING_TAGS and not self._heading_seen:
+            self._heading_seen = True
+            if self._pending is not None:
+                self._release_pending(out, after_title=False)
+        if self.renderer.is_block(tag):
+            if tag == 'table' and self._block_depth == 0:
+                self._table_writer = MarkdownTableWriter()
+                self._table_started = False
+            self._block_depth += 1
+
+    def _on_end(self, element: Any, tag: str, out: List[str]) -> None:
+        if tag in NON_TEXT_TAGS:
+            # BeautifulSoup 경로와 같이 script/style/template 내용은 텍스트로 보지 않는다
+            element.clear(keep_tail=True)
+        elif tag == 'h1' and self._h1_title is None:
+            self._h1_title = text_of(element).strip()
+        elif tag == 'title' and self._title_tag is None:
+            self._title_tag = text_of(element).strip()
+
+        if tag == 'tr' and self._block_depth == 1 and self._table_writer is not None and self._is_table_row(element):
+            self._emit_table_lines(self._table_writer.add_row(self.renderer.row_cells(element)), out)
+            self._release(element)
+            return
+
+        if self.renderer.is_block(tag):
+            self._block_depth -= 1
+            if self._block_depth == 0:
+                if self._table_writer is not None:
+                    # 행은 이미 모두 내보냈다
+                    self._table_writer = None
+                else:
+                    block = self.renderer.render_block(element)
+                    if block:
+                        self._emit_block(block, out)
+
+        if self._block_depth == 0:
+            self._release(element)
+
+    @staticmethod
+    def _is_table_row(tr: Any) -> bool:
+        """표 자신의 행인지 확인 (표 또는 thead/tbody/tfoot 바로 아래)"""
+        parent = tr.getparent()
+        if parent is None:
+            return False
+        if parent.tag in TABLE_SECTION_TAGS:
+            parent = parent.getparent()
+        return parent is not None and parent.tag == 'table'
+
+    @staticmethod
+    def _release(element: Any) -> None:
+        """렌더링이 끝난 요소의 하위 트리와 앞 형제들을 제거"""
+        element.clear()
+        parent = element.getparent()
+        if parent is None:
+            return
+        while element.getprevious() is not None:
+            del parent[0]
+
+    # ------------------------------------------------------------------
+    # 출력
+    # ------------------------------------------------------------------
+    def _emit_block(self, block: str, out: List[str]) -> None:
+        block = MULTI_BLANK_LINES.sub(BLOCK_SEPARATOR, block)
+        if self._pending is not None:
+            if self.blocks_emitted:
+                self._pending.write(BLOCK_SEPARATOR)
+            self._pending.write(block)
+            self.blocks_emitted += 1
+            return
+        self._emit_text(block, out, count=True)
+
+    def _emit_table_lines(self, lines: List[str], out: List[str]) -> None:
+        """최상위 표의 줄을 내보낸다 (첫 줄은 새 블록, 이후 줄은 같은 블록에 이어 붙임)"""
+        for line in lines:
+            if not self._table_started:
+                self._table_started = True
+                self._emit_block(line, out)
+            elif self._pending is not None:
+                self._pending.write('\n' + line)
+            else:
+                self._emit_text('\n' + line, out)
+
+    def _emit_text(self, text: str, out: List[str], count: bool = False) -> None:
+        if count:
+            if self.blocks_emitted and self.chars_emitted:
+                self._output(BLOCK_SEPARATOR, out)
+            self.blocks_emitted += 1
+        self._output(text, out)
+
+    def _output(self, text: str, out: List[str]) -> None:
+        """convert()의 마무리 정리(앞뒤 공백 제거, 연속 빈 줄 축소)를 적용하며 출력에 추가
+
+        끝의 공백은 뒤에 내용이 더 나올 때까지 보류하고(close()에서 버린다), 보류한 공백과
+        다음 텍스트를 합쳐 블록 경계에 걸친 빈 줄도 convert()와 같이 줄인다.
+        """
+        if self._held:
+            text = self._held + text
+        if not self.chars_emitted:
+            text = text.lstrip()
+        body = text.rstrip()
+        self._held = text[len(body):] if body or self.chars_emitted else ''
+        if body:
+            body = MULTI_BLANK_LINES.sub(BLOCK_SEPARATOR, body)
+            out.append(body)
+            self.chars_emitted += len(body)
+
+    def _release_pending(self, out: List[str], after_title: bool) -> None:
+        """보류한 블록을 출력으로 옮긴다"""
+        pending, self._pending = self._pending, None
+        if pending.tell():
+            pending.seek(0)
+            if after_title:
+                self._output(BLOCK_SEPARATOR, out)
+            while True:
+                data = pending.read(STREAM_CHUNK_SIZE)
+                if not data:
+                    break
+                self._output(data, out)
+        pending.close()
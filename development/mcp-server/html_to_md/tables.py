@@ -0,0 +1,94 @@
+"""
+Markdown 표 작성기
+행 단위로 셀을 받아 Markdown 표 줄을 바로 만들어 내는 모듈
+
+bs4/lxml 렌더러와 스트리밍 변환기가 함께 사용한다. 표 전체를 모으지 않고
+행마다 줄을 내보내므로, 추가 메모리는 rowspan 진행 상태(열 수만큼)뿐이다.
+"""
+from typing import List, Optional, Sequence, Tuple
+
+
+# HTML 표준의 colspan/rowspan 상한
+MAX_COLSPAN = 1000
+MAX_ROWSPAN = 65534
+
+# (셀 텍스트, colspan, rowspan)
+TableCell = Tuple[str, int, int]
+
+
+def parse_span(value: Optional[str], limit: int) -> int:
+    """colspan/rowspan 속성값을 1 이상 limit 이하의 정수로 변환 (잘못된 값은 1)"""
+    try:
+        span = int(str(value).strip())
+    except (TypeError, ValueError):
+        return 1
+    return min(max(span, 1), limit)
+
+
+def format_cell_text(text: str) -> str:
+    """셀 인라인 Markdown을 한 줄로 합치고 열 구분자(|)를 이스케이프"""
+    return ' '.join(text.split()).replace('|', '\\|')
+
+
+class MarkdownTableWriter:
+    """표 한 개의 행을 순서대로 받아 Markdown 줄을 돌려주는 작성기
+
+    첫 행은 머리글 행이며 구분선(---)을 함께 만든다. 머리글 행에 셀이 없으면 머리글 없이
+    이후 행만 출력한다. colspan은 병합된 열만큼 빈 셀을 채우고, rowspan은 열별 남은
+    행 수만 기억해 다음 행들의 해당 위치에 빈 셀을 넣으므로 이미 쓴 행을 다시 보지 않는다.
+    """
+
+    def __init__(self):
+        self._spans: List[int] = []   # 열별로 위 행의 rowspan이 아직 덮는 행 수
+        self._header_pending = True
+        self.rows_written = 0
+
+    def add_row(self, cells: Sequence[TableCell]) -> List[str]:
+        """행 하나를 추가하고 출력할 Markdown 줄 목록 반환 (빈 행이면 빈 목록)"""
+        row = self._layout(cells)
+        if self._header_pending:
+            self._header_pending = False
+            if not row:
+                return []
+            self.rows_written += 1
+            return [self._line(row), self._line(['---'] * len(row))]
+        if not row:
+            return []
+        self.rows_written += 1
+        return [self._line(row)]
+
+    def _layout(self, cells: Sequence[TableCell]) -> List[str]:
+        """셀을 열 위치에 배치 (위 행의 rowspan이 덮는 열과 colspan 열은 빈 셀)"""
+        spans = self._spans
+        row: List[str] = []
+        col = 0
+        for text, colspan, rowspan in cells:
+            col = self._fill_spanned(row, col)
+            for offset in range(colspan):
+                row.append(text if offset == 0 else '')
+                if col == len(spans):
+                    spans.append(0)
+                spans[col] = rowspan - 1
+                col += 1
+        # 행 끝 뒤쪽에 남은 rowspan 열까지 채운다
+        last = len(spans)
+        while last > col and spans[last - 1] <= 0:
+            last -= 1
+        while col < last:
+            col = self._fill_spanned(row, col)
+            if col < last:
+                row.append('')
+                col += 1
+        return row
+
+    def _fill_spanned(self, row: List[str], col: int) -> int:
+        spans = self._spans
+        while col < len(spans) and spans[col] > 0:
+            row.append('')
+            spans[col] -= 1
+            col += 1
+        return col
+
+    @staticmethod
+    def _line(cells: Sequence[str]) -> str:
+        return '| ' + ' | '.join(cells) + ' |'
@@ -4,8 +4,19 @@ HTML→MD 변환 품질을 검증하고 문제점을 식별하는 모듈
 """
 import re
 import logging
-from typing import Dict, List, Any, Tuple
-from bs4 import BeautifulSoup
+from typing import Dict, List, Any, Tuple, Union
+
+from .document import ParsedDocument
+
+
+MD_HEADING_PATTERN = re.compile(r'^#{1,6}\s+', re.MULTILINE)
+MD_TABLE_LINE_PATTERN = re.compile(r'^\|.*\|$', re.MULTILINE)
+MD_BULLET_PATTERN = re.compile(r'^[-*+]\s+', re.MULTILINE)
+MD_NUMBERED_PATTERN = re.compile(r'^\d+\.\s+', re.MULTILINE)
+MD_CODE_FENCE_PATTERN = re.compile(r'^```', re.MULTILINE)
+MD_SYMBOL_PATTERN = re.compile(r'[#*`|>\-\d\.\s]+')
+MD_LINK_PATTERN = re.compile(r'\[.*?\]\(.*?\)')
+MD_IMAGE_PATTERN = re.compile(r'!\[.*?\]\(.*?\)')
 
 
 class ConversionValidator:
@@ -14,24 +25,29 @@ class ConversionValidator:
     def __init__(self):
         self.logger = logging.getLogger("specgate.htmlconverter.validator")
     
-    def validate_conversion(self, original_html: str, converted_markdown: str) -> Dict[str, Any]:
-        """변환 품질을 검증한다."""
+    def validate_conversion(self, original_html: Union[str, ParsedDocument], converted_markdown: str) -> Dict[str, Any]:
+        """변환 품질을 검증한다.
+
+        original_html에 변환할 때 쓴 ParsedDocument를 넘기면 다시 파싱하지 않고
+        파싱 시 계산된 구조 통계를 사용한다. 문자열이면 한 번만 파싱한다.
+        """
         try:
             issues = []
             quality_score = 100
+            document = ParsedDocument.of(original_html)
             
             # 기본 검사
-            basic_issues, basic_score = self._validate_basic_requirements(original_html, converted_markdown)
+            basic_issues, basic_score = self._validate_basic_requirements(document.html, converted_markdown)
             issues.extend(basic_issues)
             quality_score = min(quality_score, basic_score)
             
             # 구조 검사
-            structure_issues, structure_score = self._validate_structure_integrity(original_html, converted_markdown)
+            structure_issues, structure_score = self._validate_structure_integrity(document, converted_markdown)
             issues.extend(structure_issues)
             quality_score = min(quality_score, structure_score)
             
             # 내용 검사
-            content_issues, content_score = self._validate_content_preservation(original_html, converted_markdown)
+            content_issues, content_score = self._validate_content_preservation(document, converted_markdown)
             issues.extend(content_issues)
             quality_score = min(quality_score, content_score)
             
@@ -72,25 +88,25 @@ class ConversionValidator:
         
         return issues, score
     
-    def _validate_structure_integrity(self, html: str, markdown: str) -> Tuple[List[str], int]:
+    def _validate_structure_integrity(self, document: ParsedDocument, markdown: str) -> Tuple[List[str], int]:
         """구조 무결성을 검증한다."""
         issues = []
         score = 100
         
         try:
-            soup = BeautifulSoup(html, 'html.parser')
+            stats = document.stats
             
             # 헤딩 수 검사
-            html_headings = len(soup.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6']))
-            md_headings = len(re.findall(r'^#{1,6}\s+', markdown, re.MULTILINE))
+            html_headings = stats.headings
+            md_headings = len(MD_HEADING_PATTERN.findall(markdown))
             
             if html_headings != md_headings:
                 issues.append(f"헤딩 수 불일치: HTML {html_headings}개, MD {md_headings}개")
                 score -= 20
             
             # 표 수 검사
-            html_tables = len(soup.find_all('table'))
-            md_tables = len(re.findall(r'^\|.*\|$', markdown, re.MULTILINE)) // 2  # 헤더+구분선+데이터
+            html_tables = stats.tables
+            md_tables = len(MD_TABLE_LINE_PATTERN.findall(markdown)) // 2  # 헤더+구분선+데이터
             
             if html_tables > 0 and md_tables == 0:
                 issues.append(f"표 변환 실패: HTML {html_tables}개 표가 변환되지 않음")
@@ -100,8 +116,8 @@ class ConversionValidator:
                 score -= 15
             
             # 리스트 수 검사
-            html_lists = len(soup.find_all(['ul', 'ol']))
-            md_lists = len(re.findall(r'^[-*+]\s+', markdown, re.MULTILINE)) + len(re.findall(r'^\d+\.\s+', markdown, re.MULTILINE))
+            html_lists = stats.lists
+            md_lists = len(MD_BULLET_PATTERN.findall(markdown)) + len(MD_NUMBERED_PATTERN.findall(markdown))
             
             if html_lists > 0 and md_lists == 0:
                 issues.append(f"리스트 변환 실패: HTML {html_lists}개 리스트가 변환되지 않음")
@@ -111,8 +127,8 @@ class ConversionValidator:
                 score -= 10
             
             # 코드 블록 검사
-            html_code_blocks = len(soup.find_all('pre'))
-            md_code_blocks = len(re.findall(r'^```', markdown, re.MULTILINE))
+            html_code_blocks = stats.pre_blocks
+            md_code_blocks = len(MD_CODE_FENCE_PATTERN.findall(markdown))
             
             if html_code_blocks > 0 and md_code_blocks == 0:
                 issues.append(f"코드 블록 변환 실패: HTML {html_code_blocks}개 코드 블록이 변환되지 않음")
@@ -127,21 +143,20 @@ class ConversionValidator:
         
         return issues, max(0, score)
     
-    def _validate_content_preservation(self, html: str, markdown: str) -> Tuple[List[str], int]:
+    def _validate_content_preservation(self, document: ParsedDocument, markdown: str) -> Tuple[List[str], int]:
         """내용 보존을 검증한다."""
         issues = []
         score = 100
         
         try:
-            soup = BeautifulSoup(html, 'html.parser')
+            stats = document.stats
             
             # 텍스트 내용 비교
-            html_text = soup.get_text().strip()
-            markdown_text = re.sub(r'[#*`|>\-\d\.\s]+', '', markdown).strip()
+            markdown_text = MD_SYMBOL_PATTERN.sub('', markdown).strip()
             
             # 텍스트 길이 비교 (50% 이상 보존되어야 함)
-            if len(html_text) > 0:
-                preservation_ratio = len(markdown_text) / len(html_text)
+            if stats.text_length > 0:
+                preservation_ratio = len(markdown_text) / stats.text_length
                 if preservation_ratio < 0.5:
                     issues.append(f"텍스트 보존률 낮음: {preservation_ratio:.1%}")
                     score -= 40
@@ -150,8 +165,8 @@ class ConversionValidator:
                     score -= 20
             
             # 링크 보존 검사
-            html_links = len(soup.find_all('a'))
-            md_links = len(re.findall(r'\[.*?\]\(.*?\)', markdown))
+            html_links = stats.links
+            md_links = len(MD_LINK_PATTERN.findall(markdown))
             
             if html_links > 0 and md_links == 0:
                 issues.append(f"링크 변환 실패: HTML {html_links}개 링크가 변환되지 않음")
@@ -161,8 +176,8 @@ class ConversionValidator:
                 score -= 10
             
             # 이미지 보존 검사
-            html_images = len(soup.find_all('img'))
-            md_images = len(re.findall(r'!\[.*?\]\(.*?\)', markdown))
+            html_images = stats.images
+            md_images = len(MD_IMAGE_PATTERN.findall(markdown))
             
             if html_images > 0 and md_images == 0:
                 issues.append(f"이미지 변환 실패: HTML {html_images}개 이미지가 변환되지 않음")
@@ -188,30 +203,28 @@ class ConversionValidator:
         else:
             return "개선이 필요한 변환 품질"
     
-    def count_headings_in_html(self, html: str) -> int:
+    def count_headings_in_html(self, html: Union[str, ParsedDocument]) -> int:
         """HTML의 헤딩 수를 계산한다."""
         try:
-            soup = BeautifulSoup(html, 'html.parser')
-            return len(soup.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6']))
+            return ParsedDocument.of(html).stats.headings
         except:
             return 0
     
     def count_headings_in_markdown(self, markdown: str) -> int:
         """Markdown의 헤딩 수를 계산한다."""
-        return len(re.findall(r'^#{1,6}\s+', markdown, re.MULTILINE))
+        return len(MD_HEADING_PATTERN.findall(markdown))
     
-    def count_tables_in_html(self, html: str) -> int:
+    def count_tables_in_html(self, html: Union[str, ParsedDocument]) -> int:
         """HTML의 표 수를 계산한다."""
         try:
-            soup = BeautifulSoup(html, 'html.parser')
-            return len(soup.find_all('table'))
+            return ParsedDocument.of(html).stats.tables
         except:
             return 0
     
     def count_tables_in_markdown(self, markdown: str) -> int:
         """Markdown의 표 수를 계산한다."""
         # 표는 헤더+구분선+데이터 행으로 구성되므로 3줄마다 1개 표
-        table_lines = len(re.findall(r'^\|.*\|$', markdown, re.MULTILINE))
+        table_lines = len(MD_TABLE_LINE_PATTERN.findall(markdown))
         return max(0, table_lines // 3)
 
 
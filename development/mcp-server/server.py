@@ -9,8 +9,8 @@ import os
 import subprocess
 import json
 import tempfile
-from datetime import datetime
-from typing import Dict, List, Any, Optional
+from datetime import datetime, timezone
+from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass
 from fastmcp import FastMCP
 
@@ -73,11 +73,36 @@ class QualityScore:
 # =============================================================================
 # 1. confluence.fetch 도구 구현 (리팩토링된 모듈 사용)
 # =============================================================================
-from confluence_fetch import ConfluenceService
+from confluence_fetch import ConfluenceService, SyncManifest
+from confluence_fetch.manifest import MANIFEST_FILENAME, SYNC_UNCHANGED
+from html_to_md.converter import HTMLToMarkdownConverter
+from html_to_md.cache import ConversionCache, ConversionCacheConfig
+from html_to_md.executor import ConversionExecutor
 
 # Confluence 서비스 인스턴스 생성
 confluence_service = ConfluenceService()
 
+# 자동 파이프라인 MD 파일 저장용 변환기 (변환 자체는 transformer 캐시 사용)
+html_md_converter = HTMLToMarkdownConverter()
+
+# 자동 파이프라인 배치 변환기 (페이지 변환을 프로세스 풀에 분산)
+conversion_executor = ConversionExecutor()
+
+# HTML→MD 변환 캐시 (작업 디렉토리별 .specgate/cache/html_to_md, 변경 없는 HTML은 재변환 생략)
+conversion_cache_config = ConversionCacheConfig.from_env()
+_conversion_caches: Dict[str, ConversionCache] = {}
+
+
+def _get_conversion_cache(output_dir: str) -> Optional[ConversionCache]:
+    """작업 디렉토리의 변환 캐시 (HTML_TO_MD_CACHE=0이면 None)"""
+    if not conversion_cache_config.enabled:
+        return None
+    cache_dir = os.path.join(output_dir, ".specgate", "cache", "html_to_md")
+    if cache_dir not in _conversion_caches:
+        _conversion_caches[cache_dir] = ConversionCache(cache_dir, conversion_cache_config)
+    return _conversion_caches[cache_dir]
+
+
 @mcp.tool()
 async def confluence_fetch(
     label: str, 
@@ -86,16 +111,34 @@ async def confluence_fetch(
     save_html: bool = True,
     output_dir: str | None = None,
     auto_pipeline: bool = True,
-    auto_create_github_issues: bool = True
+    auto_create_github_issues: bool = True,
+    crawl: bool = False,
+    max_results: int | None = None,
+    max_concurrency: int | None = None,
+    skip_unchanged: bool = True,
+    since: str | None = None,
+    incremental: bool = False,
+    two_phase: bool = False,
+    stream: bool = False
 ) -> dict:
     """Confluence에서 라벨 기준으로 문서를 수집하고 HTML 원본을 저장
     
     Args:
         label: 검색할 라벨 (필수)
         space_key: Confluence 스페이스 키 (선택사항)
-        limit: 최대 결과 수 (기본값: 10)
+        limit: 최대 결과 수 (기본값: 10, crawl=True이면 요청당 페이지 크기)
         save_html: HTML 원본 저장 여부 (기본값: True)
         output_dir: HTML 파일 저장 디렉토리 (기본값: None, 자동 감지)
+        crawl: 다음 페이지까지 모두 수집 (기본값: False)
+        max_results: crawl 시 최대 수집 문서 수 (기본값: None, 전체)
+        max_concurrency: 동시 요청 수 상한 (기본값: None, 응답 지연/오류에 따라 자동 조절)
+        skip_unchanged: 마지막 처리 이후 버전이 바뀌지 않은 페이지는 파이프라인 생략 (기본값: True)
+        since: 이 시점 이후 수정된 페이지만 조회 (예: "2025-01-31", "2025-01-31 09:00", 'now("-1d")')
+        incremental: 마지막 성공 실행 이후 수정된 페이지만 조회 (라벨/스페이스별 워터마크 사용, 기본값: False)
+        two_phase: 메타데이터만 먼저 검색하고 변경된 페이지만 본문 조회 (기본값: False)
+        stream: 검색 응답을 스트리밍으로 디코딩하여 페이지 단위로 변환 (crawl=False일 때, 기본값: False)
+            auto_pipeline과 함께 쓰면 디코딩된 페이지를 묶음마다 바로 파이프라인에 넘기고,
+            반환 문서에는 본문(html_content, content)을 넣지 않는다 (HTML 원본은 html_file 참조)
     
     Returns:
         dict: {
@@ -109,8 +152,48 @@ async def confluence_fetch(
         output_dir = _get_client_work_dir()
     # _set_client_work_dir() 호출 제거됨 - 경로 설정 로직 단순화
     
+    # 동기화 매니페스트: .specgate/data/sync/sync_manifest.json
+    sync_manifest = None
+    if skip_unchanged or incremental:
+        sync_manifest = SyncManifest.load(
+            os.path.join(_get_specgate_data_dir("sync", output_dir), MANIFEST_FILENAME)
+        )
+    
+    # 델타 조회: 명시적 since 우선, 없으면 워터마크 기준 상대 시간
+    run_started_at = datetime.now(timezone.utc)
+    modified_since = since
+    if modified_since is None and incremental:
+        modified_since = sync_manifest.delta_since(label, space_key)
+    
+    # 스트리밍 조회: 응답 전체를 모으지 않고 디코딩된 문서를 묶음마다 바로 파이프라인에 넘긴다
+    pipeline_stream = None
+    stream_handler = None
+    if auto_pipeline and stream and not crawl:
+        pipeline_stream = {"results": [], "conversion": [], "failed": False}
+        
+        async def stream_handler(documents: List[Dict[str, Any]]) -> None:
+            if pipeline_stream["failed"]:
+                return
+            try:
+                md_results, conversion = await _run_pipeline(documents, output_dir, sync_manifest, auto_create_github_issues)
+            except Exception as e:
+                logging.getLogger("specgate.pipeline").warning(f"자동 파이프라인 처리 중 경고: {e}")
+                pipeline_stream["failed"] = True
+                return
+            pipeline_stream["results"].extend(md_results)
+            if conversion is not None:
+                pipeline_stream["conversion"].append(conversion)
+    
     try:
-        fetch_result = await confluence_service.fetch_documents(label, space_key, limit, save_html, output_dir)
+        fetch_result = await confluence_service.fetch_documents(
+            label, space_key, limit, save_html, output_dir,
+            crawl=crawl, max_results=max_results, max_concurrency=max_concurrency,
+            manifest=sync_manifest if skip_unchanged else None,
+            modified_since=modified_since,
+            two_phase=two_phase,
+            stream=stream,
+            stream_handler=stream_handler
+        )
     except RuntimeError as e:
         if "This event loop is already running" in str(e):
             # 이벤트 루프 충돌 시 간단한 오류 메시지 반환
@@ -126,178 +209,288 @@ async def confluence_fetch(
         else:
             raise
 
+    # 파이프라인 없이 문서만 반환할 때도 content에 Markdown을 채운다 (변환은 첫 호출 때 지연 수행됨)
+    if not auto_pipeline and fetch_result.get("status") == "success":
+        try:
+            await confluence_service.transformer.ensure_markdown_batch(
+                fetch_result.get("documents", []),
+                conversion_executor,
+                cache=_get_conversion_cache(output_dir)
+            )
+        except Exception as e:
+            logging.getLogger("specgate.htmlconverter.executor").warning(f"문서 Markdown 변환 실패: {e}")
+    
     # 자동 파이프라인: HTML → MD → Lint
+    pipeline_completed = not auto_pipeline
     if auto_pipeline and fetch_result.get("status") == "success":
+        if pipeline_stream is not None:
+            # 스트리밍 조회 중에 묶음마다 이미 처리됨
+            fetch_result["metadata"]["conversion"] = {"batches": pipeline_stream["conversion"]}
+            fetch_result["metadata"]["pipeline_results"] = pipeline_stream["results"]
+            fetch_result["metadata"]["lint_cache"] = speclint_engine.get_cache_stats()
+            pipeline_completed = not pipeline_stream["failed"]
+        else:
+            try:
+                md_results, conversion = await _run_pipeline(
+                    fetch_result.get("documents", []), output_dir, sync_manifest, auto_create_github_issues
+                )
+                if conversion is not None:
+                    fetch_result["metadata"]["conversion"] = conversion
+                fetch_result["metadata"]["pipeline_results"] = md_results
+                fetch_result["metadata"]["lint_cache"] = speclint_engine.get_cache_stats()
+                pipeline_completed = True
+            except Exception as e:
+                logging.getLogger("specgate.pipeline").warning(f"자동 파이프라인 처리 중 경고: {e}")
+    
+    if sync_manifest is not None:
+        # 모든 결과를 빠짐없이 처리한 실행만 워터마크를 전진시킨다
+        if incremental and pipeline_completed and _is_complete_fetch(fetch_result):
+            sync_manifest.set_watermark(label, space_key, run_started_at)
+            fetch_result["metadata"]["watermark"] = run_started_at.isoformat()
         try:
-            import os as _os
-            documents = fetch_result.get("documents", [])
-            html_files = fetch_result.get("metadata", {}).get("html_files", [])
-            md_results = []
-            for idx, doc in enumerate(documents):
-                html_content = doc.get("html_content")
-                if not html_content:
-                    continue
-                filename_base = None
-                if idx < len(html_files):
-                    filename_base = _os.path.basename(html_files[idx])
-                # HTML to Markdown 변환 (직접 변환기 인스턴스 사용)
-                md_files_dir = _get_specgate_data_dir("md_files")
-                
-                # HTML 파일명 기반으로 MD 파일명 생성
-                md_output_path = None
-                html_timestamp = None
-                if filename_base:
-                    base_no_ext = _os.path.splitext(filename_base)[0]
-                    md_output_path = _os.path.join(md_files_dir, f"{base_no_ext}.md")
-                    # MD 파일 중복 처리: 동일 제목의 기존 타임스탬프 파일 제거
+            sync_manifest.save()
+        except Exception as e:
+            logging.getLogger("specgate.pipeline").warning(f"동기화 매니페스트 저장 실패: {e}")
+    
+    return fetch_result
+
+
+async def _run_pipeline(
+    documents: List[Dict[str, Any]],
+    output_dir: str,
+    sync_manifest: Optional[SyncManifest],
+    auto_create_github_issues: bool
+) -> Tuple[List[Dict[str, Any]], Optional[Dict[str, Any]]]:
+    """문서 목록에 HTML → MD → Lint 파이프라인을 실행하고 (문서별 결과, 배치 변환 지표) 반환"""
+    import os as _os
+    md_results = []
+    conversion = None
+    # 변경된 페이지는 프로세스 풀에서 한 번에 변환해 두고, 아래 루프는 캐시된 결과를 사용
+    # (배치 변환이 실패하면 루프에서 문서별로 변환)
+    try:
+        conversion_cache = _get_conversion_cache(output_dir)
+        await confluence_service.transformer.ensure_markdown_batch(
+            [doc for doc in documents if doc.get("sync_status") != SYNC_UNCHANGED],
+            conversion_executor,
+            cache=conversion_cache
+        )
+        conversion = dict(
+            conversion_executor.last_batch,
+            cache=conversion_cache.get_stats() if conversion_cache else None
+        )
+    except Exception as _batch_e:
+        logging.getLogger("specgate.htmlconverter.executor").warning(f"배치 변환 실패, 문서별 변환으로 진행: {_batch_e}")
+    for idx, doc in enumerate(documents):
+        # 마지막 처리 이후 변경되지 않은 페이지는 파이프라인 전체를 건너뛴다
+        if doc.get("sync_status") == SYNC_UNCHANGED:
+            md_results.append(_create_unchanged_pipeline_result(doc, sync_manifest))
+            continue
+        html_content = doc.get("html_content")
+        if not html_content:
+            continue
+        filename_base = None
+        if doc.get("html_file"):
+            filename_base = _os.path.basename(doc["html_file"])
+        # HTML to Markdown 변환 (직접 변환기 인스턴스 사용)
+        md_files_dir = _get_specgate_data_dir("md_files")
+        
+        # HTML 파일명 기반으로 MD 파일명 생성
+        md_output_path = None
+        html_timestamp = None
+        if filename_base:
+            base_no_ext = _os.path.splitext(filename_base)[0]
+            md_output_path = _os.path.join(md_files_dir, f"{base_no_ext}.md")
+            # MD 파일 중복 처리: 동일 제목의 기존 타임스탬프 파일 제거
+            try:
+                import re as _re, glob as _glob
+                # safe_title 및 타임스탬프 분리
+                m_ts = _re.match(r"^(?P<safe>.+?)_(?P<ts>\d{8}_\d{6})$", base_no_ext)
+                safe_for_match = m_ts.group("safe") if m_ts else base_no_ext
+                html_timestamp = m_ts.group("ts") if m_ts else None
+                pattern = _os.path.join(md_files_dir, f"{safe_for_match}_*.md")
+                ts_regex = _re.compile(rf"^{_re.escape(safe_for_match)}_\d{{8}}_\d{{6}}\.md$")
+                for old_md in _glob.glob(pattern):
+                    base_md = _os.path.basename(old_md)
+                    if not ts_regex.match(base_md):
+                        continue
                     try:
-                        import re as _re, glob as _glob
-                        # safe_title 및 타임스탬프 분리
-                        m_ts = _re.match(r"^(?P<safe>.+?)_(?P<ts>\d{8}_\d{6})$", base_no_ext)
-                        safe_for_match = m_ts.group("safe") if m_ts else base_no_ext
-                        html_timestamp = m_ts.group("ts") if m_ts else None
-                        pattern = _os.path.join(md_files_dir, f"{safe_for_match}_*.md")
-                        ts_regex = _re.compile(rf"^{_re.escape(safe_for_match)}_\d{{8}}_\d{{6}}\.md$")
-                        for old_md in _glob.glob(pattern):
-                            base_md = _os.path.basename(old_md)
-                            if not ts_regex.match(base_md):
-                                continue
-                            try:
-                                _os.remove(old_md)
-                                logging.getLogger("specgate.html_to_md").info(f"기존 MD 파일 삭제(중복 처리): {old_md}")
-                            except Exception as _e:
-                                logging.getLogger("specgate.html_to_md").warning(f"기존 MD 파일 삭제 실패: {old_md} ({_e})")
-                    except Exception as _outer_e:
-                        logging.getLogger("specgate.html_to_md").warning(f"MD 중복 처리 단계 오류: {_outer_e}")
+                        _os.remove(old_md)
+                        logging.getLogger("specgate.html_to_md").info(f"기존 MD 파일 삭제(중복 처리): {old_md}")
+                    except Exception as _e:
+                        logging.getLogger("specgate.html_to_md").warning(f"기존 MD 파일 삭제 실패: {old_md} ({_e})")
+            except Exception as _outer_e:
+                logging.getLogger("specgate.html_to_md").warning(f"MD 중복 처리 단계 오류: {_outer_e}")
+        
+        # 문서 제목 가져오기
+        document_title = doc.get("title", "")
+        
+        # HTML→MD 변환: 문서에 캐시된 변환 결과 재사용 (문서당 1회 변환)
+        markdown_text = await confluence_service.transformer.ensure_markdown(doc)
+        markdown_file = None
+        if markdown_text and md_output_path:
+            try:
+                markdown_file = await html_md_converter.save_markdown(markdown_text, md_output_path)
+            except Exception as _save_e:
+                logging.getLogger("specgate.html_to_md").warning(f"MD 파일 저장 실패: {md_output_path} ({_save_e})")
+        
+        # SpecLint 품질 검사 (직접 엔진 인스턴스 사용)
+        if markdown_text:
+            # auto_create_github_issues는 내부 speclint_lint의 HITL 호출과 별개로,
+            # 자동 파이프라인 단계에서의 HITL 연동 여부를 제어
+            lint_result = await speclint_engine.lint(markdown_text, "full", document_title)
+            # HITL 워크플로우 연동 (auto_pipeline 경로에서도 이슈 생성)
+            try:
+                # 문서 메타정보 준비
+                document_title = doc.get("title") or "unknown"
+                project_name = "unknown_project"
+                doc_type = "설계서"
+                # 제목에서 프로젝트명/문서유형 추출 시도: "[프로젝트명] 문서유형 설계서"
+                import re as _re
+                m = _re.match(r"\[([^\]]+)\]\s+(\w+)\s+설계서", document_title or "")
+                if m:
+                    project_name = m.group(1)
+                    doc_type = m.group(2)
+
+                from workflows.hitl.manager import DocumentInfo as _DocumentInfo, QualityResult as _QualityResult
+
+                document_info = _DocumentInfo(
+                    title=document_title,
+                    project_name=project_name,
+                    doc_type=doc_type,
+                    confluence_url=doc.get("url") or "N/A",
+                    content=markdown_text,
+                    metadata=lint_result.get("metadata", {})
+                )
+                quality_result = _QualityResult(
+                    score=lint_result.get("score", 0),
+                    violations=lint_result.get("violations", []),
+                    suggestions=lint_result.get("suggestions", []),
+                    metadata=lint_result.get("metadata", {})
+                )
+
+                hitl_result = None
+                if auto_create_github_issues:
+                    hitl_result = await hitl_manager.process_quality_result(document_info, quality_result)
+
+                # 결과를 lint_result 메타데이터에 첨부
+                lint_result.setdefault("hitl_workflow", {})
+                lint_result["hitl_workflow"].update({
+                    "status": getattr(hitl_result, "status", "unknown"),
+                    "message": getattr(hitl_result, "message", ""),
+                    "next_action": getattr(hitl_result, "next_action", None),
+                    "issue_url": getattr(hitl_result, "issue_url", None),
+                    "issue_number": getattr(hitl_result, "issue_number", None),
+                    "workflow_id": getattr(hitl_result, "workflow_id", None),
+                })
+            except Exception as _hitl_e:
+                logging.getLogger("specgate.hitl").warning(f"자동 파이프라인 HITL 연동 실패: {_hitl_e}")
+            
+            # 품질 리포트 저장
+            try:
+                reports_dir = _get_specgate_data_dir("quality_reports")
                 
-                # 문서 제목 가져오기
-                document_title = doc.get("title", "")
+                # HTML 파일명에서 추출한 타임스탬프 사용 (없으면 현재 시각)
+                timestamp = html_timestamp or datetime.now().strftime("%Y%m%d_%H%M%S")
+                score = lint_result.get("score", 0)
+                quality_level = lint_result.get("metadata", {}).get("quality_level", "unknown")
+                report_filename = f"quality_report_{score}pts_{quality_level}_{timestamp}.json"
+                report_path = _os.path.join(reports_dir, report_filename)
                 
-                # HTML→MD 변환기 직접 사용
-                from html_to_md.converter import HTMLToMarkdownConverter
-                html_converter = HTMLToMarkdownConverter()
-                md_conv = await html_converter.convert(
-                    html_content=html_content,
-                    preserve_structure=True,
-                    save_to_file=bool(md_output_path),
-                    output_path=md_output_path,
-                    document_title=document_title
-                )
-                markdown_text = md_conv.get("markdown")
+                report_data = {
+                    "timestamp": datetime.now().isoformat(),
+                    "file_timestamp": timestamp,
+                    "quality_score": score,
+                    "quality_level": quality_level,
+                    "check_type": "full",
+                    "violations": lint_result.get("violations", []),
+                    "suggestions": lint_result.get("suggestions", []),
+                    "metadata": lint_result.get("metadata", {}),
+                    "content_length": len(markdown_text)
+                }
                 
-                # SpecLint 품질 검사 (직접 엔진 인스턴스 사용)
-                if markdown_text:
-                    # auto_create_github_issues는 내부 speclint_lint의 HITL 호출과 별개로,
-                    # 자동 파이프라인 단계에서의 HITL 연동 여부를 제어
-                    lint_result = await speclint_engine.lint(markdown_text, "full", document_title)
-                    # HITL 워크플로우 연동 (auto_pipeline 경로에서도 이슈 생성)
-                    try:
-                        # 문서 메타정보 준비
-                        document_title = doc.get("title") or "unknown"
-                        project_name = "unknown_project"
-                        doc_type = "설계서"
-                        # 제목에서 프로젝트명/문서유형 추출 시도: "[프로젝트명] 문서유형 설계서"
-                        import re as _re
-                        m = _re.match(r"\[([^\]]+)\]\s+(\w+)\s+설계서", document_title or "")
-                        if m:
-                            project_name = m.group(1)
-                            doc_type = m.group(2)
-
-                        from workflows.hitl.manager import DocumentInfo as _DocumentInfo, QualityResult as _QualityResult
-
-                        document_info = _DocumentInfo(
-                            title=document_title,
-                            project_name=project_name,
-                            doc_type=doc_type,
-                            confluence_url=doc.get("url") or "N/A",
-                            content=markdown_text,
-                            metadata=lint_result.get("metadata", {})
-                        )
-                        quality_result = _QualityResult(
-                            score=lint_result.get("score", 0),
-                            violations=lint_result.get("violations", []),
-                            suggestions=lint_result.get("suggestions", []),
-                            metadata=lint_result.get("metadata", {})
-                        )
-
-                        hitl_result = None
-                        if auto_create_github_issues:
-                            hitl_result = await hitl_manager.process_quality_result(document_info, quality_result)
-
-                        # 결과를 lint_result 메타데이터에 첨부
-                        lint_result.setdefault("hitl_workflow", {})
-                        lint_result["hitl_workflow"].update({
-                            "status": getattr(hitl_result, "status", "unknown"),
-                            "message": getattr(hitl_result, "message", ""),
-                            "next_action": getattr(hitl_result, "next_action", None),
-                            "issue_url": getattr(hitl_result, "issue_url", None),
-                            "issue_number": getattr(hitl_result, "issue_number", None),
-                            "workflow_id": getattr(hitl_result, "workflow_id", None),
-                        })
-                    except Exception as _hitl_e:
-                        logging.getLogger("specgate.hitl").warning(f"자동 파이프라인 HITL 연동 실패: {_hitl_e}")
-                    
-                    # 품질 리포트 저장
-                    try:
-                        import json
-                        from datetime import datetime
-                        
-                        reports_dir = _get_specgate_data_dir("quality_reports")
-                        
-                        # HTML 파일명에서 추출한 타임스탬프 사용 (없으면 현재 시각)
-                        timestamp = html_timestamp or datetime.now().strftime("%Y%m%d_%H%M%S")
-                        score = lint_result.get("score", 0)
-                        quality_level = lint_result.get("metadata", {}).get("quality_level", "unknown")
-                        report_filename = f"quality_report_{score}pts_{quality_level}_{timestamp}.json"
-                        report_path = _os.path.join(reports_dir, report_filename)
-                        
-                        report_data = {
-                            "timestamp": datetime.now().isoformat(),
-                            "file_timestamp": timestamp,
-                            "quality_score": score,
-                            "quality_level": quality_level,
-                            "check_type": "full",
-                            "violations": lint_result.get("violations", []),
-                            "suggestions": lint_result.get("suggestions", []),
-                            "metadata": lint_result.get("metadata", {}),
-                            "content_length": len(markdown_text)
-                        }
-                        
-                        with open(report_path, 'w', encoding='utf-8') as f:
-                            json.dump(report_data, f, ensure_ascii=False, indent=2)
-                        
-                        lint_result["metadata"]["report_saved"] = True
-                        lint_result["metadata"]["report_path"] = report_path
-                        
-                        logging.getLogger("specgate.pipeline").info(f"품질 리포트 저장: {report_path}")
-                        
-                    except Exception as report_e:
-                        logging.getLogger("specgate.pipeline").warning(f"품질 리포트 저장 실패: {report_e}")
-                        lint_result["metadata"]["report_saved"] = False
-                        lint_result["metadata"]["report_error"] = str(report_e)
-                else:
-                    lint_result = {"score": 0}
-                md_results.append({
-                    "title": doc.get("title"),
-                    "html_file": html_files[idx] if idx < len(html_files) else None,
-                    "markdown_file": md_output_path or md_conv.get("conversion_info", {}).get("file_path"),
-                    "lint": lint_result
-                })
-            fetch_result["metadata"]["pipeline_results"] = md_results
-        except Exception as e:
-            logging.getLogger("specgate.pipeline").warning(f"자동 파이프라인 처리 중 경고: {e}")
-    
-    return fetch_result
+                with open(report_path, 'w', encoding='utf-8') as f:
+                    json.dump(report_data, f, ensure_ascii=False, indent=2)
+                
+                lint_result["metadata"]["report_saved"] = True
+                lint_result["metadata"]["report_path"] = report_path
+                
+                logging.getLogger("specgate.pipeline").info(f"품질 리포트 저장: {report_path}")
+                
+            except Exception as report_e:
+                logging.getLogger("specgate.pipeline").warning(f"품질 리포트 저장 실패: {report_e}")
+                lint_result["metadata"]["report_saved"] = False
+                lint_result["metadata"]["report_error"] = str(report_e)
+        else:
+            lint_result = {"score": 0}
+        md_results.append({
+            "title": doc.get("title"),
+            "page_id": doc.get("id"),
+            "version": doc.get("version"),
+            "status": doc.get("sync_status", "processed"),
+            "html_file": doc.get("html_file"),
+            "markdown_file": markdown_file,
+            "lint": lint_result
+        })
+        
+        # 처리 완료된 버전을 매니페스트에 기록
+        if sync_manifest is not None and markdown_text:
+            sync_manifest.record(
+                doc,
+                html_file=doc.get("html_file"),
+                markdown_file=markdown_file,
+                score=lint_result.get("score"),
+                quality_level=lint_result.get("metadata", {}).get("quality_level"),
+                report_path=lint_result.get("metadata", {}).get("report_path")
+            )
+    return md_results, conversion
+
+
+def _is_complete_fetch(fetch_result: Dict[str, Any]) -> bool:
+    """조회 결과가 누락 없이 완료되었는지 (성공, 다음 페이지 없음, 페이지/본문 조회 오류와 스트림 중단 없음)"""
+    metadata = fetch_result.get("metadata", {})
+    return (
+        fetch_result.get("status") == "success"
+        and not metadata.get("has_more", False)
+        and not metadata.get("crawl", {}).get("errors")
+        and not metadata.get("two_phase", {}).get("body_errors")
+        and not metadata.get("stream", {}).get("error")
+    )
+
+
+def _create_unchanged_pipeline_result(doc: Dict[str, Any], sync_manifest: Optional[SyncManifest]) -> Dict[str, Any]:
+    """변경되지 않아 건너뛴 페이지의 pipeline_results 항목 (직전 처리 결과 참조)"""
+    previous = (sync_manifest.get(doc.get("id")) if sync_manifest else None) or {}
+    return {
+        "title": doc.get("title"),
+        "page_id": doc.get("id"),
+        "version": doc.get("version"),
+        "status": SYNC_UNCHANGED,
+        "html_file": previous.get("html_file"),
+        "markdown_file": previous.get("markdown_file"),
+        "lint": {
+            "score": previous.get("score"),
+            "metadata": {
+                "quality_level": previous.get("quality_level"),
+                "report_path": previous.get("report_path"),
+                "processed_at": previous.get("processed_at")
+            }
+        }
+    }
 
 
 # =============================================================================
 # 2. speclint.lint 도구 구현 (HITL 워크플로우 통합)
 # =============================================================================
-from speclint_lint import SpecLint
+from speclint_lint import SpecLint, LintResultCache, LintCacheConfig, BatchLintConfig
 from workflows.hitl.manager import HITLWorkflowManager, DocumentInfo, QualityResult
 
-# SpecLint 인스턴스 생성
-speclint_engine = SpecLint()
+# SpecLint 인스턴스 생성 (같은 내용/검사 유형/제목/규칙 세트의 결과는 캐시에서 재사용, SPECLINT_CACHE=0이면 사용 안 함)
+speclint_cache_config = LintCacheConfig.from_env()
+# 배치 검사는 SPECLINT_BATCH_WORKERS가 2 이상이면 스레드/프로세스 풀에서 동시에 실행
+speclint_engine = SpecLint(
+    cache=LintResultCache(speclint_cache_config) if speclint_cache_config.enabled else None,
+    batch_config=BatchLintConfig.from_env()
+)
 
 # HITL 워크플로우 매니저 생성
 hitl_manager = HITLWorkflowManager()
@@ -530,7 +723,7 @@ def _get_specgate_data_dir(subfolder: str, output_dir: str = None) -> str:
     """SpecGate 데이터 디렉토리 경로를 생성하고 디렉토리를 생성한다.
     
     Args:
-        subfolder: 하위 폴더명 ('html_files', 'md_files', 'quality_reports', 'logs')
+        subfolder: 하위 폴더명 ('html_files', 'md_files', 'quality_reports', 'sync', 'logs')
         output_dir: 사용자 지정 출력 디렉토리 (선택사항)
     
     Returns:
@@ -598,12 +791,39 @@ def initialize_server():
     print("  - .specgate/data/html_files/: HTML 원본 저장")
     print("  - .specgate/data/md_files/: 변환된 Markdown 저장")
     print("  - .specgate/data/quality_reports/: 품질 검사 결과 저장")
+    print("  - .specgate/data/sync/: 페이지 동기화 매니페스트 (변경 없는 페이지 생략)")
+    print("  - .specgate/cache/html_to_md/: HTML→MD 변환 캐시 (변경 없는 HTML은 재변환 생략)")
     print("  - .specgate/logs/: 서버 실행 로그")
     print("🔄 HITL 워크플로우:")
     print("  - 90점 이상: 자동 승인 → Phase 2 진행")
     print("  - 70-89점: HITL 검토용 GitHub Issue 생성")
     print("  - 70점 미만: 필수 수정용 GitHub Issue 생성")
     
+    # Confluence HTTP 커넥션 풀 (세션은 첫 요청 시 서버 이벤트 루프에서 생성)
+    pool = confluence_service.client.pool_config
+    print(f"🔌 Confluence 커넥션 풀: limit={pool.limit}, per_host={pool.limit_per_host}, "
+          f"keepalive={pool.keepalive_timeout}s, dns_cache_ttl={pool.dns_cache_ttl}s")
+    retry = confluence_service.client.retry_policy
+    limiter = confluence_service.client.rate_limiter
+    print(f"🚦 Confluence 호출 제한: {limiter.rate:g} req/s (burst {limiter.capacity:g}), "
+          f"재시도 최대 {retry.max_attempts}회 (base {retry.base_delay}s, max {retry.max_delay}s)")
+    concurrency = confluence_service.client.concurrency
+    print(f"📈 Confluence 동시 요청 자동 조절: 시작 {concurrency.window}, 범위 {concurrency.min_limit}-{concurrency.max_limit}")
+    executor_config = conversion_executor.config
+    print(f"🧮 HTML→MD 배치 변환: 워커 {executor_config.workers}개 ({executor_config.start_method}), "
+          f"{executor_config.min_batch}페이지, HTML {executor_config.min_bytes // 1024}KB 이상일 때 프로세스 풀 사용")
+    prune_config = conversion_executor.prune_config
+    if prune_config.enabled:
+        print(f"🧹 HTML 사전 가지치기: 매크로 {', '.join(prune_config.macros) or '-'}, "
+              f"속성 {', '.join(prune_config.attributes) or '-'}, data: URI {'제거' if prune_config.drop_data_uris else '유지'}")
+    else:
+        print("🧹 HTML 사전 가지치기: 비활성화 (HTML_TO_MD_PRUNE=0)")
+    if conversion_cache_config.enabled:
+        print(f"🗃️ HTML→MD 변환 캐시: 최대 {conversion_cache_config.max_bytes // (1024 * 1024)}MB, "
+              f"미사용 {conversion_cache_config.max_age_seconds / 86400:g}일 후 만료")
+    else:
+        print("🗃️ HTML→MD 변환 캐시: 비활성화 (HTML_TO_MD_CACHE=0)")
+    
     # 클라이언트 작업 디렉토리 자동 감지
     client_dir = _get_client_work_dir()
     print(f"📁 자동 감지된 클라이언트 작업 디렉토리: {client_dir}")
@@ -630,6 +850,21 @@ def initialize_server():
 
 def cleanup_server():
     """서버 종료 시 정리 작업"""
+    # 공유 Confluence HTTP 세션 종료
+    try:
+        asyncio.run(confluence_service.close())
+    except Exception as e:
+        logging.getLogger('specgate').warning(f"Confluence HTTP 세션 종료 실패: {e}")
+    # HTML→MD 변환 프로세스 풀 종료
+    try:
+        conversion_executor.shutdown()
+    except Exception as e:
+        logging.getLogger('specgate').warning(f"HTML→MD 변환 프로세스 풀 종료 실패: {e}")
+    # SpecLint 배치 검사 워커 풀 종료
+    try:
+        speclint_engine.batch_linter.shutdown()
+    except Exception as e:
+        logging.getLogger('specgate').warning(f"SpecLint 배치 검사 워커 풀 종료 실패: {e}")
     print("🛑 SpecGate MCP Server 종료")
 
 
@@ -642,4 +877,6 @@ if __name__ == "__main__":
         # FastMCP 서버 실행
         mcp.run()
     except KeyboardInterrupt:
+        pass
+    finally:
         cleanup_server()
@@ -21,6 +21,11 @@ Confluence에서 가져온 설계 문서의 표준화 여부를 검사하고
 
 from .core import SpecLint
 from .core import (
+    RuleEngine,
+    LintResultCache,
+    LintCacheConfig,
+    BatchLintConfig,
+    BatchLintRun,
     DocumentStructureAnalyzer,
     TemplateValidator,
     QualityScorer,
@@ -28,7 +33,6 @@ from .core import (
     QUALITY_SCORING,
     PERFORMANCE_REQUIREMENTS,
     MEMORY_REQUIREMENTS,
-    STRUCTURE_CHECKS,
     IMPROVEMENT_SUGGESTIONS
 )
 
@@ -37,6 +41,11 @@ __author__ = "SpecGate Team"
 
 __all__ = [
     'SpecLint',
+    'RuleEngine',
+    'LintResultCache',
+    'LintCacheConfig',
+    'BatchLintConfig',
+    'BatchLintRun',
     'DocumentStructureAnalyzer',
     'TemplateValidator', 
     'QualityScorer',
@@ -44,6 +53,5 @@ __all__ = [
     'QUALITY_SCORING',
     'PERFORMANCE_REQUIREMENTS',
     'MEMORY_REQUIREMENTS',
-    'STRUCTURE_CHECKS',
     'IMPROVEMENT_SUGGESTIONS'
 ]
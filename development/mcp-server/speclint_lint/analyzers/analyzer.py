@@ -11,10 +11,10 @@ SpecGate 표준 템플릿 준수 여부를 평가하는 모듈입니다.
 - 규칙 형식 및 개수 분석
 - 문서 기본 통계 (단어 수, 줄 수 등)
 """
-import re
 import logging
-from typing import Dict, List, Any, Optional
-from speclint_lint.utils.rules import STRUCTURE_CHECKS
+from typing import Dict, Any, Optional
+from speclint_lint.engine import RuleEngine, CheckOutcome
+from speclint_lint.utils.markdown_index import MarkdownIndex
 
 
 class DocumentStructureAnalyzer:
@@ -22,33 +22,21 @@ class DocumentStructureAnalyzer:
     
     설계 문서의 구조적 요소들을 분석하여
     SpecGate 표준 템플릿 준수 여부를 평가합니다.
+    검사 패턴과 가중치는 규칙 엔진(speclint-rules.yaml의 checks)에서 가져옵니다.
     """
     
-    def __init__(self):
-        self.checks = STRUCTURE_CHECKS
+    def __init__(self, engine: Optional[RuleEngine] = None):
+        self.engine = engine or RuleEngine.default()
         self.logger = logging.getLogger("specgate.speclint.analyzer")
-        
-        # 정규식 패턴 미리 컴파일 (성능 최적화)
-        # 제목 패턴을 더 유연하게 허용
-        self.title_patterns = [
-            r'^#\s*\[[^\]]+\]\s*(\[[^\]]+\]|\w+)\s*설계서\s*$',  # [프로젝트] [유형] 설계서
-            r'^#\s*\[[^\]]+\]\s*[A-Za-z가-힣\s]+\s*설계서\s*$',  # [프로젝트] API 설계서
-            r'^#\s*[A-Za-z가-힣\s]+\s*설계서\s*$'  # SpecGate API 설계서
-        ]
-        
-        self._compiled_patterns = {
-            'title_format': [re.compile(pattern, re.MULTILINE) for pattern in self.title_patterns],
-            'design_rules_section': re.compile(self.checks['design_rules_section']['pattern'], re.IGNORECASE),
-            'technical_spec_section': re.compile(self.checks['technical_spec_section']['pattern'], re.IGNORECASE),
-            'rule_format': re.compile(self.checks['rule_format']['pattern'])
-        }
     
-    async def analyze(self, content: str, document_title: Optional[str] = None) -> Dict[str, Any]:
+    async def analyze(self, content: str, document_title: Optional[str] = None,
+                      index: Optional[MarkdownIndex] = None) -> Dict[str, Any]:
         """문서 구조를 분석하고 점수를 계산한다.
         
         Args:
             content: 분석할 문서 내용
             document_title: Confluence 문서의 실제 제목 (선택사항)
+            index: 미리 만든 섹션 인덱스 (없으면 content로 만든다)
             
         Returns:
             Dict[str, Any]: 구조 분석 결과
@@ -58,26 +46,28 @@ class DocumentStructureAnalyzer:
             return self._create_empty_result()
         
         try:
+            if index is None:
+                index = self.engine.build_index(content)
+            outcomes = self.engine.evaluate(index)
+            
             # 제목 형식 검사 (Confluence 제목 우선 사용)
-            title_result = self._check_title_format(content, document_title)
+            title_result = self._check_title_format(outcomes, document_title)
             
             # 설계 규칙 섹션 검사
-            design_rules_result = self._check_design_rules_section(content)
+            design_rules_result = self._heading_result(outcomes['design_rules_section'])
             
             # 기술 스펙 섹션 검사
-            technical_spec_result = self._check_technical_spec_section(content)
+            technical_spec_result = self._heading_result(outcomes['technical_spec_section'])
             
             # 규칙 개수 계산
-            rule_count = self._count_rules(content)
+            rule_count = self._count_rules(index)
             
             # 기본 통계
-            word_count = len(content.split())
-            line_count = len(content.split('\n'))
+            word_count = index.word_count
+            line_count = index.line_count
             
             # 구조 점수 계산
-            structure_score = self._calculate_structure_score(
-                title_result, design_rules_result, technical_spec_result, rule_count, content
-            )
+            structure_score = self._calculate_structure_score(outcomes, title_result)
             
             result = {
                 "has_title": title_result["valid"],
@@ -132,199 +122,105 @@ class DocumentStructureAnalyzer:
             "error": error_message
         }
     
-    def _check_title_format(self, content: str, document_title: Optional[str] = None) -> Dict[str, Any]:
+    def _check_title_format(self, outcomes: Dict[str, CheckOutcome], document_title: Optional[str] = None) -> Dict[str, Any]:
         """제목 형식 검사
         
         Args:
-            content: 문서 내용
+            outcomes: 규칙 엔진의 검사별 결과
             document_title: Confluence 문서의 실제 제목 (선택사항)
             
         Returns:
             Dict[str, Any]: 제목 형식 검사 결과
         """
+        check = self.engine.checks['title_format']
         try:
             # Confluence 문서 제목이 있으면 우선 사용
             if document_title:
                 self.logger.info(f"Confluence 문서 제목으로 검사: {document_title}")
                 # Confluence 제목을 Markdown 형식으로 변환하여 검사
                 confluence_title = f"# {document_title}"
-                
-                patterns = self._compiled_patterns['title_format']
-                match = None
-                matched_pattern = None
-                
-                for i, pattern in enumerate(patterns):
-                    match = pattern.search(confluence_title)
-                    if match:
-                        matched_pattern = self.title_patterns[i]
-                        break
+                found = self.engine.match_heading_text('title_format', confluence_title)
+                pattern_index, match = found if found else (0, None)
                 
                 return {
                     "valid": bool(match),
-                    "pattern": matched_pattern or self.checks['title_format']['pattern'],
-                    "description": self.checks['title_format']['description'],
+                    "pattern": check.patterns[pattern_index],
+                    "description": check.description,
                     "match": match.group() if match else confluence_title,
-                    "weight": self.checks['title_format']['weight'],
+                    "weight": check.weight,
                     "source": "confluence_title"
                 }
             else:
-                # 기존 방식: Markdown 내용에서 제목 검색
-                patterns = self._compiled_patterns['title_format']
-                match = None
-                matched_pattern = None
-                
-                for i, pattern in enumerate(patterns):
-                    match = pattern.search(content)
-                    if match:
-                        matched_pattern = self.title_patterns[i]
-                        break
-                
-                return {
-                    "valid": bool(match),
-                    "pattern": matched_pattern or self.checks['title_format']['pattern'],
-                    "description": self.checks['title_format']['description'],
-                    "match": match.group() if match else None,
-                    "weight": self.checks['title_format']['weight'],
-                    "source": "markdown_content"
-                }
+                # 기존 방식: Markdown 헤딩에서 제목 검색
+                result = self._heading_result(outcomes['title_format'])
+                result["source"] = "markdown_content"
+                return result
         except Exception as e:
             self.logger.error(f"제목 형식 검사 중 오류: {e}")
             return {
                 "valid": False,
-                "pattern": self.checks['title_format']['pattern'],
-                "description": self.checks['title_format']['description'],
+                "pattern": check.patterns[0],
+                "description": check.description,
                 "error": str(e),
-                "weight": self.checks['title_format']['weight']
+                "weight": check.weight
             }
     
-    def _check_design_rules_section(self, content: str) -> Dict[str, Any]:
-        """설계 규칙 섹션 검사
+    def _heading_result(self, outcome: CheckOutcome) -> Dict[str, Any]:
+        """heading 검사 결과를 분석 결과 형식으로 변환
         
         Args:
-            content: 문서 내용
+            outcome: 규칙 엔진의 heading 검사 결과
             
         Returns:
-            Dict[str, Any]: 설계 규칙 섹션 검사 결과
+            Dict[str, Any]: 섹션 검사 결과
         """
-        try:
-            pattern = self._compiled_patterns['design_rules_section']
-            match = pattern.search(content)
-            
-            return {
-                "valid": bool(match),
-                "pattern": self.checks['design_rules_section']['pattern'],
-                "description": self.checks['design_rules_section']['description'],
-                "match": match.group() if match else None,
-                "weight": self.checks['design_rules_section']['weight']
-            }
-        except Exception as e:
-            self.logger.error(f"설계 규칙 섹션 검사 중 오류: {e}")
-            return {
-                "valid": False,
-                "pattern": self.checks['design_rules_section']['pattern'],
-                "description": self.checks['design_rules_section']['description'],
-                "error": str(e),
-                "weight": self.checks['design_rules_section']['weight']
-            }
-    
-    def _check_technical_spec_section(self, content: str) -> Dict[str, Any]:
-        """기술 스펙 섹션 검사
-        
-        Args:
-            content: 문서 내용
-            
-        Returns:
-            Dict[str, Any]: 기술 스펙 섹션 검사 결과
-        """
-        try:
-            pattern = self._compiled_patterns['technical_spec_section']
-            match = pattern.search(content)
-            
-            return {
-                "valid": bool(match),
-                "pattern": self.checks['technical_spec_section']['pattern'],
-                "description": self.checks['technical_spec_section']['description'],
-                "match": match.group() if match else None,
-                "weight": self.checks['technical_spec_section']['weight']
-            }
-        except Exception as e:
-            self.logger.error(f"기술 스펙 섹션 검사 중 오류: {e}")
-            return {
-                "valid": False,
-                "pattern": self.checks['technical_spec_section']['pattern'],
-                "description": self.checks['technical_spec_section']['description'],
-                "error": str(e),
-                "weight": self.checks['technical_spec_section']['weight']
-            }
+        check = outcome.check
+        return {
+            "valid": outcome.passed,
+            "pattern": check.patterns[outcome.pattern_index or 0],
+            "description": check.description,
+            "match": outcome.match,
+            "weight": check.weight
+        }
     
-    def _count_rules(self, content: str) -> int:
+    def _count_rules(self, index: MarkdownIndex) -> int:
         """규칙 개수 계산
         
         Args:
-            content: 문서 내용
+            index: 문서 섹션 인덱스
             
         Returns:
             int: 발견된 규칙 개수
         """
         try:
-            pattern = self._compiled_patterns['rule_format']
-            matches = pattern.findall(content)
-            count = len(matches)
+            count = len(index.rule_lines)
             self.logger.debug(f"발견된 규칙 개수: {count}")
             return count
         except Exception as e:
             self.logger.error(f"규칙 개수 계산 중 오류: {e}")
             return 0
     
-    def _calculate_structure_score(self, title_result: Dict[str, Any], 
-                                 design_rules_result: Dict[str, Any],
-                                 technical_spec_result: Dict[str, Any],
-                                 rule_count: int, content: str) -> int:
+    def _calculate_structure_score(self, outcomes: Dict[str, CheckOutcome], title_result: Dict[str, Any]) -> int:
         """구조 점수 계산
         
+        통과한 검사의 가중치 합 (제목은 Confluence 제목 검사 결과를 우선 반영)
+        
         Args:
+            outcomes: 규칙 엔진의 검사별 결과
             title_result: 제목 형식 검사 결과
-            design_rules_result: 설계 규칙 섹션 검사 결과
-            technical_spec_result: 기술 스펙 섹션 검사 결과
-            rule_count: 규칙 개수
             
         Returns:
             int: 구조 점수 (0-100)
         """
         try:
-            score = 0
+            score = sum(
+                outcome.score for check_id, outcome in outcomes.items() if check_id != 'title_format'
+            )
             
             # 제목 형식 점수
             if title_result.get("valid", False):
                 score += title_result.get("weight", 0)
             
-            # 설계 규칙 섹션 점수
-            if design_rules_result.get("valid", False):
-                score += design_rules_result.get("weight", 0)
-            
-            # 기술 스펙 섹션 점수
-            if technical_spec_result.get("valid", False):
-                score += technical_spec_result.get("weight", 0)
-            
-            # 규칙 개수 점수 (10점)
-            if rule_count >= 5:  # 최소 5개 규칙 이상
-                rule_score = 10  # 고정 점수
-            elif rule_count > 0:
-                rule_score = rule_count * 2  # 부족하면 개수에 비례 (최대 8점)
-            else:
-                rule_score = 0  # 규칙이 없으면 0점
-            
-            score += rule_score
-            
-            # 코드 블록 존재 점수 (10점)
-            code_blocks = self._count_code_blocks(content)
-            if code_blocks > 0:
-                score += 10
-            
-            # 변경 이력 존재 점수 (5점)
-            if self._has_change_history(content):
-                score += 5
-            
             final_score = min(score, 100)  # 최대 100점
             self.logger.debug(f"구조 점수 계산: {final_score} (기본: {score})")
             return final_score
@@ -332,57 +228,3 @@ class DocumentStructureAnalyzer:
         except Exception as e:
             self.logger.error(f"구조 점수 계산 중 오류: {e}")
             return 0
-    
-    def _count_code_blocks(self, content: str) -> int:
-        """코드 블록 개수 계산"""
-        try:
-            # 다양한 코드 블록 패턴 검사
-            code_patterns = [
-                r'```[\s\S]*?```',  # 기본 코드 블록
-                r'```python[\s\S]*?```',  # Python 코드 블록
-                r'```javascript[\s\S]*?```',  # JavaScript 코드 블록
-                r'```json[\s\S]*?```',  # JSON 코드 블록
-                r'```yaml[\s\S]*?```',  # YAML 코드 블록
-                r'```xml[\s\S]*?```',  # XML 코드 블록
-                r'```sql[\s\S]*?```',  # SQL 코드 블록
-                r'```bash[\s\S]*?```',  # Bash 코드 블록
-                r'```shell[\s\S]*?```',  # Shell 코드 블록
-            ]
-            
-            total_blocks = 0
-            for pattern in code_patterns:
-                matches = re.findall(pattern, content, re.MULTILINE | re.DOTALL)
-                total_blocks += len(matches)
-            
-            self.logger.debug(f"발견된 코드 블록 개수: {total_blocks}")
-            return total_blocks
-            
-        except Exception as e:
-            self.logger.error(f"코드 블록 계산 중 오류: {e}")
-            return 0
-    
-    def _has_change_history(self, content: str) -> bool:
-        """변경 이력 섹션 존재 여부 확인"""
-        try:
-            # 변경 이력 섹션 패턴들
-            change_history_patterns = [
-                r'##\s*[0-9]+\.\s*변경\s*이력',
-                r'##\s*[0-9]+\.\s*changelog',
-                r'##\s*[0-9]+\.\s*version',
-                r'##\s*[0-9]+\.\s*history',
-                r'##\s*[0-9]+\.\s*revision'
-            ]
-            
-            for pattern in change_history_patterns:
-                if re.search(pattern, content, re.IGNORECASE):
-                    self.logger.debug("변경 이력 섹션 발견")
-                    return True
-            
-            self.logger.debug("변경 이력 섹션 없음")
-            return False
-            
-        except Exception as e:
-            self.logger.error(f"변경 이력 검사 중 오류: {e}")
-            return False
-
-
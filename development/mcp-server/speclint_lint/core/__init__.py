@@ -24,11 +24,13 @@ from speclint_lint.validators import TemplateValidator
 from speclint_lint.scorers import QualityScorer
 from speclint_lint.suggestors import ImprovementSuggester
 from .speclint import SpecLint
+from .cache import LintResultCache, LintCacheConfig
+from .batch import BatchLinter, BatchLintConfig, BatchLintRun
+from speclint_lint.engine import RuleEngine
 from speclint_lint.utils import (
     QUALITY_SCORING, 
     PERFORMANCE_REQUIREMENTS, 
     MEMORY_REQUIREMENTS,
-    STRUCTURE_CHECKS,
     IMPROVEMENT_SUGGESTIONS
 )
 
@@ -37,6 +39,11 @@ __author__ = "SpecGate Team"
 
 __all__ = [
     'SpecLint',
+    'RuleEngine',
+    'LintResultCache',
+    'LintCacheConfig',
+    'BatchLintConfig',
+    'BatchLintRun',
     'DocumentStructureAnalyzer',
     'TemplateValidator', 
     'QualityScorer',
@@ -44,6 +51,5 @@ __all__ = [
     'QUALITY_SCORING',
     'PERFORMANCE_REQUIREMENTS',
     'MEMORY_REQUIREMENTS',
-    'STRUCTURE_CHECKS',
     'IMPROVEMENT_SUGGESTIONS'
 ]
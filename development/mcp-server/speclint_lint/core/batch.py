@@ -0,0 +1,394 @@
+"""
+SpecLint 병렬 배치 검사
+여러 문서의 품질 검사를 스레드/프로세스 풀에 나눠 실행하고 끝나는 순서대로 결과를 내는 모듈
+
+검사 단계는 async 함수지만 모두 CPU 작업이라 이벤트 루프에서 차례로 await하면 겹치지 않는다.
+동시에 실행하는 문서 수를 워커 수로 제한하고, 문서별 제한 시간은 워커가 검사를 시작했다고 알린
+시각부터 세므로 첫 배치의 풀 시작(프로세스 생성, 모듈 import) 시간은 포함하지 않는다.
+제한 시간을 넘긴 문서는 오류 결과를 먼저 내고 그 워커가 끝날 때까지 다음 문서를 배정하지 않는다.
+"""
+import os
+import time
+import queue
+import signal
+import asyncio
+import logging
+import threading
+import itertools
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Tuple
+
+from speclint_lint.engine import RuleEngine, RuleSet
+from speclint_lint.utils.rules import PERFORMANCE_REQUIREMENTS
+from utils.mp import worker_context
+
+
+BATCH_MODES = ("thread", "process")
+
+# 검사 시작 보고를 기다리는 동안 마감 시각을 다시 확인하는 간격 (초)
+START_POLL_INTERVAL = 0.02
+
+# (입력 순번, 문서 내용, 검사 유형, 문서 제목, 제한 시간, 작업 번호)
+LintTask = Tuple[int, str, str, Optional[str], Optional[float], int]
+
+# 워커 프로세스마다 한 번 만들어 재사용하는 SpecLint와 이벤트 루프
+_worker_speclint = None
+_worker_loop: Optional[asyncio.AbstractEventLoop] = None
+# 검사를 시작할 때 (작업 번호, time.monotonic())을 보내는 큐
+_worker_started = None
+
+
+class LintTimeout(BaseException):
+    """워커 안에서 제한 시간을 넘김 (lint()의 except Exception에 잡히지 않도록 BaseException)"""
+
+
+def _raise_timeout(signum, frame):
+    raise LintTimeout()
+
+
+def _init_worker(rule_set: RuleSet, started=None) -> None:
+    global _worker_speclint, _worker_loop, _worker_started
+    from .speclint import SpecLint
+    _worker_speclint = SpecLint(RuleEngine(rule_set))
+    _worker_loop = asyncio.new_event_loop()
+    _worker_started = started
+
+
+def _lint_in_worker(task: LintTask) -> Tuple[int, Optional[Dict[str, Any]], int, float]:
+    """워커 프로세스에서 문서 하나를 검사 (결과, 워커 PID, 검사 시간 반환, 시간 초과 시 결과는 None)
+
+    SIGALRM을 쓸 수 있으면 제한 시간에 검사를 중단해 워커를 바로 다음 문서에 쓸 수 있게 한다.
+    """
+    index, content, check_type, document_title, timeout, task_id = task
+    if _worker_started is not None:
+        _worker_started.put((task_id, time.monotonic()))
+    started = time.perf_counter()
+    use_alarm = bool(timeout) and hasattr(signal, "SIGALRM")
+    if use_alarm:
+        signal.signal(signal.SIGALRM, _raise_timeout)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        result = _worker_loop.run_until_complete(_worker_speclint.lint(content, check_type, document_title))
+    except LintTimeout:
+        result = None
+    finally:
+        if use_alarm:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+    return index, result, os.getpid(), time.perf_counter() - started
+
+
+@dataclass
+class BatchLintConfig:
+    """배치 검사 설정"""
+    workers: int = 1                   # 동시에 검사하는 문서 수 (1이면 현재 이벤트 루프에서 차례로 검사)
+    mode: str = "process"              # process: 프로세스 풀 (CPU 병렬), thread: 스레드 풀
+    timeout: Optional[float] = PERFORMANCE_REQUIREMENTS['single_document']['timeout']  # 문서별 제한 시간 (초, 풀에서 검사할 때 적용)
+    min_batch: int = 2                 # 이보다 적은 문서는 풀 없이 검사
+    start_method: str = "spawn"        # 서버의 스레드/이벤트 루프 상태를 복제하지 않도록 spawn 사용
+
+    @classmethod
+    def from_env(cls) -> "BatchLintConfig":
+        """환경변수(SPECLINT_BATCH_*)에서 설정을 읽는다. 미설정 항목은 기본값 사용"""
+        defaults = cls()
+        timeout = os.getenv("SPECLINT_BATCH_TIMEOUT")
+        return cls(
+            workers=max(1, int(os.getenv("SPECLINT_BATCH_WORKERS", defaults.workers))),
+            mode=os.getenv("SPECLINT_BATCH_MODE", defaults.mode),
+            timeout=(float(timeout) or None) if timeout is not None else defaults.timeout,
+            min_batch=int(os.getenv("SPECLINT_BATCH_MIN_BATCH", defaults.min_batch)),
+            start_method=os.getenv("SPECLINT_BATCH_START_METHOD", defaults.start_method)
+        )
+
+
+class BatchLintRun:
+    """batch_lint_stream()이 돌려주는 비동기 반복자
+
+    문서별 결과를 검사가 끝나는 순서대로 내고, 받은 결과로 batch_lint()와 같은
+    summary를 누적한다. 반복이 끝나면 results는 입력 순서의 전체 결과이다.
+    """
+
+    def __init__(self, linter: "BatchLinter", documents: Sequence[Dict[str, Any]], check_type: str):
+        self.linter = linter
+        self._stream = linter.stream(documents, check_type)
+        self._results: Dict[int, Dict[str, Any]] = {}
+        self.total = len(documents)
+        self.check_type = check_type
+        self.started = datetime.now()
+        self.finished: Optional[datetime] = None
+
+    def __aiter__(self) -> "BatchLintRun":
+        return self
+
+    async def __anext__(self) -> Dict[str, Any]:
+        try:
+            index, result = await self._stream.__anext__()
+        except StopAsyncIteration:
+            self.finished = self.finished or datetime.now()
+            raise
+        self._results[index] = result
+        return result
+
+    async def aclose(self) -> None:
+        """반복을 중간에 멈출 때 풀에 남은 작업 정리"""
+        await self._stream.aclose()
+
+    @property
+    def results(self) -> List[Dict[str, Any]]:
+        """지금까지 받은 결과 (입력 순서)"""
+        return [self._results[index] for index in sorted(self._results)]
+
+    @property
+    def summary(self) -> Dict[str, Any]:
+        """지금까지 받은 결과의 요약 통계 (성공은 점수 > 0, 평균은 전체 문서 수 기준)"""
+        scores = [result.get('score', 0) for result in self._results.values()]
+        successful_count = sum(1 for score in scores if score > 0)
+        return {
+            'total_documents': self.total,
+            'successful_count': successful_count,
+            'failed_count': len(scores) - successful_count,
+            'average_score': sum(scores) / self.total if self.total else 0
+        }
+
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        end = self.finished or datetime.now()
+        return {
+            'check_type': self.check_type,
+            'timestamp': end.isoformat(),
+            'processing_time_seconds': (end - self.started).total_seconds(),
+            'batch': dict(self.linter.last_batch)
+        }
+
+
+class BatchLinter:
+    """스레드/프로세스 풀 기반 배치 검사기
+
+    stream()은 (입력 순번, 결과)를 검사가 끝나는 순서대로 낸다. 검사 결과 캐시는
+    현재 프로세스에서 먼저 조회하여 적중한 문서는 워커로 보내지 않고, 워커 결과를 저장한다.
+    풀은 첫 배치에서 만들어 재사용하며, shutdown()으로 정리한다.
+    프로세스 워커가 비정상 종료되면 해당 문서는 오류 결과로 채우고 다음 문서부터 풀을 새로 만든다.
+    """
+
+    def __init__(self, speclint, config: Optional[BatchLintConfig] = None):
+        self.speclint = speclint
+        self.config = config or BatchLintConfig()
+        if self.config.mode not in BATCH_MODES:
+            raise ValueError(f"지원하지 않는 배치 검사 모드: {self.config.mode} (허용: {', '.join(BATCH_MODES)})")
+        self.logger = logging.getLogger("specgate.speclint.batch")
+        self._pool: Optional[Executor] = None
+        self._started = None                    # 워커의 검사 시작 보고 큐 (풀과 함께 만든다)
+        self._task_ids = itertools.count()
+        self._local = threading.local()
+
+        self.batches = 0
+        self.documents_linted = 0
+        self.timeouts = 0
+        self.last_batch: Dict[str, Any] = {}
+
+    def uses_pool(self, count: int) -> bool:
+        return self.config.workers > 1 and count >= self.config.min_batch
+
+    async def stream(self, documents: Sequence[Dict[str, Any]], check_type: str) -> AsyncIterator[Tuple[int, Dict[str, Any]]]:
+        """문서 목록을 검사하여 (입력 순번, 결과)를 끝나는 순서대로 생성"""
+        self.batches += 1
+        started = time.perf_counter()
+        self.last_batch = {'documents': len(documents), 'cache_hits': 0, 'timeouts': 0, 'failed': 0, 'per_worker': {}}
+        if not self.uses_pool(len(documents)):
+            self.last_batch.update(mode='in_process', workers=1)
+            for index, doc in enumerate(documents):
+                self.logger.info(f"문서 {index + 1}/{len(documents)} 처리 중: {doc.get('title', 'Unknown')}")
+                result = await self._lint_here(index, doc, check_type)
+                self.documents_linted += 1
+                yield index, result
+        else:
+            self.last_batch.update(mode=f'{self.config.mode}_pool', workers=self.config.workers)
+            async for index, result in self._stream_in_pool(documents, check_type):
+                self.documents_linted += 1
+                yield index, result
+        self.last_batch['elapsed'] = round(time.perf_counter() - started, 4)
+
+    async def _stream_in_pool(self, documents: Sequence[Dict[str, Any]], check_type: str) -> AsyncIterator[Tuple[int, Dict[str, Any]]]:
+        loop = asyncio.get_running_loop()
+        speclint = self.speclint
+        pending = list(range(len(documents)))
+        pending.reverse()
+        running: Dict[asyncio.Future, Tuple[int, Optional[str], float]] = {}   # 작업 → (순번, 캐시 키, 마감 시각)
+        expired = set()                                                       # 결과를 이미 시간 초과로 낸 작업
+        unstarted: Dict[int, asyncio.Future] = {}                            # 시작 보고 전 작업 (작업 번호 → 작업)
+        try:
+            while pending or len(running) > len(expired):
+                # 쉬는 워커 수만큼 배정 (시간 초과한 작업도 끝날 때까지 워커를 차지)
+                while pending and len(running) < self.config.workers:
+                    index = pending.pop()
+                    doc = documents[index]
+                    content, title = doc.get('content', ''), doc.get('title', 'Unknown')
+                    cache_key = speclint.cache_key(content, check_type, title)
+                    cached = speclint.cached_result(cache_key, datetime.now()) if cache_key else None
+                    if cached is not None:
+                        self.last_batch['cache_hits'] += 1
+                        yield index, self._attach(cached, index, doc)
+                        continue
+                    task_id = next(self._task_ids)
+                    future = self._submit(loop, (index, content, check_type, title, self.config.timeout, task_id))
+                    # 마감 시각은 워커가 검사를 시작했다고 알린 뒤 정한다
+                    running[future] = (index, cache_key, float('inf'))
+                    if self.config.timeout:
+                        unstarted[task_id] = future
+                if not running:
+                    continue
+
+                if unstarted:
+                    self._apply_started(loop, running, unstarted)
+                active_deadlines = [deadline for future, (_, _, deadline) in running.items() if future not in expired]
+                wait_for = min(active_deadlines) - loop.time() if active_deadlines else None
+                if wait_for is not None and wait_for == float('inf'):
+                    wait_for = None
+                if unstarted:
+                    wait_for = min(wait_for, START_POLL_INTERVAL) if wait_for is not None else START_POLL_INTERVAL
+                done, _ = await asyncio.wait(
+                    list(running), timeout=max(wait_for, 0) if wait_for is not None else None,
+                    return_when=asyncio.FIRST_COMPLETED
+                )
+
+                if unstarted and done:
+                    unstarted = {task_id: future for task_id, future in unstarted.items() if future not in done}
+                for future in done:
+                    index, cache_key, _ = running.pop(future)
+                    if future in expired:
+                        expired.discard(future)
+                        continue
+                    yield index, self._collect(future, index, documents[index], cache_key)
+
+                now = loop.time()
+                for future, (index, _, deadline) in running.items():
+                    if future not in expired and deadline <= now:
+                        expired.add(future)
+                        yield index, self._timeout_result(index, documents[index])
+        finally:
+            for future in running:
+                future.cancel()
+
+    def _apply_started(self, loop: asyncio.AbstractEventLoop, running: Dict[asyncio.Future, Tuple[int, Optional[str], float]],
+                       unstarted: Dict[int, asyncio.Future]) -> None:
+        """워커의 시작 보고를 읽어 시작한 작업의 마감 시각을 시작 시각 + 제한 시간으로 정한다"""
+        while True:
+            try:
+                task_id, started_at = self._started.get_nowait()
+            except queue.Empty:
+                return
+            future = unstarted.pop(task_id, None)
+            if future in running:
+                index, cache_key, _ = running[future]
+                running[future] = (index, cache_key, loop.time() + started_at + self.config.timeout - time.monotonic())
+
+    def _submit(self, loop: asyncio.AbstractEventLoop, task: LintTask) -> asyncio.Future:
+        pool = self._get_pool()
+        if self.config.mode == "process":
+            return loop.run_in_executor(pool, _lint_in_worker, task)
+        return loop.run_in_executor(pool, self._lint_in_thread, task)
+
+    def _lint_in_thread(self, task: LintTask) -> Tuple[int, Optional[Dict[str, Any]], int, float]:
+        """워커 스레드에서 문서 하나를 검사 (스레드마다 캐시 없는 SpecLint와 이벤트 루프를 만들어 재사용)"""
+        index, content, check_type, document_title, _, task_id = task
+        self._started.put((task_id, time.monotonic()))
+        local = self._local
+        if not hasattr(local, "speclint"):
+            local.speclint = type(self.speclint)(self.speclint.engine)
+            local.loop = asyncio.new_event_loop()
+        started = time.perf_counter()
+        result = local.loop.run_until_complete(local.speclint.lint(content, check_type, document_title))
+        return index, result, threading.get_ident(), time.perf_counter() - started
+
+    def _collect(self, future: asyncio.Future, index: int, doc: Dict[str, Any], cache_key: Optional[str]) -> Dict[str, Any]:
+        """워커 결과를 문서 결과로 변환 (성공한 검사는 캐시에 저장)"""
+        try:
+            _, result, worker, elapsed = future.result()
+        except Exception as e:
+            if isinstance(e, BrokenProcessPool):
+                self._pool = None
+            self.logger.error(f"문서 {doc.get('id', f'doc_{index + 1}')} 처리 실패: {str(e) or type(e).__name__}")
+            self.last_batch['failed'] += 1
+            return self._error_result(index, doc, str(e) or type(e).__name__)
+        if result is None:
+            return self._timeout_result(index, doc)
+
+        worker_stats = self.last_batch['per_worker'].setdefault(str(worker), {'documents': 0, 'busy_seconds': 0.0})
+        worker_stats['documents'] += 1
+        worker_stats['busy_seconds'] = round(worker_stats['busy_seconds'] + elapsed, 4)
+        if cache_key and "structure_analysis" in result.get("metadata", {}):
+            result["metadata"]["cache_hit"] = False
+            self.speclint.cache.put(cache_key, result)
+        return self._attach(result, index, doc)
+
+    async def _lint_here(self, index: int, doc: Dict[str, Any], check_type: str) -> Dict[str, Any]:
+        """현재 이벤트 루프에서 문서 하나를 검사"""
+        try:
+            result = await self.speclint.lint(doc.get('content', ''), check_type, doc.get('title', 'Unknown'))
+            return self._attach(result, index, doc)
+        except Exception as e:
+            self.logger.error(f"문서 {doc.get('id', f'doc_{index + 1}')} 처리 실패: {str(e)}")
+            self.last_batch['failed'] += 1
+            return self._error_result(index, doc, str(e))
+
+    def _timeout_result(self, index: int, doc: Dict[str, Any]) -> Dict[str, Any]:
+        self.timeouts += 1
+        self.last_batch['timeouts'] += 1
+        message = f"검사 제한 시간({self.config.timeout}초)을 초과했습니다."
+        self.logger.warning(f"문서 {doc.get('id', f'doc_{index + 1}')} {message}")
+        result = self._error_result(index, doc, message)
+        result['metadata']['timeout'] = True
+        return result
+
+    @staticmethod
+    def _attach(result: Dict[str, Any], index: int, doc: Dict[str, Any]) -> Dict[str, Any]:
+        result['document_id'] = doc.get('id', f'doc_{index + 1}')
+        result['title'] = doc.get('title', 'Unknown')
+        return result
+
+    @staticmethod
+    def _error_result(index: int, doc: Dict[str, Any], message: str) -> Dict[str, Any]:
+        return {
+            'document_id': doc.get('id', f'doc_{index + 1}'),
+            'title': doc.get('title', 'Unknown'),
+            'score': 0,
+            'violations': [{'type': 'processing_error', 'message': message}],
+            'suggestions': ['문서를 확인하고 다시 시도하세요.'],
+            'metadata': {'error': message}
+        }
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """누적 배치 지표와 마지막 배치의 워커별 시간"""
+        return {
+            'workers': self.config.workers,
+            'mode': self.config.mode,
+            'batches': self.batches,
+            'documents_linted': self.documents_linted,
+            'timeouts': self.timeouts,
+            'last_batch': self.last_batch
+        }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """풀 종료"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=wait, cancel_futures=True)
+            self._pool = None
+            self._started = None
+
+    def _get_pool(self) -> Executor:
+        if self._pool is None:
+            if self.config.mode == "process":
+                context = worker_context(self.config.start_method)
+                self._started = context.Queue()
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.config.workers,
+                    mp_context=context,
+                    initializer=_init_worker,
+                    initargs=(self.speclint.engine.rule_set, self._started)
+                )
+            else:
+                self._started = queue.SimpleQueue()
+                self._pool = ThreadPoolExecutor(max_workers=self.config.workers, thread_name_prefix="speclint-batch")
+        return self._pool
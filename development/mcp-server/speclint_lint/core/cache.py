@@ -0,0 +1,208 @@
+"""
+SpecLint 검사 결과 캐시
+
+문서 내용, 검사 유형, 문서 제목, 규칙 세트 버전의 해시를 키로
+검사 결과를 메모리(LRU)와 선택적으로 디스크에 저장하는 모듈입니다.
+
+에이전트가 같은 Markdown을 반복 검사하거나 Confluence 파이프라인이 변경 없는
+문서를 다시 검사할 때, 분석 → 검사 → 점수 → 제안 단계를 다시 거치지 않고
+해시 한 번과 JSON 디코딩 한 번으로 이전 결과를 돌려줍니다.
+"""
+import os
+import json
+import hashlib
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+
+# 결과 구조(점수/제안 계산 방식)가 바뀌면 올려서 이전 항목을 무효화
+LINT_CACHE_FORMAT_VERSION = 1
+CACHE_FILE_SUFFIX = ".json"
+
+
+@dataclass
+class LintCacheConfig:
+    """검사 결과 캐시 설정"""
+    enabled: bool = True
+    max_entries: int = 512                  # 메모리에 두는 결과 수 (초과 시 가장 오래 사용하지 않은 항목부터 제거)
+    directory: Optional[str] = None         # 디스크 캐시 디렉토리 (None이면 메모리만 사용)
+    max_bytes: int = 64 * 1024 * 1024       # 디스크 캐시 파일 총 크기 상한
+
+    @classmethod
+    def from_env(cls) -> "LintCacheConfig":
+        """환경변수(SPECLINT_CACHE*)에서 설정을 읽는다. 미설정 항목은 기본값 사용"""
+        defaults = cls()
+        return cls(
+            enabled=os.getenv("SPECLINT_CACHE", "1").lower() not in ("0", "false", "no", "off"),
+            max_entries=int(os.getenv("SPECLINT_CACHE_SIZE", defaults.max_entries)),
+            directory=os.getenv("SPECLINT_CACHE_DIR") or defaults.directory,
+            max_bytes=int(float(os.getenv("SPECLINT_CACHE_MAX_MB", defaults.max_bytes / (1024 * 1024))) * 1024 * 1024)
+        )
+
+
+class LintResultCache:
+    """콘텐츠 주소 기반 검사 결과 캐시
+
+    결과는 JSON 문자열로 저장하고 조회할 때마다 새로 디코딩하므로, 호출자가 반환된
+    결과(metadata 등)를 수정해도 캐시된 항목은 바뀌지 않는다.
+    메모리에 없는 키는 디스크(directory/<키 앞 2자리>/<키>.json)에서 찾아 메모리로 올린다.
+    디스크 항목의 사용 순서는 파일 수정 시각으로 정하며, 처음 저장할 때 디렉토리를 한 번 훑는다.
+    """
+
+    def __init__(self, config: Optional[LintCacheConfig] = None):
+        self.config = config or LintCacheConfig()
+        self.logger = logging.getLogger("specgate.speclint.cache")
+        # 키 → JSON 문자열 (앞쪽일수록 오래 사용하지 않은 항목)
+        self._memory: "OrderedDict[str, str]" = OrderedDict()
+        # 디스크 키 → 파일 크기 (처음 저장할 때 로드)
+        self._disk_entries: Optional["OrderedDict[str, int]"] = None
+        self._disk_bytes = 0
+
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+        self.disk_evictions = 0
+
+    @staticmethod
+    def make_key(content: str, check_type: str, document_title: Optional[str], rules_version: str) -> str:
+        """문서 내용, 검사 유형, 문서 제목, 규칙 세트 버전으로 캐시 키(sha256) 계산"""
+        digest = hashlib.sha256()
+        digest.update(json.dumps(
+            [LINT_CACHE_FORMAT_VERSION, rules_version, check_type, document_title], ensure_ascii=False
+        ).encode("utf-8"))
+        digest.update(b"\0")
+        digest.update((content or "").encode("utf-8"))
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """캐시된 검사 결과 조회 (없으면 None)"""
+        payload = self._memory.get(key)
+        if payload is not None:
+            self._memory.move_to_end(key)
+            self.hits += 1
+            return json.loads(payload)
+
+        if self.config.directory:
+            payload = self._read_disk(key)
+            if payload is not None:
+                self._remember(key, payload)
+                self.hits += 1
+                self.disk_hits += 1
+                return json.loads(payload)
+
+        self.misses += 1
+        return None
+
+    def put(self, key: str, result: Dict[str, Any]) -> None:
+        """검사 결과 저장 (메모리, 설정되어 있으면 디스크)"""
+        try:
+            payload = json.dumps(result, ensure_ascii=False)
+        except (TypeError, ValueError) as e:
+            self.logger.warning(f"검사 결과를 직렬화할 수 없어 캐시하지 않습니다: {e}")
+            return
+        self._remember(key, payload)
+        self.stores += 1
+        if self.config.directory:
+            self._write_disk(key, payload)
+
+    def clear(self) -> None:
+        """메모리 캐시 비우기 (디스크 항목은 유지)"""
+        self._memory.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """적중/실패/제거 카운터와 캐시 크기"""
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'disk_hits': self.disk_hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / lookups, 4) if lookups else None,
+            'stores': self.stores,
+            'evictions': self.evictions,
+            'disk_evictions': self.disk_evictions,
+            'entries': len(self._memory),
+            'max_entries': self.config.max_entries,
+            'directory': self.config.directory,
+            'disk_entries': len(self._disk_entries) if self._disk_entries is not None else None,
+            'disk_bytes': self._disk_bytes if self._disk_entries is not None else None
+        }
+
+    def _remember(self, key: str, payload: str) -> None:
+        self._memory[key] = payload
+        self._memory.move_to_end(key)
+        while len(self._memory) > max(self.config.max_entries, 0):
+            self._memory.popitem(last=False)
+            self.evictions += 1
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.config.directory, key[:2], f"{key}{CACHE_FILE_SUFFIX}")
+
+    def _read_disk(self, key: str) -> Optional[str]:
+        path = self._path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                payload = f.read()
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            self.logger.warning(f"검사 결과 캐시 항목 읽기 실패, 무시합니다: {path} ({e})")
+            return None
+        if self._disk_entries is not None and key in self._disk_entries:
+            self._disk_entries.move_to_end(key)
+        return payload
+
+    def _write_disk(self, key: str, payload: str) -> None:
+        path = self._path(key)
+        data = payload.encode("utf-8")
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # 동시에 읽는 쪽이 쓰다 만 파일을 보지 않도록 임시 파일에 쓴 뒤 교체
+            temp_path = f"{path}.{os.getpid()}.tmp"
+            with open(temp_path, 'wb') as f:
+                f.write(data)
+            os.replace(temp_path, path)
+        except OSError as e:
+            self.logger.warning(f"검사 결과 캐시 저장 실패: {path} ({e})")
+            return
+
+        entries = self._load_disk_entries()
+        self._disk_bytes += len(data) - entries.pop(key, 0)
+        entries[key] = len(data)
+        while entries and self._disk_bytes > self.config.max_bytes:
+            old_key, size = entries.popitem(last=False)
+            self._disk_bytes -= size
+            try:
+                os.remove(self._path(old_key))
+            except OSError:
+                pass
+            self.disk_evictions += 1
+
+    def _load_disk_entries(self) -> "OrderedDict[str, int]":
+        """디스크 캐시 디렉토리를 한 번 훑어 사용 순서 목록을 만든다"""
+        if self._disk_entries is not None:
+            return self._disk_entries
+
+        found = []
+        directory = self.config.directory
+        if os.path.isdir(directory):
+            for shard in os.scandir(directory):
+                if not shard.is_dir():
+                    continue
+                for item in os.scandir(shard.path):
+                    if not item.name.endswith(CACHE_FILE_SUFFIX):
+                        continue
+                    try:
+                        stat = item.stat()
+                    except OSError:
+                        continue
+                    found.append((stat.st_mtime, item.name[:-len(CACHE_FILE_SUFFIX)], stat.st_size))
+
+        found.sort()
+        self._disk_entries = OrderedDict((key, size) for _, key, size in found)
+        self._disk_bytes = sum(self._disk_entries.values())
+        return self._disk_entries
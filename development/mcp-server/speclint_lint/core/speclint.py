@@ -18,6 +18,9 @@ from speclint_lint.analyzers import DocumentStructureAnalyzer
 from speclint_lint.validators import TemplateValidator
 from speclint_lint.scorers import QualityScorer
 from speclint_lint.suggestors import ImprovementSuggester
+from speclint_lint.engine import RuleEngine
+from .cache import LintResultCache
+from .batch import BatchLinter, BatchLintConfig, BatchLintRun
 
 
 class SpecLint:
@@ -27,12 +30,22 @@ class SpecLint:
     통합 워크플로우를 제공합니다.
     """
     
-    def __init__(self):
-        """SpecLint 인스턴스 초기화"""
-        self.analyzer = DocumentStructureAnalyzer()
-        self.validator = TemplateValidator()
+    def __init__(self, engine: Optional[RuleEngine] = None, cache: Optional[LintResultCache] = None,
+                 batch_config: Optional[BatchLintConfig] = None):
+        """SpecLint 인스턴스 초기화
+        
+        Args:
+            engine: 검사 규칙 엔진 (없으면 기본 규칙 파일로 만든 공유 엔진)
+            cache: 검사 결과 캐시 (없으면 매번 검사)
+            batch_config: 배치 검사 설정 (없으면 워커 1개, 문서를 차례로 검사)
+        """
+        self.engine = engine or RuleEngine.default()
+        self.cache = cache
+        self.batch_linter = BatchLinter(self, batch_config)
+        self.analyzer = DocumentStructureAnalyzer(self.engine)
+        self.validator = TemplateValidator(self.engine)
         self.scorer = QualityScorer()
-        self.suggester = ImprovementSuggester()
+        self.suggester = ImprovementSuggester(self.engine.suggestions)
         self.logger = logging.getLogger("specgate.speclint")
         
         self.logger.info("SpecLint 인스턴스 초기화 완료")
@@ -65,13 +78,22 @@ class SpecLint:
                 self.logger.warning("빈 문서 검사 요청")
                 return self.scorer.create_error_result("문서 파싱에 실패했습니다.", check_type)
             
+            # 같은 내용/검사 유형/제목/규칙 세트로 검사한 결과가 있으면 재사용
+            cache_key = self.cache_key(content, check_type, document_title)
+            cached = self.cached_result(cache_key, start_time) if cache_key else None
+            if cached is not None:
+                return cached
+            
+            # 문서를 한 번 훑어 섹션 인덱스 생성 (분석기와 검사기가 공유, 규칙 평가도 한 번)
+            index = self.engine.build_index(content)
+            
             # 1단계: 문서 구조 분석
             self.logger.info("1단계: 문서 구조 분석 중...")
-            structure_analysis = await self.analyzer.analyze(content, document_title)
+            structure_analysis = await self.analyzer.analyze(content, document_title, index)
             
             # 2단계: 템플릿 준수 검사
             self.logger.info("2단계: 템플릿 준수 검사 중...")
-            template_violations = await self.validator.validate(content, check_type)
+            template_violations = await self.validator.validate(content, check_type, index)
             
             # 3단계: 품질 점수 계산
             self.logger.info("3단계: 품질 점수 계산 중...")
@@ -99,10 +121,14 @@ class SpecLint:
                     "quality_level": quality_level,
                     "processing_result": processing_result,
                     "processing_time_seconds": processing_time,
-                    "structure_analysis": structure_analysis
+                    "structure_analysis": structure_analysis,
+                    "cache_hit": False if cache_key else None
                 }
             }
             
+            if cache_key:
+                self.cache.put(cache_key, result)
+            
             self.logger.info(f"품질 검사 완료 - 점수: {quality_score}/100, 등급: {quality_level}, 처리시간: {processing_time:.2f}초")
             return result
             
@@ -111,22 +137,44 @@ class SpecLint:
             self.logger.error(f"품질 검사 실패: {str(e)} (처리시간: {processing_time:.2f}초)")
             return self.scorer.create_error_result(f"품질 검사 중 오류 발생: {str(e)}", check_type)
     
+    def cache_key(self, content: str, check_type: str, document_title: Optional[str]) -> Optional[str]:
+        """검사 결과 캐시 키 (캐시를 사용하지 않으면 None)"""
+        if self.cache is None:
+            return None
+        return self.cache.make_key(content, check_type, document_title, self.engine.version)
+    
+    def cached_result(self, cache_key: str, start_time: datetime) -> Optional[Dict[str, Any]]:
+        """캐시된 검사 결과 (metadata에 cache_hit, 조회 시각, 처리 시간 기록, 없으면 None)"""
+        cached = self.cache.get(cache_key)
+        if cached is None:
+            return None
+        cached["metadata"].update({
+            "cache_hit": True,
+            "timestamp": datetime.now().isoformat(),
+            "processing_time_seconds": (datetime.now() - start_time).total_seconds()
+        })
+        self.logger.info(f"품질 검사 캐시 적중 - 점수: {cached['score']}/100")
+        return cached
+    
+    def get_cache_stats(self) -> Optional[Dict[str, Any]]:
+        """검사 결과 캐시의 적중/실패/제거 카운터 (캐시를 사용하지 않으면 None)"""
+        return self.cache.get_stats() if self.cache is not None else None
+    
     async def batch_lint(self, documents: List[Dict[str, Any]], check_type: str = "full") -> Dict[str, Any]:
         """배치 문서 품질 검사
         
+        batch_config.workers가 2 이상이면 스레드/프로세스 풀에서 문서를 동시에 검사한다.
+        
         Args:
             documents: 검사할 문서 목록 (각 문서는 'content', 'id', 'title' 키 포함)
             check_type: 검사 유형 ("full", "basic", "structure")
             
         Returns:
             Dict[str, Any]: 배치 검사 결과
-                - results: 각 문서별 검사 결과
+                - results: 각 문서별 검사 결과 (입력 순서)
                 - summary: 전체 요약 통계
                 - metadata: 메타데이터
         """
-        start_time = datetime.now()
-        self.logger.info(f"배치 문서 품질 검사 시작 - 문서 수: {len(documents)}")
-        
         if not documents:
             self.logger.warning("빈 문서 목록으로 배치 검사 요청")
             return {
@@ -144,59 +192,38 @@ class SpecLint:
                 }
             }
         
-        results = []
-        total_score = 0
-        successful_count = 0
-        failed_count = 0
+        run = self.batch_lint_stream(documents, check_type)
+        async for _ in run:
+            pass
         
-        for i, doc in enumerate(documents, 1):
-            try:
-                content = doc.get('content', '')
-                doc_id = doc.get('id', f'doc_{i}')
-                doc_title = doc.get('title', 'Unknown')
-                
-                self.logger.info(f"문서 {i}/{len(documents)} 처리 중: {doc_title}")
-                
-                result = await self.lint(content, check_type, doc_title)
-                result['document_id'] = doc_id
-                result['title'] = doc_title
-                
-                results.append(result)
-                total_score += result['score']
-                
-                if result['score'] > 0:
-                    successful_count += 1
-                else:
-                    failed_count += 1
-                    
-            except Exception as e:
-                self.logger.error(f"문서 {doc.get('id', f'doc_{i}')} 처리 실패: {str(e)}")
-                failed_count += 1
-                results.append({
-                    'document_id': doc.get('id', f'doc_{i}'),
-                    'title': doc.get('title', 'Unknown'),
-                    'score': 0,
-                    'violations': [{'type': 'processing_error', 'message': str(e)}],
-                    'suggestions': ['문서를 확인하고 다시 시도하세요.'],
-                    'metadata': {'error': str(e)}
-                })
-        
-        processing_time = (datetime.now() - start_time).total_seconds()
-        average_score = total_score / len(documents) if documents else 0
-        
-        self.logger.info(f"배치 검사 완료 - 성공: {successful_count}, 실패: {failed_count}, 평균점수: {average_score:.1f}, 처리시간: {processing_time:.2f}초")
+        summary = run.summary
+        metadata = run.metadata
+        self.logger.info(
+            f"배치 검사 완료 - 성공: {summary['successful_count']}, 실패: {summary['failed_count']}, "
+            f"평균점수: {summary['average_score']:.1f}, 처리시간: {metadata['processing_time_seconds']:.2f}초"
+        )
         
         return {
-            'results': results,
-            'summary': {
-                'total_documents': len(documents),
-                'successful_count': successful_count,
-                'failed_count': failed_count,
-                'average_score': average_score
-            },
-            'metadata': {
-                'check_type': check_type,
-                'timestamp': datetime.now().isoformat(),
-                'processing_time_seconds': processing_time
-            }
+            'results': run.results,
+            'summary': summary,
+            'metadata': metadata
         }
+    
+    def batch_lint_stream(self, documents: List[Dict[str, Any]], check_type: str = "full") -> BatchLintRun:
+        """배치 문서 품질 검사 결과를 끝나는 순서대로 내는 비동기 반복자
+        
+        사용 예시:
+            run = speclint.batch_lint_stream(documents)
+            async for result in run:
+                print(result['document_id'], result['score'])
+            print(run.summary)
+        
+        Args:
+            documents: 검사할 문서 목록 (각 문서는 'content', 'id', 'title' 키 포함)
+            check_type: 검사 유형 ("full", "basic", "structure")
+            
+        Returns:
+            BatchLintRun: 문서별 결과 반복자 (summary, metadata, 입력 순서의 results 제공)
+        """
+        self.logger.info(f"배치 문서 품질 검사 시작 - 문서 수: {len(documents)}")
+        return BatchLintRun(self.batch_linter, documents, check_type)
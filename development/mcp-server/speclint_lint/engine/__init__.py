@@ -0,0 +1,8 @@
+"""
+SpecLint 규칙 엔진 모듈
+
+설정 파일에 선언된 검사 규칙을 읽어 컴파일하고 문서 인덱스를 평가합니다.
+"""
+from .rule_engine import RuleEngine, RuleSet, RuleCheck, CheckOutcome, load_rule_set
+
+__all__ = ['RuleEngine', 'RuleSet', 'RuleCheck', 'CheckOutcome', 'load_rule_set']
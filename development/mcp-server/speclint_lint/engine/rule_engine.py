@@ -0,0 +1,495 @@
+"""
+SpecLint 선언형 규칙 엔진
+
+규칙 설정 파일(development/rules/speclint-rules.yaml의 checks)을 읽어 검사마다
+범위(scope), 패턴, 가중치, 위반 유형, 개선 제안을 한 번만 선언하고,
+시작할 때 범위별로 하나의 결합 정규식으로 컴파일하는 모듈입니다.
+
+- heading: 인덱스의 헤딩 줄 범위에서만 패턴 검색 (앞선 패턴 우선, 처음 일치하면 멈춤)
+- section/document: 검사마다 이름 있는 그룹을 둔 선택(|) 패턴으로 본문을 한 번 훑음
+- code_block/rule_line/list_item: 문서 인덱스(MarkdownIndex)에 기록된 항목 수로 판정
+
+따라서 본문을 훑는 비용은 규칙 수 × 문서 크기가 아니라 범위별로 한 번의 스캔에 비례합니다.
+heading/section/list_item 검사 결과는 '## N.' 섹션의 내용 해시별로 저장해 두므로,
+이미 검사한 문서의 새 버전은 내용이 바뀐 섹션만 다시 검사하고 나머지는 저장된 결과와 합칩니다.
+"""
+import os
+import re
+import json
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Pattern, Tuple
+
+import yaml
+
+from speclint_lint.utils.markdown_index import MarkdownIndex, Section, compile_scan_pattern
+
+
+# 기본 규칙 파일 (development/rules/speclint-rules.yaml)
+DEFAULT_RULES_PATH = Path(__file__).resolve().parents[3] / "rules" / "speclint-rules.yaml"
+
+SCOPES = ("heading", "section", "list_item", "document", "code_block", "rule_line")
+# 검사 유형별로 누적 적용하는 단계
+STAGES = ("basic", "structure", "full")
+CHECK_TYPE_STAGES = {
+    "basic": ("basic",),
+    "structure": ("basic", "structure"),
+    "full": ("basic", "structure", "full"),
+}
+FLAG_NAMES = {"ignorecase": "i", "multiline": "m", "dotall": "s"}
+# 엔진이 내용 해시별로 기억하는 섹션 결과 수
+DEFAULT_SECTION_CACHE_SIZE = 4096
+
+
+@dataclass(frozen=True)
+class RuleCheck:
+    """설정 파일에 선언된 검사 하나"""
+    id: str
+    scope: str
+    patterns: Tuple[str, ...] = ()
+    flags: str = ""                   # 인라인 플래그 문자 (예: "im")
+    level: Optional[int] = None       # heading: 이 레벨의 헤딩만 검사
+    section: Optional[str] = None     # section/list_item: 범위를 정하는 heading 검사 ID
+    weight: int = 0                   # 통과 시 구조 점수 (rule_line은 일치 1개당)
+    max_weight: Optional[int] = None  # rule_line 구조 점수 상한
+    min_count: int = 1                # 통과에 필요한 일치/항목 수 (list_item 기본값은 0)
+    min_length: Optional[int] = None  # list_item: 줄별 최소 내용 길이
+    forbidden: bool = False           # 일치가 없어야 통과
+    stages: Tuple[str, ...] = ()
+    violation: Optional[str] = None
+    penalty: int = 0
+    message: str = ""
+    description: str = ""
+    suggestion: Optional[str] = None
+
+    def compile(self, index: int = 0) -> Pattern:
+        """패턴 하나를 선언된 플래그로 컴파일"""
+        return re.compile(self.scoped(index))
+
+    def scoped(self, index: int = 0) -> str:
+        """다른 패턴과 결합할 수 있도록 플래그를 그룹 안에 한정한 패턴 문자열"""
+        pattern = self.patterns[index]
+        return f"(?{self.flags}:{pattern})" if self.flags else f"(?:{pattern})"
+
+
+@dataclass
+class CheckOutcome:
+    """문서 하나에 대한 검사 결과 (검사 유형과 무관한 사실)"""
+    check: RuleCheck
+    applicable: bool = True           # section/list_item: 범위 섹션이 없으면 False
+    count: int = 0                    # 일치/항목 수
+    match: Optional[str] = None       # 처음 일치한 문자열
+    position: Optional[int] = None    # 처음 일치한 위치
+    pattern_index: Optional[int] = None
+    failed_items: List[int] = field(default_factory=list)   # list_item: min_length 미달 목록 순번 (1부터)
+
+    @property
+    def passed(self) -> bool:
+        check = self.check
+        if not self.applicable:
+            return True
+        if check.forbidden:
+            return self.count == 0
+        return self.count >= check.min_count and not self.failed_items
+
+    @property
+    def score(self) -> int:
+        """구조 점수 기여분"""
+        check = self.check
+        if check.scope == "rule_line":
+            earned = self.count * check.weight
+            return min(earned, check.max_weight) if check.max_weight is not None else earned
+        return check.weight if self.applicable and self.passed else 0
+
+
+@dataclass(frozen=True)
+class RuleSet:
+    """설정 파일에서 읽은 검사 목록"""
+    checks: Tuple[RuleCheck, ...]
+    version: str                      # 검사 선언의 해시 (결과 캐시 키 등에 사용)
+    source: Optional[str] = None
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], source: Optional[str] = None) -> "RuleSet":
+        """설정 딕셔너리의 checks 섹션으로 규칙 세트 생성 (잘못된 선언은 ValueError)"""
+        declared = (data or {}).get("checks")
+        if not isinstance(declared, dict) or not declared:
+            raise ValueError(f"규칙 설정에 checks 섹션이 없습니다: {source}")
+
+        checks = []
+        for check_id, spec in declared.items():
+            checks.append(cls._parse_check(check_id, spec or {}))
+
+        scopes = {check.id: check.scope for check in checks}
+        for check in checks:
+            if check.section is not None and check.section not in scopes:
+                raise ValueError(f"검사 '{check.id}'의 section '{check.section}'이(가) 선언되지 않았습니다")
+            if check.section is not None and scopes[check.section] != "heading":
+                raise ValueError(f"검사 '{check.id}'의 section '{check.section}'은(는) heading 검사가 아닙니다")
+        if sum(1 for check in checks if check.scope == "rule_line") > 1:
+            raise ValueError("rule_line 검사는 하나만 선언할 수 있습니다")
+
+        canonical = json.dumps(declared, ensure_ascii=False, sort_keys=True, default=str)
+        version = hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:16]
+        return cls(tuple(checks), version, source)
+
+    @staticmethod
+    def _parse_check(check_id: str, spec: Dict[str, Any]) -> RuleCheck:
+        scope = spec.get("scope")
+        if scope not in SCOPES:
+            raise ValueError(f"검사 '{check_id}'의 scope가 잘못되었습니다: {scope} (허용: {', '.join(SCOPES)})")
+
+        patterns = spec.get("patterns")
+        if patterns is None and spec.get("pattern") is not None:
+            patterns = [spec["pattern"]]
+        patterns = tuple(patterns or ())
+        if scope in ("heading", "section", "document", "rule_line") and not patterns:
+            raise ValueError(f"검사 '{check_id}'에 patterns가 없습니다")
+        if scope in ("section", "list_item") and not spec.get("section"):
+            raise ValueError(f"검사 '{check_id}'에 section이 없습니다")
+
+        flags = ""
+        for name in spec.get("flags") or ():
+            if name not in FLAG_NAMES:
+                raise ValueError(f"검사 '{check_id}'의 flags가 잘못되었습니다: {name}")
+            flags += FLAG_NAMES[name]
+
+        stages = tuple(spec.get("stages") or ())
+        unknown = [stage for stage in stages if stage not in STAGES]
+        if unknown:
+            raise ValueError(f"검사 '{check_id}'의 stages가 잘못되었습니다: {unknown}")
+
+        check = RuleCheck(
+            id=check_id,
+            scope=scope,
+            patterns=patterns,
+            flags=flags,
+            level=spec.get("level"),
+            section=spec.get("section"),
+            weight=int(spec.get("weight", 0)),
+            max_weight=spec.get("max_weight"),
+            min_count=int(spec.get("min_count", 0 if scope == "list_item" else 1)),
+            min_length=spec.get("min_length"),
+            forbidden=bool(spec.get("forbidden", False)),
+            stages=stages,
+            violation=spec.get("violation"),
+            penalty=int(spec.get("penalty", 0)),
+            message=spec.get("message") or f"'{check_id}' 검사를 통과하지 못했습니다.",
+            description=spec.get("description", ""),
+            suggestion=spec.get("suggestion")
+        )
+        for index in range(len(patterns)):
+            try:
+                check.compile(index)
+            except re.error as e:
+                raise ValueError(f"검사 '{check_id}'의 패턴을 컴파일할 수 없습니다: {patterns[index]} ({e})")
+        return check
+
+
+class SectionChecks:
+    """섹션 하나의 검사 결과 (같은 내용의 섹션이면 문서/버전과 무관하게 재사용)
+
+    위치는 모두 상대 위치이며 필요한 항목만 처음 조회할 때 계산한다.
+    headings: (검사 ID, 패턴 순번) → 섹션에서 처음 일치한 헤딩의 (섹션 시작 기준 위치, 일치 문자열)
+    spans: (기준 heading 검사 ID, 범위 시작의 섹션 기준 위치) → 그 범위에 걸린 검사별
+           [일치 수, 첫 일치 문자열, 범위 시작 기준 위치, 패턴 순번, min_length 미달 순번]
+    """
+    __slots__ = ("digest", "headings", "spans")
+
+    def __init__(self, digest: str):
+        self.digest = digest
+        self.headings: Dict[Tuple[str, int], Optional[Tuple[int, str]]] = {}
+        self.spans: Dict[Tuple[str, int], Dict[str, list]] = {}
+
+
+def load_rule_set(path: Optional[str] = None) -> RuleSet:
+    """규칙 설정 파일을 읽어 규칙 세트 생성 (경로 미지정 시 SPECLINT_RULES_FILE, 없으면 기본 파일)"""
+    path = path or os.getenv("SPECLINT_RULES_FILE") or str(DEFAULT_RULES_PATH)
+    with open(path, "r", encoding="utf-8") as f:
+        data = yaml.safe_load(f)
+    return RuleSet.from_dict(data, source=path)
+
+
+class RuleEngine:
+    """컴파일된 규칙 세트로 문서 인덱스를 평가하는 엔진
+
+    evaluate()는 검사 유형과 무관한 검사별 결과를 계산해 인덱스에 메모하므로
+    분석기와 검사기가 같은 인덱스로 호출해도 문서는 한 번만 평가된다.
+    structure_score()와 violations()는 그 결과에서 점수와 위반 목록을 만든다.
+    """
+
+    _default: Dict[str, "RuleEngine"] = {}
+
+    def __init__(self, rule_set: RuleSet, section_cache_size: int = DEFAULT_SECTION_CACHE_SIZE):
+        self.rule_set = rule_set
+        self.logger = logging.getLogger("specgate.speclint.engine")
+        self.checks: Dict[str, RuleCheck] = {check.id: check for check in rule_set.checks}
+        self._compile()
+
+        # 섹션 내용 해시 → 검사 결과 (앞쪽일수록 오래 사용하지 않은 항목)
+        self.section_cache_size = section_cache_size
+        self._sections: "OrderedDict[str, SectionChecks]" = OrderedDict()
+        self._sections_lock = threading.Lock()
+        self.section_stats = {"evaluated": 0, "reused": 0, "evictions": 0}
+        self.logger.info(f"SpecLint 규칙 엔진 준비 완료 - 검사 {len(self.checks)}개, 버전 {self.version} ({rule_set.source})")
+
+    @classmethod
+    def default(cls) -> "RuleEngine":
+        """기본 규칙 파일로 만든 엔진 (경로별로 한 번만 읽고 컴파일)"""
+        path = os.getenv("SPECLINT_RULES_FILE") or str(DEFAULT_RULES_PATH)
+        if path not in cls._default:
+            cls._default[path] = cls(load_rule_set(path))
+        return cls._default[path]
+
+    @property
+    def version(self) -> str:
+        return self.rule_set.version
+
+    @property
+    def suggestions(self) -> Dict[str, str]:
+        """위반 유형별 개선 제안"""
+        return {
+            check.violation: check.suggestion.strip()
+            for check in self.rule_set.checks
+            if check.violation and check.suggestion
+        }
+
+    def build_index(self, content: str) -> MarkdownIndex:
+        """규칙 줄 패턴을 반영한 문서 인덱스 생성"""
+        return MarkdownIndex.build(content, self.scan_pattern)
+
+    def match_heading_text(self, check_id: str, text: str) -> Optional[Tuple[int, re.Match]]:
+        """heading 검사의 패턴을 임의의 헤딩 문자열에 적용 (Confluence 제목 검사용)"""
+        check = self.checks[check_id]
+        for pattern_index in range(len(check.patterns)):
+            match = self._patterns[check.id][pattern_index].search(text)
+            if match:
+                return pattern_index, match
+        return None
+
+    def evaluate(self, index: MarkdownIndex) -> Dict[str, CheckOutcome]:
+        """검사별 결과 계산 (같은 인덱스에 대해서는 메모한 결과 반환)
+
+        섹션별 결과는 내용 해시로 엔진에 저장되므로, 전에 본 섹션은 다시 검사하지 않는다.
+        """
+        key = f"rule_engine:{self.version}"
+        if key not in index.results:
+            index.results[key] = self._evaluate(index)
+        return index.results[key]
+
+    def structure_score(self, outcomes: Dict[str, CheckOutcome]) -> int:
+        """통과한 검사의 가중치 합 (최대 100)"""
+        return min(sum(outcome.score for outcome in outcomes.values()), 100)
+
+    def violations(self, outcomes: Dict[str, CheckOutcome], check_type: str) -> List[Dict[str, Any]]:
+        """검사 유형의 단계 순서대로, 단계 안에서는 선언 순서대로 위반 목록 생성"""
+        violations = []
+        for stage in CHECK_TYPE_STAGES.get(check_type, ()):
+            for check in self.rule_set.checks:
+                if stage not in check.stages or not check.violation:
+                    continue
+                outcome = outcomes[check.id]
+                if not outcome.applicable:
+                    continue
+                if outcome.failed_items:
+                    # list_item의 min_length 미달은 줄마다 기록
+                    if outcome.count < check.min_count:
+                        violations.append(self._violation(check, index=0))
+                    for item_number in outcome.failed_items:
+                        violations.append(self._violation(check, index=item_number))
+                elif not outcome.passed:
+                    violations.append(self._violation(check))
+        return violations
+
+    def _compile(self) -> None:
+        checks = self.rule_set.checks
+        self._patterns: Dict[str, List[Pattern]] = {
+            check.id: [check.compile(i) for i in range(len(check.patterns))] for check in checks
+        }
+
+        self._heading_checks = [check for check in checks if check.scope == "heading"]
+
+        # section/document: 이름 있는 그룹의 선택 패턴 - 범위를 한 번 훑어 검사별 일치 수를 센다
+        # (같은 위치에서 여러 검사가 일치하면 먼저 선언된 검사만 센다)
+        range_groups: Dict[Tuple[str, Optional[str]], Dict[str, Tuple[RuleCheck, int]]] = {}
+        for check in checks:
+            if check.scope not in ("section", "document"):
+                continue
+            groups = range_groups.setdefault((check.scope, check.section), {})
+            for i in range(len(check.patterns)):
+                groups[f"r{len(groups)}"] = (check, i)
+        self._range_matchers: Dict[Tuple[str, Optional[str]], Tuple[Pattern, Dict[str, Tuple[RuleCheck, int]]]] = {
+            key: (re.compile("|".join(f"(?P<{name}>{check.scoped(i)})" for name, (check, i) in groups.items())), groups)
+            for key, groups in range_groups.items()
+        }
+
+        # section/list_item 검사를 기준 heading 검사별로 묶는다
+        self._anchored: Dict[str, List[RuleCheck]] = {}
+        for check in checks:
+            if check.scope in ("section", "list_item"):
+                self._anchored.setdefault(check.section, []).append(check)
+
+        rule_checks = [check for check in checks if check.scope == "rule_line"]
+        # rule_line 검사가 없으면 규칙 분기는 어떤 글자와도 일치하지 않게 둔다
+        self.scan_pattern = compile_scan_pattern(rule_checks[0].patterns[0] if rule_checks else r'[^\s\S]')
+
+    def _evaluate(self, index: MarkdownIndex) -> Dict[str, CheckOutcome]:
+        outcomes = {check.id: CheckOutcome(check) for check in self.rule_set.checks}
+        content = index.content
+        sections = index.sections
+        section_checks = self._section_checks(sections)
+
+        for check in self._heading_checks:
+            found = self._first_heading(index, check, sections, section_checks)
+            if found:
+                outcome = outcomes[check.id]
+                outcome.count = 1
+                outcome.pattern_index, outcome.position, outcome.match = found
+
+        # section/list_item: 기준 헤딩이 있는 섹션의 결과에서 범위 결과를 찾는다
+        for anchor_id, checks in self._anchored.items():
+            span = self._section_span(index, outcomes[anchor_id])
+            if span is None:
+                for check in checks:
+                    outcomes[check.id].applicable = False
+                continue
+            start, end = span
+            section_number = index.section_number(start)
+            section = sections[section_number]
+            if end == section.end:
+                spans = section_checks[section_number].spans
+                key = (anchor_id, start - section.start)
+                if key not in spans:
+                    spans[key] = self._span_results(index, anchor_id, start, end)
+                results = spans[key]
+            else:
+                # 범위가 섹션 끝과 다르면(빈 일치 등) 저장하지 않고 계산
+                results = self._span_results(index, anchor_id, start, end)
+            for check_id, (count, match, position, pattern_index, failed_items) in results.items():
+                outcome = outcomes[check_id]
+                outcome.count = count
+                outcome.match = match
+                outcome.position = start + position if position is not None else None
+                outcome.pattern_index = pattern_index
+                outcome.failed_items = list(failed_items)
+
+        # document: 섹션 경계를 넘는 일치도 있으므로 문서 전체를 훑는다
+        document_matcher = self._range_matchers.get(("document", None))
+        if document_matcher is not None:
+            matcher, groups = document_matcher
+            for match in matcher.finditer(content):
+                check, pattern_index = groups[match.lastgroup]
+                outcome = outcomes[check.id]
+                if outcome.count == 0:
+                    outcome.match = match.group()
+                    outcome.position = match.start()
+                    outcome.pattern_index = pattern_index
+                outcome.count += 1
+
+        for check in self.rule_set.checks:
+            outcome = outcomes[check.id]
+            if check.scope == "code_block":
+                outcome.count = index.code_example_count
+            elif check.scope == "rule_line":
+                outcome.count = len(index.rule_lines)
+                if index.rule_lines:
+                    outcome.match = index.rule_lines[0].text
+                    outcome.position = index.rule_lines[0].start
+        return outcomes
+
+    def _section_checks(self, sections: List[Section]) -> List[SectionChecks]:
+        """섹션별 저장된 결과 (없으면 새로 만들어 저장)"""
+        found = []
+        with self._sections_lock:
+            for section in sections:
+                checks = self._sections.get(section.digest)
+                if checks is None:
+                    checks = self._sections[section.digest] = SectionChecks(section.digest)
+                    self.section_stats["evaluated"] += 1
+                else:
+                    self._sections.move_to_end(section.digest)
+                    self.section_stats["reused"] += 1
+                found.append(checks)
+            while len(self._sections) > max(self.section_cache_size, 0):
+                self._sections.popitem(last=False)
+                self.section_stats["evictions"] += 1
+        return found
+
+    def _first_heading(self, index: MarkdownIndex, check: RuleCheck, sections: List[Section],
+                       section_checks: List[SectionChecks]) -> Optional[Tuple[int, int, str]]:
+        """앞선 패턴 우선으로 처음 일치하는 헤딩의 (패턴 순번, 위치, 일치 문자열)
+
+        패턴마다 섹션 순서대로 찾고 처음 일치하면 멈추며, 섹션별 결과는 처음 필요할 때 계산한다.
+        """
+        headings = index.headings
+        content = index.content
+        for pattern_index, pattern in enumerate(self._patterns[check.id]):
+            key = (check.id, pattern_index)
+            for section, checks in zip(sections, section_checks):
+                if key not in checks.headings:
+                    found = None
+                    for number in section.headings:
+                        heading = headings[number]
+                        if check.level is not None and heading.level != check.level:
+                            continue
+                        match = pattern.search(content, heading.start, heading.end)
+                        if match:
+                            found = (match.start() - section.start, match.group())
+                            break
+                    checks.headings[key] = found
+                found = checks.headings[key]
+                if found is not None:
+                    return pattern_index, section.start + found[0], found[1]
+        return None
+
+    def _span_results(self, index: MarkdownIndex, anchor_id: str, start: int, end: int) -> Dict[str, list]:
+        """기준 헤딩 뒤 범위에 걸린 section/list_item 검사 결과 (위치는 범위 시작 기준)"""
+        results: Dict[str, list] = {}
+        range_matcher = self._range_matchers.get(("section", anchor_id))
+        if range_matcher is not None:
+            matcher, groups = range_matcher
+            for match in matcher.finditer(index.content, start, end):
+                check, pattern_index = groups[match.lastgroup]
+                result = results.get(check.id)
+                if result is None:
+                    results[check.id] = [1, match.group(), match.start() - start, pattern_index, ()]
+                else:
+                    result[0] += 1
+
+        items = None
+        for check in self._anchored[anchor_id]:
+            if check.scope != "list_item":
+                continue
+            if items is None:
+                items = index.list_items_in(start, end)
+            failed_items = ()
+            if check.min_length is not None:
+                failed_items = tuple(
+                    number for number, item in enumerate(items, 1) if len(item.text) < check.min_length
+                )
+            results[check.id] = [len(items), None, None, None, failed_items]
+        return results
+
+    @staticmethod
+    def _section_span(index: MarkdownIndex, heading_outcome: CheckOutcome) -> Optional[Tuple[int, int]]:
+        """heading 검사가 찾은 헤딩의 일치 끝부터 다음 '## N.' 전까지 (본문이 비어 있으면 None)"""
+        if not heading_outcome.count:
+            return None
+        start = heading_outcome.position + len(heading_outcome.match)
+        end = index.section_end(start)
+        if not index.content[start:end].strip():
+            return None
+        return start, end
+
+    @staticmethod
+    def _violation(check: RuleCheck, **values: Any) -> Dict[str, Any]:
+        message = check.message.format(**values) if "{" in check.message else check.message
+        return {
+            "type": check.violation,
+            "message": message,
+            "penalty": check.penalty
+        }
@@ -5,8 +5,9 @@ SpecLint 개선 제안 생성기
 US-002의 품질 검사 결과에 따라 사용자에게 실용적인 수정 방향을 제시합니다.
 """
 import logging
-from typing import List, Dict, Any, Set
+from typing import List, Dict, Any, Optional, Set
 from speclint_lint.utils.rules import IMPROVEMENT_SUGGESTIONS
+from speclint_lint.engine import RuleEngine
 
 
 class ImprovementSuggester:
@@ -16,8 +17,11 @@ class ImprovementSuggester:
     구체적이고 실행 가능한 개선 제안을 생성합니다.
     """
     
-    def __init__(self):
-        self.suggestions = IMPROVEMENT_SUGGESTIONS
+    def __init__(self, suggestions: Optional[Dict[str, str]] = None):
+        # 규칙 엔진이 선언한 검사별 제안이 기본 제안보다 우선 (없으면 기본 규칙 세트의 제안)
+        if suggestions is None:
+            suggestions = RuleEngine.default().suggestions
+        self.suggestions = {**IMPROVEMENT_SUGGESTIONS, **suggestions}
         self.logger = logging.getLogger("specgate.speclint.suggester")
     
     async def generate_suggestions(self, violations: List[Dict[str, Any]]) -> List[str]:
@@ -7,14 +7,14 @@ from .rules import (
     QUALITY_SCORING,
     PERFORMANCE_REQUIREMENTS,
     MEMORY_REQUIREMENTS,
-    STRUCTURE_CHECKS,
     IMPROVEMENT_SUGGESTIONS
 )
+from .markdown_index import MarkdownIndex
 
 __all__ = [
     'QUALITY_SCORING',
     'PERFORMANCE_REQUIREMENTS',
     'MEMORY_REQUIREMENTS',
-    'STRUCTURE_CHECKS',
-    'IMPROVEMENT_SUGGESTIONS'
+    'IMPROVEMENT_SUGGESTIONS',
+    'MarkdownIndex'
 ]
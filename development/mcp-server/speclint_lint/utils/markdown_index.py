@@ -0,0 +1,251 @@
+"""
+SpecLint Markdown 섹션 인덱스
+
+문서를 한 번만 훑어 제목(헤딩) 위치와 레벨, 펜스 코드 블록 범위,
+규칙 줄을 기록하고, 섹션별 목록 항목을 제공하는 모듈입니다.
+
+분석기와 검사기는 문서 전체에 정규식을 반복 적용하는 대신 이 인덱스에서
+답을 찾으므로, 문서 한 건의 검사 비용은 선형 스캔 한 번으로 줄어듭니다.
+SpecLint.lint()가 호출마다 한 번 만들어 분석기와 검사기에 함께 넘깁니다.
+'## N.' 섹션마다 내용 해시를 두어, 규칙 엔진이 바뀌지 않은 섹션의 검사 결과를 재사용합니다.
+"""
+import re
+import bisect
+import hashlib
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Match, NamedTuple, Optional, Pattern, Tuple
+
+
+# 번호가 붙은 2레벨 섹션 제목 (## N.) - 섹션 경계
+NUMBERED_SECTION_PATTERN = re.compile(r'[0-9]+\.')
+
+# 정규식에서 특수 의미가 있는 글자와 수량자
+REGEX_SPECIAL_CHARS = set('.^$*+?{}[]|()\\')
+REGEX_QUANTIFIERS = set('*+?{')
+
+
+def compile_scan_pattern(rule_pattern: str) -> Pattern:
+    """줄 시작의 펜스/헤딩 기호, 위치에 상관없는 규칙 표기와 한 줄 안의 ```코드```를 한 번에 찾는 패턴
+
+    문서 앞에 '\\n'을 붙여 훑는다. 모든 분기가 글자('\\n', 규칙 첫 글자, '`')로 시작해야 정규식
+    엔진이 그 글자가 아닌 위치를 건너뛰므로, 그룹은 첫 글자 뒤에 둔다 (규칙 패턴이 글자로
+    시작하지 않으면 그대로 넣는다). 기호 뒤 줄 내용은 전방 탐색으로 잡아 소비하지 않으므로
+    같은 줄의 규칙도 이어서 찾는다. 일치 종류는 마지막으로 닫힌 그룹(lastgroup)으로 구분한다.
+    """
+    if rule_pattern[:1] == '\\' and rule_pattern[1:2] in REGEX_SPECIAL_CHARS:
+        prefix, rest = rule_pattern[:2], rule_pattern[2:]
+    elif rule_pattern[:1] and rule_pattern[:1] not in REGEX_SPECIAL_CHARS:
+        prefix, rest = rule_pattern[:1], rule_pattern[1:]
+    else:
+        prefix, rest = '', rule_pattern
+    if rest[:1] in REGEX_QUANTIFIERS or '|' in rest:
+        # 첫 글자에 수량자가 붙거나 최상위 선택(|)이 있을 수 있으면 나누지 않는다
+        prefix, rest = '', rule_pattern
+    return re.compile(
+        r'\n[ \t]*(?:'
+        r'(?P<fence>`{3,}|~{3,})(?=(?P<fence_line>[^\n]*))'
+        r'|(?P<hashes>#+)(?=(?P<heading_line>[^\n]*))'
+        r')'
+        r'|' + prefix + r'(?P<rule>' + rest + r')'
+        r'|`(?P<span>``+[^`\n]+?`{3,})'
+    )
+
+
+# '-' 또는 '*'로 시작하는 줄 (목록 항목, 구분선, 굵은 글씨 규칙 줄 포함)
+LIST_ITEM_PATTERN = re.compile(r'^[ \t]*([-*])([^\n]*)', re.MULTILINE)
+
+
+class Heading(NamedTuple):
+    """'#'로 시작하는 줄 (start~end는 줄 범위, 줄바꿈 제외)"""
+    level: int
+    title: str
+    start: int
+    end: int
+    in_code: bool
+
+
+class CodeBlock(NamedTuple):
+    """펜스 코드 블록 (여는 펜스 줄 시작부터 닫는 펜스 줄 끝까지)"""
+    info: str
+    start: int
+    end: int
+    closed: bool
+
+
+class ListItem(NamedTuple):
+    """'-' 또는 '*'로 시작하는 줄 (text는 기호 뒤 내용)"""
+    marker: str
+    text: str
+    start: int
+    in_code: bool
+
+
+class Section(NamedTuple):
+    """'## N.' 섹션 제목부터 다음 '## N.' 전까지 (첫 섹션은 문서 시작부터)
+
+    digest는 섹션 내용의 해시, headings는 이 섹션에 속한 MarkdownIndex.headings 순번 범위.
+    """
+    start: int
+    end: int
+    digest: str
+    headings: range
+
+
+class RuleLine(NamedTuple):
+    """규칙 형식(**RULE-영역-번호** (유형):)과 일치한 위치"""
+    text: str
+    start: int
+    end: int
+    in_code: bool
+
+
+@dataclass
+class MarkdownIndex:
+    """문서 한 건의 구조 인덱스
+
+    build()로 만들며, 헤딩과 규칙은 코드 블록 안에 있어도 기록하고 in_code로 구분한다.
+    검사 결과가 정규식으로 문서 전체를 찾던 때와 같도록 조회 메서드는 코드 블록 안의 항목도
+    포함한다 (예: 작성 가이드의 ```markdown 예시 안에 있는 템플릿 헤딩).
+    목록 항목은 섹션 검사에서만 쓰므로 list_items_in()이 요청한 범위만 찾아 기억해 둔다.
+    """
+    content: str
+    headings: List[Heading] = field(default_factory=list)
+    code_blocks: List[CodeBlock] = field(default_factory=list)
+    rule_lines: List[RuleLine] = field(default_factory=list)
+    code_spans: List[Tuple[int, int]] = field(default_factory=list)   # 한 줄 안의 ```코드``` 범위
+    _list_items: Dict[Tuple[int, int], List[ListItem]] = field(default_factory=dict, repr=False)
+    _sections: Optional[List[Section]] = field(default=None, repr=False)
+    # 이 인덱스로 계산한 결과 메모 (규칙 세트 버전별 검사 결과 등)
+    results: Dict[str, Any] = field(default_factory=dict, repr=False)
+
+    @classmethod
+    def build(cls, content: str, scan_pattern: Optional[Pattern] = None) -> "MarkdownIndex":
+        """문서를 한 번 훑어 인덱스를 만든다 (scan_pattern: compile_scan_pattern()으로 만든 규칙 엔진의 패턴)
+
+        scan_pattern을 주지 않으면 기본 규칙 세트(RuleEngine.default())의 패턴을 사용한다.
+        """
+        if scan_pattern is None:
+            # 규칙 엔진이 이 모듈을 가져오므로 호출 시점에 가져온다
+            from speclint_lint.engine import RuleEngine
+            scan_pattern = RuleEngine.default().scan_pattern
+        index = cls(content or "")
+        content = index.content
+        open_fence: Optional[Tuple[str, int, str]] = None   # (펜스 문자열, 시작 위치, 정보 문자열)
+
+        # 위치는 앞에 붙인 '\n' 때문에 1씩 밀려 있다
+        for match in scan_pattern.finditer('\n' + content):
+            kind = match.lastgroup
+            in_code = open_fence is not None
+            if kind == 'heading_line':
+                index.headings.append(Heading(
+                    len(match.group('hashes')), match.group(kind).strip(), match.start(), match.end(kind) - 1, in_code
+                ))
+            elif kind == 'rule':
+                # 분기 첫 글자는 그룹 밖에 있으므로 전체 일치를 규칙 표기로 쓴다
+                start = match.start() - 1
+                index.rule_lines.append(RuleLine(match.group(), start, match.end() - 1, in_code))
+            elif kind == 'span':
+                index.code_spans.append((match.start() - 1, match.end() - 1))
+            else:
+                fence, rest = match.group('fence', kind)
+                line_start, line_end = match.start(), match.end(kind) - 1
+                if open_fence is None:
+                    if fence[0] == '`' and '`' in rest:
+                        # 백틱 펜스의 정보 문자열에는 백틱이 올 수 없으므로 줄 안의 코드 표기
+                        if '```' in rest:
+                            index.code_spans.append((line_start, line_end))
+                        continue
+                    open_fence = (fence, line_start, rest.strip())
+                elif fence[0] == open_fence[0][0] and len(fence) >= len(open_fence[0]) and not rest.strip():
+                    index.code_blocks.append(CodeBlock(open_fence[2], open_fence[1], line_end, True))
+                    open_fence = None
+
+        if open_fence is not None:
+            # 닫히지 않은 펜스는 문서 끝까지 코드 블록 (코드 예제로는 세지 않음)
+            index.code_blocks.append(CodeBlock(open_fence[2], open_fence[1], len(content), False))
+        return index
+
+    @property
+    def closed_code_blocks(self) -> List[CodeBlock]:
+        """여는 펜스와 닫는 펜스가 모두 있는 코드 블록"""
+        return [block for block in self.code_blocks if block.closed]
+
+    @property
+    def code_example_count(self) -> int:
+        """코드 예제 수 (닫힌 펜스 코드 블록 + 줄 안의 ```코드``` 표기)"""
+        return len(self.closed_code_blocks) + len(self.code_spans)
+
+    @property
+    def line_count(self) -> int:
+        return self.content.count('\n') + 1
+
+    @property
+    def word_count(self) -> int:
+        return len(self.content.split())
+
+    @property
+    def sections(self) -> List[Section]:
+        """'## N.' 섹션 제목으로 나눈 구간과 내용 해시 (처음 조회할 때 한 번 계산)
+
+        경계는 section_end()와 같이 코드 블록 안의 섹션 제목도 포함하므로,
+        섹션 제목에서 시작하는 검사 범위는 항상 한 섹션 안에 있다.
+        """
+        if self._sections is None:
+            starts = [0] + [
+                heading.start for heading in self.headings
+                if heading.start > 0 and heading.level == 2 and NUMBERED_SECTION_PATTERN.match(heading.title)
+            ]
+            ends = starts[1:] + [len(self.content)]
+            heading_starts = [heading.start for heading in self.headings]
+            sections = []
+            for start, end in zip(starts, ends):
+                text = self.content[start:end].encode('utf-8')
+                sections.append(Section(
+                    start, end,
+                    hashlib.blake2b(text, digest_size=16).hexdigest(),
+                    range(bisect.bisect_left(heading_starts, start), bisect.bisect_left(heading_starts, end))
+                ))
+            self._sections = sections
+        return self._sections
+
+    def section_number(self, position: int) -> int:
+        """position이 속한 섹션의 sections 순번"""
+        return bisect.bisect_right([section.start for section in self.sections], position) - 1
+
+    def find_heading(self, pattern: Pattern, level: Optional[int] = None) -> Optional[Tuple[Heading, Match]]:
+        """헤딩 줄 안에서 패턴과 처음 일치하는 헤딩과 일치 결과 (level을 주면 그 레벨만, 없으면 None)"""
+        for heading in self.headings:
+            if level is not None and heading.level != level:
+                continue
+            match = pattern.search(self.content, heading.start, heading.end)
+            if match:
+                return heading, match
+        return None
+
+    def section_end(self, position: int) -> int:
+        """position 이후 처음 나오는 '## N.' 섹션 제목의 시작 위치 (없으면 문서 끝)"""
+        for heading in self.headings:
+            if heading.start >= position and heading.level == 2 and NUMBERED_SECTION_PATTERN.match(heading.title):
+                return heading.start
+        return len(self.content)
+
+    def section_after(self, pattern: Pattern) -> Optional[Tuple[int, int]]:
+        """패턴과 일치하는 헤딩의 일치 끝부터 다음 '## N.' 섹션 전까지의 범위 (없으면 None)"""
+        found = self.find_heading(pattern)
+        if found is None:
+            return None
+        _, match = found
+        return match.end(), self.section_end(match.end())
+
+    def list_items_in(self, start: int, end: int) -> List[ListItem]:
+        """범위 안에서 줄이 시작하는 목록 항목 (범위별로 한 번만 찾음)"""
+        key = (start, end)
+        if key not in self._list_items:
+            block_starts = [block.start for block in self.code_blocks]
+            items = []
+            for match in LIST_ITEM_PATTERN.finditer(self.content, start, end):
+                block = bisect.bisect_right(block_starts, match.start()) - 1
+                in_code = block >= 0 and match.start() <= self.code_blocks[block].end
+                items.append(ListItem(match.group(1), match.group(2).strip(), match.start(), in_code))
+            self._list_items[key] = items
+        return self._list_items[key]
@@ -0,0 +1,141 @@
+"""
+로컬 Confluence 스탠드인 서버를 사용한 confluence_fetch 통합 테스트
+"""
+import pytest
+import pytest_asyncio
+
+from confluence_fetch import ConfluenceService, RetryPolicy, SyncManifest, TokenBucket
+from confluence_fetch.client import ConfluenceAPIClient
+from tests.utils.confluence_standin import ConfluenceStandIn, CorpusConfig, FaultProfile
+
+
+@pytest_asyncio.fixture
+async def standin(monkeypatch):
+    server = ConfluenceStandIn(CorpusConfig(pages=120, body_kb=1, seed=7))
+    await server.start()
+    monkeypatch.setenv("CONFLUENCE_BASE_URL", server.base_url)
+    yield server
+    await server.stop()
+
+
+def _service() -> ConfluenceService:
+    service = ConfluenceService()
+    service.client = ConfluenceAPIClient(
+        retry_policy=RetryPolicy(max_attempts=8, base_delay=0.01),
+        rate_limiter=TokenBucket(rate=0)
+    )
+    return service
+
+
+def _expected_ids(standin, label, space_key=None):
+    return sorted(
+        page["id"] for page in standin.pages
+        if label in page["labels"] and (space_key is None or page["space"]["key"] == space_key)
+    )
+
+
+class TestConfluenceStandIn:
+    """스탠드인 서버 대상 수집 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_crawl_returns_every_matching_page(self, standin):
+        service = _service()
+        try:
+            result = await service.fetch_documents("design", "SG", limit=7, save_html=False, crawl=True)
+        finally:
+            await service.close()
+
+        assert result["status"] == "success"
+        assert sorted(d["id"] for d in result["documents"]) == _expected_ids(standin, "design", "SG")
+        assert result["metadata"]["total_size"] == len(result["documents"])
+
+    @pytest.mark.asyncio
+    async def test_next_links_page_through_results(self, standin):
+        client = ConfluenceAPIClient(rate_limiter=TokenBucket(rate=0))
+        try:
+            page = await client.search_content('label = "spec"', limit=10)
+            ids = [r["id"] for r in page["results"]]
+            while page["_links"].get("next"):
+                page = await client.get_next_page(page["_links"]["next"])
+                ids.extend(r["id"] for r in page["results"])
+        finally:
+            await client.close()
+
+        assert sorted(ids) == _expected_ids(standin, "spec")
+        assert len(ids) == len(set(ids))
+
+    @pytest.mark.asyncio
+    async def test_delta_query_returns_only_touched_pages(self, standin):
+        standin.touch(["100003", "100006"])
+        service = _service()
+        try:
+            result = await service.fetch_documents("design", save_html=False, modified_since='now("-5m")', stream=True)
+        finally:
+            await service.close()
+
+        assert sorted(d["id"] for d in result["documents"]) == ["100003", "100006"]
+        assert all(d["version"] >= 2 for d in result["documents"])
+
+    @pytest.mark.asyncio
+    async def test_crawl_survives_flaky_profile(self, standin):
+        standin.set_faults(FaultProfile(rate_429=0.2, rate_5xx=0.2, retry_after=0.01, seed=3))
+        service = _service()
+        try:
+            result = await service.fetch_documents("api", limit=5, save_html=False, crawl=True, max_concurrency=4)
+        finally:
+            await service.close()
+
+        assert sorted(d["id"] for d in result["documents"]) == _expected_ids(standin, "api")
+        assert result["metadata"]["http_metrics"]["retries"] > 0
+        assert standin.stats.status_counts.get(429, 0) + standin.stats.status_counts.get(503, 0) > 0
+
+    @pytest.mark.asyncio
+    async def test_broken_stream_does_not_advance_watermark(self, standin, tmp_path, monkeypatch):
+        import server
+
+        monkeypatch.setattr(server.confluence_service, "client", _service().client)
+        manifest_path = str(tmp_path / ".specgate" / "data" / "sync" / "sync_manifest.json")
+        fetch = dict(label="design", limit=50, output_dir=str(tmp_path), save_html=False,
+                     auto_pipeline=False, incremental=True, stream=True)
+        try:
+            # 본문 절반에서 연결이 끊기면 일부 문서만 받고 다음 페이지 링크도 없다
+            standin.set_faults(FaultProfile(truncate_body=0.5))
+            broken = await server.confluence_fetch.fn(**fetch)
+
+            assert broken["status"] == "success"
+            assert 0 < len(broken["documents"]) < len(_expected_ids(standin, "design"))
+            assert broken["metadata"]["stream"]["error"]
+            assert "watermark" not in broken["metadata"]
+            assert SyncManifest.load(manifest_path).get_watermark("design") is None
+
+            standin.set_faults(FaultProfile())
+            complete = await server.confluence_fetch.fn(**fetch)
+        finally:
+            await server.confluence_service.close()
+
+        assert complete["metadata"]["stream"] == {"error": None}
+        assert "watermark" in complete["metadata"]
+        assert SyncManifest.load(manifest_path).get_watermark("design") is not None
+
+    @pytest.mark.asyncio
+    async def test_streamed_pipeline_processes_pages_in_batches(self, standin, tmp_path, monkeypatch):
+        import server
+
+        monkeypatch.setenv("CLIENT_WORK_DIR", str(tmp_path))
+        monkeypatch.setattr(server.confluence_service, "client", _service().client)
+        try:
+            result = await server.confluence_fetch.fn(
+                label="design", limit=50, output_dir=str(tmp_path), stream=True, auto_create_github_issues=False
+            )
+        finally:
+            await server.confluence_service.close()
+
+        expected = _expected_ids(standin, "design")
+        assert [r["page_id"] for r in result["metadata"]["pipeline_results"]] == [d["id"] for d in result["documents"]]
+        assert sorted(d["id"] for d in result["documents"]) == expected
+        assert all(r["markdown_file"] and "quality_level" in r["lint"]["metadata"] for r in result["metadata"]["pipeline_results"])
+        # 처리한 문서의 본문은 반환 결과에 남기지 않는다 (HTML 원본은 파일로 저장됨)
+        assert all("html_content" not in d and d["html_file"] for d in result["documents"])
+        batches = result["metadata"]["conversion"]["batches"]
+        assert sum(batch["pages"] for batch in batches) == len(expected)
+        assert len(batches) == -(-len(expected) // 16)
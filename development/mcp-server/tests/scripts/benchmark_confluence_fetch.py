@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Confluence 수집 처리량 벤치마크
+
+로컬 스탠드인 서버(tests/utils/confluence_standin.py)를 띄우고
+ConfluenceService.fetch_documents(crawl=True)의 처리량을 장애 프로파일별로 측정합니다.
+실제 테넌트가 필요 없으므로 CI에서도 실행할 수 있습니다.
+
+사용법 (mcp-server 디렉토리에서):
+    python -m tests.scripts.benchmark_confluence_fetch --pages 2000 --profiles none,realistic,throttled
+    python -m tests.scripts.benchmark_confluence_fetch --json > benchmark.json
+"""
+import os
+import sys
+import json
+import time
+import asyncio
+import argparse
+import logging
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from tests.utils.confluence_standin import ConfluenceStandIn, CorpusConfig, FaultProfile, FAULT_PROFILES
+
+
+async def run_profile(profile: str, args: argparse.Namespace) -> dict:
+    """프로파일 하나에 대해 스탠드인을 띄우고 전체 수집을 측정"""
+    from confluence_fetch import ConfluenceService
+
+    corpus = CorpusConfig(pages=args.pages, body_kb=args.body_kb, labels=(args.label,), seed=args.seed)
+    faults = FaultProfile.named(profile)
+    faults.seed = args.seed
+
+    async with ConfluenceStandIn(corpus, faults) as standin:
+        os.environ["CONFLUENCE_BASE_URL"] = standin.base_url
+        service = ConfluenceService()
+        try:
+            t0 = time.perf_counter()
+            result = await service.fetch_documents(
+                args.label,
+                limit=args.page_size,
+                save_html=False,
+                crawl=True,
+                max_concurrency=args.max_concurrency,
+                stream=args.stream
+            )
+            elapsed = time.perf_counter() - t0
+        finally:
+            await service.close()
+            os.environ.pop("CONFLUENCE_BASE_URL", None)
+
+    documents = len(result.get("documents", []))
+    http_metrics = result.get("metadata", {}).get("http_metrics", {})
+    return {
+        "profile": profile,
+        "status": result.get("status"),
+        "documents": documents,
+        "elapsed": round(elapsed, 3),
+        "docs_per_sec": round(documents / elapsed, 1) if elapsed else None,
+        "client": {
+            "requests": http_metrics.get("requests"),
+            "retries": http_metrics.get("retries"),
+            "throttled": http_metrics.get("throttled"),
+            "connection_reuse_ratio": http_metrics.get("connection_reuse_ratio"),
+            "final_window": http_metrics.get("concurrency", {}).get("window"),
+            "peak_window": http_metrics.get("concurrency", {}).get("peak_window"),
+        },
+        "server": standin.stats.to_dict()
+    }
+
+
+def _print_table(results: list) -> None:
+    print(f"{'profile':<12}{'docs':>8}{'sec':>9}{'docs/s':>10}{'reqs':>7}{'retry':>7}{'429':>6}{'window':>8}")
+    for r in results:
+        c = r["client"]
+        print(
+            f"{r['profile']:<12}{r['documents']:>8}{r['elapsed']:>9.2f}{r['docs_per_sec'] or 0:>10.1f}"
+            f"{c['requests'] or 0:>7}{c['retries'] or 0:>7}{c['throttled'] or 0:>6}"
+            f"{c['final_window'] or 0:>4}/{c['peak_window'] or 0:<3}"
+        )
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description="Confluence 수집 처리량 벤치마크 (로컬 스탠드인 사용)")
+    parser.add_argument("--pages", type=int, default=1000, help="생성할 문서 수")
+    parser.add_argument("--body-kb", type=float, default=8.0, help="문서 본문 크기(KB)")
+    parser.add_argument("--page-size", type=int, default=25, help="요청당 문서 수 (limit)")
+    parser.add_argument("--max-concurrency", type=int, default=None, help="동시 요청 상한 (기본값: 자동 조절)")
+    parser.add_argument("--profiles", default="none,realistic,throttled,flaky",
+                        help=f"쉼표로 구분한 장애 프로파일 ({', '.join(FAULT_PROFILES)})")
+    parser.add_argument("--label", default="design")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--stream", action="store_true", help="스트리밍 디코딩 사용 (단일 요청 모드에만 적용)")
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    results = []
+    for profile in [p.strip() for p in args.profiles.split(",") if p.strip()]:
+        results.append(await run_profile(profile, args))
+
+    if args.json:
+        print(json.dumps(results, ensure_ascii=False, indent=2))
+    else:
+        _print_table(results)
+    return 0 if all(r["status"] == "success" and r["documents"] == args.pages for r in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
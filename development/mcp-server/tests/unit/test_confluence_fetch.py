@@ -0,0 +1,778 @@
+"""
+confluence_fetch 모듈 테스트
+"""
+import json
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from confluence_fetch import (
+    ConfluenceAPIClient, ConfluenceService, ConnectionPoolConfig, SyncManifest, RetryPolicy, TokenBucket,
+    AdaptiveConcurrencyLimiter, SearchResultsStreamDecoder
+)
+from confluence_fetch.ratelimit import parse_retry_after
+
+
+def _make_page(page_id, version=1, html=""):
+    """테스트용 Confluence 검색 결과 항목"""
+    return {
+        "id": str(page_id),
+        "title": f"문서 {page_id}",
+        "body": {"storage": {"value": html}},
+        "version": {"number": version, "when": "2025-01-01T00:00:00.000Z"},
+        "space": {"key": "SG", "name": "SpecGate"},
+        "_links": {"webui": f"/spaces/SG/pages/{page_id}"}
+    }
+
+
+class FakeSearchClient(ConfluenceAPIClient):
+    """search_content / get_next_page를 메모리 데이터로 대체한 클라이언트"""
+
+    def __init__(self, total, with_total_size=True, fail_starts=()):
+        super().__init__()
+        self.total = total
+        self.with_total_size = with_total_size
+        self.fail_starts = set(fail_starts)
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.calls = []
+
+    async def search_content(self, cql, limit=10, start=0, expand=None):
+        self.calls.append(start)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+            if start in self.fail_starts:
+                return {"error": "API 호출 실패: 500"}
+            return self._page(start, limit)
+        finally:
+            self.in_flight -= 1
+
+    async def get_next_page(self, next_link):
+        start = int(next_link.rsplit("start=", 1)[1])
+        return await self.search_content("", 10, start)
+
+    def _page(self, start, limit):
+        results = [_make_page(i) for i in range(start, min(start + limit, self.total))]
+        page = {"results": results, "start": start, "limit": limit, "size": len(results), "_links": {}}
+        if self.with_total_size:
+            page["totalSize"] = self.total
+        if start + limit < self.total:
+            page["_links"]["next"] = f"/rest/api/content/search?cql=x&limit={limit}&start={start + limit}"
+        return page
+
+
+def _service_with(client):
+    service = ConfluenceService()
+    service.client = client
+    return service
+
+
+class TestConfluenceCrawl:
+    """페이지 수집(crawl) 모드 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_crawl_collects_all_pages_with_bounded_concurrency(self):
+        client = FakeSearchClient(total=95)
+        service = _service_with(client)
+
+        result = await service.fetch_documents("design", limit=10, save_html=False, crawl=True, max_concurrency=3)
+
+        assert result["status"] == "success"
+        assert sorted(int(d["id"]) for d in result["documents"]) == list(range(95))
+        assert result["metadata"]["crawl"]["pages_fetched"] == 10
+        assert result["metadata"]["has_more"] is False
+        assert client.max_in_flight <= 3
+
+    @pytest.mark.asyncio
+    async def test_crawl_follows_next_links_without_total_size(self):
+        client = FakeSearchClient(total=25, with_total_size=False)
+        service = _service_with(client)
+
+        docs = [doc async for doc in service.iter_documents("design", page_size=10)]
+
+        assert [int(d["id"]) for d in docs] == list(range(25))
+        assert client.calls == [0, 10, 20]
+
+    @pytest.mark.asyncio
+    async def test_crawl_respects_max_results(self):
+        client = FakeSearchClient(total=100)
+        service = _service_with(client)
+
+        result = await service.fetch_documents("design", limit=10, save_html=False, crawl=True, max_results=35)
+
+        assert len(result["documents"]) == 35
+        assert result["metadata"]["has_more"] is True
+        assert max(client.calls) < 40
+
+    @pytest.mark.asyncio
+    async def test_crawl_keeps_going_after_failed_page(self):
+        client = FakeSearchClient(total=30, fail_starts={10})
+        service = _service_with(client)
+
+        result = await service.fetch_documents("design", limit=10, save_html=False, crawl=True)
+
+        assert result["status"] == "success"
+        assert len(result["documents"]) == 20
+        assert result["metadata"]["crawl"]["errors"] == ["API 호출 실패: 500"]
+
+
+class TestConfluenceHTTPSession:
+    """공유 HTTP 세션/커넥션 풀 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_session_is_reused_across_requests(self):
+        async def search(request):
+            return web.json_response({"results": [_make_page(1)], "_links": {}})
+
+        app = web.Application()
+        app.router.add_get("/wiki/rest/api/content/search", search)
+        server = TestServer(app)
+        await server.start_server()
+        try:
+            client = ConfluenceAPIClient(ConnectionPoolConfig(limit_per_host=2))
+            client._base_url = lambda: str(server.make_url("/wiki")).rstrip("/")
+
+            for _ in range(3):
+                response = await client.search_content('label = "design"')
+                assert len(response["results"]) == 1
+            session = client._session
+
+            metrics = client.get_metrics()
+            assert metrics["requests"] == 3
+            assert metrics["connections_new"] == 1
+            assert metrics["connections_reused"] == 2
+            assert metrics["avg_elapsed_reused"] is not None
+
+            await client.close()
+            assert session.closed
+            assert client._session is None
+        finally:
+            await server.close()
+
+
+class TestRateLimitRetry:
+    """호출 제한(429)/일시 오류 재시도 테스트"""
+
+    def test_parse_retry_after_headers(self):
+        now = datetime(2025, 1, 31, 12, 0, tzinfo=timezone.utc)
+
+        assert parse_retry_after({"Retry-After": "7"}, now=now) == 7.0
+        assert parse_retry_after({"Retry-After": "Fri, 31 Jan 2025 12:00:30 GMT"}, now=now) == 30.0
+        assert parse_retry_after({"Beta-Retry-After": "3"}, now=now) == 3.0
+        assert parse_retry_after({"X-RateLimit-Reset": "2025-01-31T12:01:00Z"}, now=now) == 60.0
+        assert parse_retry_after({}, now=now) is None
+
+    def test_backoff_is_bounded(self):
+        policy = RetryPolicy(max_attempts=3, base_delay=1.0, max_delay=4.0)
+
+        assert all(0 <= policy.compute_delay(attempt) <= 4.0 for attempt in range(1, 10))
+        assert policy.compute_delay(1, {"Retry-After": "2"}) >= 2.0
+        assert policy.should_retry(429, 1) and policy.should_retry(None, 2)
+        assert not policy.should_retry(404, 1)
+        assert not policy.should_retry(503, 3)
+
+    @pytest.mark.asyncio
+    async def test_retries_after_429_and_5xx(self):
+        responses = [
+            web.json_response({"message": "rate limited"}, status=429, headers={"Retry-After": "0"}),
+            web.json_response({"message": "unavailable"}, status=503),
+        ]
+
+        async def search(request):
+            if responses:
+                return responses.pop(0)
+            return web.json_response({"results": [_make_page(1)], "_links": {}})
+
+        app = web.Application()
+        app.router.add_get("/wiki/rest/api/content/search", search)
+        server = TestServer(app)
+        await server.start_server()
+        try:
+            client = ConfluenceAPIClient(
+                retry_policy=RetryPolicy(base_delay=0.01),
+                rate_limiter=TokenBucket(rate=100)
+            )
+            client._base_url = lambda: str(server.make_url("/wiki")).rstrip("/")
+
+            response = await client.search_content('label = "design"')
+
+            assert len(response["results"]) == 1
+            metrics = client.get_metrics()
+            assert metrics["requests"] == 3
+            assert metrics["retries"] == 2
+            assert metrics["throttled"] == 1
+            await client.close()
+        finally:
+            await server.close()
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_attempts(self):
+        async def search(request):
+            return web.json_response({"message": "down"}, status=500)
+
+        app = web.Application()
+        app.router.add_get("/wiki/rest/api/content/search", search)
+        server = TestServer(app)
+        await server.start_server()
+        try:
+            client = ConfluenceAPIClient(
+                retry_policy=RetryPolicy(max_attempts=2, base_delay=0.01),
+                rate_limiter=TokenBucket(rate=100)
+            )
+            client._base_url = lambda: str(server.make_url("/wiki")).rstrip("/")
+
+            response = await client.search_content('label = "design"')
+
+            assert response == {"error": "API 호출 실패: 500"}
+            assert client.get_metrics()["requests"] == 2
+            await client.close()
+        finally:
+            await server.close()
+
+    @pytest.mark.asyncio
+    async def test_token_bucket_pause_blocks_all_callers(self):
+        bucket = TokenBucket(rate=1000)
+        bucket.pause(0.05)
+
+        waits = await asyncio.gather(*(bucket.acquire() for _ in range(3)))
+
+        assert all(w >= 0.04 for w in waits)
+
+
+class TestAdaptiveConcurrency:
+    """AIMD 동시성 컨트롤러 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_window_grows_while_healthy_and_halves_on_429(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=8)
+
+        for _ in range(20):
+            starts = [await limiter.acquire() for _ in range(limiter.window)]
+            for started_at in starts:
+                limiter.release(started_at, 200, 0.05)
+        assert limiter.window == 8
+
+        # 같은 혼잡 구간에서 시작된 요청들의 429는 한 번만 반영
+        starts = [await limiter.acquire() for _ in range(4)]
+        for started_at in starts:
+            limiter.release(started_at, 429, 0.05)
+
+        metrics = limiter.get_metrics()
+        assert metrics["window"] == 4
+        assert metrics["decisions"]["throttled"] == 1
+        assert metrics["recent_decisions"][-1]["action"] == "throttled"
+
+    @pytest.mark.asyncio
+    async def test_latency_spike_shrinks_window_and_blocks_extra_requests(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=4, latency_floor=0.1)
+        for _ in range(4):
+            limiter.release(await limiter.acquire(), 200, 0.05)
+
+        limiter.release(await limiter.acquire(), 200, 0.5)
+        assert limiter.window == 2
+        assert limiter.get_metrics()["decisions"]["latency"] == 1
+
+        held = [await limiter.acquire() for _ in range(2)]
+        blocked = asyncio.ensure_future(limiter.acquire())
+        await asyncio.sleep(0.01)
+        assert not blocked.done()
+
+        limiter.release(held[0])  # 결과 없이 반납해도 대기 중인 요청이 진행된다
+        await asyncio.wait_for(blocked, 1)
+        assert limiter.in_flight == 2
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_passes_wakeup_on(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=1, max_limit=1)
+        held = await limiter.acquire()
+        first = asyncio.ensure_future(limiter.acquire())
+        second = asyncio.ensure_future(limiter.acquire())
+        await asyncio.sleep(0.01)
+
+        # 첫 대기자가 깨워진 뒤 재개되기 전에 취소되어도 두 번째 대기자는 진행된다
+        limiter.release(held)
+        first.cancel()
+        await asyncio.wait_for(second, 1)
+        assert first.cancelled()
+        assert limiter.in_flight == 1
+
+    @pytest.mark.asyncio
+    async def test_client_backs_off_when_server_throttles(self):
+        state = {"in_flight": 0}
+
+        async def search(request):
+            state["in_flight"] += 1
+            try:
+                await asyncio.sleep(0.02)
+                if state["in_flight"] > 2:
+                    return web.json_response({"message": "too many"}, status=429, headers={"Retry-After": "0"})
+                start = int(request.query.get("start", 0))
+                results = [_make_page(i) for i in range(start, min(start + 5, 40))]
+                return web.json_response({
+                    "results": results, "start": start, "limit": 5, "size": len(results),
+                    "totalSize": 40, "_links": {}
+                })
+            finally:
+                state["in_flight"] -= 1
+
+        app = web.Application()
+        app.router.add_get("/wiki/rest/api/content/search", search)
+        server = TestServer(app)
+        await server.start_server()
+        try:
+            client = ConfluenceAPIClient(
+                retry_policy=RetryPolicy(max_attempts=10, base_delay=0.01),
+                rate_limiter=TokenBucket(rate=0),
+                concurrency=AdaptiveConcurrencyLimiter(initial_limit=8, max_limit=8)
+            )
+            client._base_url = lambda: str(server.make_url("/wiki")).rstrip("/")
+            service = _service_with(client)
+
+            result = await service.fetch_documents("design", limit=5, save_html=False, crawl=True)
+
+            assert len(result["documents"]) == 40
+            concurrency = result["metadata"]["http_metrics"]["concurrency"]
+            assert concurrency["decisions"]["throttled"] >= 1
+            assert concurrency["window"] <= 4
+            await client.close()
+        finally:
+            await server.close()
+
+
+class TestStreamingSearch:
+    """검색 응답 스트리밍 디코딩 테스트"""
+
+    def test_decoder_handles_arbitrary_chunk_boundaries(self):
+        response = {
+            "results": [
+                {**_make_page(i, html='<p>"따옴표" \\ [괄호], {중괄호}</p>' * i), "children": {"results": [1]}}
+                for i in range(4)
+            ],
+            "start": 0, "limit": 4, "size": 4, "totalSize": 9,
+            "_links": {"next": "/rest/api/content/search?start=4"}
+        }
+        raw = json.dumps(response, ensure_ascii=False, indent=1).encode("utf-8")
+
+        for chunk_size in (1, 3, 17, len(raw)):
+            decoder = SearchResultsStreamDecoder()
+            items = []
+            for i in range(0, len(raw), chunk_size):
+                items.extend(decoder.feed(raw[i:i + chunk_size]))
+            envelope = decoder.close()
+
+            assert items == response["results"]
+            assert envelope == {**response, "results": []}
+
+    def test_decoder_rejects_truncated_body(self):
+        decoder = SearchResultsStreamDecoder()
+        assert decoder.feed(b'{"results": [{"id": "1"}, {"id": ') == [{"id": "1"}]
+        with pytest.raises(ValueError):
+            decoder.close()
+
+    @pytest.mark.asyncio
+    async def test_documents_are_yielded_before_response_completes(self):
+        release = asyncio.Event()
+
+        async def search(request):
+            response = web.StreamResponse()
+            await response.prepare(request)
+            await response.write(b'{"results": [' + json.dumps(_make_page(1)).encode() + b",")
+            await release.wait()
+            await response.write(json.dumps(_make_page(2)).encode() + b'], "size": 2, "totalSize": 2, "_links": {}}')
+            await response.write_eof()
+            return response
+
+        app = web.Application()
+        app.router.add_get("/wiki/rest/api/content/search", search)
+        server = TestServer(app)
+        await server.start_server()
+        try:
+            client = ConfluenceAPIClient(rate_limiter=TokenBucket(rate=0))
+            client._base_url = lambda: str(server.make_url("/wiki")).rstrip("/")
+            service = _service_with(client)
+
+            envelope = {}
+            docs = service.stream_documents("design", envelope=envelope)
+            first = await asyncio.wait_for(docs.__anext__(), 1)
+            assert first["id"] == "1"
+            assert envelope == {}
+
+            release.set()
+            rest = [doc async for doc in docs]
+            assert [d["id"] for d in rest] == ["2"]
+            assert envelope["totalSize"] == 2
+            await client.close()
+        finally:
+            await server.close()
+
+    @pytest.mark.asyncio
+    async def test_stream_handler_receives_batches_before_response_completes(self, tmp_path):
+        release = asyncio.Event()
+
+        async def search(request):
+            response = web.StreamResponse()
+            await response.prepare(request)
+            await response.write(b'{"results": [' + json.dumps(_make_page(1, html="<p>1</p>")).encode() + b",")
+            await release.wait()
+            await response.write(json.dumps(_make_page(2, html="<p>2</p>")).encode() + b'], "size": 2, "_links": {}}')
+            await response.write_eof()
+            return response
+
+        app = web.Application()
+        app.router.add_get("/wiki/rest/api/content/search", search)
+        server = TestServer(app)
+        await server.start_server()
+        try:
+            client = ConfluenceAPIClient(rate_limiter=TokenBucket(rate=0))
+            client._base_url = lambda: str(server.make_url("/wiki")).rstrip("/")
+            service = _service_with(client)
+            manifest = SyncManifest.load(str(tmp_path / "sync_manifest.json"))
+            batches = []
+
+            async def handler(documents):
+                # 핸들러 시점에는 본문과 동기화 상태가 준비되어 있다
+                batches.append([(d["id"], d["html_content"], d["sync_status"]) for d in documents])
+                release.set()
+
+            result = await service.fetch_documents(
+                "design", save_html=False, manifest=manifest, stream=True,
+                stream_handler=handler, stream_batch_size=1
+            )
+
+            # 첫 문서는 응답이 끝나기 전에 핸들러로 넘어갔다
+            assert batches == [[("1", "<p>1</p>", "new")], [("2", "<p>2</p>", "new")]]
+            assert [d["id"] for d in result["documents"]] == ["1", "2"]
+            assert all("html_content" not in d for d in result["documents"])
+            assert result["metadata"]["sync"]["new"] == 2
+            assert result["metadata"]["stream"] == {"error": None, "handled": True}
+            await client.close()
+        finally:
+            await server.close()
+
+    @pytest.mark.asyncio
+    async def test_fetch_documents_stream_mode_matches_buffered(self):
+        pages = [_make_page(i, html=f"<p>{i}</p>") for i in range(3)]
+
+        async def search(request):
+            return web.json_response({"results": pages, "size": 3, "totalSize": 3, "_links": {}})
+
+        app = web.Application()
+        app.router.add_get("/wiki/rest/api/content/search", search)
+        server = TestServer(app)
+        await server.start_server()
+        try:
+            client = ConfluenceAPIClient(rate_limiter=TokenBucket(rate=0))
+            client._base_url = lambda: str(server.make_url("/wiki")).rstrip("/")
+            service = _service_with(client)
+
+            buffered = await service.fetch_documents("design", save_html=False)
+            streamed = await service.fetch_documents("design", save_html=False, stream=True)
+
+            assert streamed["status"] == "success"
+            assert streamed["documents"] == buffered["documents"]
+            assert streamed["metadata"]["total_count"] == 3
+            assert streamed["metadata"]["stream"] == {"error": None}
+            await client.close()
+        finally:
+            await server.close()
+
+
+class TestLazyMarkdownConversion:
+    """문서당 1회 HTML→Markdown 변환 테스트"""
+
+    @pytest.fixture
+    def convert_calls(self, monkeypatch):
+        from html_to_md.converter import HTMLToMarkdownConverter
+
+        calls = []
+        original = HTMLToMarkdownConverter.convert
+
+        async def counting_convert(self, html_content, *args, **kwargs):
+            calls.append(html_content)
+            return await original(self, html_content, *args, **kwargs)
+
+        monkeypatch.setattr(HTMLToMarkdownConverter, "convert", counting_convert)
+        return calls
+
+    @pytest.mark.asyncio
+    async def test_conversion_is_lazy_and_cached(self, convert_calls):
+        service = ConfluenceService()
+        doc = service.transformer.transform_to_specgate_format({"results": [_make_page(1, html="<h1>제목</h1><p>본문</p>")]})
+
+        assert doc["content"] is None
+        assert convert_calls == []
+
+        first = await service.transformer.ensure_markdown(doc)
+        second = await service.transformer.ensure_markdown(doc)
+
+        assert first == second == doc["content"]
+        assert "# 제목" in first
+        assert len(convert_calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_pipeline_reuses_cached_conversion(self, tmp_path, monkeypatch, convert_calls):
+        import server
+
+        monkeypatch.setenv("CLIENT_WORK_DIR", str(tmp_path))
+        pages = [_make_page(i, html=f"<h1>[SG] API 설계서</h1><p>문서 {i}</p>") for i in range(2)]
+
+        class StaticClient(FakeSearchClient):
+            async def search_content(self, cql, limit=10, start=0, expand=None):
+                return {"results": pages, "_links": {}}
+
+        monkeypatch.setattr(server.confluence_service, "client", StaticClient(total=0))
+        # 변환 호출을 세기 위해 현재 프로세스에서 변환
+        monkeypatch.setattr(server.conversion_executor.config, "workers", 1)
+
+        result = await server.confluence_fetch.fn(label="design", auto_create_github_issues=False, skip_unchanged=False)
+
+        assert len(convert_calls) == 2
+        assert result["metadata"]["conversion"]["pages"] == 2
+        for doc, pipeline_result in zip(result["documents"], result["metadata"]["pipeline_results"]):
+            assert doc["content"].startswith("# [SG] API 설계서")
+            with open(pipeline_result["markdown_file"], encoding="utf-8") as f:
+                assert f.read() == doc["content"]
+            assert pipeline_result["lint"]["metadata"]["cache_hit"] in (True, False)
+        assert result["metadata"]["lint_cache"]["stores"] >= 1
+
+    @pytest.mark.asyncio
+    async def test_direct_lookups_return_markdown(self):
+        class LookupClient(FakeSearchClient):
+            async def search_content(self, cql, limit=10, start=0, expand=None):
+                return {"results": [_make_page(i, html=f"<h1>문서 {i}</h1>") for i in range(2)], "_links": {}}
+
+            async def get_content_by_id(self, content_id, expand=None):
+                return _make_page(content_id, html="<h1>단건</h1><p>본문</p>")
+
+        service = _service_with(LookupClient(total=0))
+
+        by_id = await service.fetch_document_by_id("7")
+        by_cql = await service.search_by_cql('label = "design"')
+
+        assert by_id["document"]["content"].startswith("# 단건")
+        assert [doc["content"] for doc in by_cql["documents"]] == ["# 문서 0", "# 문서 1"]
+
+    @pytest.mark.asyncio
+    async def test_fetch_without_pipeline_returns_markdown(self, tmp_path, monkeypatch):
+        import server
+
+        monkeypatch.setenv("CLIENT_WORK_DIR", str(tmp_path))
+        pages = [_make_page(i, html=f"<h1>문서 {i}</h1><p>본문</p>") for i in range(2)]
+
+        class StaticClient(FakeSearchClient):
+            async def search_content(self, cql, limit=10, start=0, expand=None):
+                return {"results": pages, "_links": {}}
+
+        monkeypatch.setattr(server.confluence_service, "client", StaticClient(total=0))
+        monkeypatch.setattr(server.conversion_executor.config, "workers", 1)
+
+        result = await server.confluence_fetch.fn(label="design", output_dir=str(tmp_path), save_html=False, auto_pipeline=False)
+
+        assert [doc["content"].splitlines()[0] for doc in result["documents"]] == ["# 문서 0", "# 문서 1"]
+        assert "pipeline_results" not in result["metadata"]
+
+    @pytest.mark.asyncio
+    async def test_batch_conversion_fills_documents(self, convert_calls):
+        from html_to_md import ConversionExecutor, ConversionExecutorConfig
+
+        service = ConfluenceService()
+        pages = [_make_page(i, html=f"<h1>문서 {i}</h1><p>본문</p>") for i in range(3)] + [_make_page(9, html="")]
+        docs = [service.transformer.transform_to_specgate_format({"results": [page]}) for page in pages]
+        executor = ConversionExecutor(ConversionExecutorConfig(workers=1))
+
+        await service.transformer.ensure_markdown_batch(docs, executor)
+        cached = await service.transformer.ensure_markdown(docs[0])
+
+        assert [doc["conversion_status"] for doc in docs] == ["success", "success", "success", "empty"]
+        assert cached == docs[0]["content"] and cached.startswith("# 문서 0")
+        assert len(convert_calls) == 3
+
+    @pytest.mark.asyncio
+    async def test_batch_conversion_reuses_conversion_cache(self, tmp_path, convert_calls):
+        from html_to_md import ConversionCache, ConversionExecutor, ConversionExecutorConfig
+
+        service = ConfluenceService()
+        pages = [_make_page(i, html=f"<h1>문서 {i}</h1><p>본문</p>") for i in range(2)]
+        executor = ConversionExecutor(ConversionExecutorConfig(workers=1))
+        cache = ConversionCache(str(tmp_path))
+
+        runs = []
+        for _ in range(2):
+            docs = [service.transformer.transform_to_specgate_format({"results": [page]}) for page in pages]
+            await service.transformer.ensure_markdown_batch(docs, executor, cache=cache)
+            runs.append([doc["content"] for doc in docs])
+
+        assert runs[0] == runs[1]
+        assert len(convert_calls) == 2
+        assert executor.last_batch["cache_hits"] == 2
+        assert cache.get_stats()["hits"] == 2
+
+
+class TestSyncManifest:
+    """동기화 매니페스트 테스트"""
+
+    def test_classify_and_persist(self, tmp_path):
+        path = str(tmp_path / "sync" / "sync_manifest.json")
+        manifest = SyncManifest.load(path)
+        doc = {"id": "1", "title": "문서", "version": 3, "html_content": "<p>본문</p>"}
+
+        assert manifest.classify(doc) == "new"
+        manifest.record(doc, score=85)
+        assert manifest.save() is True
+
+        reloaded = SyncManifest.load(path)
+        assert reloaded.classify(doc) == "unchanged"
+        assert reloaded.get("1")["score"] == 85
+        assert reloaded.classify({**doc, "version": 4}) == "changed"
+        assert reloaded.classify({**doc, "html_content": "<p>수정</p>"}) == "changed"
+
+
+class TestDeltaQuery:
+    """lastmodified 워터마크 기반 델타 조회 테스트"""
+
+    def test_generate_cql_query_with_since(self):
+        client = ConfluenceAPIClient()
+
+        assert client.generate_cql_query("design", "SG", "2025-01-31") == \
+            'label = "design" AND space = "SG" AND lastmodified >= "2025/01/31"'
+        assert client.generate_cql_query("design", None, "2025-01-31T09:30") == \
+            'label = "design" AND lastmodified >= "2025/01/31 09:30"'
+        assert client.generate_cql_query("design", None, 'now("-2h")').endswith('lastmodified >= now("-2h")')
+        with pytest.raises(ValueError):
+            client.generate_cql_query("design", None, "어제")
+
+    def test_watermark_to_relative_cql_date(self, tmp_path):
+        manifest = SyncManifest.load(str(tmp_path / "sync_manifest.json"))
+        now = datetime(2025, 1, 31, 12, 0, tzinfo=timezone.utc)
+
+        assert manifest.delta_since("design", "SG", now=now) is None
+        manifest.set_watermark("design", "SG", now - timedelta(minutes=90))
+        manifest.set_watermark("design", "SG", now - timedelta(hours=5))  # 이전 시각으로는 되돌리지 않음
+
+        assert manifest.delta_since("design", "SG", overlap_minutes=10, now=now) == 'now("-101m")'
+        assert manifest.delta_since("design", None, now=now) is None
+
+
+class TestTwoPhaseFetch:
+    """메타데이터 검색 후 필요한 본문만 조회하는 2단계 조회 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_only_changed_pages_fetch_bodies(self, tmp_path):
+        class TwoPhaseClient(FakeSearchClient):
+            def __init__(self):
+                super().__init__(total=0)
+                self.expands = []
+                self.body_requests = []
+
+            async def search_content(self, cql, limit=10, start=0, expand=None):
+                self.expands.append(expand)
+                return {"results": [
+                    {**_make_page(i, version=2 if i == 1 else 1), "body": {}} for i in range(4)
+                ], "_links": {}}
+
+            async def get_content_by_id(self, content_id, expand=None):
+                self.body_requests.append(content_id)
+                return _make_page(content_id, version=2 if content_id == "1" else 1, html=f"<p>{content_id}</p>")
+
+        manifest = SyncManifest.load(str(tmp_path / "sync_manifest.json"))
+        for i in range(3):
+            manifest.record({"id": str(i), "version": 1, "html_content": f"<p>{i}</p>"})
+
+        client = TwoPhaseClient()
+        service = _service_with(client)
+        result = await service.fetch_documents(
+            "design", save_html=False, manifest=manifest, two_phase=True,
+            body_filter=lambda doc: doc["id"] != "3"
+        )
+
+        assert client.expands == ["version,space"]
+        assert client.body_requests == ["1"]
+        assert result["metadata"]["two_phase"] == {"metadata_only": 3, "bodies_fetched": 1, "body_errors": []}
+        statuses = {d["id"]: d["sync_status"] for d in result["documents"]}
+        assert statuses == {"0": "unchanged", "1": "changed", "2": "unchanged", "3": "new"}
+        assert result["documents"][1]["html_content"] == "<p>1</p>"
+
+
+class TestIncrementalPipeline:
+    """변경 없는 페이지 생략 파이프라인 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_second_run_reports_unchanged(self, tmp_path, monkeypatch):
+        import server
+
+        monkeypatch.setenv("CLIENT_WORK_DIR", str(tmp_path))
+        pages = [_make_page(i, html=f"<h1>[SG] API 설계서</h1><p>문서 {i}</p>") for i in range(3)]
+
+        class StaticClient(FakeSearchClient):
+            async def search_content(self, cql, limit=10, start=0, expand=None):
+                return {"results": pages, "_links": {}}
+
+        monkeypatch.setattr(server.confluence_service, "client", StaticClient(total=0))
+
+        first = await server.confluence_fetch.fn(label="design", auto_create_github_issues=False)
+        statuses = [r["status"] for r in first["metadata"]["pipeline_results"]]
+        assert statuses == ["new", "new", "new"]
+        assert first["metadata"]["sync"]["new"] == 3
+
+        pages[1] = _make_page(1, version=2, html="<h1>[SG] API 설계서</h1><p>수정됨</p>")
+        second = await server.confluence_fetch.fn(label="design", auto_create_github_issues=False)
+        results = second["metadata"]["pipeline_results"]
+        assert [r["status"] for r in results] == ["unchanged", "changed", "unchanged"]
+        assert len(second["metadata"]["html_files"]) == 1
+        assert results[0]["markdown_file"] == first["metadata"]["pipeline_results"][0]["markdown_file"]
+        assert results[0]["lint"]["score"] == first["metadata"]["pipeline_results"][0]["lint"]["score"]
+
+    @pytest.mark.asyncio
+    async def test_incremental_run_adds_lastmodified_clause(self, tmp_path, monkeypatch):
+        import server
+
+        monkeypatch.setenv("CLIENT_WORK_DIR", str(tmp_path))
+        queries = []
+
+        class RecordingClient(FakeSearchClient):
+            async def search_content(self, cql, limit=10, start=0, expand=None):
+                queries.append(cql)
+                return {"results": [], "_links": {}}
+
+        monkeypatch.setattr(server.confluence_service, "client", RecordingClient(total=0))
+
+        first = await server.confluence_fetch.fn(label="design", incremental=True)
+        second = await server.confluence_fetch.fn(label="design", incremental=True)
+
+        assert "lastmodified" not in queries[0]
+        assert "watermark" in first["metadata"]
+        assert 'lastmodified >= now("-' in queries[1]
+        assert second["metadata"]["modified_since"].startswith("now(")
+
+    @pytest.mark.asyncio
+    async def test_failed_body_fetch_keeps_watermark(self, tmp_path, monkeypatch):
+        import server
+
+        monkeypatch.setenv("CLIENT_WORK_DIR", str(tmp_path))
+
+        class BodyFailClient(FakeSearchClient):
+            async def search_content(self, cql, limit=10, start=0, expand=None):
+                return {"results": [{**_make_page(i), "body": {}} for i in range(3)], "_links": {}}
+
+            async def get_content_by_id(self, content_id, expand=None):
+                if content_id == "1":
+                    return {"error": "API 호출 실패: 500"}
+                return _make_page(content_id, html=f"<h1>[SG] API 설계서</h1><p>문서 {content_id}</p>")
+
+        monkeypatch.setattr(server.confluence_service, "client", BodyFailClient(total=0))
+
+        result = await server.confluence_fetch.fn(
+            label="design", output_dir=str(tmp_path), incremental=True, two_phase=True,
+            auto_create_github_issues=False
+        )
+
+        assert result["metadata"]["two_phase"]["body_errors"] == [{"id": "1", "error": "API 호출 실패: 500"}]
+        assert [r["page_id"] for r in result["metadata"]["pipeline_results"]] == ["0", "2"]
+        assert "watermark" not in result["metadata"]
+        manifest = SyncManifest.load(str(tmp_path / ".specgate" / "data" / "sync" / "sync_manifest.json"))
+        assert manifest.get_watermark("design") is None
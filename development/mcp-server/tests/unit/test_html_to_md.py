@@ -0,0 +1,545 @@
+"""
+html_to_md 모듈 테스트
+"""
+import sys
+import types
+import random
+import dataclasses
+
+import pytest
+
+from html_to_md import (
+    ConversionCache,
+    ConversionCacheConfig,
+    ConversionExecutor,
+    ConversionExecutorConfig,
+    ConversionValidator,
+    HTMLParser,
+    HTMLPruner,
+    HTMLToMarkdownConverter,
+    ParsedDocument,
+    PruneConfig,
+)
+from html_to_md import converter as converter_module
+from html_to_md import document as document_module
+from html_to_md import streaming
+from tests.utils.confluence_standin import _build_body
+
+
+EQUIVALENCE_SAMPLES = [
+    "",
+    "<p>본문<!-- 주석 -->계속</p><script>var a;</script>꼬리<style>p {}</style>",
+    "<h2>제목<style>h2 {}</style> 이어짐</h2><title>문서</title>"
+    '<pre class="language-go"><code class="x">fn main() {}</code></pre>',
+    '<h2>앞</h2><ac:structured-macro ac:name="code"><ac:parameter ac:name="language">python</ac:parameter>'
+    "<ac:plain-text-body><![CDATA[if a < b:\n    print(1)]]></ac:plain-text-body></ac:structured-macro><h2>뒤</h2>",
+    '<ac:structured-macro ac:name="warning"><ac:rich-text-body><p>주의 '
+    '<ac:link><ri:page ri:content-title="설계"/><ac:plain-text-link-body>링크</ac:plain-text-link-body>'
+    "</ac:link></p></ac:rich-text-body></ac:structured-macro>",
+    "<table><thead><tr><th>a &amp; b</th></tr></thead><tbody><tr><td>1<br>2 <img src=\"i.png\" alt=\"그림\"></td></tr>"
+    "</tbody></table><blockquote>인용 원문</blockquote>",
+]
+
+
+async def _convert(html: str, **kwargs) -> str:
+    result = await HTMLToMarkdownConverter().convert(html, **kwargs)
+    assert result["status"] == "success"
+    return result["markdown"]
+
+
+class TestSinglePassRenderer:
+    """단일 순회 렌더러 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_blocks_are_emitted_once_in_document_order(self):
+        markdown = await _convert(
+            "<h1>제목</h1><div><p>첫 문단</p><h2>소제목</h2></div>"
+            "<ul><li><p>항목 문단</p></li></ul><p>마지막 문단</p>"
+        )
+
+        assert markdown == "# 제목\n\n첫 문단\n\n## 소제목\n\n- 항목 문단\n\n마지막 문단"
+
+    @pytest.mark.asyncio
+    async def test_nested_lists_are_indented_not_repeated(self):
+        markdown = await _convert(
+            "<ul><li>상위 1<ul><li>하위 A</li><li>하위 B<ol><li>깊이 2</li></ol></li></ul></li>"
+            "<li>상위 2</li></ul>"
+        )
+
+        assert markdown == "- 상위 1\n  - 하위 A\n  - 하위 B\n    1. 깊이 2\n- 상위 2"
+
+    @pytest.mark.asyncio
+    async def test_table_cells_render_once_and_nested_rows_stay_inside(self):
+        markdown = await _convert(
+            "<table><tbody>"
+            "<tr><th>필드</th><th>설명</th></tr>"
+            "<tr><td><p>id</p></td><td>식별자 | 키<table><tr><td>내부</td></tr></table></td></tr>"
+            "</tbody></table>"
+        )
+
+        assert markdown == "| 필드 | 설명 |\n| --- | --- |\n| id | 식별자 \\| 키내부 |"
+
+    @pytest.mark.asyncio
+    async def test_header_row_without_th_is_not_duplicated(self):
+        markdown = await _convert("<table><tr><td>A</td><td>B</td></tr><tr><td>1</td><td>2</td></tr></table>")
+
+        assert markdown == "| A | B |\n| --- | --- |\n| 1 | 2 |"
+
+    @pytest.mark.asyncio
+    async def test_blockquote_and_code_block(self):
+        markdown = await _convert(
+            "<blockquote><p>인용 1</p><p>인용 2</p></blockquote>"
+            '<pre class="python"><code>print("hi")</code></pre>'
+        )
+
+        assert markdown == '> 인용 1\n>\n> 인용 2\n\n```python\nprint("hi")\n```'
+
+
+class TestInlineRenderer:
+    """인라인 렌더러 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_only_the_marked_occurrence_is_formatted(self):
+        markdown = await _convert("<p>API 호출 시 <strong>API</strong> 키를 사용한다</p>")
+
+        assert markdown == "API 호출 시 **API** 키를 사용한다"
+
+    @pytest.mark.asyncio
+    async def test_nested_and_mixed_inline_elements(self):
+        markdown = await _convert(
+            '<p><strong>굵게 <em>기울임</em> </strong><code>a*b</code> '
+            '<a href="https://example.com">링크 <del>취소</del></a><br/>다음 줄</p>'
+        )
+
+        assert markdown == "**굵게 *기울임*** `a*b` [링크 ~~취소~~](https://example.com)\n다음 줄"
+
+    @pytest.mark.asyncio
+    async def test_table_cells_and_list_items_keep_inline_formatting(self):
+        markdown = await _convert(
+            "<table><tr><th>규칙</th></tr><tr><td><p><strong>MUST</strong> 인증</p></td></tr></table>"
+            "<ul><li><em>선택</em> 항목<ul><li>하위</li></ul></li></ul>"
+        )
+
+        assert markdown == "| 규칙 |\n| --- |\n| **MUST** 인증 |\n\n- *선택* 항목\n  - 하위"
+
+
+class TestTableRenderer:
+    """행 단위 표 렌더러 테스트"""
+
+    SPANNED = (
+        "<table><thead><tr><th colspan=\"2\">이름</th><th>설명</th></tr></thead><tbody>"
+        "<tr><td rowspan=\"2\">user</td><td>id</td><td>식별자</td></tr>"
+        "<tr><td>name</td><td>이름</td></tr>"
+        "<tr><td>order</td><td>id</td><td rowspan=\"3\">주문</td></tr>"
+        "<tr><td colspan=\"x\">잘못된 값</td></tr>"
+        "</tbody></table>"
+    )
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("backend", ["lxml", "bs4"])
+    async def test_colspan_and_rowspan_keep_columns_aligned(self, backend):
+        markdown = await _convert(self.SPANNED, backend=backend)
+
+        assert markdown == (
+            "| 이름 |  | 설명 |\n| --- | --- | --- |\n"
+            "| user | id | 식별자 |\n|  | name | 이름 |\n"
+            "| order | id | 주문 |\n| 잘못된 값 |  |  |"
+        )
+
+    @pytest.mark.asyncio
+    async def test_streaming_emits_rows_as_they_close(self):
+        rows = "".join(f"<tr><td>f{i}</td><td>{i}</td></tr>" for i in range(3000))
+        html = f"<h1>필드</h1><table><tr><th>이름</th><th>값</th></tr>{rows}</table><p>끝</p>"
+        expected = await _convert(html)
+
+        converter = HTMLToMarkdownConverter()
+        fragments = [f async for f in converter.convert_stream(html, chunk_size=4096)]
+
+        assert "".join(fragments) == expected
+        # 표가 닫히기 전에 이미 여러 조각으로 나뉘어 나온다
+        assert sum(1 for f in fragments if f.startswith("\n| f")) > 2000
+
+
+class TestMacroRendering:
+    """Confluence 매크로 제자리 변환 테스트"""
+
+    HTML = (
+        "<h1>API</h1><ac:structured-macro ac:name=\"info\"><ac:rich-text-body><p>인증 필요</p>"
+        "</ac:rich-text-body></ac:structured-macro><h2>예제</h2>"
+        '<ac:structured-macro ac:name="warning"><ac:rich-text-body><p>첫 줄</p><ul><li>항목</li></ul>'
+        '<ac:structured-macro ac:name="code"><ac:parameter ac:name="language">bash</ac:parameter>'
+        "<ac:plain-text-body>curl -X GET</ac:plain-text-body></ac:structured-macro></ac:rich-text-body>"
+        "</ac:structured-macro><h2>부록</h2>"
+        '<ac:structured-macro ac:name="expand"><ac:parameter ac:name="title">더보기</ac:parameter>'
+        "<ac:rich-text-body><p>펼친 내용</p></ac:rich-text-body></ac:structured-macro>"
+    )
+    EXPECTED = (
+        "# API\n\n> **정보**: 인증 필요\n\n## 예제\n\n"
+        "> **⚠️ 경고**: 첫 줄\n>\n> - 항목\n>\n> ```bash\n> curl -X GET\n> ```\n\n"
+        "## 부록\n\n펼친 내용"
+    )
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("backend", ["lxml", "bs4"])
+    async def test_macros_render_once_in_place(self, backend):
+        markdown = await _convert(self.HTML, backend=backend)
+
+        assert markdown == self.EXPECTED
+
+    CODE_MACRO = (
+        '<h2>예제</h2><ac:structured-macro ac:name="code"><ac:parameter ac:name="language">python</ac:parameter>'
+        '<ac:plain-text-body><![CDATA[if a < b and c > 0:\n    print("<ok> & done")]]></ac:plain-text-body>'
+        "</ac:structured-macro><!-- <![CDATA[주석]]> --><h2>다음</h2>"
+    )
+    CODE_EXPECTED = '## 예제\n\n```python\nif a < b and c > 0:\n    print("<ok> & done")\n```\n\n## 다음'
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("path", ["lxml", "bs4", "stream"])
+    @pytest.mark.parametrize("prune", [True, False])
+    async def test_cdata_code_body_renders_between_headings(self, path, prune):
+        converter = HTMLToMarkdownConverter(prune_config=PruneConfig(enabled=prune))
+        if path == "stream":
+            markdown = "".join([fragment async for fragment in converter.convert_stream(self.CODE_MACRO, chunk_size=5)])
+        else:
+            markdown = (await converter.convert(self.CODE_MACRO, backend=path))["markdown"]
+
+        assert markdown == self.CODE_EXPECTED
+
+    def test_parsed_document_keeps_cdata_code_body(self):
+        body = next(ParsedDocument.parse(self.CODE_MACRO).root.iter("ac:plain-text-body"))
+
+        assert body.text == 'if a < b and c > 0:\n    print("<ok> & done")'
+
+    @pytest.mark.asyncio
+    async def test_bodyless_macro_keeps_text(self):
+        markdown = await _convert('<p>앞</p><ac:structured-macro ac:name="note">간단 메모</ac:structured-macro><p>뒤</p>')
+
+        assert markdown == "앞\n\n> **📝 노트**: 간단 메모\n\n뒤"
+
+
+class TestLxmlBackend:
+    """lxml 변환 백엔드 테스트"""
+
+    @staticmethod
+    async def _both(html: str, **kwargs):
+        converter = HTMLToMarkdownConverter()
+        soup_result = await converter.convert(html, backend="bs4", **kwargs)
+        lxml_result = await converter.convert(html, backend="lxml", **kwargs)
+        return soup_result, lxml_result
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("html", EQUIVALENCE_SAMPLES)
+    async def test_output_matches_bs4_backend(self, html):
+        soup_result, lxml_result = await self._both(html, document_title="문서 제목")
+
+        assert lxml_result["status"] == soup_result["status"] == "success"
+        assert lxml_result["markdown"] == soup_result["markdown"]
+        assert lxml_result["metadata"] == soup_result["metadata"]
+
+    @pytest.mark.asyncio
+    async def test_output_matches_bs4_backend_on_generated_pages(self):
+        for page_id in range(5):
+            html = _build_body(page_id, f"page-{page_id}", 8, random.Random(page_id))
+            soup_result, lxml_result = await self._both(html)
+
+            assert lxml_result["markdown"] == soup_result["markdown"]
+            assert lxml_result["metadata"] == soup_result["metadata"]
+
+    @pytest.mark.asyncio
+    async def test_backend_is_selectable_per_call(self):
+        converter = HTMLToMarkdownConverter()
+
+        default = await converter.convert("<p>x</p>")
+        explicit = await converter.convert("<p>x</p>", backend="bs4")
+        invalid = await converter.convert("<p>x</p>", backend="html5lib")
+
+        assert default["conversion_info"]["backend"] == "lxml"
+        assert explicit["conversion_info"]["backend"] == "bs4"
+        assert invalid["status"] == "error"
+
+
+class TestHTMLPruner:
+    """파싱 전 가지치기 테스트"""
+
+    BLOB = "A" * 4000
+    HTML = (
+        "<ac:layout><ac:layout-section><ac:layout-cell><h1 style=\"color: red\">설계</h1>"
+        '<ac:structured-macro ac:name="drawio"><ac:parameter ac:name="diagramName">흐름</ac:parameter>'
+        '<ac:structured-macro ac:name="code"><ac:plain-text-body><![CDATA[</ac:structured-macro>]]>'
+        "</ac:plain-text-body></ac:structured-macro></ac:structured-macro>"
+        f'<p>그림 <img src="data:image/png;base64,{BLOB}" alt="인라인"> <img src="a.png" alt="첨부"></p>'
+        '<ac:structured-macro ac:name="jira" ac:schema-version="1"/><p>본문 유지</p>'
+        "</ac:layout-cell></ac:layout-section></ac:layout>"
+    )
+    PRUNED = "<h1>설계</h1><p>그림 <img alt=\"인라인\"> <img src=\"a.png\" alt=\"첨부\"></p><p>본문 유지</p>"
+
+    def test_drops_macros_attributes_and_wrappers(self):
+        pruner = HTMLPruner()
+
+        assert pruner.prune(self.HTML) == self.PRUNED
+        assert pruner.pruned_bytes == len(self.HTML.encode("utf-8")) - len(self.PRUNED.encode("utf-8"))
+        assert pruner.elements_pruned == 2
+
+    @pytest.mark.parametrize("chunk_size", [1, 7, 64])
+    def test_chunked_bytes_input_matches_one_shot(self, chunk_size):
+        data = self.HTML.encode("utf-8")
+        pruner = HTMLPruner()
+
+        pruned = "".join(pruner.feed(data[i:i + chunk_size]) for i in range(0, len(data), chunk_size)) + pruner.close()
+
+        assert pruned == self.PRUNED
+
+    @pytest.mark.asyncio
+    async def test_converter_reports_pruned_bytes(self):
+        pruned = await HTMLToMarkdownConverter().convert(self.HTML)
+        unpruned = await HTMLToMarkdownConverter(prune_config=PruneConfig(enabled=False)).convert(self.HTML)
+
+        assert pruned["markdown"] == "# 설계\n\n그림  ![첨부](a.png)\n\n본문 유지"
+        assert pruned["conversion_info"]["pruned_bytes"] > len(self.BLOB)
+        assert unpruned["conversion_info"]["pruned_bytes"] == 0
+        assert self.BLOB in unpruned["markdown"]
+
+
+class TestStreamingConversion:
+    """스트리밍 변환 테스트"""
+
+    STREAM_SAMPLES = EQUIVALENCE_SAMPLES + [
+        TestMacroRendering.HTML,
+        TestTableRenderer.SPANNED,
+        TestHTMLPruner.HTML,
+        "<p>앞</p><ac:structured-macro ac:name=\"info\"><ac:rich-text-body><p>바깥"
+        "<ac:structured-macro ac:name=\"note\"><ac:rich-text-body><p>안쪽</p></ac:rich-text-body>"
+        "</ac:structured-macro></p></ac:rich-text-body></ac:structured-macro><p>뒤</p><h2>늦은 제목</h2>",
+        "<pre>a\n\n\n\nb</pre><p>c</p><p>x<script>if (a</b) y()</script>z</p>",
+        "<h1>T</h1><ul><li></li></ul>",
+        "<ul><li></li></ul><pre>a\n\n\n\n</pre><pre>\n\n\nb</pre><p> </p>",
+    ]
+
+    @staticmethod
+    async def _collect(source, **kwargs) -> str:
+        converter = HTMLToMarkdownConverter()
+        return "".join([fragment async for fragment in converter.convert_stream(source, **kwargs)])
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("html", STREAM_SAMPLES)
+    @pytest.mark.parametrize("document_title", [None, "문서 제목"])
+    async def test_fragments_join_to_convert_output(self, html, document_title):
+        expected = await HTMLToMarkdownConverter().convert(html, document_title=document_title)
+
+        for chunk_size in (1, 7, 4096):
+            metadata = {}
+            markdown = await self._collect(html, document_title=document_title, metadata=metadata, chunk_size=chunk_size)
+            metadata.pop("stream")
+
+            assert markdown == expected["markdown"]
+            assert metadata == expected["metadata"]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("document_title", [None, "문서 제목"])
+    async def test_trailing_whitespace_is_cleaned_like_convert(self, document_title):
+        html = "<h1>T</h1><ul><li></li></ul>"
+        expected = await HTMLToMarkdownConverter().convert(html, document_title=document_title)
+
+        for chunk_size in (1, 4096):
+            markdown = await self._collect(html, document_title=document_title, chunk_size=chunk_size)
+
+            assert markdown == expected["markdown"] == "# T\n\n-"
+
+    @pytest.mark.asyncio
+    async def test_parser_restart_keeps_output_and_bounds_tree(self, monkeypatch):
+        monkeypatch.setattr(streaming, "PARSER_RESTART_CHARS", 256)
+        html = (
+            "<div><ac:layout><ac:layout-section><ac:layout-cell>"
+            + _build_body(3, "큰 문서", 16, random.Random(3))
+            + "</ac:layout-cell></ac:layout-section></ac:layout>떠도는 텍스트</div><p>끝</p>"
+        )
+        expected = await HTMLToMarkdownConverter().convert(html)
+
+        metadata = {}
+        markdown = await self._collect(html.encode("utf-8"), metadata=metadata, chunk_size=1024)
+
+        assert markdown == expected["markdown"]
+        assert metadata["stream"]["parser_restarts"] > 1
+
+    @pytest.mark.asyncio
+    async def test_convert_to_file_writes_markdown(self, tmp_path):
+        html = _build_body(1, "파일", 8, random.Random(1))
+        chunks = [html[i:i + 500] for i in range(0, len(html), 500)]
+        expected = await HTMLToMarkdownConverter().convert(html)
+
+        output_path = tmp_path / "out" / "page.md"
+        result = await HTMLToMarkdownConverter().convert_to_file(iter(chunks), str(output_path))
+
+        assert result["status"] == "success"
+        assert result["conversion_info"]["streaming"] is True
+        assert result["metadata"] == expected["metadata"]
+        assert output_path.read_text(encoding="utf-8") == expected["markdown"]
+
+
+class TestParsedDocument:
+    """공유 문서 모델 테스트"""
+
+    HTML = (
+        "<h1>제목</h1><p>본문 <a href=\"https://example.com\">링크</a> <code>x</code></p>"
+        "<table><tr><th>A</th></tr><tr><td>1</td></tr></table><ul><li>항목</li></ul>"
+        "<pre class=\"python\"><code>print(1)</code></pre><img src=\"a.png\" alt=\"그림\">"
+        '<ac:structured-macro ac:name="code"><ac:plain-text-body>x</ac:plain-text-body></ac:structured-macro>'
+    )
+
+    def test_stats_are_computed_with_the_parse(self):
+        stats = ParsedDocument.parse(self.HTML).stats
+
+        assert (stats.headings, stats.tables, stats.lists, stats.links, stats.images) == (1, 1, 1, 1, 1)
+        assert (stats.pre_blocks, stats.code_macros, stats.code_blocks) == (1, 1, 2)
+        assert stats.title == "제목"
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            stats.tables = 0
+
+    @pytest.mark.asyncio
+    async def test_converter_parser_and_validator_share_one_parse(self, monkeypatch):
+        calls = []
+        original = document_module.parse_html
+        monkeypatch.setattr(document_module, "parse_html", lambda html: calls.append(html) or original(html))
+
+        document = ParsedDocument.parse(self.HTML)
+        result = await HTMLToMarkdownConverter().convert(document)
+        structure = HTMLParser().parse_html_structure(document)
+        validation = ConversionValidator().validate_conversion(document, result["markdown"])
+
+        assert len(calls) == 1
+        assert result["metadata"] == document.metadata()
+        assert structure["title"] == "제목"
+        assert [c["language"] for c in structure["code_blocks"]] == ["python", "text"]
+        assert structure["tables"][0]["headers"] == ["A"]
+        assert validation["quality_score"] > 0
+
+    def test_string_input_still_works(self):
+        validator = ConversionValidator()
+
+        assert validator.count_headings_in_html(self.HTML) == 1
+        assert validator.count_tables_in_html(ParsedDocument.parse(self.HTML)) == 1
+        assert HTMLParser().parse_html_structure(self.HTML)["links"][0]["url"] == "https://example.com"
+
+
+class TestConversionExecutor:
+    """프로세스 풀 배치 변환 테스트"""
+
+    PAGES = [(_build_body(i, f"page-{i}", 4, random.Random(i)), f"page-{i}") for i in range(4)] + [("", "빈 문서")]
+
+    @staticmethod
+    async def _expected(pages):
+        converter = HTMLToMarkdownConverter()
+        return [await converter.convert(html, document_title=title) for html, title in pages]
+
+    @pytest.mark.asyncio
+    async def test_pool_results_match_convert_in_input_order(self):
+        executor = ConversionExecutor(ConversionExecutorConfig(workers=2, min_batch=2, min_bytes=0))
+        try:
+            results = await executor.convert_batch(self.PAGES)
+        finally:
+            executor.shutdown()
+
+        expected = await self._expected(self.PAGES)
+        assert [r["markdown"] for r in results] == [e["markdown"] for e in expected]
+        assert [r["metadata"] for r in results] == [e["metadata"] for e in expected]
+
+        batch = executor.last_batch
+        assert batch["mode"] == "process_pool"
+        assert sum(worker["pages"] for worker in batch["per_worker"].values()) == len(self.PAGES)
+        assert executor.get_metrics()["pages_converted"] == len(self.PAGES)
+
+    @pytest.mark.asyncio
+    async def test_small_batch_converts_in_process(self):
+        executor = ConversionExecutor(ConversionExecutorConfig(workers=4, min_batch=3))
+
+        results = await executor.convert_batch(self.PAGES[:2])
+
+        assert executor.last_batch["mode"] == "in_process"
+        assert executor._pool is None
+        assert [r["markdown"] for r in results] == [e["markdown"] for e in await self._expected(self.PAGES[:2])]
+        assert await executor.convert_batch([]) == []
+
+    @pytest.mark.asyncio
+    async def test_small_html_total_converts_in_process(self):
+        executor = ConversionExecutor(ConversionExecutorConfig(workers=4, min_batch=2, min_bytes=1024 * 1024))
+
+        await executor.convert_batch(self.PAGES)
+
+        assert executor.last_batch["mode"] == "in_process"
+        assert executor._pool is None
+        assert executor.uses_pool(["가" * (400 * 1024)] * 2)
+
+    @pytest.mark.asyncio
+    async def test_spawned_workers_do_not_rerun_main_script(self, tmp_path, monkeypatch):
+        # python server.py로 실행한 것처럼 __main__을 실행되면 표시 파일을 남기는 스크립트로 교체
+        marker = tmp_path / "main_ran"
+        script = tmp_path / "fake_server.py"
+        script.write_text(f"open({str(marker)!r}, 'a').write('x')\n", encoding="utf-8")
+        fake_main = types.ModuleType("__main__")
+        fake_main.__file__ = str(script)
+        monkeypatch.setitem(sys.modules, "__main__", fake_main)
+
+        executor = ConversionExecutor(ConversionExecutorConfig(workers=2, min_batch=2, min_bytes=0))
+        try:
+            results = await executor.convert_batch(self.PAGES[:2])
+        finally:
+            executor.shutdown()
+
+        assert executor.last_batch["mode"] == "process_pool"
+        assert all(result["status"] == "success" for result in results)
+        assert not marker.exists()
+        assert sys.modules["__main__"] is fake_main
+
+
+class TestConversionCache:
+    """변환 캐시 테스트"""
+
+    HTML = "<h1>제목</h1><p>본문 <strong>굵게</strong></p><ul><li>항목</li></ul>"
+
+    @pytest.mark.asyncio
+    async def test_hit_returns_same_result_without_parsing(self, tmp_path, monkeypatch):
+        converter = HTMLToMarkdownConverter(cache=ConversionCache(str(tmp_path)))
+        first = await converter.convert(self.HTML, document_title="문서")
+
+        monkeypatch.setattr(document_module, "parse_html", lambda html: pytest.fail("캐시 적중 시 파싱하지 않아야 함"))
+        # 새 인스턴스(다음 실행)도 디스크에 저장된 결과를 사용
+        second = await HTMLToMarkdownConverter(cache=ConversionCache(str(tmp_path))).convert(self.HTML, document_title="문서")
+
+        assert first["conversion_info"]["cache_hit"] is False
+        assert second["conversion_info"]["cache_hit"] is True
+        assert second["markdown"] == first["markdown"]
+        assert second["metadata"] == first["metadata"]
+        assert converter.get_cache_stats()["misses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_key_covers_options_and_converter_version(self, tmp_path, monkeypatch):
+        cache = ConversionCache(str(tmp_path))
+        converter = HTMLToMarkdownConverter(cache=cache)
+
+        await converter.convert(self.HTML)
+        await converter.convert(self.HTML, document_title="다른 제목")
+        await converter.convert(self.HTML, preserve_structure=False)
+        monkeypatch.setattr(converter_module, "CONVERTER_VERSION", "next")
+        await converter.convert(self.HTML)
+        await converter.convert(self.HTML, use_cache=False)
+
+        assert (cache.hits, cache.misses, cache.stores) == (0, 4, 4)
+
+    def test_lru_eviction_by_size_and_expiry_by_age(self, tmp_path):
+        entry = {"markdown": "x" * 200, "metadata": {}, "elements_converted": 1}
+        cache = ConversionCache(str(tmp_path))
+        for key in ("a1", "b2", "c3"):
+            cache.put(key, entry)
+        # 항목 3개까지만 들어가도록 상한 조정
+        cache.config.max_bytes = cache.get_stats()["bytes"]
+        assert cache.get("a1") is not None
+        cache.put("d4", entry)
+
+        assert cache.get("b2") is None
+        assert [cache.get(key) is not None for key in ("a1", "c3", "d4")] == [True, True, True]
+        assert cache.evictions == 1
+
+        expired = ConversionCache(str(tmp_path), ConversionCacheConfig(max_age_seconds=-1))
+        assert expired.get("a1") is None
+        assert expired.get_stats()["entries"] == 0
+        assert not any(tmp_path.rglob("*.json"))
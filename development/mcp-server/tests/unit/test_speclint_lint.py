@@ -0,0 +1,570 @@
+"""
+speclint_lint 모듈 테스트
+"""
+import re
+import sys
+import time
+import types
+from pathlib import Path
+
+import pytest
+import yaml
+
+from speclint_lint import SpecLint, LintResultCache, LintCacheConfig, BatchLintConfig, ImprovementSuggester
+from speclint_lint import QUALITY_SCORING, IMPROVEMENT_SUGGESTIONS
+from speclint_lint.engine import RuleEngine, RuleSet, load_rule_set
+from speclint_lint.engine.rule_engine import DEFAULT_RULES_PATH
+from speclint_lint.utils import MarkdownIndex
+
+
+TEST_DOCUMENTS_DIR = Path(__file__).resolve().parents[4] / "documentation" / "templates" / "test-documents"
+
+SAMPLE_DOCUMENT = """# [SpecGate] API 설계서
+
+## 1. 개요
+본문
+
+## 2. 설계 규칙 (Design Rules)
+### 2.1 MUST 규칙
+- **RULE-API-001** (MUST): 모든 API는 인증을 거쳐야 한다
+- **RULE-API-002** (SHOULD): 응답은 JSON 형식을 사용한다
+  - 근거: 짧음
+**RULE-API-003** (MUST NOT): 비밀번호를 로그에 남기지 않는다
+
+```markdown
+## 9. 예시 안의 헤딩
+- 코드 안의 항목
+```
+
+## 3. 기술 스펙
+인라인 ```json``` 표기
+
+## 4. 변경 이력
+~~~
+열린 펜스
+"""
+
+
+class TestMarkdownIndex:
+    """한 번 훑어 만든 섹션 인덱스"""
+
+    def test_headings_and_code_blocks(self):
+        index = MarkdownIndex.build(SAMPLE_DOCUMENT)
+
+        titles = [(heading.level, heading.title, heading.in_code) for heading in index.headings]
+        assert titles == [
+            (1, "[SpecGate] API 설계서", False),
+            (2, "1. 개요", False),
+            (2, "2. 설계 규칙 (Design Rules)", False),
+            (3, "2.1 MUST 규칙", False),
+            (2, "9. 예시 안의 헤딩", True),
+            (2, "3. 기술 스펙", False),
+            (2, "4. 변경 이력", False),
+        ]
+        for heading in index.headings:
+            assert SAMPLE_DOCUMENT[heading.start:heading.end].lstrip().startswith("#")
+            assert "\n" not in SAMPLE_DOCUMENT[heading.start:heading.end]
+
+        assert [(block.info, block.closed) for block in index.code_blocks] == [("markdown", True), ("", False)]
+        assert len(index.code_spans) == 1
+        assert index.code_example_count == 2
+
+    def test_rule_lines_and_section_items(self):
+        index = MarkdownIndex.build(SAMPLE_DOCUMENT)
+        assert [rule.text.split("**")[1] for rule in index.rule_lines] == ["RULE-API-001", "RULE-API-002", "RULE-API-003"]
+
+        start, end = index.section_after(re.compile(r"##\s*2\.\s*설계\s*규칙"))
+        assert SAMPLE_DOCUMENT[start:end].lstrip().startswith("(Design Rules)")
+        # 다음 경계는 코드 블록 안의 '## 9.'
+        assert SAMPLE_DOCUMENT[end:].startswith("## 9.")
+
+        items = index.list_items_in(start, end)
+        assert [item.marker for item in items] == ["-", "-", "-", "*"]
+        assert items[2].text == "근거: 짧음"
+        assert items[3].text.startswith("*RULE-API-003**")
+        assert index.list_items_in(start, end) is items
+
+    def test_title_lookup_by_level(self):
+        index = MarkdownIndex.build("## [SpecGate] API 설계서\n# SpecGate API 설계서\n")
+        pattern = re.compile(r"^#\s*[A-Za-z가-힣\s]+\s*설계서\s*$", re.MULTILINE)
+
+        heading, match = index.find_heading(pattern, level=1)
+        assert heading.start == index.headings[1].start
+        assert match.group() == "# SpecGate API 설계서"
+
+    def test_sections_and_digests(self):
+        index = MarkdownIndex.build(SAMPLE_DOCUMENT)
+        starts = [SAMPLE_DOCUMENT[section.start:].split("\n", 1)[0] for section in index.sections]
+        assert starts == ["# [SpecGate] API 설계서", "## 1. 개요", "## 2. 설계 규칙 (Design Rules)",
+                          "## 9. 예시 안의 헤딩", "## 3. 기술 스펙", "## 4. 변경 이력"]
+        assert [index.headings[number].title for number in index.sections[2].headings] == [
+            "2. 설계 규칙 (Design Rules)", "2.1 MUST 규칙"
+        ]
+        assert index.sections[-1].end == len(SAMPLE_DOCUMENT)
+        assert index.section_number(index.sections[3].start) == 3
+
+        edited = MarkdownIndex.build(SAMPLE_DOCUMENT.replace("본문", "바뀐 본문"))
+        changed = [old.digest != new.digest for old, new in zip(index.sections, edited.sections)]
+        assert changed == [False, True, False, False, False, False]
+
+    def test_empty_document(self):
+        index = MarkdownIndex.build("")
+        assert index.headings == [] and index.code_blocks == [] and index.rule_lines == []
+        assert index.line_count == 1 and index.word_count == 0
+
+
+class TestSpecLintWithIndex:
+    """SpecLint.lint()가 인덱스를 한 번 만들어 분석기와 검사기에 넘기는지"""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("filename, score, violations, rule_count", [
+        ("01-API-Design-Perfect.md", 100, [], 7),
+        ("02-Architecture-Design-TitleError.md", 60, ["title_format_mismatch"], 7),
+        ("03-Data-Model-Design-MissingRules.md", 0, ["design_rules_missing", "technical_spec_missing"], 0),
+        ("04-Security-Design-MissingCode.md", 85, ["code_example_missing"], 7),
+        ("05-Performance-Design-MissingHistory.md", 90, ["change_history_missing"], 7),
+    ])
+    async def test_test_document_scores(self, filename, score, violations, rule_count):
+        content = (TEST_DOCUMENTS_DIR / filename).read_text(encoding="utf-8")
+
+        result = await SpecLint().lint(content, "full")
+
+        assert result["score"] == score
+        assert [violation["type"] for violation in result["violations"]] == violations
+        assert result["metadata"]["structure_analysis"]["rule_count"] == rule_count
+
+    # 인덱스 도입 전(문서 전체 정규식 검색)과 달라진 판정: CommonMark 펜스와 줄 시작 헤딩만 인정
+    INDEX_RULES_HEAD = "# [SpecGate] API 설계서\n\n## 1. 개요\n본문\n\n"
+    INDEX_RULES_BODY = (
+        "## 2. 설계 규칙\n- **RULE-API-001** (MUST): 모든 API는 인증을 거쳐야 한다\n\n"
+        "## 3. 기술 스펙\n내용\n\n## 4. 변경 이력\n- v1\n\n"
+    )
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("tail, code_example", [
+        ("~~~\ncode\n~~~\n", True),                          # ~~~ 펜스도 코드 예제 (이전: 누락)
+        ("```\ncode\n```\n", True),
+        ("설명 ``` 이후\n\n```python\nx = 1\n", False),        # 줄 중간 ```와 닫히지 않은 펜스는 짝이 아님 (이전: 예제)
+        ("인라인 ```json``` 표기\n", True),
+    ])
+    async def test_code_examples_follow_commonmark_fences(self, tail, code_example):
+        result = await SpecLint().lint(self.INDEX_RULES_HEAD + self.INDEX_RULES_BODY + tail, "full")
+
+        assert ("code_example_missing" not in [v["type"] for v in result["violations"]]) is code_example
+
+    @pytest.mark.asyncio
+    async def test_sections_are_found_only_at_line_start(self):
+        quoted = self.INDEX_RULES_BODY.replace("## 2. 설계 규칙", "> ## 2. 설계 규칙")
+
+        result = await SpecLint().lint(self.INDEX_RULES_HEAD + quoted + "```\nx\n```\n", "full")
+
+        # 인용문 안의 헤딩은 섹션이 아니다 (이전: 섹션으로 인정)
+        assert [v["type"] for v in result["violations"]] == ["design_rules_missing"]
+
+    @pytest.mark.asyncio
+    async def test_index_built_once_per_lint(self, monkeypatch):
+        calls = []
+        original_build = MarkdownIndex.build.__func__
+
+        def counting_build(cls, content, *args):
+            calls.append(content)
+            return original_build(cls, content, *args)
+
+        monkeypatch.setattr(MarkdownIndex, "build", classmethod(counting_build))
+
+        result = await SpecLint().lint(SAMPLE_DOCUMENT, "full")
+
+        assert len(calls) == 1
+        assert result["metadata"]["structure_analysis"]["rule_count"] == 3
+        # 분석기/검사기를 직접 호출하면 각자 인덱스를 만든다
+        speclint = SpecLint()
+        await speclint.validator.validate(SAMPLE_DOCUMENT, "full")
+        assert len(calls) == 2
+
+
+class TestRuleEngine:
+    """speclint-rules.yaml의 checks로 만든 규칙 엔진"""
+
+    def _rules(self):
+        return yaml.safe_load(DEFAULT_RULES_PATH.read_text(encoding="utf-8"))
+
+    def test_default_rule_set(self):
+        rule_set = load_rule_set()
+        assert [check.id for check in rule_set.checks][:3] == ["title_format", "design_rules_section", "technical_spec_section"]
+        assert len(rule_set.version) == 16
+        assert RuleSet.from_dict(self._rules()).version == rule_set.version
+        assert RuleEngine.default() is RuleEngine.default()
+
+    def test_evaluate_memoized_per_index(self):
+        engine = RuleEngine.default()
+        index = engine.build_index(SAMPLE_DOCUMENT)
+        outcomes = engine.evaluate(index)
+
+        assert engine.evaluate(index) is outcomes
+        assert outcomes["design_rules_section"].passed
+        assert outcomes["design_rules_count"].count == 4
+        # 인덱스의 '근거: 짧음'(3번째 항목)만 10자 미만
+        assert outcomes["design_rules_content_length"].failed_items == [3]
+        assert outcomes["rule_format"].count == 3
+
+    def test_violations_follow_stage_and_declaration_order(self):
+        engine = RuleEngine.default()
+        outcomes = engine.evaluate(engine.build_index("# 제목\n\n## 2. 설계 규칙\n- 짧음\n"))
+
+        assert [v["type"] for v in engine.violations(outcomes, "basic")] == ["title_format_mismatch"]
+        assert [v["type"] for v in engine.violations(outcomes, "full")] == [
+            "title_format_mismatch",
+            "technical_spec_missing", "design_rules_keywords_missing", "design_rules_insufficient", "rule_content_too_short",
+            "design_rules_keywords_missing", "design_rules_insufficient", "rule_content_too_short",
+            "code_example_missing", "change_history_missing",
+        ]
+        assert engine.violations(outcomes, "full")[4]["message"] == "규칙 1의 내용이 너무 짧습니다."
+
+    def test_check_defaults_declared_only_in_rule_set(self):
+        engine = RuleEngine.default()
+        violation_types = {check.violation for check in engine.rule_set.checks}
+
+        assert not violation_types & set(QUALITY_SCORING["deductions"])
+        assert not violation_types & set(IMPROVEMENT_SUGGESTIONS)
+        assert ImprovementSuggester().suggestions == {**IMPROVEMENT_SUGGESTIONS, **engine.suggestions}
+        assert MarkdownIndex.build(SAMPLE_DOCUMENT).rule_lines == engine.build_index(SAMPLE_DOCUMENT).rule_lines
+
+    def test_rule_set_without_rule_line_check(self):
+        rules = self._rules()
+        rules["checks"] = {key: check for key, check in rules["checks"].items() if check["scope"] != "rule_line"}
+        engine = RuleEngine(RuleSet.from_dict(rules))
+
+        index = engine.build_index(SAMPLE_DOCUMENT)
+        assert index.rule_lines == []
+        assert [heading.title for heading in index.headings][:2] == ["[SpecGate] API 설계서", "1. 개요"]
+
+    @pytest.mark.asyncio
+    async def test_custom_check_without_code_change(self, tmp_path, monkeypatch):
+        rules = self._rules()
+        rules["checks"]["security_section"] = {
+            "scope": "heading",
+            "patterns": [r"##\s*[0-9]+\.\s*보안"],
+            "weight": 0,
+            "stages": ["full"],
+            "violation": "security_section_missing",
+            "penalty": -5,
+            "message": "보안 섹션이 누락되었습니다.",
+            "suggestion": "보안 고려사항 섹션을 추가하세요.",
+        }
+        rules_file = tmp_path / "rules.yaml"
+        rules_file.write_text(yaml.safe_dump(rules, allow_unicode=True), encoding="utf-8")
+        monkeypatch.setenv("SPECLINT_RULES_FILE", str(rules_file))
+
+        engine = RuleEngine.default()
+        assert engine.version != load_rule_set(str(DEFAULT_RULES_PATH)).version
+        content = (TEST_DOCUMENTS_DIR / "01-API-Design-Perfect.md").read_text(encoding="utf-8")
+
+        result = await SpecLint(engine).lint(content, "full")
+
+        assert [violation["type"] for violation in result["violations"]] == ["security_section_missing"]
+        assert result["score"] == 95
+        assert result["suggestions"][0] == "보안 고려사항 섹션을 추가하세요."
+
+    @pytest.mark.parametrize("change, message", [
+        ({"scope": "paragraph"}, "scope"),
+        ({"section": "missing_check"}, "section"),
+        ({"patterns": ["("]}, "패턴"),
+        ({"stages": ["later"]}, "stages"),
+    ])
+    def test_invalid_declaration(self, change, message):
+        rules = self._rules()
+        rules["checks"]["design_rules_keywords"].update(change)
+
+        with pytest.raises(ValueError, match=message):
+            RuleSet.from_dict(rules)
+
+
+class TestLintResultCache:
+    """내용/검사 유형/제목/규칙 세트 버전 해시로 찾는 검사 결과 캐시"""
+
+    @pytest.mark.asyncio
+    async def test_hit_returns_same_result(self):
+        speclint = SpecLint(cache=LintResultCache())
+
+        first = await speclint.lint(SAMPLE_DOCUMENT, "full", "[SpecGate] API 설계서")
+        first["metadata"]["report_saved"] = True
+        second = await speclint.lint(SAMPLE_DOCUMENT, "full", "[SpecGate] API 설계서")
+
+        assert first["metadata"]["cache_hit"] is False
+        assert second["metadata"]["cache_hit"] is True
+        assert second["score"] == first["score"]
+        assert second["violations"] == first["violations"]
+        assert second["suggestions"] == first["suggestions"]
+        # 반환된 결과를 수정해도 캐시 항목은 그대로
+        assert "report_saved" not in second["metadata"]
+        stats = speclint.get_cache_stats()
+        assert (stats["hits"], stats["misses"], stats["stores"]) == (1, 1, 1)
+
+    @pytest.mark.asyncio
+    async def test_key_covers_check_type_title_and_rules(self):
+        speclint = SpecLint(cache=LintResultCache())
+        await speclint.lint(SAMPLE_DOCUMENT, "full")
+
+        for check_type, title in (("basic", None), ("full", "다른 제목 설계서")):
+            result = await speclint.lint(SAMPLE_DOCUMENT, check_type, title)
+            assert result["metadata"]["cache_hit"] is False
+
+        key = LintResultCache.make_key(SAMPLE_DOCUMENT, "full", None, speclint.engine.version)
+        assert key != LintResultCache.make_key(SAMPLE_DOCUMENT, "full", None, "other-rules")
+        assert speclint.cache.get(key) is not None
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction(self):
+        speclint = SpecLint(cache=LintResultCache(LintCacheConfig(max_entries=2)))
+        documents = [SAMPLE_DOCUMENT + f"\n문서 {i}\n" for i in range(3)]
+        for document in documents:
+            await speclint.lint(document)
+
+        assert (await speclint.lint(documents[0]))["metadata"]["cache_hit"] is False
+        assert (await speclint.lint(documents[2]))["metadata"]["cache_hit"] is True
+        stats = speclint.get_cache_stats()
+        assert stats["entries"] == 2
+        assert stats["evictions"] == 2
+
+    @pytest.mark.asyncio
+    async def test_disk_cache_shared_between_instances(self, tmp_path):
+        config = LintCacheConfig(directory=str(tmp_path))
+        first = await SpecLint(cache=LintResultCache(config)).lint(SAMPLE_DOCUMENT)
+
+        speclint = SpecLint(cache=LintResultCache(config))
+        result = await speclint.lint(SAMPLE_DOCUMENT)
+
+        assert result["metadata"]["cache_hit"] is True
+        assert result["score"] == first["score"]
+        assert speclint.get_cache_stats()["disk_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_disk_size_limit(self, tmp_path):
+        cache = LintResultCache(LintCacheConfig(directory=str(tmp_path), max_bytes=1))
+        speclint = SpecLint(cache=cache)
+        await speclint.lint(SAMPLE_DOCUMENT)
+        await speclint.lint(SAMPLE_DOCUMENT, "basic")
+
+        stats = speclint.get_cache_stats()
+        assert stats["disk_evictions"] == 2
+        assert stats["disk_entries"] == 0
+        assert not list(tmp_path.glob("*/*.json"))
+
+    @pytest.mark.asyncio
+    async def test_without_cache(self):
+        speclint = SpecLint()
+        result = await speclint.lint(SAMPLE_DOCUMENT)
+        assert result["metadata"]["cache_hit"] is None
+        assert speclint.get_cache_stats() is None
+
+    def test_config_from_env(self, monkeypatch):
+        monkeypatch.setenv("SPECLINT_CACHE", "off")
+        monkeypatch.setenv("SPECLINT_CACHE_SIZE", "8")
+        monkeypatch.setenv("SPECLINT_CACHE_DIR", "/tmp/speclint-cache")
+        monkeypatch.setenv("SPECLINT_CACHE_MAX_MB", "1")
+
+        config = LintCacheConfig.from_env()
+
+        assert (config.enabled, config.max_entries, config.directory, config.max_bytes) == (
+            False, 8, "/tmp/speclint-cache", 1024 * 1024
+        )
+
+
+def _comparable(result):
+    """실행마다 달라지는 값(시각, 처리 시간)을 뺀 검사 결과"""
+    metadata = {key: value for key, value in result["metadata"].items() if key not in ("timestamp", "processing_time_seconds")}
+    return dict(result, metadata=metadata)
+
+
+class TestIncrementalLint:
+    """섹션 내용 해시별로 저장한 검사 결과를 재사용하는 재검사"""
+
+    @pytest.mark.asyncio
+    async def test_only_changed_section_is_evaluated(self):
+        engine = RuleEngine(load_rule_set())
+        speclint = SpecLint(engine)
+        await speclint.lint(SAMPLE_DOCUMENT)
+        assert engine.section_stats == {"evaluated": 6, "reused": 0, "evictions": 0}
+
+        edited = SAMPLE_DOCUMENT.replace("## 3. 기술 스펙\n", "## 3. 기술 스펙\n추가된 문단\n")
+        result = await speclint.lint(edited)
+
+        assert engine.section_stats == {"evaluated": 7, "reused": 5, "evictions": 0}
+        full = await SpecLint(RuleEngine(load_rule_set())).lint(edited)
+        assert _comparable(result) == _comparable(full)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("filename", [
+        "01-API-Design-Perfect.md",
+        "02-Architecture-Design-TitleError.md",
+        "04-Security-Design-MissingCode.md",
+        "05-Performance-Design-MissingHistory.md",
+    ])
+    @pytest.mark.parametrize("edit", [
+        lambda text: text.replace("## 3. 기술 스펙", "## 3. 기술 사양", 1),
+        lambda text: text.replace("## 2. 설계 규칙", "## 2. 설계  규칙\n- 짧음\n", 1),
+        lambda text: re.sub(r"\n- \*\*RULE-[^\n]*", "", text, count=2),
+        lambda text: text.replace("\n# ", "\n# 제목 없는 ", 1),
+        lambda text: text + "\n## 9. 변경 이력\n- 1.0.0 초안\n",
+        lambda text: text.replace("```", "", 1),
+    ])
+    async def test_relint_matches_full_lint(self, filename, edit):
+        original = (TEST_DOCUMENTS_DIR / filename).read_text(encoding="utf-8")
+        edited = edit(original)
+        speclint = SpecLint(RuleEngine(load_rule_set()))
+        for check_type in ("full", "structure"):
+            await speclint.lint(original, check_type)
+
+            incremental = await speclint.lint(edited, check_type)
+            full = await SpecLint(RuleEngine(load_rule_set())).lint(edited, check_type)
+
+            assert incremental["score"] == full["score"]
+            assert _comparable(incremental) == _comparable(full)
+
+    def test_section_cache_is_bounded(self):
+        engine = RuleEngine(load_rule_set(), section_cache_size=2)
+        engine.evaluate(engine.build_index(SAMPLE_DOCUMENT))
+
+        assert engine.section_stats["evictions"] == 4
+
+
+class SlowSpecLint(SpecLint):
+    """제목이 'slow'인 문서는 검사 전에 멈추는 SpecLint (스레드 워커도 이 클래스로 만든다)"""
+
+    async def lint(self, content, check_type="full", document_title=None):
+        if document_title == "slow":
+            time.sleep(0.5)
+        return await super().lint(content, check_type, document_title)
+
+
+class TestBatchLint:
+    """워커 수와 문서별 제한 시간이 있는 배치 검사"""
+
+    def _documents(self):
+        documents = [
+            {"id": path.stem, "title": None, "content": path.read_text(encoding="utf-8")}
+            for path in sorted(TEST_DOCUMENTS_DIR.glob("*.md"))
+        ]
+        documents.append({"id": "empty", "title": "빈 문서", "content": ""})
+        return documents
+
+    @pytest.mark.asyncio
+    async def test_thread_pool_matches_sequential(self):
+        documents = self._documents()
+        sequential = await SpecLint().batch_lint(documents)
+
+        speclint = SpecLint(batch_config=BatchLintConfig(workers=3, mode="thread"))
+        run = speclint.batch_lint_stream(documents)
+        streamed = [result["document_id"] async for result in run]
+        batch = await speclint.batch_lint(documents)
+        speclint.batch_linter.shutdown()
+
+        assert sorted(streamed) == sorted(document["id"] for document in documents)
+        assert run.summary == sequential["summary"]
+        assert [result["document_id"] for result in run.results] == [document["id"] for document in documents]
+        assert [result["score"] for result in batch["results"]] == [result["score"] for result in sequential["results"]]
+        assert batch["summary"] == sequential["summary"]
+        assert batch["metadata"]["batch"]["mode"] == "thread_pool"
+
+    @pytest.mark.asyncio
+    async def test_timeout_does_not_wait_for_stuck_document(self):
+        documents = self._documents()[:3]
+        documents.insert(0, {"id": "slow-doc", "title": "slow", "content": documents[0]["content"]})
+        speclint = SlowSpecLint(batch_config=BatchLintConfig(workers=2, mode="thread", timeout=0.1))
+
+        started = time.perf_counter()
+        run = speclint.batch_lint_stream(documents)
+        order = [result["document_id"] async for result in run]
+        elapsed = time.perf_counter() - started
+        speclint.batch_linter.shutdown()
+
+        # 멈춘 문서는 제한 시간에 오류 결과를 내고, 나머지는 다른 워커에서 끝난다
+        assert elapsed < 0.4
+        assert sorted(order) == sorted(document["id"] for document in documents)
+        slow = run.results[0]
+        assert slow["metadata"]["timeout"] is True
+        assert slow["violations"][0]["type"] == "processing_error"
+        assert run.summary["failed_count"] == 1 + sum(1 for result in run.results[1:] if result["score"] == 0)
+        assert run.metadata["batch"]["timeouts"] == 1
+
+    @pytest.mark.asyncio
+    async def test_cache_hits_skip_workers(self):
+        documents = self._documents()
+        speclint = SpecLint(cache=LintResultCache(), batch_config=BatchLintConfig(workers=2, mode="thread"))
+        first = await speclint.batch_lint(documents)
+        second = await speclint.batch_lint(documents)
+        speclint.batch_linter.shutdown()
+
+        # 빈 문서는 오류 결과라 저장하지 않는다
+        assert second["metadata"]["batch"]["cache_hits"] == len(documents) - 1
+        assert second["summary"] == first["summary"]
+
+    @pytest.mark.asyncio
+    async def test_process_pool(self):
+        documents = self._documents()
+        sequential = await SpecLint().batch_lint(documents)
+        speclint = SpecLint(batch_config=BatchLintConfig(workers=2, mode="process"))
+        try:
+            batch = await speclint.batch_lint(documents)
+        finally:
+            speclint.batch_linter.shutdown()
+
+        assert [result["score"] for result in batch["results"]] == [result["score"] for result in sequential["results"]]
+        assert batch["metadata"]["batch"]["mode"] == "process_pool"
+
+    @pytest.mark.asyncio
+    async def test_spawned_workers_do_not_rerun_main_script(self, tmp_path, monkeypatch):
+        # python server.py로 실행한 것처럼 __main__을 실행되면 표시 파일을 남기는 스크립트로 교체
+        marker = tmp_path / "main_ran"
+        script = tmp_path / "fake_server.py"
+        script.write_text(f"open({str(marker)!r}, 'a').write('x')\n", encoding="utf-8")
+        fake_main = types.ModuleType("__main__")
+        fake_main.__file__ = str(script)
+        monkeypatch.setitem(sys.modules, "__main__", fake_main)
+
+        documents = self._documents()[:2]
+        speclint = SpecLint(batch_config=BatchLintConfig(workers=2, mode="process", start_method="spawn"))
+        try:
+            batch = await speclint.batch_lint(documents)
+        finally:
+            speclint.batch_linter.shutdown()
+
+        assert batch["metadata"]["batch"]["mode"] == "process_pool"
+        assert batch["summary"]["total_documents"] == 2
+        assert not marker.exists()
+        assert sys.modules["__main__"] is fake_main
+
+    @pytest.mark.asyncio
+    async def test_timeout_counts_from_worker_start_not_pool_startup(self):
+        # 첫 배치는 프로세스 생성과 import에 제한 시간보다 오래 걸린다
+        documents = [{"id": f"doc-{i}", "title": None, "content": f"# 문서 {i}"} for i in range(6)]
+        speclint = SpecLint(batch_config=BatchLintConfig(workers=3, mode="process", timeout=0.1))
+        try:
+            started = time.perf_counter()
+            batch = await speclint.batch_lint(documents)
+            elapsed = time.perf_counter() - started
+        finally:
+            speclint.batch_linter.shutdown()
+
+        assert elapsed > 0.1
+        assert batch["metadata"]["batch"]["timeouts"] == 0
+        assert not any(result["metadata"].get("timeout") for result in batch["results"])
+
+    def test_worker_alarm_stops_long_lint(self, monkeypatch):
+        from speclint_lint.core import batch
+
+        batch._init_worker(RuleEngine.default().rule_set)
+
+        async def stuck(*args):
+            time.sleep(2)
+
+        monkeypatch.setattr(batch._worker_speclint, "lint", stuck)
+        started = time.perf_counter()
+        index, result, _, _ = batch._lint_in_worker((0, "# 문서", "full", None, 0.1, 0))
+
+        assert (index, result) == (0, None)
+        assert time.perf_counter() - started < 1
+
+    def test_invalid_mode(self):
+        with pytest.raises(ValueError, match="배치 검사 모드"):
+            SpecLint(batch_config=BatchLintConfig(mode="fiber"))
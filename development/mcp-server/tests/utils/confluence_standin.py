@@ -0,0 +1,428 @@
+"""
+로컬 Confluence REST 스탠드인 서버
+
+실제 Atlassian 테넌트 없이 confluence_fetch의 수집 처리량과 페이지네이션 동작을
+재현 가능하게 측정하기 위한 aiohttp 기반 가짜 서버입니다.
+
+지원 API:
+    - GET /wiki/rest/api/content/search  (CQL label/space/lastmodified 필터, start/limit, _links.next)
+    - GET /wiki/rest/api/content/{id}
+
+장애 프로파일로 응답 지연, 429(Retry-After 포함), 5xx 응답, 본문 중간 연결 끊김을 주입할 수 있습니다.
+
+단독 실행:
+    python -m tests.utils.confluence_standin --pages 5000 --port 8090 --profile throttled
+    CONFLUENCE_BASE_URL=http://127.0.0.1:8090/wiki python server.py
+"""
+import re
+import json
+import random
+import asyncio
+import argparse
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Any, List, Optional, Tuple
+from urllib.parse import urlencode
+
+from aiohttp import web
+
+
+@dataclass
+class FaultProfile:
+    """요청마다 적용할 장애 주입 설정"""
+    latency: float = 0.0               # 기본 응답 지연(초)
+    latency_jitter: float = 0.0        # 지연에 더할 무작위 값의 최대치(초)
+    latency_per_kb: float = 0.0        # 응답 1KB당 추가 지연(초), 페이지 무게 반영
+    rate_429: float = 0.0              # 429 응답 비율 (0~1)
+    rate_5xx: float = 0.0              # 5xx(503) 응답 비율 (0~1)
+    retry_after: float = 1.0           # 429 응답의 Retry-After(초)
+    max_in_flight: Optional[int] = None  # 초과하는 동시 요청은 429 (테넌트 동시성 한도)
+    truncate_body: float = 0.0         # 0보다 크면 200 응답 본문을 이 비율만큼만 보내고 연결을 끊음
+    seed: Optional[int] = None
+
+    @classmethod
+    def named(cls, name: str) -> "FaultProfile":
+        """이름으로 미리 정의된 프로파일 조회"""
+        try:
+            return replace(FAULT_PROFILES[name])
+        except KeyError:
+            raise ValueError(f"알 수 없는 장애 프로파일: {name} (사용 가능: {', '.join(FAULT_PROFILES)})")
+
+
+FAULT_PROFILES: Dict[str, FaultProfile] = {
+    "none": FaultProfile(),
+    "realistic": FaultProfile(latency=0.08, latency_jitter=0.04, latency_per_kb=0.0005),
+    "slow": FaultProfile(latency=0.5, latency_jitter=0.3, latency_per_kb=0.002),
+    "throttled": FaultProfile(latency=0.05, latency_jitter=0.02, max_in_flight=4, retry_after=0.2),
+    "flaky": FaultProfile(latency=0.05, latency_jitter=0.05, rate_429=0.05, rate_5xx=0.05, retry_after=0.2),
+    "truncated": FaultProfile(latency=0.05, truncate_body=0.5),
+}
+
+
+@dataclass
+class CorpusConfig:
+    """생성할 문서 집합 설정"""
+    pages: int = 500
+    body_kb: float = 8.0                       # 페이지 본문 크기(대략, KB)
+    labels: Tuple[str, ...] = ("design", "api", "spec")
+    spaces: Tuple[str, ...] = ("SG", "API")
+    history_days: int = 30                     # 수정 시각을 흩뿌릴 기간(일)
+    seed: int = 42
+
+
+def _build_body(page_id: int, title: str, body_kb: float, rng: random.Random) -> str:
+    """설계서 형태의 Confluence storage HTML 본문 생성"""
+    parts = [
+        f"<h1>{title}</h1>",
+        "<h2>1. 개요</h2>",
+        f"<p>문서 {page_id}의 목적과 범위를 설명합니다.</p>",
+        "<h2>2. 설계 규칙</h2>",
+        "<ul><li>DR-001: 모든 API는 인증을 거쳐야 한다 (MUST)</li>"
+        "<li>DR-002: 응답 시간은 200ms 이하를 유지한다 (SHOULD)</li></ul>",
+        '<ac:structured-macro ac:name="info"><ac:rich-text-body><p>참고 사항</p></ac:rich-text-body></ac:structured-macro>',
+    ]
+    target = int(body_kb * 1024)
+    size = sum(len(p) for p in parts)
+    section = 3
+    while size < target:
+        rows = "".join(
+            f"<tr><td>field_{i}</td><td>string</td><td>항목 {rng.randint(1, 9999)} 설명</td></tr>"
+            for i in range(5)
+        )
+        chunk = (
+            f"<h2>{section}. 상세 설계 {section}</h2>"
+            f"<p>{'세부 구현 내용을 기술합니다. ' * rng.randint(3, 8)}</p>"
+            f"<table><tr><th>필드</th><th>타입</th><th>설명</th></tr>{rows}</table>"
+        )
+        parts.append(chunk)
+        size += len(chunk)
+        section += 1
+    return "".join(parts)
+
+
+def generate_corpus(config: Optional[CorpusConfig] = None, now: Optional[datetime] = None) -> List[Dict[str, Any]]:
+    """CorpusConfig에 따라 Confluence 콘텐츠 목록 생성 (같은 seed면 같은 결과)"""
+    config = config or CorpusConfig()
+    now = now or datetime.now(timezone.utc)
+    rng = random.Random(config.seed)
+    corpus = []
+    for i in range(config.pages):
+        page_id = 100000 + i
+        space = config.spaces[i % len(config.spaces)]
+        labels = [config.labels[i % len(config.labels)]]
+        if rng.random() < 0.2:
+            labels.append(rng.choice(config.labels))
+        title = f"[{space}] 기능 {i} 설계서"
+        modified = now - timedelta(minutes=rng.randint(0, config.history_days * 24 * 60))
+        corpus.append({
+            "id": str(page_id),
+            "type": "page",
+            "status": "current",
+            "title": title,
+            "labels": sorted(set(labels)),
+            "space": {"key": space, "name": f"{space} Space"},
+            "version": {"number": rng.randint(1, 5), "when": _format_when(modified)},
+            "body": _build_body(page_id, title, config.body_kb, rng),
+            "modified": modified,
+        })
+    return corpus
+
+
+def _format_when(value: datetime) -> str:
+    return value.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.000Z")
+
+
+class CQLFilter:
+    """스탠드인이 지원하는 CQL 부분집합 (AND로 연결된 label/space/type/lastmodified 조건)"""
+
+    _CLAUSE = re.compile(
+        r'^\s*(?P<field>label|space|type|lastmodified)\s*(?P<op>>=|<=|=|>|<)\s*'
+        r'(?:"(?P<quoted>[^"]*)"|(?P<func>now\("[^"]*"\))|(?P<bare>[\w.-]+))\s*$',
+        re.IGNORECASE
+    )
+    _RELATIVE = re.compile(r'^now\("(?P<sign>[+-])(?P<amount>\d+)(?P<unit>[mhdw])"\)$')
+    _UNITS = {"m": "minutes", "h": "hours", "d": "days", "w": "weeks"}
+
+    def __init__(self, cql: str, now: Optional[datetime] = None):
+        self.now = now or datetime.now(timezone.utc)
+        self.clauses = [self._parse_clause(c) for c in re.split(r"\s+AND\s+", cql.strip(), flags=re.IGNORECASE) if c]
+
+    def _parse_clause(self, clause: str) -> Tuple[str, str, Any]:
+        match = self._CLAUSE.match(clause)
+        if not match:
+            raise ValueError(f"지원하지 않는 CQL 조건: {clause}")
+        field_name = match.group("field").lower()
+        op = match.group("op")
+        raw = match.group("quoted") if match.group("quoted") is not None else (match.group("func") or match.group("bare"))
+        if field_name == "lastmodified":
+            return field_name, op, self._parse_date(raw)
+        if op != "=":
+            raise ValueError(f"{field_name}에는 '=' 연산자만 지원합니다")
+        return field_name, op, raw
+
+    def _parse_date(self, raw: str) -> datetime:
+        relative = self._RELATIVE.match(raw)
+        if relative:
+            delta = timedelta(**{self._UNITS[relative.group("unit")]: int(relative.group("amount"))})
+            return self.now - delta if relative.group("sign") == "-" else self.now + delta
+        for fmt in ("%Y/%m/%d %H:%M", "%Y/%m/%d", "%Y-%m-%d %H:%M", "%Y-%m-%d"):
+            try:
+                return datetime.strptime(raw, fmt).replace(tzinfo=timezone.utc)
+            except ValueError:
+                continue
+        raise ValueError(f"지원하지 않는 날짜 형식: {raw}")
+
+    def matches(self, page: Dict[str, Any]) -> bool:
+        for field_name, op, value in self.clauses:
+            if field_name == "label" and value not in page["labels"]:
+                return False
+            if field_name == "space" and page["space"]["key"] != value:
+                return False
+            if field_name == "type" and page["type"] != value:
+                return False
+            if field_name == "lastmodified" and not self._compare(page["modified"], op, value):
+                return False
+        return True
+
+    @staticmethod
+    def _compare(left: datetime, op: str, right: datetime) -> bool:
+        return {
+            ">=": left >= right, ">": left > right,
+            "<=": left <= right, "<": left < right, "=": left == right
+        }[op]
+
+
+@dataclass
+class StandInStats:
+    """스탠드인 서버 요청 통계"""
+    requests: int = 0
+    status_counts: Dict[int, int] = field(default_factory=dict)
+    in_flight: int = 0
+    max_in_flight: int = 0
+    bytes_sent: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "status_counts": dict(self.status_counts),
+            "max_in_flight": self.max_in_flight,
+            "bytes_sent": self.bytes_sent
+        }
+
+
+class ConfluenceStandIn:
+    """Confluence REST API v1 일부를 흉내 내는 로컬 서버
+
+    사용 예:
+        async with ConfluenceStandIn(CorpusConfig(pages=2000), FaultProfile.named("flaky")) as standin:
+            os.environ["CONFLUENCE_BASE_URL"] = standin.base_url
+            ...
+    """
+
+    def __init__(
+        self,
+        corpus: Optional[Any] = None,
+        faults: Optional[FaultProfile] = None,
+        max_limit: int = 100
+    ):
+        if corpus is None or isinstance(corpus, CorpusConfig):
+            corpus = generate_corpus(corpus)
+        self.pages: List[Dict[str, Any]] = list(corpus)
+        self._by_id = {page["id"]: page for page in self.pages}
+        self.faults = faults or FaultProfile()
+        self.max_limit = max_limit
+        self.stats = StandInStats()
+        self._rng = random.Random(self.faults.seed)
+        self._runner: Optional[web.AppRunner] = None
+        self.base_url: Optional[str] = None
+
+    # ------------------------------------------------------------------
+    # 서버 수명 주기
+    # ------------------------------------------------------------------
+    def create_app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_get("/wiki/rest/api/content/search", self._handle_search)
+        app.router.add_get("/wiki/rest/api/content/{content_id}", self._handle_content)
+        return app
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """서버를 시작하고 ConfluenceAPIClient용 기본 URL('http://host:port/wiki') 반환"""
+        self._runner = web.AppRunner(self.create_app())
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        bound_port = self._runner.addresses[0][1]
+        self.base_url = f"http://{host}:{bound_port}/wiki"
+        return self.base_url
+
+    async def stop(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def __aenter__(self) -> "ConfluenceStandIn":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.stop()
+
+    # ------------------------------------------------------------------
+    # 코퍼스/장애 조작
+    # ------------------------------------------------------------------
+    def set_faults(self, faults: FaultProfile) -> None:
+        """실행 중에 장애 프로파일 교체 (seed가 있으면 난수열도 다시 시작)"""
+        self.faults = faults
+        self._rng = random.Random(faults.seed)
+
+    def touch(self, page_ids: List[str], when: Optional[datetime] = None) -> None:
+        """지정한 페이지의 버전을 올리고 수정 시각을 갱신 (증분 동기화 테스트용)"""
+        when = when or datetime.now(timezone.utc)
+        for page_id in page_ids:
+            page = self._by_id[str(page_id)]
+            page["version"] = {"number": page["version"]["number"] + 1, "when": _format_when(when)}
+            page["modified"] = when
+            page["body"] = page["body"] + f"<p>수정 {page['version']['number']}</p>"
+
+    # ------------------------------------------------------------------
+    # 요청 처리
+    # ------------------------------------------------------------------
+    async def _handle_search(self, request: web.Request) -> web.StreamResponse:
+        async def build() -> web.Response:
+            try:
+                cql_filter = CQLFilter(request.query.get("cql", ""))
+                start = max(0, int(request.query.get("start", 0)))
+                limit = min(self.max_limit, max(1, int(request.query.get("limit", 25))))
+            except ValueError as e:
+                return self._error(400, str(e))
+            expand = request.query.get("expand", "")
+
+            matched = [page for page in self.pages if cql_filter.matches(page)]
+            window = matched[start:start + limit]
+            payload = {
+                "results": [self._render(page, expand) for page in window],
+                "start": start,
+                "limit": limit,
+                "size": len(window),
+                "totalSize": len(matched),
+                "_links": {"base": self.base_url or "", "context": "/wiki"}
+            }
+            if start + limit < len(matched):
+                query = {"cql": request.query.get("cql", ""), "limit": limit, "start": start + limit}
+                if expand:
+                    query["expand"] = expand
+                payload["_links"]["next"] = f"/rest/api/content/search?{urlencode(query)}"
+            return self._json(payload)
+
+        return await self._with_faults(request, build)
+
+    async def _handle_content(self, request: web.Request) -> web.StreamResponse:
+        async def build() -> web.Response:
+            page = self._by_id.get(request.match_info["content_id"])
+            if page is None:
+                return self._error(404, "No content found with id")
+            return self._json(self._render(page, request.query.get("expand", "")))
+
+        return await self._with_faults(request, build)
+
+    async def _with_faults(self, request: web.Request, build) -> web.StreamResponse:
+        stats = self.stats
+        stats.requests += 1
+        stats.in_flight += 1
+        stats.max_in_flight = max(stats.max_in_flight, stats.in_flight)
+        try:
+            faults = self.faults
+            if faults.max_in_flight is not None and stats.in_flight > faults.max_in_flight:
+                response = self._throttled()
+            elif faults.rate_429 and self._rng.random() < faults.rate_429:
+                response = self._throttled()
+            elif faults.rate_5xx and self._rng.random() < faults.rate_5xx:
+                response = self._error(503, "Service Unavailable")
+            else:
+                response = await build()
+
+            delay = faults.latency + self._rng.uniform(0, faults.latency_jitter)
+            delay += faults.latency_per_kb * (response.content_length or 0) / 1024
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            stats.status_counts[response.status] = stats.status_counts.get(response.status, 0) + 1
+            if faults.truncate_body and response.status == 200:
+                return await self._send_truncated(request, response)
+            stats.bytes_sent += response.content_length or 0
+            return response
+        finally:
+            stats.in_flight -= 1
+
+    async def _send_truncated(self, request: web.Request, response: web.Response) -> web.StreamResponse:
+        """전체 길이를 알린 뒤 본문 일부만 보내고 연결을 끊는다 (응답 도중 네트워크 단절 재현)"""
+        body = response.body
+        cut = int(len(body) * self.faults.truncate_body)
+        truncated = web.StreamResponse(status=200, headers={"Content-Type": "application/json"})
+        truncated.content_length = len(body)
+        await truncated.prepare(request)
+        await truncated.write(body[:cut])
+        self.stats.bytes_sent += cut
+        request.transport.close()
+        return truncated
+
+    def _render(self, page: Dict[str, Any], expand: str) -> Dict[str, Any]:
+        """expand 파라미터에 따라 응답 항목 구성"""
+        expands = {e.strip() for e in expand.split(",") if e.strip()}
+        item = {
+            "id": page["id"],
+            "type": page["type"],
+            "status": page["status"],
+            "title": page["title"],
+            "_links": {"webui": f"/spaces/{page['space']['key']}/pages/{page['id']}"}
+        }
+        if "version" in expands:
+            item["version"] = dict(page["version"])
+        if "space" in expands:
+            item["space"] = dict(page["space"])
+        if "body.storage" in expands:
+            item["body"] = {"storage": {"value": page["body"], "representation": "storage"}}
+        if "ancestors" in expands:
+            item["ancestors"] = []
+        if "metadata.labels" in expands:
+            item["metadata"] = {"labels": {"results": [{"name": name} for name in page["labels"]]}}
+        return item
+
+    def _throttled(self) -> web.Response:
+        return self._error(429, "Rate limit exceeded", headers={"Retry-After": f"{self.faults.retry_after:g}"})
+
+    @staticmethod
+    def _json(payload: Dict[str, Any], status: int = 200, headers: Optional[Dict[str, str]] = None) -> web.Response:
+        return web.Response(
+            body=json.dumps(payload, ensure_ascii=False).encode("utf-8"),
+            status=status,
+            headers=headers,
+            content_type="application/json"
+        )
+
+    def _error(self, status: int, message: str, headers: Optional[Dict[str, str]] = None) -> web.Response:
+        return self._json({"statusCode": status, "message": message}, status=status, headers=headers)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="로컬 Confluence REST 스탠드인 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8090)
+    parser.add_argument("--pages", type=int, default=CorpusConfig.pages)
+    parser.add_argument("--body-kb", type=float, default=CorpusConfig.body_kb)
+    parser.add_argument("--profile", default="none", choices=sorted(FAULT_PROFILES))
+    parser.add_argument("--seed", type=int, default=CorpusConfig.seed)
+    args = parser.parse_args()
+
+    standin = ConfluenceStandIn(
+        CorpusConfig(pages=args.pages, body_kb=args.body_kb, seed=args.seed),
+        FaultProfile.named(args.profile)
+    )
+    standin.base_url = f"http://{args.host}:{args.port}/wiki"
+    print(f"🧪 Confluence 스탠드인: 문서 {args.pages}개, 본문 약 {args.body_kb:g}KB, 프로파일 '{args.profile}'")
+    print(f"   CONFLUENCE_BASE_URL={standin.base_url}")
+    web.run_app(standin.create_app(), host=args.host, port=args.port, print=None)
+
+
+if __name__ == "__main__":
+    main()
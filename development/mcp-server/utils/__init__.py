@@ -0,0 +1,8 @@
+"""
+SpecGate 공통 유틸리티
+
+여러 모듈(html_to_md, speclint_lint)이 함께 쓰는 도우미를 포함합니다.
+"""
+from .mp import worker_context
+
+__all__ = ['worker_context']
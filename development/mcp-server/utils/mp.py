@@ -0,0 +1,43 @@
+"""
+워커 프로세스 풀 시작 방식
+
+HTML→MD 변환 실행기(html_to_md.executor)와 SpecLint 배치 검사(speclint_lint.core.batch)의
+프로세스 풀이 함께 쓰는 multiprocessing 컨텍스트를 제공합니다.
+"""
+import sys
+import types
+import multiprocessing
+import multiprocessing.context
+
+
+class _WorkerSpawnProcess(multiprocessing.context.SpawnProcess):
+    """부모의 __main__ 스크립트를 다시 실행하지 않는 spawn 워커 프로세스
+
+    spawn은 자식 프로세스에서 부모의 __main__을 __mp_main__으로 다시 실행하므로, python server.py로
+    띄운 서버에서는 워커마다 ConfluenceService, SpecLint, 로깅 설정까지 새로 만든다. 풀의 워커 함수는
+    모두 패키지 모듈에 있으므로 시작 정보를 만드는 동안만 __main__을 빈 모듈로 바꿔 경로를 빼고,
+    워커는 필요한 모듈만 import하여 시작한다.
+
+    multiprocessing에 시작 정보에서 __main__을 빼는 공개 설정이 없어 SpawnProcess._Popen을
+    감싼다. 이 클래스 밖에서는 _Popen에 의존하지 않는다.
+    """
+
+    @staticmethod
+    def _Popen(process_obj):
+        main_module = sys.modules.get("__main__")
+        sys.modules["__main__"] = types.ModuleType("__main__")
+        try:
+            return multiprocessing.context.SpawnProcess._Popen(process_obj)
+        finally:
+            sys.modules["__main__"] = main_module
+
+
+class _WorkerSpawnContext(multiprocessing.context.SpawnContext):
+    Process = _WorkerSpawnProcess
+
+
+def worker_context(start_method: str) -> multiprocessing.context.BaseContext:
+    """워커 프로세스 풀의 mp_context (spawn이면 __main__을 다시 실행하지 않는 컨텍스트)"""
+    if start_method == "spawn":
+        return _WorkerSpawnContext()
+    return multiprocessing.get_context(start_method)